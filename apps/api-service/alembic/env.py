@@ -22,6 +22,7 @@ for path in (SRC_DIR, BASE_DIR):
 
 from app.core.settings import get_settings  # noqa: E402
 from app.infrastructure.persistence.models.base import Base  # noqa: E402
+from app.infrastructure.persistence.partitions import is_partition_name  # noqa: E402
 from app.infrastructure.persistence.registry import import_all_models  # noqa: E402
 
 # Ensure all ORM metadata is registered before Alembic inspects Base metadata.
@@ -35,6 +36,12 @@ if config.config_file_name is not None:
 target_metadata = Base.metadata
 
 
+def include_name(name: str | None, type_: str, parent_names: object) -> bool:
+    """Keep autogenerate away from event-table partitions, which are created at runtime."""
+
+    return not (type_ == "table" and name is not None and is_partition_name(name))
+
+
 def get_database_url() -> str:
     """Return the SQLAlchemy URL configured for migrations."""
 
@@ -56,6 +63,7 @@ def run_migrations_offline() -> None:
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
         compare_type=True,
+        include_name=include_name,
     )
 
     with context.begin_transaction():
@@ -90,6 +98,7 @@ def do_run_migrations(connection: Connection) -> None:
         compare_type=True,
         compare_server_default=True,
         render_as_batch=False,
+        include_name=include_name,
     )
 
     with context.begin_transaction():
@@ -0,0 +1,34 @@
+"""add checkpoint columns to workflow run steps"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_120000"
+down_revision: Union[str, None] = "c44d51a2f265"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _json_type() -> sa.types.TypeEngine:
+    return sa.JSON().with_variant(
+        sa.dialects.postgresql.JSONB(astext_type=sa.Text()), "postgresql"
+    )
+
+
+def upgrade() -> None:
+    op.add_column("workflow_run_steps", sa.Column("node_id", sa.String(), nullable=True))
+    op.add_column(
+        "workflow_run_steps", sa.Column("input_fingerprint", sa.String(length=64), nullable=True)
+    )
+    op.add_column("workflow_run_steps", sa.Column("output", _json_type(), nullable=True))
+    op.add_column("workflow_run_steps", sa.Column("session_items", _json_type(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("workflow_run_steps", "session_items")
+    op.drop_column("workflow_run_steps", "output")
+    op.drop_column("workflow_run_steps", "input_fingerprint")
+    op.drop_column("workflow_run_steps", "node_id")
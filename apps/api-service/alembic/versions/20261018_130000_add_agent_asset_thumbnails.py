@@ -0,0 +1,32 @@
+"""link agent assets to generated thumbnail objects"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_130000"
+down_revision: Union[str, None] = "20261018_120000"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "agent_assets",
+        sa.Column("thumbnail_object_id", sa.dialects.postgresql.UUID(as_uuid=True), nullable=True),
+    )
+    op.create_foreign_key(
+        "fk_agent_assets_thumbnail_object",
+        "agent_assets",
+        "storage_objects",
+        ["thumbnail_object_id"],
+        ["id"],
+        ondelete="SET NULL",
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("fk_agent_assets_thumbnail_object", "agent_assets", type_="foreignkey")
+    op.drop_column("agent_assets", "thumbnail_object_id")
@@ -0,0 +1,194 @@
+"""range-partition run events, ledger events and activity events by month (Postgres)
+
+Rebuilds each table as ``PARTITION BY RANGE (<time column>)`` with one
+partition per UTC month (from the oldest stored row through three months
+ahead) plus a DEFAULT partition, then copies the rows across. Postgres
+requires the partition column in every primary key and unique constraint, so
+those gain the time column; ``activity_event_receipts.event_id`` loses its
+foreign key because it cannot reference a partitioned key without the time
+column (orphaned receipts are purged by activity retention instead).
+
+Constraint and index definitions are read from the catalog rather than
+restated here, so the rebuild keeps whatever earlier migrations produced.
+Other dialects keep plain tables and are left untouched.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_140000"
+down_revision: Union[str, None] = "20261018_130000"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TABLES: tuple[tuple[str, str], ...] = (
+    ("agent_run_events", "ingested_at"),
+    ("conversation_ledger_events", "ingested_at"),
+    ("activity_events", "created_at"),
+)
+_MONTHS_AHEAD = 3
+_RECEIPTS_FK = "fk_activity_event_receipts_event_id_activity_events"
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+    for table, column in _TABLES:
+        _rebuild(bind, table, column, partitioned=True)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+    for table, column in reversed(_TABLES):
+        _rebuild(bind, table, column, partitioned=False)
+    op.execute(
+        "DELETE FROM activity_event_receipts r WHERE NOT EXISTS "
+        "(SELECT 1 FROM activity_events e WHERE e.id = r.event_id)"
+    )
+    op.create_foreign_key(
+        _RECEIPTS_FK,
+        "activity_event_receipts",
+        "activity_events",
+        ["event_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+
+
+def _rebuild(bind: sa.engine.Connection, table: str, column: str, *, partitioned: bool) -> None:
+    old = f"{table}_{'unpartitioned' if partitioned else 'partitioned'}"
+    constraints = bind.execute(
+        sa.text(
+            "SELECT conname, contype, pg_get_constraintdef(oid) FROM pg_constraint "
+            "WHERE conrelid = to_regclass(:table) AND contype IN ('p', 'u', 'f') "
+            "ORDER BY contype DESC"
+        ),
+        {"table": table},
+    ).all()
+    backing = {name for name, kind, _ in constraints if kind in ("p", "u")}
+    indexes = [
+        (name, definition)
+        for name, definition in bind.execute(
+            sa.text(
+                "SELECT indexname, indexdef FROM pg_indexes "
+                "WHERE schemaname = current_schema() AND tablename = :table"
+            ),
+            {"table": table},
+        ).all()
+        if name not in backing
+    ]
+    inbound = bind.execute(
+        sa.text(
+            "SELECT conname, conrelid::regclass::text FROM pg_constraint "
+            "WHERE confrelid = to_regclass(:table) AND contype = 'f'"
+        ),
+        {"table": table},
+    ).all()
+
+    # Free every name so the rebuilt table can reuse it.
+    for name, owner in inbound:
+        op.execute(f'ALTER TABLE {owner} DROP CONSTRAINT "{name}"')
+    for name, kind, _ in constraints:
+        if kind == "f":
+            op.execute(f'ALTER TABLE "{table}" DROP CONSTRAINT "{name}"')
+    for name, kind, _ in constraints:
+        if kind != "f":
+            op.execute(f'ALTER TABLE "{table}" DROP CONSTRAINT "{name}"')
+    for name, _ in indexes:
+        op.execute(f'DROP INDEX "{name}"')
+    op.execute(f'ALTER TABLE "{table}" RENAME TO "{old}"')
+
+    like = f'(LIKE "{old}" INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'
+    if partitioned:
+        op.execute(f'CREATE TABLE "{table}" {like} PARTITION BY RANGE ("{column}")')
+        for statement in _partition_statements(bind, table, old, column):
+            op.execute(statement)
+    else:
+        op.execute(f'CREATE TABLE "{table}" {like}')
+    op.execute(f'INSERT INTO "{table}" SELECT * FROM "{old}"')
+
+    adjust = _append_key_column if partitioned else _remove_key_column
+    for name, kind, definition in constraints:
+        if kind in ("p", "u"):
+            definition = adjust(definition, column, after="")
+        op.execute(f'ALTER TABLE "{table}" ADD CONSTRAINT "{name}" {definition}')
+    for _, definition in indexes:
+        if definition.startswith("CREATE UNIQUE INDEX"):
+            definition = adjust(definition, column, after=" USING ")
+        op.execute(definition)
+
+    sequence = bind.execute(
+        sa.text("SELECT pg_get_serial_sequence(:table, 'id')"), {"table": old}
+    ).scalar()
+    if sequence:
+        op.execute(f'ALTER SEQUENCE {sequence} OWNED BY "{table}".id')
+    op.execute(f'DROP TABLE "{old}"')
+
+
+def _partition_statements(
+    bind: sa.engine.Connection, table: str, source: str, column: str
+) -> list[str]:
+    oldest = bind.execute(sa.text(f'SELECT min("{column}") FROM "{source}"')).scalar()
+    now = datetime.now(UTC)
+    current = _month(min(oldest, now) if oldest is not None else now)
+    last = _add_months(_month(now), _MONTHS_AHEAD)
+    statements = [f'CREATE TABLE "{table}_default" PARTITION OF "{table}" DEFAULT']
+    while current <= last:
+        upper = _add_months(current, 1)
+        statements.append(
+            f'CREATE TABLE "{table}_p{current:%Y%m}" PARTITION OF "{table}" '
+            f"FOR VALUES FROM ('{current.isoformat()} 00:00:00+00') "
+            f"TO ('{upper.isoformat()} 00:00:00+00')"
+        )
+        current = upper
+    return statements
+
+
+def _month(value: datetime) -> date:
+    value = value.astimezone(UTC) if value.tzinfo else value
+    return date(value.year, value.month, 1)
+
+
+def _add_months(value: date, months: int) -> date:
+    index = value.year * 12 + (value.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _key_span(definition: str, after: str) -> tuple[int, int]:
+    """Return the bounds of the first parenthesised column list after ``after``."""
+
+    open_at = definition.index("(", definition.index(after) if after else 0)
+    depth = 0
+    for position in range(open_at, len(definition)):
+        if definition[position] == "(":
+            depth += 1
+        elif definition[position] == ")":
+            depth -= 1
+            if depth == 0:
+                return open_at, position
+    raise ValueError(f"Unbalanced column list in {definition!r}")
+
+
+def _append_key_column(definition: str, column: str, *, after: str) -> str:
+    start, end = _key_span(definition, after)
+    columns = [part.strip() for part in definition[start + 1 : end].split(",")]
+    if column in columns:
+        return definition
+    return f"{definition[:end]}, {column}{definition[end:]}"
+
+
+def _remove_key_column(definition: str, column: str, *, after: str) -> str:
+    start, end = _key_span(definition, after)
+    columns = [part.strip() for part in definition[start + 1 : end].split(",")]
+    if len(columns) < 2 or columns[-1] != column:
+        return definition
+    return f"{definition[: start + 1]}{', '.join(columns[:-1])}{definition[end:]}"
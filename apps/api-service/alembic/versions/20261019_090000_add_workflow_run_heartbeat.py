@@ -0,0 +1,22 @@
+"""add heartbeat column to workflow runs"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_090000"
+down_revision: Union[str, None] = "20261018_140000"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "workflow_runs", sa.Column("heartbeat_at", sa.DateTime(timezone=True), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("workflow_runs", "heartbeat_at")
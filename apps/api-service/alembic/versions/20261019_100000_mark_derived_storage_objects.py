@@ -0,0 +1,43 @@
+"""mark storage objects derived from another object (thumbnails)"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_100000"
+down_revision: Union[str, None] = "20261019_090000"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "storage_objects",
+        sa.Column("derived_from_id", sa.dialects.postgresql.UUID(as_uuid=True), nullable=True),
+    )
+    op.create_foreign_key(
+        "fk_storage_objects_derived_from",
+        "storage_objects",
+        "storage_objects",
+        ["derived_from_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    # Thumbnails written before derivatives were marked carry the source in metadata.
+    op.execute(
+        """
+        UPDATE storage_objects
+        SET derived_from_id = (metadata_json ->> 'derived_from')::uuid
+        WHERE metadata_json ->> 'variant' = 'thumbnail'
+          AND metadata_json ->> 'derived_from' IS NOT NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("fk_storage_objects_derived_from", "storage_objects", type_="foreignkey")
+    op.drop_column("storage_objects", "derived_from_id")
@@ -0,0 +1,106 @@
+"""move run-event and ledger-event dedupe keys into non-partitioned key tables
+
+The partitioned event tables can only hold unique keys that include their
+``ingested_at`` partition column, which a per-insert timestamp makes useless
+for rejecting duplicates. ``agent_run_event_keys`` and
+``conversation_ledger_event_keys`` carry the logical keys instead; writers
+insert into them in the same transaction as the event row. On Postgres the
+time-extended unique constraints are dropped from the event tables.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_110000"
+down_revision: Union[str, None] = "20261019_100000"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_RUN_EVENTS_UNIQUE = "uq_agent_run_events_seq"
+_LEDGER_EVENTS_UNIQUE = "uq_conversation_ledger_events_conversation_stream_event"
+
+
+def upgrade() -> None:
+    op.create_table(
+        "agent_run_event_keys",
+        sa.Column(
+            "conversation_id",
+            sa.dialects.postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("agent_conversations.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("sequence_no", sa.Integer(), nullable=False),
+        sa.Column("ingested_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("conversation_id", "sequence_no"),
+    )
+    op.create_index("ix_agent_run_event_keys_ingested_at", "agent_run_event_keys", ["ingested_at"])
+    op.create_table(
+        "conversation_ledger_event_keys",
+        sa.Column(
+            "conversation_id",
+            sa.dialects.postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("agent_conversations.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("stream_id", sa.String(length=255), nullable=False),
+        sa.Column("event_id", sa.Integer(), nullable=False),
+        sa.Column("ingested_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("conversation_id", "stream_id", "event_id"),
+    )
+    op.create_index(
+        "ix_conversation_ledger_event_keys_ingested_at",
+        "conversation_ledger_event_keys",
+        ["ingested_at"],
+    )
+
+    # GROUP BY tolerates duplicates that slipped past the time-extended keys.
+    op.execute(
+        """
+        INSERT INTO agent_run_event_keys (conversation_id, sequence_no, ingested_at)
+        SELECT conversation_id, sequence_no, min(ingested_at)
+        FROM agent_run_events
+        GROUP BY conversation_id, sequence_no
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO conversation_ledger_event_keys
+            (conversation_id, stream_id, event_id, ingested_at)
+        SELECT conversation_id, stream_id, event_id, min(ingested_at)
+        FROM conversation_ledger_events
+        GROUP BY conversation_id, stream_id, event_id
+        """
+    )
+
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute(f'ALTER TABLE agent_run_events DROP CONSTRAINT IF EXISTS "{_RUN_EVENTS_UNIQUE}"')
+    op.execute(
+        "ALTER TABLE conversation_ledger_events "
+        f'DROP CONSTRAINT IF EXISTS "{_LEDGER_EVENTS_UNIQUE}"'
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        # The 20261018_140000 downgrade strips ingested_at from these again.
+        op.create_unique_constraint(
+            _RUN_EVENTS_UNIQUE,
+            "agent_run_events",
+            ["conversation_id", "sequence_no", "ingested_at"],
+        )
+        op.create_unique_constraint(
+            _LEDGER_EVENTS_UNIQUE,
+            "conversation_ledger_events",
+            ["conversation_id", "stream_id", "event_id", "ingested_at"],
+        )
+    op.drop_index(
+        "ix_conversation_ledger_event_keys_ingested_at",
+        table_name="conversation_ledger_event_keys",
+    )
+    op.drop_table("conversation_ledger_event_keys")
+    op.drop_index("ix_agent_run_event_keys_ingested_at", table_name="agent_run_event_keys")
+    op.drop_table("agent_run_event_keys")
@@ -0,0 +1,23 @@
+"""count failed thumbnail renders per agent asset"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "20261019_120000"
+down_revision: Union[str, None] = "20261019_110000"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "agent_assets",
+        sa.Column("thumbnail_failures", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("agent_assets", "thumbnail_failures")
@@ -0,0 +1,204 @@
+"""Compare retention cost of batched deletes against monthly partition drops.
+
+Seeds a scratch ``bench_retention_events`` table with rows spread evenly over
+``--months`` UTC months, then expires everything older than ``--keep-months``
+using either:
+
+* ``delete``    - the batched ``DELETE ... WHERE id IN (...)`` loop used by the
+  cleanup scripts on unpartitioned tables (works on SQLite and Postgres);
+* ``partition`` - the same table range-partitioned by month, expired via
+  ``drop_expired_partitions`` (Postgres only).
+
+Reports rows removed, wall time, statements issued and, on Postgres, the
+on-disk size left behind (deleted rows stay as bloat until VACUUM reclaims them).
+The scratch table is dropped before and after each run.
+
+Example:
+    python scripts/bench_event_retention.py --database-url postgresql+asyncpg://localhost/bench \\
+        --rows 1000000 --mode both
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.infrastructure.persistence.partitions import (
+    PartitionedTable,
+    add_months,
+    drop_expired_partitions,
+    month_start,
+    monthly_partitions,
+)
+
+_TABLE = PartitionedTable("bench_retention_events", "created_at")
+_SEED_CHUNK = 5_000
+
+
+async def _drop_table(session: AsyncSession) -> None:
+    cascade = " CASCADE" if session.get_bind().dialect.name == "postgresql" else ""
+    await session.execute(text(f'DROP TABLE IF EXISTS "{_TABLE.name}"{cascade}'))
+    await session.commit()
+
+
+async def _create_table(session: AsyncSession, *, partitioned: bool, months: int) -> None:
+    await _drop_table(session)
+    if session.get_bind().dialect.name == "sqlite":
+        await session.execute(
+            text(
+                f'CREATE TABLE "{_TABLE.name}" (id INTEGER PRIMARY KEY AUTOINCREMENT, '
+                "created_at TIMESTAMP NOT NULL, payload TEXT NOT NULL)"
+            )
+        )
+    else:
+        await session.execute(
+            text(
+                f'CREATE TABLE "{_TABLE.name}" (id BIGSERIAL, '
+                "created_at TIMESTAMPTZ NOT NULL, payload TEXT NOT NULL)"
+                + (f' PARTITION BY RANGE ("{_TABLE.column}")' if partitioned else "")
+            )
+        )
+        if partitioned:
+            now = month_start(datetime.now(UTC))
+            for partition in monthly_partitions(
+                _TABLE.name, first=add_months(now, -months), last=add_months(now, 1)
+            ):
+                await session.execute(text(partition.create_sql()))
+    await session.execute(
+        text(f'CREATE INDEX "ix_{_TABLE.name}_created" ON "{_TABLE.name}" ("created_at")')
+    )
+    await session.commit()
+
+
+async def _seed(session: AsyncSession, *, rows: int, months: int) -> None:
+    now = datetime.now(UTC)
+    span = timedelta(days=30 * months).total_seconds()
+    insert = text(
+        f'INSERT INTO "{_TABLE.name}" (created_at, payload) VALUES (:created_at, :payload)'
+    )
+    for offset in range(0, rows, _SEED_CHUNK):
+        batch = [
+            {
+                "created_at": now - timedelta(seconds=span * index / rows),
+                "payload": "x" * 256,
+            }
+            for index in range(offset, min(offset + _SEED_CHUNK, rows))
+        ]
+        await session.execute(insert, batch)
+        await session.commit()
+
+
+async def _table_bytes(session: AsyncSession) -> int | None:
+    if session.get_bind().dialect.name != "postgresql":
+        return None
+    result = await session.execute(
+        text(
+            "SELECT COALESCE(sum(pg_total_relation_size(inhrelid)), 0) "
+            "+ pg_total_relation_size(to_regclass(:table)) "
+            "FROM pg_inherits WHERE inhparent = to_regclass(:table)"
+        ),
+        {"table": _TABLE.name},
+    )
+    return int(result.scalar() or 0)
+
+
+async def _expire_by_delete(session: AsyncSession, cutoff: datetime, batch: int) -> int:
+    statements = 0
+    while True:
+        ids = (
+            await session.execute(
+                text(
+                    f'SELECT id FROM "{_TABLE.name}" WHERE created_at < :cutoff '
+                    "ORDER BY id LIMIT :limit"
+                ),
+                {"cutoff": cutoff, "limit": batch},
+            )
+        ).scalars().all()
+        statements += 1
+        if not ids:
+            return statements
+        await session.execute(
+            text(f'DELETE FROM "{_TABLE.name}" WHERE id IN ({", ".join(map(str, ids))})')
+        )
+        await session.commit()
+        statements += 1
+
+
+async def _count(session: AsyncSession) -> int:
+    return int((await session.execute(text(f'SELECT count(*) FROM "{_TABLE.name}"'))).scalar())
+
+
+async def _run_mode(
+    session_factory: async_sessionmaker[AsyncSession], mode: str, args: argparse.Namespace
+) -> None:
+    kept_from = add_months(month_start(datetime.now(UTC)), -args.keep_months)
+    cutoff = datetime(kept_from.year, kept_from.month, 1, tzinfo=UTC)
+    async with session_factory() as session:
+        await _create_table(session, partitioned=mode == "partition", months=args.months)
+        await _seed(session, rows=args.rows, months=args.months)
+        before = await _count(session)
+
+        started = time.perf_counter()
+        if mode == "partition":
+            dropped = await drop_expired_partitions(session, _TABLE, cutoff=cutoff)
+            # One catalog lookup plus one DROP per expired month.
+            statements = len(dropped) + 1
+        else:
+            statements = await _expire_by_delete(session, cutoff, args.batch)
+        elapsed = time.perf_counter() - started
+
+        remaining = await _count(session)
+        size = await _table_bytes(session)
+        await _drop_table(session)
+
+    print(f"mode={mode} rows_removed={before - remaining:,} rows_kept={remaining:,}")
+    print(f"elapsed_s={elapsed:.3f} statements={statements}")
+    if size is not None:
+        print(f"table_bytes_after={size:,}")
+
+
+async def run(args: argparse.Namespace) -> None:
+    engine = create_async_engine(args.database_url)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    modes = ["delete", "partition"] if args.mode == "both" else [args.mode]
+    if engine.dialect.name != "postgresql" and "partition" in modes:
+        print("partition mode requires Postgres; running delete mode only")
+        modes = ["delete"]
+    try:
+        for mode in modes:
+            await _run_mode(session_factory, mode, args)
+    finally:
+        await engine.dispose()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark event retention strategies")
+    parser.add_argument(
+        "--database-url",
+        default="sqlite+aiosqlite:///./bench_event_retention.db",
+        help="Async SQLAlchemy URL (Postgres enables partition mode)",
+    )
+    parser.add_argument("--rows", type=int, default=200_000, help="Rows to seed")
+    parser.add_argument("--months", type=int, default=12, help="Months of history to seed")
+    parser.add_argument("--keep-months", type=int, default=6, help="Months to retain")
+    parser.add_argument("--batch", type=int, default=10_000, help="Delete batch size")
+    parser.add_argument(
+        "--mode",
+        choices=("delete", "partition", "both"),
+        default="both",
+        help="Retention strategy to measure",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    asyncio.run(run(parse_args()))
+
+
+if __name__ == "__main__":  # pragma: no cover - manual utility
+    main()
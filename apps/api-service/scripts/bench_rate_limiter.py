@@ -0,0 +1,131 @@
+"""Measure per-request rate limiter overhead against a real Redis.
+
+Drives the chat-stream admission path (per-minute quota + concurrency slot) at a fixed
+request rate using an open-loop schedule, so slow responses do not throttle the offered
+load. Reports achieved throughput, admission latency percentiles and Redis commands per
+request (from ``INFO commandstats``).
+
+`--mode legacy` replays the previous fixed-window command sequence
+(INCR/EXPIRE per quota, INCR/EXPIRE for the slot) for comparison.
+
+Example:
+    python scripts/bench_rate_limiter.py --redis-url redis://localhost:6379/15 --rps 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from redis.asyncio import BlockingConnectionPool, Redis
+
+from app.services.shared.rate_limit_service import (
+    ConcurrencyQuota,
+    RateLimiter,
+    RateLimitExceeded,
+    RateLimitQuota,
+)
+
+_RATE = RateLimitQuota(name="bench_per_minute", limit=1_000_000, window_seconds=60)
+_SLOT = ConcurrencyQuota(name="bench_concurrency", limit=1_000_000, ttl_seconds=300)
+
+
+async def _command_count(client: Redis) -> int:
+    stats = await client.info("commandstats")
+    return sum(int(entry.get("calls", 0)) for entry in stats.values() if isinstance(entry, dict))
+
+
+async def _admit_current(limiter: RateLimiter, parts: list[str]) -> None:
+    lease = await limiter.acquire_concurrency(_SLOT, parts, rate_quotas=[(_RATE, parts)])
+    await lease.release()
+
+
+async def _admit_legacy(client: Redis, parts: list[str]) -> None:
+    suffix = ":".join(parts)
+    quota_key = f"bench-legacy:quota:{_RATE.name}:{suffix}"
+    slot_key = f"bench-legacy:concurrency:{_SLOT.name}:{suffix}"
+    if await client.incr(quota_key) == 1:
+        await client.expire(quota_key, _RATE.window_seconds)
+    await client.incr(slot_key)
+    await client.expire(slot_key, _SLOT.ttl_seconds)
+    if await client.decr(slot_key) <= 0:
+        await client.delete(slot_key)
+
+
+async def run(args: argparse.Namespace) -> None:
+    # Requests queue for a connection, as they do behind the app's pool, instead of
+    # failing with MaxConnectionsError once the offered load outruns the pool.
+    pool = BlockingConnectionPool.from_url(args.redis_url, max_connections=args.connections)
+    client = Redis(connection_pool=pool)
+    limiter = RateLimiter()
+    limiter.configure(redis=client, prefix="bench", owns_client=False)
+    await client.ping()
+
+    # Warm the connection pool and load the script so they are not measured.
+    await asyncio.gather(
+        *(_admit_current(limiter, ["warm", str(i)]) for i in range(args.connections))
+    )
+
+    latencies: list[float] = []
+    rejected = 0
+    tasks: set[asyncio.Task[None]] = set()
+    total = int(args.rps * args.duration)
+    interval = 1.0 / args.rps
+
+    async def _one(parts: list[str]) -> None:
+        nonlocal rejected
+        started = time.perf_counter()
+        try:
+            if args.mode == "legacy":
+                await _admit_legacy(client, parts)
+            else:
+                await _admit_current(limiter, parts)
+        except RateLimitExceeded:
+            rejected += 1
+        latencies.append(time.perf_counter() - started)
+
+    commands_before = await _command_count(client)
+    started = time.perf_counter()
+    for index in range(total):
+        target = started + index * interval
+        delay = target - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        parts = ["tenant", f"user-{random.randrange(args.users)}"]
+        task = asyncio.create_task(_one(parts))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - started
+    # The INFO call itself is counted once.
+    commands = await _command_count(client) - commands_before - 1
+
+    latencies.sort()
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(f"mode={args.mode} requests={total} rejected={rejected}")
+    print(f"achieved_rps={total / elapsed:,.0f} (target {args.rps:,})")
+    print(
+        "latency_ms "
+        f"p50={quantiles[49] * 1000:.3f} p95={quantiles[94] * 1000:.3f} "
+        f"p99={quantiles[98] * 1000:.3f} max={latencies[-1] * 1000:.3f}"
+    )
+    print(f"redis_commands_per_request={commands / total:.2f}")
+    await client.aclose()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark rate limiter overhead")
+    parser.add_argument("--redis-url", default="redis://localhost:6379/15")
+    parser.add_argument("--rps", type=int, default=5000, help="Offered requests per second")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds to run")
+    parser.add_argument("--users", type=int, default=1000, help="Distinct limiter identities")
+    parser.add_argument("--connections", type=int, default=50, help="Redis pool size")
+    parser.add_argument("--mode", choices=("current", "legacy"), default="current")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(run(parse_args()))
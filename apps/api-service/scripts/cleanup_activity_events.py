@@ -1,5 +1,10 @@
 """Delete aged activity_events rows based on configured TTL.
 
+On Postgres the table is range-partitioned by month, so whole expired
+partitions are dropped (or detached with ``--detach``) instead of deleting rows.
+Other databases fall back to batched deletes. Receipts whose event is gone are
+purged afterwards in both cases.
+
 Intended to be run via `just cleanup-activity-events` so env files are loaded.
 """
 
@@ -11,12 +16,18 @@ import logging
 from datetime import UTC, datetime, timedelta
 from typing import Sequence
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, exists, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.settings import get_settings
 from app.infrastructure.db import get_async_sessionmaker
-from app.infrastructure.persistence.activity.models import ActivityEventRow
+from app.infrastructure.persistence.activity.models import ActivityEventRow, ActivityReceiptRow
+from app.infrastructure.persistence.partitions import (
+    ACTIVITY_EVENTS,
+    drop_expired_partitions,
+    ensure_partitions,
+    is_partitioned,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -39,8 +50,59 @@ async def _delete_batch(session: AsyncSession, cutoff: datetime, batch_size: int
     return len(ids)
 
 
-async def run_cleanup(ttl_days: int, batch_size: int, sleep_ms: int, dry_run: bool) -> None:
-    cutoff = datetime.now(UTC) - timedelta(days=ttl_days)
+async def _purge_orphan_receipts(session: AsyncSession) -> int:
+    result = await session.execute(
+        delete(ActivityReceiptRow).where(
+            ~exists().where(ActivityEventRow.id == ActivityReceiptRow.event_id)
+        )
+    )
+    await session.commit()
+    return int(getattr(result, "rowcount", 0) or 0)
+
+
+async def _drop_partitions(
+    session: AsyncSession,
+    *,
+    now: datetime,
+    cutoff: datetime,
+    months_ahead: int,
+    detach: bool,
+    dry_run: bool,
+) -> None:
+    if not dry_run:
+        created = await ensure_partitions(
+            session, ACTIVITY_EVENTS, now=now, months_ahead=months_ahead
+        )
+        if created:
+            logger.info(
+                "cleanup_activity_events.partitions_created", extra={"partitions": created}
+            )
+    dropped = await drop_expired_partitions(
+        session, ACTIVITY_EVENTS, cutoff=cutoff, detach=detach, dry_run=dry_run
+    )
+    logger.info(
+        "cleanup_activity_events.dry_run"
+        if dry_run
+        else "cleanup_activity_events.partitions_removed",
+        extra={
+            "partitions": dropped,
+            "detach": detach,
+            "cutoff": cutoff.isoformat(),
+        },
+    )
+
+
+async def run_cleanup(
+    ttl_days: int,
+    batch_size: int,
+    sleep_ms: int,
+    dry_run: bool,
+    *,
+    detach: bool = False,
+    months_ahead: int = 3,
+) -> None:
+    now = datetime.now(UTC)
+    cutoff = now - timedelta(days=ttl_days)
     session_factory = get_async_sessionmaker()
 
     logger.info(
@@ -49,6 +111,20 @@ async def run_cleanup(ttl_days: int, batch_size: int, sleep_ms: int, dry_run: bo
     )
 
     async with session_factory() as session:
+        if await is_partitioned(session, ACTIVITY_EVENTS.name):
+            await _drop_partitions(
+                session,
+                now=now,
+                cutoff=cutoff,
+                months_ahead=months_ahead,
+                detach=detach,
+                dry_run=dry_run,
+            )
+            if not dry_run:
+                purged = await _purge_orphan_receipts(session)
+                logger.info("cleanup_activity_events.complete", extra={"receipts_purged": purged})
+            return
+
         total_deleted = 0
         while True:
             if dry_run:
@@ -76,7 +152,12 @@ async def run_cleanup(ttl_days: int, batch_size: int, sleep_ms: int, dry_run: bo
             if sleep_ms:
                 await asyncio.sleep(sleep_ms / 1000)
 
-    logger.info("cleanup_activity_events.complete", extra={"total_deleted": total_deleted})
+        purged = 0 if dry_run else await _purge_orphan_receipts(session)
+
+    logger.info(
+        "cleanup_activity_events.complete",
+        extra={"total_deleted": total_deleted, "receipts_purged": purged},
+    )
 
 
 def parse_args() -> argparse.Namespace:
@@ -90,6 +171,11 @@ def parse_args() -> argparse.Namespace:
         help="Sleep milliseconds between batches",
     )
     parser.add_argument("--dry-run", action="store_true", help="Do not delete, just count")
+    parser.add_argument(
+        "--detach",
+        action="store_true",
+        help="Detach expired partitions instead of dropping them (Postgres only)",
+    )
     return parser.parse_args()
 
 
@@ -107,7 +193,16 @@ def main() -> None:
         else settings.activity_events_cleanup_sleep_ms
     )
 
-    asyncio.run(run_cleanup(ttl_days, batch_size, sleep_ms, args.dry_run))
+    asyncio.run(
+        run_cleanup(
+            ttl_days,
+            batch_size,
+            sleep_ms,
+            args.dry_run,
+            detach=args.detach,
+            months_ahead=settings.event_partitions_months_ahead,
+        )
+    )
 
 
 if __name__ == "__main__":  # pragma: no cover - manual utility
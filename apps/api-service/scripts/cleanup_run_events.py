@@ -1,5 +1,10 @@
 """Delete aged agent_run_events rows based on configured TTL.
 
+On Postgres the table is range-partitioned by month, so whole expired
+partitions are dropped (or detached with ``--detach``) instead of deleting rows.
+Other databases fall back to batched deletes. Either way the matching
+``agent_run_event_keys`` rows are purged too.
+
 Intended to be run via `just cleanup-run-events` so env files are loaded.
 """
 
@@ -16,7 +21,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.settings import get_settings
 from app.infrastructure.db import get_async_sessionmaker
-from app.infrastructure.persistence.conversations.models import AgentRunEvent
+from app.infrastructure.persistence.conversations.models import AgentRunEvent, AgentRunEventKey
+from app.infrastructure.persistence.partitions import (
+    RUN_EVENTS,
+    drop_expired_partitions,
+    ensure_partitions,
+    is_partitioned,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -39,8 +50,54 @@ async def _delete_batch(session: AsyncSession, cutoff: datetime, batch_size: int
     return len(ids)
 
 
-async def run_cleanup(ttl_days: int, batch_size: int, sleep_ms: int, dry_run: bool) -> None:
-    cutoff = datetime.now(UTC) - timedelta(days=ttl_days)
+async def _delete_keys(session: AsyncSession, cutoff: datetime) -> None:
+    await session.execute(delete(AgentRunEventKey).where(AgentRunEventKey.ingested_at < cutoff))
+    await session.commit()
+
+
+async def _drop_partitions(
+    session: AsyncSession,
+    *,
+    now: datetime,
+    cutoff: datetime,
+    months_ahead: int,
+    detach: bool,
+    dry_run: bool,
+    batch_size: int,
+) -> None:
+    if not dry_run:
+        created = await ensure_partitions(session, RUN_EVENTS, now=now, months_ahead=months_ahead)
+        if created:
+            logger.info("cleanup_run_events.partitions_created", extra={"partitions": created})
+    dropped = await drop_expired_partitions(
+        session,
+        RUN_EVENTS,
+        cutoff=cutoff,
+        detach=detach,
+        dry_run=dry_run,
+        batch_size=batch_size,
+    )
+    logger.info(
+        "cleanup_run_events.dry_run" if dry_run else "cleanup_run_events.partitions_removed",
+        extra={
+            "partitions": dropped,
+            "detach": detach,
+            "cutoff": cutoff.isoformat(),
+        },
+    )
+
+
+async def run_cleanup(
+    ttl_days: int,
+    batch_size: int,
+    sleep_ms: int,
+    dry_run: bool,
+    *,
+    detach: bool = False,
+    months_ahead: int = 3,
+) -> None:
+    now = datetime.now(UTC)
+    cutoff = now - timedelta(days=ttl_days)
     session_factory = get_async_sessionmaker()
 
     logger.info(
@@ -49,6 +106,18 @@ async def run_cleanup(ttl_days: int, batch_size: int, sleep_ms: int, dry_run: bo
     )
 
     async with session_factory() as session:
+        if await is_partitioned(session, RUN_EVENTS.name):
+            await _drop_partitions(
+                session,
+                now=now,
+                cutoff=cutoff,
+                months_ahead=months_ahead,
+                detach=detach,
+                dry_run=dry_run,
+                batch_size=batch_size,
+            )
+            return
+
         total_deleted = 0
         while True:
             if dry_run:
@@ -67,6 +136,7 @@ async def run_cleanup(ttl_days: int, batch_size: int, sleep_ms: int, dry_run: bo
 
             deleted = await _delete_batch(session, cutoff, batch_size)
             if deleted == 0:
+                await _delete_keys(session, cutoff)
                 break
             total_deleted += deleted
             logger.info(
@@ -90,6 +160,11 @@ def parse_args() -> argparse.Namespace:
         help="Sleep milliseconds between batches",
     )
     parser.add_argument("--dry-run", action="store_true", help="Do not delete, just count")
+    parser.add_argument(
+        "--detach",
+        action="store_true",
+        help="Detach expired partitions instead of dropping them (Postgres only)",
+    )
     return parser.parse_args()
 
 
@@ -105,7 +180,16 @@ def main() -> None:
         args.sleep_ms if args.sleep_ms is not None else settings.run_events_cleanup_sleep_ms
     )
 
-    asyncio.run(run_cleanup(ttl_days, batch_size, sleep_ms, args.dry_run))
+    asyncio.run(
+        run_cleanup(
+            ttl_days,
+            batch_size,
+            sleep_ms,
+            args.dry_run,
+            detach=args.detach,
+            months_ahead=settings.event_partitions_months_ahead,
+        )
+    )
 
 
 if __name__ == "__main__":  # pragma: no cover - manual utility
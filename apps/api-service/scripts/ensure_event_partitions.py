@@ -0,0 +1,71 @@
+"""Pre-create upcoming monthly partitions for the partitioned event tables.
+
+Covers agent_run_events, conversation_ledger_events and activity_events. The
+leader-elected ``event-partitions`` background job and the cleanup jobs already
+do this; run the script by hand after a long outage or before a bulk import.
+No-op on databases without partitioned tables.
+
+Intended to be run via `just ensure-event-partitions` so env files are loaded.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+from datetime import UTC, datetime
+
+from app.core.settings import get_settings
+from app.infrastructure.db import get_async_sessionmaker
+from app.infrastructure.persistence.partitions import (
+    PARTITIONED_TABLES,
+    ensure_partitions,
+    is_partitioned,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def run(months_ahead: int) -> None:
+    now = datetime.now(UTC)
+    session_factory = get_async_sessionmaker()
+
+    async with session_factory() as session:
+        for table in PARTITIONED_TABLES:
+            if not await is_partitioned(session, table.name):
+                logger.info("ensure_event_partitions.skipped", extra={"table": table.name})
+                continue
+            created = await ensure_partitions(
+                session, table, now=now, months_ahead=months_ahead
+            )
+            logger.info(
+                "ensure_event_partitions.ensured",
+                extra={"table": table.name, "created": created},
+            )
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Pre-create monthly event partitions")
+    parser.add_argument(
+        "--months-ahead",
+        type=int,
+        default=None,
+        help="Months to create beyond the current one (override settings)",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    settings = get_settings()
+    months_ahead = (
+        args.months_ahead
+        if args.months_ahead is not None
+        else settings.event_partitions_months_ahead
+    )
+    asyncio.run(run(months_ahead))
+
+
+if __name__ == "__main__":  # pragma: no cover - manual utility
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any
 
 from openai.types.responses.web_search_tool_param import UserLocation
@@ -12,6 +13,12 @@ from app.services.agents.context import ConversationActorContext
 
 ContextProvider = Callable[["PromptRuntimeContext", Any], dict[str, Any]]
 
+# Shared trailer rendered after the prompt of agents that opt in through
+# ``AgentSpec.runtime_context``; only the listed sections are rendered. It carries the
+# per-user and per-run variables (ids, memory summary, date/time) so the agent prompt
+# itself renders byte-identically across turns and remains a cacheable prefix.
+RUNTIME_CONTEXT_PROMPT_PATH = Path(__file__).with_name("runtime_context.md.j2")
+
 
 @dataclass(slots=True)
 class ContainerOverrideContext:
@@ -170,6 +177,7 @@ def _datetime_provider(ctx: PromptRuntimeContext, spec) -> dict[str, Any]:  # pr
 __all__ = [
     "ContainerOverrideContext",
     "PromptRuntimeContext",
+    "RUNTIME_CONTEXT_PROMPT_PATH",
     "build_prompt_context",
     "register_context_provider",
 ]
@@ -13,6 +13,8 @@ from typing import Any, Literal
 
 from app.guardrails._shared.specs import AgentGuardrailConfig, ToolGuardrailConfig
 
+RuntimeContextSection = Literal["identity", "conversation", "memory", "datetime"]
+
 
 @dataclass(frozen=True, slots=True)
 class AgentSpec:
@@ -34,6 +36,10 @@ class AgentSpec:
     - `default` marks the default agent for the provider.
     - `wrap_with_handoff_prompt` optionally passes the prompt through the SDK
       handoff helper to prepend handoff instructions (useful for orchestrators).
+    - `runtime_context` opts the agent into sections of the per-run trailer appended
+      after its prompt (`_shared/runtime_context.md.j2`): "identity" (tenant and
+      user ids), "conversation" (conversation id), "memory" (compaction summary),
+      "datetime" (current date and time). Nothing is appended by default.
     - `tool_keys` is the ordered set of tool identifiers that will be attached
       to the concrete Agent instance (no implicit/default/core tools).
     - `handoff_context` optionally overrides how much history is forwarded to a
@@ -68,6 +74,7 @@ class AgentSpec:
     default: bool = False
     wrap_with_handoff_prompt: bool = False
     prompt_defaults: dict[str, Any] = field(default_factory=dict)
+    runtime_context: tuple[RuntimeContextSection, ...] = ()
     # Explicit tool assignment (mirrors Agents SDK: Agent(..., tools=[...])).
     tool_keys: tuple[str, ...] = ()
     # Optional per-tool configuration (e.g., {"code_interpreter": {"mode": "explicit"}}).
@@ -152,6 +159,7 @@ __all__ = [
     "OutputSpec",
     "AgentToolConfig",
     "GuardrailRuntimeOptions",
+    "RuntimeContextSection",
 ]
 
 
@@ -19,6 +19,7 @@ def get_agent_spec() -> AgentSpec:
         capabilities=("code", "analysis", "debugging"),
         tool_keys=("code_interpreter",),
         prompt_path=base_dir / "prompt.md.j2",
+        runtime_context=("conversation", "memory", "datetime"),
         memory_strategy={
             "mode": "compact",
             "max_user_turns": 10,
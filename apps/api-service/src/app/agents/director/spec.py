@@ -50,6 +50,7 @@ def get_agent_spec() -> AgentSpec:
             ),
         },
         prompt_path=base_dir / "prompt.md.j2",
+        runtime_context=("identity",),
         # Keep history lean for tool-style workflows.
         memory_strategy={
             "mode": "trim",
@@ -21,6 +21,7 @@ def get_agent_spec() -> AgentSpec:
             }
         },
         prompt_path=base_dir / "prompt.md.j2",
+        runtime_context=("datetime",),
         # Default to trim history if this agent ever receives handoffs.
         handoff_context={},
         memory_strategy={
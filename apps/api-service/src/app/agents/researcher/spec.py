@@ -16,6 +16,7 @@ def get_agent_spec() -> AgentSpec:
         # Web-first research and synthesis; code/image handled by other specialists.
         tool_keys=("web_search",),
         prompt_path=base_dir / "prompt.md.j2",
+        runtime_context=("datetime",),
         memory_strategy={
             "mode": "summarize",
             "max_user_turns": 12,
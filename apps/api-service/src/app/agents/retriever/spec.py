@@ -24,6 +24,7 @@ def get_agent_spec() -> AgentSpec:
             "ranking_options": {"score_threshold": 0.4},
         },
         prompt_path=base_dir / "prompt.md.j2",
+        runtime_context=("identity",),
         memory_strategy={
             "mode": "trim",
             "max_user_turns": 8,
@@ -113,8 +113,8 @@ async def _enforce_email_verification_quota(user_id: str, client_ip: str | None)
                 [client_ip],
             )
         )
-    for quota, keys in quotas:
-        try:
-            await rate_limiter.enforce(quota, keys)
-        except RateLimitExceeded as exc:
-            raise_rate_limit_http_error(exc, tenant_id="email-verification", user_id=keys[0])
+    try:
+        await rate_limiter.enforce_many(quotas)
+    except RateLimitExceeded as exc:
+        keys = next(parts for quota, parts in quotas if quota.name == exc.quota)
+        raise_rate_limit_http_error(exc, tenant_id="email-verification", user_id=keys[0])
@@ -197,11 +197,10 @@ async def _enforce_mfa_verify_quota(key: object, client_ip: str | None) -> None:
                 [client_ip],
             )
         )
-    for quota, keys in quotas:
-        try:
-            await rate_limiter.enforce(quota, keys)
-        except RateLimitExceeded as exc:
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail=str(exc),
-            ) from exc
+    try:
+        await rate_limiter.enforce_many(quotas)
+    except RateLimitExceeded as exc:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=str(exc),
+        ) from exc
@@ -209,8 +209,8 @@ async def _enforce_password_reset_quota(email: str, client_ip: str | None) -> No
                 [client_ip],
             )
         )
-    for quota, keys in quotas:
-        try:
-            await rate_limiter.enforce(quota, keys)
-        except RateLimitExceeded as exc:
-            raise_rate_limit_http_error(exc, tenant_id="password-reset", user_id=keys[0])
+    try:
+        await rate_limiter.enforce_many(quotas)
+    except RateLimitExceeded as exc:
+        keys = next(parts for quota, parts in quotas if quota.name == exc.quota)
+        raise_rate_limit_http_error(exc, tenant_id="password-reset", user_id=keys[0])
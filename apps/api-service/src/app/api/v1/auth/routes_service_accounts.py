@@ -6,6 +6,7 @@ import base64
 import hashlib
 import json
 from datetime import UTC, datetime
+from time import perf_counter
 from typing import Any
 
 from fastapi import APIRouter, Depends, Header, HTTPException, status
@@ -19,9 +20,16 @@ from app.api.models.auth import (
 from app.domain.secrets import SecretPurpose
 from app.infrastructure.secrets import get_secret_provider
 from app.infrastructure.security.nonce_store import get_nonce_store
-from app.infrastructure.security.vault import VaultClientUnavailable, VaultVerificationError
+from app.infrastructure.security.vault import (
+    VaultClientUnavailable,
+    VaultVerificationError,
+    get_vault_verification_cache,
+)
 from app.observability.logging import log_event
-from app.observability.metrics import record_nonce_cache_result
+from app.observability.metrics import (
+    observe_service_account_vault_verification,
+    record_nonce_cache_result,
+)
 from app.services.auth_service import (
     ServiceAccountCatalogUnavailable,
     ServiceAccountRateLimitError,
@@ -161,15 +169,37 @@ async def _validate_vault_payload(
             detail="Vault verification disabled; cannot accept vault credentials.",
         )
 
-    await _verify_vault_signature(authorization, payload_bytes)
+    await _verify_vault_signature(authorization, payload_bytes, claims=claims)
 
     await _enforce_nonce(claims)
     _enforce_timestamps(claims)
     return claims
 
 
-async def _verify_vault_signature(authorization: str, payload_bytes: bytes) -> None:
+async def _verify_vault_signature(
+    authorization: str, payload_bytes: bytes, *, claims: dict[str, Any] | None = None
+) -> None:
     signature = _extract_signature(authorization)
+    account = claims.get("account") if claims else None
+    started = perf_counter()
+
+    # Retried issuance calls resend the same envelope; skip Transit if Vault already
+    # accepted it recently. Nonce and timestamp checks below still run every time.
+    cache = get_vault_verification_cache()
+    digest = cache.digest(payload_bytes, signature)
+    if cache.enabled and cache.contains(digest):
+        observe_service_account_vault_verification(
+            account=account,
+            result="success",
+            cached=True,
+            duration_seconds=perf_counter() - started,
+        )
+        log_event(
+            "vault_signature_verify",
+            result="success",
+            reason="cached",
+        )
+        return
 
     try:
         provider = get_secret_provider()
@@ -193,6 +223,7 @@ async def _verify_vault_signature(authorization: str, payload_bytes: bytes) -> N
             purpose=SecretPurpose.SERVICE_ACCOUNT_ISSUANCE,
         )
     except VaultVerificationError as exc:
+        _observe_verification(account, "error", started)
         log_event(
             "vault_signature_verify",
             level="error",
@@ -205,6 +236,7 @@ async def _verify_vault_signature(authorization: str, payload_bytes: bytes) -> N
             detail=f"Vault verification failed: {exc}",
         ) from exc
     except RuntimeError as exc:
+        _observe_verification(account, "error", started)
         log_event(
             "vault_signature_verify",
             level="error",
@@ -218,6 +250,7 @@ async def _verify_vault_signature(authorization: str, payload_bytes: bytes) -> N
         ) from exc
 
     if not valid:
+        _observe_verification(account, "failure", started)
         log_event(
             "vault_signature_verify",
             level="warning",
@@ -228,6 +261,11 @@ async def _verify_vault_signature(authorization: str, payload_bytes: bytes) -> N
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid Vault signature.",
         )
+    _observe_verification(account, "success", started)
+    if cache.enabled:
+        exp = _numeric_date(claims.get("exp")) if claims else None
+        remaining = exp - datetime.now(UTC).timestamp() if exp is not None else None
+        cache.add(digest, ttl_seconds=remaining)
     log_event(
         "vault_signature_verify",
         result="success",
@@ -235,6 +273,23 @@ async def _verify_vault_signature(authorization: str, payload_bytes: bytes) -> N
     )
 
 
+def _numeric_date(value: Any) -> float | None:
+    """Return a JWT NumericDate claim (integer or fractional seconds), else ``None``."""
+
+    if isinstance(value, bool) or not isinstance(value, int | float):
+        return None
+    return float(value)
+
+
+def _observe_verification(account: str | None, result: str, started: float) -> None:
+    observe_service_account_vault_verification(
+        account=account,
+        result=result,
+        cached=False,
+        duration_seconds=perf_counter() - started,
+    )
+
+
 async def _enforce_nonce(claims: dict[str, Any]) -> None:
     nonce = claims.get("nonce")
     if not isinstance(nonce, str) or not nonce.strip():
@@ -243,15 +298,15 @@ async def _enforce_nonce(claims: dict[str, Any]) -> None:
             detail="Vault payload missing nonce.",
         )
 
-    exp = claims.get("exp")
-    if not isinstance(exp, int):
+    exp = _numeric_date(claims.get("exp"))
+    if exp is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Vault payload missing exp.",
         )
 
     now = datetime.now(UTC)
-    ttl_seconds = exp - int(now.timestamp())
+    ttl_seconds = int(exp - now.timestamp())
     if ttl_seconds <= 0:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
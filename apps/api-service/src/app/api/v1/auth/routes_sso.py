@@ -206,11 +206,10 @@ async def _enforce_sso_start_quota(
                 [client_ip, provider],
             )
         )
-    for quota, keys in quotas:
-        try:
-            await rate_limiter.enforce(quota, keys)
-        except RateLimitExceeded as exc:
-            raise_rate_limit_http_error(exc, tenant_id=tenant_scope)
+    try:
+        await rate_limiter.enforce_many(quotas)
+    except RateLimitExceeded as exc:
+        raise_rate_limit_http_error(exc, tenant_id=tenant_scope)
 
 
 async def _enforce_sso_callback_quota(*, provider_key: str, client_ip: str | None) -> None:
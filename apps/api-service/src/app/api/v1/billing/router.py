@@ -601,20 +601,17 @@ async def billing_event_stream(
     settings = get_settings()
 
     service = get_billing_events_service()
-    await _enforce_tenant_quota(
-        quota=RateLimitQuota(
-            name="billing_stream_per_minute",
-            limit=settings.billing_stream_rate_limit_per_minute,
-            window_seconds=60,
-            scope="tenant",
-        ),
-        context=context,
-    )
     stream_lease = await _acquire_tenant_stream_slot(
         quota=ConcurrencyQuota(
             name="billing_stream_concurrency",
             limit=settings.billing_stream_concurrent_limit,
-            ttl_seconds=300,
+            ttl_seconds=15,
+            scope="tenant",
+        ),
+        rate_quota=RateLimitQuota(
+            name="billing_stream_per_minute",
+            limit=settings.billing_stream_rate_limit_per_minute,
+            window_seconds=60,
             scope="tenant",
         ),
         context=context,
@@ -650,24 +647,16 @@ async def billing_event_stream(
     return StreamingResponse(event_generator(), media_type="text/event-stream")
 
 
-async def _enforce_tenant_quota(quota: RateLimitQuota, context: TenantContext) -> None:
-    if quota.limit <= 0:
-        return
-    tenant_id = context.tenant_id
-    try:
-        await rate_limiter.enforce(quota, [tenant_id])
-    except RateLimitExceeded as exc:
-        raise_rate_limit_http_error(exc, tenant_id=tenant_id, user_id=context.user.get("user_id"))
-
-
 async def _acquire_tenant_stream_slot(
     quota: ConcurrencyQuota,
+    *,
+    rate_quota: RateLimitQuota,
     context: TenantContext,
 ) -> RateLimitLease:
-    if quota.limit <= 0:
-        return RateLimitLease(None, None)
     tenant_id = context.tenant_id
     try:
-        return await rate_limiter.acquire_concurrency(quota, [tenant_id])
+        return await rate_limiter.acquire_concurrency(
+            quota, [tenant_id], rate_quotas=[(rate_quota, [tenant_id])]
+        )
     except RateLimitExceeded as exc:
         raise_rate_limit_http_error(exc, tenant_id=tenant_id, user_id=context.user.get("user_id"))
@@ -4,7 +4,7 @@ import logging
 from collections.abc import AsyncIterator
 from datetime import UTC, datetime
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
 from fastapi.responses import StreamingResponse
 
 from app.api.dependencies import raise_rate_limit_http_error
@@ -16,6 +16,13 @@ from app.api.v1.shared.public_stream_projector import PublicStreamProjector
 from app.core.settings import get_settings
 from app.domain.input_attachments import InputAttachmentNotFoundError
 from app.services.agents import AgentService, ConversationActorContext, get_agent_service
+from app.services.agents.detached_runs import (
+    ChatRun,
+    ChatRunExpiredError,
+    ChatRunNotFoundError,
+    ChatRunStreamEntry,
+    get_chat_run_manager,
+)
 from app.services.conversations.ledger_recorder import get_conversation_ledger_recorder
 from app.services.shared.rate_limit_service import (
     ConcurrencyQuota,
@@ -37,7 +44,23 @@ logger = logging.getLogger(__name__)
 
 
 STREAM_EVENT_RESPONSE = {
-    "description": "Server-sent events stream of agent outputs.",
+    "description": (
+        "Server-sent events stream of agent outputs. Each frame carries an `id`; the "
+        "`X-Chat-Run-Id` header names the run to resume after a disconnect."
+    ),
+    "model": StreamingChatEvent,
+    "content": {
+        "text/event-stream": {
+            "schema": {"$ref": "#/components/schemas/StreamingChatEvent"}
+        }
+    },
+}
+
+RUN_STREAM_RESPONSE = {
+    "description": (
+        "Server-sent events stream of a chat run, resumed after the event id sent as "
+        "`Last-Event-ID` (or `cursor`)."
+    ),
     "model": StreamingChatEvent,
     "content": {
         "text/event-stream": {
@@ -97,12 +120,22 @@ async def stream_chat_with_agent(
     _: object = Depends(enforce_usage_guardrails),
     agent_service: AgentService = Depends(get_agent_service),
 ) -> StreamingResponse:
-    """Provide an SSE stream for real-time agent responses."""
+    """Provide an SSE stream for real-time agent responses.
+
+    The run executes detached from this connection. Each frame carries an `id`; after a
+    disconnect, resume from `GET /chat/runs/{run_id}/stream` with `Last-Event-ID`.
+    """
 
     actor = _conversation_actor(current_user, tenant_context)
     settings = get_settings()
-    await _enforce_user_quota(
-        quota=RateLimitQuota(
+    stream_lease = await _acquire_stream_slot(
+        quota=ConcurrencyQuota(
+            name="chat_stream_concurrency",
+            limit=settings.chat_stream_concurrent_limit,
+            ttl_seconds=15,
+            scope="user",
+        ),
+        rate_quota=RateLimitQuota(
             name="chat_stream_per_minute",
             limit=settings.chat_stream_rate_limit_per_minute,
             window_seconds=60,
@@ -111,113 +144,158 @@ async def stream_chat_with_agent(
         tenant_id=tenant_context.tenant_id,
         user_id=actor.user_id,
     )
-    stream_lease = await _acquire_stream_slot(
-        quota=ConcurrencyQuota(
-            name="chat_stream_concurrency",
-            limit=settings.chat_stream_concurrent_limit,
-            ttl_seconds=300,
-            scope="user",
+
+    run_id = PublicStreamProjector.new_stream_id(prefix="chat")
+    manager = get_chat_run_manager()
+    await manager.start(
+        ChatRun(run_id=run_id, tenant_id=actor.tenant_id, user_id=actor.user_id),
+        _project_chat_run(
+            request,
+            actor=actor,
+            agent_service=agent_service,
+            stream_lease=stream_lease,
+            stream_id=run_id,
         ),
-        tenant_id=tenant_context.tenant_id,
-        user_id=actor.user_id,
     )
+    return _chat_run_response(await manager.events(run_id), run_id=run_id)
 
-    async def _event_stream() -> AsyncIterator[str]:
-        async with stream_lease:
-            projector = PublicStreamProjector(
-                stream_id=PublicStreamProjector.new_stream_id(prefix="chat")
-            )
-            ledger_recorder = get_conversation_ledger_recorder()
-            last_heartbeat = datetime.now(tz=UTC)
-            last_conversation_id = request.conversation_id or "unknown"
-            last_response_id: str | None = None
-            last_agent = request.agent_type
-            terminal_sent = False
-            try:
-                async for event in agent_service.chat_stream(request, actor=actor):
-                    if event.conversation_id and event.scope is None:
-                        last_conversation_id = event.conversation_id
-                    if event.response_id and event.scope is None:
-                        last_response_id = event.response_id
-                    if event.agent and event.scope is None:
-                        last_agent = event.agent
-
-                    now_iso = datetime.now(tz=UTC).isoformat().replace("+00:00", "Z")
-                    public_events = projector.project(
-                        event,
-                        conversation_id=last_conversation_id,
-                        response_id=last_response_id,
-                        agent=last_agent,
-                        workflow_meta=None,
-                        server_timestamp=now_iso,
-                    )
-                    if not terminal_sent:
-                        try:
-                            await ledger_recorder.record_public_events(
-                                tenant_id=tenant_context.tenant_id,
-                                conversation_id=last_conversation_id,
-                                events=public_events,
-                            )
-                        except Exception:
-                            logger.exception(
-                                "chat.stream.ledger_persist_failed",
-                                extra={
-                                    "conversation_id": last_conversation_id,
-                                    "agent": last_agent,
-                                },
-                            )
-                        for ev in public_events:
-                            yield f"data: {ev.model_dump_json(by_alias=True)}\n\n"
-                        if any(
-                            getattr(ev, "kind", None) in {"final", "error"}
-                            for ev in public_events
-                        ):
-                            # Keep draining the upstream generator so it can persist the assistant
-                            # message + finalize side effects, but stop emitting to the client.
-                            terminal_sent = True
-                            continue
-
-                        now = datetime.now(tz=UTC)
-                        if (now - last_heartbeat).total_seconds() >= 15:
-                            last_heartbeat = now
-                            yield f": heartbeat {now.isoformat().replace('+00:00', 'Z')}\n\n"
-            except Exception as exc:
-                logger.exception(
-                    "chat.stream.serialization_error",
-                    extra={
-                        "conversation_id": last_conversation_id,
-                        "agent": last_agent,
-                        "error": str(exc),
-                    },
-                )
-                if terminal_sent:
-                    return
-                error_event = projector.project_error(
+
+@router.get("/runs/{run_id}/stream", responses={200: RUN_STREAM_RESPONSE})
+async def resume_chat_stream(
+    run_id: str,
+    cursor: str | None = Query(
+        None, description="Resume after this event id (overrides Last-Event-ID)."
+    ),
+    last_event_id: str | None = Header(default=None, alias="Last-Event-ID"),
+    current_user: CurrentUser = Depends(require_verified_scopes("conversations:read")),
+    tenant_context: TenantContext = Depends(require_tenant_role(*_ALLOWED_VIEWER_ROLES)),
+) -> StreamingResponse:
+    """Reattach to a chat run's stream, starting after the last event the client saw."""
+
+    actor = _conversation_actor(current_user, tenant_context)
+    manager = get_chat_run_manager()
+    try:
+        await manager.get_run(run_id, tenant_id=actor.tenant_id, user_id=actor.user_id)
+        entries = await manager.events(run_id, after=cursor or last_event_id)
+    except ChatRunNotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    except ChatRunExpiredError as exc:
+        raise HTTPException(status_code=status.HTTP_410_GONE, detail=str(exc)) from exc
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return _chat_run_response(entries, run_id=run_id)
+
+
+async def _project_chat_run(
+    request: AgentChatRequest,
+    *,
+    actor: ConversationActorContext,
+    agent_service: AgentService,
+    stream_lease: RateLimitLease,
+    stream_id: str,
+) -> AsyncIterator[str]:
+    """Drive the agent and yield serialized public frames for the detached run."""
+
+    async with stream_lease:
+        projector = PublicStreamProjector(stream_id=stream_id)
+        ledger_recorder = get_conversation_ledger_recorder()
+        last_conversation_id = request.conversation_id or "unknown"
+        last_response_id: str | None = None
+        last_agent = request.agent_type
+        terminal_sent = False
+        try:
+            async for event in agent_service.chat_stream(request, actor=actor):
+                if event.conversation_id and event.scope is None:
+                    last_conversation_id = event.conversation_id
+                if event.response_id and event.scope is None:
+                    last_response_id = event.response_id
+                if event.agent and event.scope is None:
+                    last_agent = event.agent
+
+                now_iso = datetime.now(tz=UTC).isoformat().replace("+00:00", "Z")
+                public_events = projector.project(
+                    event,
                     conversation_id=last_conversation_id,
                     response_id=last_response_id,
                     agent=last_agent,
                     workflow_meta=None,
-                    code=None,
-                    message=str(exc),
-                    source="server",
-                    is_retryable=False,
-                    server_timestamp=datetime.now(tz=UTC).isoformat().replace("+00:00", "Z"),
+                    server_timestamp=now_iso,
                 )
+                if terminal_sent:
+                    continue
                 try:
                     await ledger_recorder.record_public_events(
-                        tenant_id=tenant_context.tenant_id,
+                        tenant_id=actor.tenant_id,
                         conversation_id=last_conversation_id,
-                        events=[error_event],
+                        events=public_events,
                     )
                 except Exception:
                     logger.exception(
-                        "chat.stream.ledger_error_event_persist_failed",
+                        "chat.stream.ledger_persist_failed",
                         extra={
                             "conversation_id": last_conversation_id,
                             "agent": last_agent,
                         },
                     )
-                yield f"data: {error_event.model_dump_json(by_alias=True)}\n\n"
+                for ev in public_events:
+                    yield ev.model_dump_json(by_alias=True)
+                if any(
+                    getattr(ev, "kind", None) in {"final", "error"} for ev in public_events
+                ):
+                    # Keep draining the upstream generator so it can persist the assistant
+                    # message + finalize side effects, but stop emitting to the client.
+                    terminal_sent = True
+        except Exception as exc:
+            logger.exception(
+                "chat.stream.serialization_error",
+                extra={
+                    "conversation_id": last_conversation_id,
+                    "agent": last_agent,
+                    "error": str(exc),
+                },
+            )
+            if terminal_sent:
+                return
+            error_event = projector.project_error(
+                conversation_id=last_conversation_id,
+                response_id=last_response_id,
+                agent=last_agent,
+                workflow_meta=None,
+                code=None,
+                message=str(exc),
+                source="server",
+                is_retryable=False,
+                server_timestamp=datetime.now(tz=UTC).isoformat().replace("+00:00", "Z"),
+            )
+            try:
+                await ledger_recorder.record_public_events(
+                    tenant_id=actor.tenant_id,
+                    conversation_id=last_conversation_id,
+                    events=[error_event],
+                )
+            except Exception:
+                logger.exception(
+                    "chat.stream.ledger_error_event_persist_failed",
+                    extra={
+                        "conversation_id": last_conversation_id,
+                        "agent": last_agent,
+                    },
+                )
+            yield error_event.model_dump_json(by_alias=True)
+
+
+def _chat_run_response(
+    entries: AsyncIterator[ChatRunStreamEntry | None], *, run_id: str
+) -> StreamingResponse:
+    async def _event_stream() -> AsyncIterator[str]:
+        last_heartbeat = datetime.now(tz=UTC)
+        async for entry in entries:
+            if entry is not None:
+                yield f"id: {entry.entry_id}\ndata: {entry.data}\n\n"
+            now = datetime.now(tz=UTC)
+            if (now - last_heartbeat).total_seconds() >= 15:
+                last_heartbeat = now
+                yield f": heartbeat {now.isoformat().replace('+00:00', 'Z')}\n\n"
 
     headers = {
         "Cache-Control": "no-cache",
@@ -225,6 +303,7 @@ async def stream_chat_with_agent(
         "Content-Type": "text/event-stream",
         "Access-Control-Allow-Origin": "*",
         "Access-Control-Allow-Headers": "*",
+        "X-Chat-Run-Id": run_id,
     }
 
     return StreamingResponse(
@@ -244,12 +323,17 @@ async def _enforce_user_quota(quota: RateLimitQuota, *, tenant_id: str, user_id:
 
 
 async def _acquire_stream_slot(
-    quota: ConcurrencyQuota, *, tenant_id: str, user_id: str
+    quota: ConcurrencyQuota,
+    *,
+    rate_quota: RateLimitQuota,
+    tenant_id: str,
+    user_id: str,
 ) -> RateLimitLease:
-    if quota.limit <= 0:
-        return RateLimitLease(None, None)
+    key_parts = [tenant_id, user_id]
     try:
-        return await rate_limiter.acquire_concurrency(quota, [tenant_id, user_id])
+        return await rate_limiter.acquire_concurrency(
+            quota, key_parts, rate_quotas=[(rate_quota, key_parts)]
+        )
     except RateLimitExceeded as exc:
         raise_rate_limit_http_error(exc, tenant_id=tenant_id, user_id=user_id)
 
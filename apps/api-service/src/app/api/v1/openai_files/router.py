@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import logging
+import re
 import uuid
+from collections.abc import AsyncIterator
+from contextlib import AsyncExitStack
 from typing import Any, cast
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import Response
-from openai import AsyncOpenAI
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from fastapi.responses import Response, StreamingResponse
+from openai import APIStatusError, AsyncOpenAI
+from starlette.background import BackgroundTask
 
 from app.api.dependencies.auth import CurrentUser, require_verified_user
 from app.api.dependencies.tenant import TenantContext, TenantRole, require_tenant_role
@@ -35,6 +39,10 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/openai", tags=["openai-files"])
 
+# Single byte-range requests only; anything else is ignored and served in full (RFC 9110).
+_RANGE_PATTERN = re.compile(r"^bytes=(\d+-\d*|-\d+)$")
+_PASSTHROUGH_HEADERS = ("Content-Length", "Content-Range", "Accept-Ranges")
+
 
 def _client() -> AsyncOpenAI:
     settings = get_settings()
@@ -75,6 +83,7 @@ def _ledger_query_store() -> ConversationLedgerQueryStore:
 @router.get("/files/{file_id}/download")
 async def download_openai_file(
     file_id: str,
+    range_header: str | None = Header(default=None, alias="Range"),
     _: CurrentUser = Depends(require_verified_user()),
     tenant_context: TenantContext = Depends(
         require_tenant_role(
@@ -98,9 +107,33 @@ async def download_openai_file(
             detail="File not found",
         ) from None
 
+    extra_headers: dict[str, str] = {}
+    if range_header and _RANGE_PATTERN.match(range_header.strip()):
+        extra_headers["Range"] = range_header.strip()
+
+    # Keep the upstream response open for the lifetime of our streamed body so the
+    # file is piped through in bounded chunks instead of buffered in worker memory.
+    stack = AsyncExitStack()
     try:
-        resp = await cast(Any, client).files.content(file_id)
+        resp = await stack.enter_async_context(
+            cast(Any, client).files.with_streaming_response.content(
+                file_id, extra_headers=extra_headers or None
+            )
+        )
+    except APIStatusError as exc:
+        await stack.aclose()
+        if exc.status_code == status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE:
+            raise HTTPException(
+                status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                detail="Requested range not satisfiable",
+            ) from exc
+        logger.warning("openai.file_download.failed", exc_info=exc, extra={"file_id": file_id})
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail="Failed to fetch file from OpenAI",
+        ) from exc
     except Exception as exc:  # pragma: no cover - network/runtime errors
+        await stack.aclose()
         logger.warning("openai.file_download.failed", exc_info=exc, extra={"file_id": file_id})
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
@@ -108,14 +141,31 @@ async def download_openai_file(
         ) from exc
 
     filename = getattr(resp, "filename", None) or f"{file_id}.bin"
-    content_bytes = await resp.aread()
-    return Response(
-        content=content_bytes,
+    headers = {
+        "Content-Disposition": f'attachment; filename="{filename}"',
+        "Cache-Control": "private, max-age=300",
+    }
+    for name in _PASSTHROUGH_HEADERS:
+        value = resp.headers.get(name)
+        if value:
+            headers[name] = value
+    chunk_size = get_settings().storage_stream_chunk_bytes
+
+    async def _body() -> AsyncIterator[bytes]:
+        try:
+            async for chunk in resp.iter_bytes(chunk_size):
+                yield chunk
+        finally:
+            await stack.aclose()
+
+    # The background task also closes the upstream response when the client goes away
+    # before the body starts; closing the stack twice is a no-op.
+    return StreamingResponse(
+        _body(),
+        status_code=resp.status_code,
         media_type="application/octet-stream",
-        headers={
-            "Content-Disposition": f'attachment; filename="{filename}"',
-            "Cache-Control": "private, max-age=300",
-        },
+        headers=headers,
+        background=BackgroundTask(stack.aclose),
     )
 
 
@@ -3,15 +3,15 @@
 from __future__ import annotations
 
 import logging
+from collections import deque
 from datetime import UTC, datetime
 from typing import Any, cast
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, status
 from fastapi.responses import StreamingResponse
 
 from app.api.dependencies.auth import CurrentUser, require_verified_scopes
 from app.api.dependencies.tenant import TenantContext
-from app.api.v1.shared.public_stream_projector import PublicStreamProjector
 from app.api.v1.shared.streaming import MessageAttachment
 from app.api.v1.workflows.dependencies import (
     require_workflow_admin_role,
@@ -23,6 +23,7 @@ from app.api.v1.workflows.schemas import (
     WorkflowListResponse,
     WorkflowRunCancelResponse,
     WorkflowRunDetail,
+    WorkflowRunDispatchResponse,
     WorkflowRunListItem,
     WorkflowRunListResponse,
     WorkflowRunRequestBody,
@@ -37,8 +38,8 @@ from app.domain.workflows import WorkflowStatus
 from app.services.agents.container_overrides import ContainerOverrideError
 from app.services.agents.context import ConversationActorContext
 from app.services.agents.vector_store_overrides import VectorStoreOverrideError
-from app.services.conversations.ledger_recorder import get_conversation_ledger_recorder
 from app.services.workflows.catalog import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.services.workflows.public_events import project_workflow_events
 from app.services.workflows.service import WorkflowRunRequest, get_workflow_service
 from app.workflows._shared.schema_utils import schema_to_json_schema
 
@@ -379,106 +380,65 @@ async def run_workflow_stream(
 
     async def _event_stream():
         last_heartbeat = datetime.now(tz=UTC)
-        projector = PublicStreamProjector(
-            stream_id=PublicStreamProjector.new_stream_id(prefix="workflow")
-        )
-        ledger_recorder = get_conversation_ledger_recorder()
-        last_conversation_id = request.conversation_id or "unknown"
-        last_response_id: str | None = None
-        terminal_sent = False
-
-        try:
-            async for event in stream:
-                metadata = event.metadata if isinstance(event.metadata, dict) else {}
-                if event.conversation_id and event.scope is None:
-                    last_conversation_id = event.conversation_id
-                if event.response_id and event.scope is None:
-                    last_response_id = event.response_id
-
-                now_iso = datetime.now(tz=UTC).isoformat().replace("+00:00", "Z")
-                workflow_meta = {
-                    "workflow_key": metadata.get("workflow_key", workflow_key),
-                    "workflow_run_id": metadata.get("workflow_run_id"),
-                    "step_name": metadata.get("step_name"),
-                    "step_agent": metadata.get("step_agent"),
-                    "stage_name": metadata.get("stage_name"),
-                    "parallel_group": metadata.get("parallel_group"),
-                    "branch_index": metadata.get("branch_index"),
-                }
-                public_events = projector.project(
-                    event,
-                    conversation_id=last_conversation_id,
-                    response_id=last_response_id,
-                    agent=event.agent,
-                    workflow_meta=workflow_meta,
-                    server_timestamp=now_iso,
-                )
-                if not terminal_sent:
-                    try:
-                        await ledger_recorder.record_public_events(
-                            tenant_id=tenant_context.tenant_id,
-                            conversation_id=last_conversation_id,
-                            events=public_events,
-                        )
-                    except Exception:
-                        logger.exception(
-                            "workflows.stream.ledger_persist_failed",
-                            extra={
-                                "workflow_key": workflow_key,
-                                "conversation_id": last_conversation_id,
-                            },
-                        )
-                    for ev in public_events:
-                        yield f"data: {ev.model_dump_json(by_alias=True)}\n\n"
-                    if any(
-                        getattr(ev, "kind", None) in {"final", "error"} for ev in public_events
-                    ):
-                        # Drain the upstream stream so the workflow runner can finish recording
-                        # run state and side effects before we close the connection.
-                        terminal_sent = True
-                        continue
-
-                    now = datetime.now(tz=UTC)
-                    if (now - last_heartbeat).total_seconds() >= 15:
-                        last_heartbeat = now
-                        yield f": heartbeat {now.isoformat().replace('+00:00', 'Z')}\n\n"
-        except Exception as exc:
-            logger.exception(
-                "workflows.stream.serialization_error",
-                extra={
-                    "workflow_key": workflow_key,
-                    "conversation_id": last_conversation_id,
-                    "error": str(exc),
-                },
-            )
-            if terminal_sent:
-                return
-            error_event = projector.project_error(
-                conversation_id=last_conversation_id,
-                response_id=last_response_id,
-                agent=None,
-                workflow_meta={"workflow_key": workflow_key},
-                code=None,
-                message=str(exc),
-                source="server",
-                is_retryable=False,
-                server_timestamp=datetime.now(tz=UTC).isoformat().replace("+00:00", "Z"),
-            )
-            try:
-                await ledger_recorder.record_public_events(
-                    tenant_id=tenant_context.tenant_id,
-                    conversation_id=last_conversation_id,
-                    events=[error_event],
-                )
-            except Exception:
-                logger.exception(
-                    "workflows.stream.ledger_error_event_persist_failed",
-                    extra={
-                        "workflow_key": workflow_key,
-                        "conversation_id": last_conversation_id,
-                    },
-                )
-            yield f"data: {error_event.model_dump_json(by_alias=True)}\n\n"
+        async for public_events in project_workflow_events(
+            stream,
+            workflow_key=workflow_key,
+            tenant_id=tenant_context.tenant_id,
+            conversation_id=request.conversation_id,
+        ):
+            for ev in public_events:
+                yield f"data: {ev.model_dump_json(by_alias=True)}\n\n"
+            now = datetime.now(tz=UTC)
+            if (now - last_heartbeat).total_seconds() >= 15:
+                last_heartbeat = now
+                yield f": heartbeat {now.isoformat().replace('+00:00', 'Z')}\n\n"
+
+    headers = {
+        "Cache-Control": "no-cache",
+        "Connection": "keep-alive",
+        "Content-Type": "text/event-stream",
+        "Access-Control-Allow-Origin": "*",
+        "Access-Control-Allow-Headers": "*",
+    }
+
+    return StreamingResponse(_event_stream(), media_type="text/event-stream", headers=headers)
+
+
+@router.post("/runs/{run_id}/resume", responses={200: STREAM_EVENT_RESPONSE})
+async def resume_workflow_run(
+    run_id: str,
+    current_user: CurrentUser = Depends(require_verified_scopes("conversations:write")),
+    tenant_context: TenantContext = Depends(require_workflow_viewer_role),
+):
+    """Continue a failed, cancelled or interrupted run, replaying checkpointed steps."""
+
+    service = get_workflow_service()
+    user_id = current_user.get("user_id") or current_user.get("subject")
+    actor = ConversationActorContext(
+        tenant_id=tenant_context.tenant_id,
+        user_id=str(user_id),
+    )
+    try:
+        run, stream = await service.resume_run_stream(run_id, actor=actor)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    except RuntimeError as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
+
+    async def _event_stream():
+        last_heartbeat = datetime.now(tz=UTC)
+        async for public_events in project_workflow_events(
+            stream,
+            workflow_key=run.workflow_key,
+            tenant_id=tenant_context.tenant_id,
+            conversation_id=run.conversation_id,
+        ):
+            for ev in public_events:
+                yield f"data: {ev.model_dump_json(by_alias=True)}\n\n"
+            now = datetime.now(tz=UTC)
+            if (now - last_heartbeat).total_seconds() >= 15:
+                last_heartbeat = now
+                yield f": heartbeat {now.isoformat().replace('+00:00', 'Z')}\n\n"
 
     headers = {
         "Cache-Control": "no-cache",
@@ -491,6 +451,123 @@ async def run_workflow_stream(
     return StreamingResponse(_event_stream(), media_type="text/event-stream", headers=headers)
 
 
+@router.post(
+    "/{workflow_key}/run-detached",
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=WorkflowRunDispatchResponse,
+)
+async def run_workflow_detached(
+    workflow_key: str,
+    request: WorkflowRunRequestBody,
+    http_request: Request,
+    current_user: CurrentUser = Depends(require_verified_scopes("conversations:write")),
+    tenant_context: TenantContext = Depends(require_workflow_viewer_role),
+):
+    """Queue a workflow run for a background worker and return its id immediately."""
+
+    service = get_workflow_service()
+    user_id = current_user.get("user_id") or current_user.get("subject")
+    actor = ConversationActorContext(
+        tenant_id=tenant_context.tenant_id,
+        user_id=str(user_id),
+    )
+    try:
+        job = await service.dispatch_workflow(
+            workflow_key,
+            request=WorkflowRunRequest(
+                message=request.message,
+                attachments=request.attachments,
+                conversation_id=request.conversation_id,
+                location=request.location,
+                share_location=request.share_location,
+                container_overrides=request.container_overrides,
+                vector_store_overrides=request.vector_store_overrides,
+            ),
+            actor=actor,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    except RuntimeError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)
+        ) from exc
+
+    return WorkflowRunDispatchResponse(
+        workflow_run_id=job.run_id,
+        workflow_key=job.workflow_key,
+        conversation_id=job.conversation_id,
+        events_url=http_request.url_for(
+            "stream_workflow_run_events", run_id=job.run_id
+        ).path,
+    )
+
+
+RUN_EVENTS_STREAM_RESPONSE = {
+    "description": (
+        "Server-sent events stream of a detached workflow run. Each frame carries an `id` "
+        "that can be sent back as `Last-Event-ID` (or `cursor`) to resume."
+    ),
+    "model": StreamingWorkflowEvent,
+    "content": {
+        "text/event-stream": {
+            "schema": {"$ref": "#/components/schemas/StreamingWorkflowEvent"}
+        }
+    },
+}
+
+
+@router.get("/runs/{run_id}/events/stream", responses={200: RUN_EVENTS_STREAM_RESPONSE})
+async def stream_workflow_run_events(
+    run_id: str,
+    cursor: str | None = Query(
+        None, description="Resume after this event id (overrides Last-Event-ID)."
+    ),
+    last_event_id: str | None = Header(default=None, alias="Last-Event-ID"),
+    current_user: CurrentUser = Depends(require_verified_scopes("conversations:read")),
+    tenant_context: TenantContext = Depends(require_workflow_viewer_role),
+):
+    """Attach to a detached run's live event stream from any replica."""
+
+    service = get_workflow_service()
+    try:
+        entries = await service.stream_run_events(
+            run_id,
+            tenant_id=tenant_context.tenant_id,
+            after=cursor or last_event_id,
+        )
+    except ValueError as exc:
+        message = str(exc)
+        code = (
+            status.HTTP_404_NOT_FOUND
+            if "not found" in message.lower()
+            else status.HTTP_400_BAD_REQUEST
+        )
+        raise HTTPException(status_code=code, detail=message) from exc
+    except RuntimeError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)
+        ) from exc
+
+    async def _event_stream():
+        last_heartbeat = datetime.now(tz=UTC)
+        async for entry in entries:
+            if entry is not None:
+                yield f"id: {entry.entry_id}\ndata: {entry.data}\n\n"
+            now = datetime.now(tz=UTC)
+            if (now - last_heartbeat).total_seconds() >= 15:
+                last_heartbeat = now
+                yield f": heartbeat {now.isoformat().replace('+00:00', 'Z')}\n\n"
+
+    headers = {
+        "Cache-Control": "no-cache",
+        "Connection": "keep-alive",
+        "Content-Type": "text/event-stream",
+        "Access-Control-Allow-Origin": "*",
+        "Access-Control-Allow-Headers": "*",
+    }
+    return StreamingResponse(_event_stream(), media_type="text/event-stream", headers=headers)
+
+
 @router.get("/{workflow_key}", response_model=WorkflowDescriptorResponse)
 async def get_workflow_descriptor(
     workflow_key: str,
@@ -515,6 +592,8 @@ async def get_workflow_descriptor(
                 input_mapper_type=step.input_mapper_type,
                 max_turns=step.max_turns,
                 output_schema=schema_to_json_schema(step.output_schema),
+                depends_on=list(step.depends_on) if step.depends_on is not None else None,
+                reducer=step.reducer,
             )
             for step in stage.steps
         ]
@@ -562,22 +641,18 @@ def _parse_status(value: str | None) -> WorkflowStatus | None:
 
 
 def _align_step_schemas(spec, steps) -> list[dict[str, Any] | None]:
-    # Build a cursor over the declared steps to align schemas with executed steps,
-    # preserving execution order and handling duplicate names/guards.
-    declared: list[tuple[str, dict[str, Any] | None]] = []
+    # Steps are recorded in completion order, which differs from declaration order
+    # once independent steps overlap; match each executed step to the next declared
+    # step with the same name (names may repeat across stages).
+    declared: dict[str, deque[dict[str, Any] | None]] = {}
     for stage in spec.resolved_stages():
         for step in stage.steps:
-            declared.append((step.display_name(), schema_to_json_schema(step.output_schema)))
+            declared.setdefault(step.display_name(), deque()).append(
+                schema_to_json_schema(step.output_schema)
+            )
 
     aligned: list[dict[str, Any] | None] = []
-    cursor = 0
     for step in steps:
-        schema = None
-        while cursor < len(declared):
-            name, maybe_schema = declared[cursor]
-            cursor += 1
-            if name == step.step_name:
-                schema = maybe_schema
-                break
-        aligned.append(schema)
+        candidates = declared.get(step.step_name)
+        aligned.append(candidates.popleft() if candidates else None)
     return aligned
@@ -115,6 +115,16 @@ class WorkflowRunCancelResponse(BaseModel):
     success: bool = Field(..., description="True if the cancel request succeeded.")
 
 
+class WorkflowRunDispatchResponse(BaseModel):
+    workflow_run_id: str = Field(..., description="Identifier of the queued workflow run.")
+    workflow_key: str = Field(..., description="Workflow that will be executed.")
+    conversation_id: str = Field(..., description="Conversation the run writes to.")
+    events_url: str = Field(
+        ...,
+        description="SSE endpoint for attaching to (or resuming) the run's event stream.",
+    )
+
+
 class WorkflowRunReplayEventsResponse(BaseModel):
     """Paged list of persisted public_sse_v1 frames for deterministic workflow run replay."""
 
@@ -136,6 +146,8 @@ class WorkflowStepDescriptor(BaseModel):
     input_mapper_type: str | None = None
     max_turns: int | None = None
     output_schema: dict[str, Any] | None = None
+    depends_on: list[str] | None = None
+    reducer: str | None = None
 
 
 class WorkflowStageDescriptor(BaseModel):
@@ -169,6 +181,7 @@ __all__ = [
     "WorkflowRunListItem",
     "WorkflowRunListResponse",
     "WorkflowRunCancelResponse",
+    "WorkflowRunDispatchResponse",
     "WorkflowRunReplayEventsResponse",
     "WorkflowStepDescriptor",
     "WorkflowStageDescriptor",
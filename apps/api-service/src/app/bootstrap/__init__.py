@@ -2,24 +2,32 @@
 
 from .container import (
     ApplicationContainer,
+    ProcessRole,
     get_container,
     reset_container,
     set_container,
     shutdown_container,
+    start_singleton_job,
     wire_asset_service,
+    wire_chat_run_manager,
     wire_conversation_query_service,
     wire_storage_service,
     wire_title_service,
+    wire_workflow_services,
 )
 
 __all__ = [
     "ApplicationContainer",
+    "ProcessRole",
     "get_container",
     "reset_container",
     "set_container",
     "shutdown_container",
+    "start_singleton_job",
     "wire_asset_service",
+    "wire_chat_run_manager",
     "wire_conversation_query_service",
     "wire_storage_service",
     "wire_title_service",
+    "wire_workflow_services",
 ]
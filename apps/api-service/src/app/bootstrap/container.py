@@ -3,17 +3,40 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Literal, cast
 
-from app.core.settings import get_settings
+from app.core.settings import Settings, get_settings
+from app.infrastructure.chat.redis_backend import RedisChatRunBackend
+from app.infrastructure.executors import shutdown_integration_executors
+from app.infrastructure.persistence.assets.repository import SqlAlchemyAssetRepository
 from app.infrastructure.persistence.workflows.repository import (
     SqlAlchemyWorkflowRunRepository,
 )
-from app.infrastructure.redis.factory import reset_redis_factory, shutdown_redis_factory
+from app.infrastructure.redis.factory import (
+    get_redis_factory,
+    reset_redis_factory,
+    shutdown_redis_factory,
+)
+from app.infrastructure.redis_types import RedisBytesClient
+from app.infrastructure.secrets.registry import shutdown_secret_provider
+from app.infrastructure.security.vault import reset_vault_verification_cache
+from app.infrastructure.storage.presign_cache import build_presigned_url_cache
+from app.infrastructure.workflows.redis_backend import RedisWorkflowRunBackend
 from app.services.activity import ActivityService
+from app.services.agents.detached_runs import (
+    ChatRunBackend,
+    ChatRunManager,
+    InMemoryChatRunBackend,
+)
 from app.services.agents.interaction_context import InteractionContextBuilder
 from app.services.assets.service import AssetService
+from app.services.assets.thumbnails import (
+    AssetThumbnailBackfill,
+    AssetThumbnailPipeline,
+    thumbnails_available,
+)
 from app.services.auth.mfa_service import MfaService
 from app.services.auth.service_account_service import ServiceAccountTokenService
 from app.services.auth.session_service import UserSessionService
@@ -31,9 +54,20 @@ from app.services.geoip_service import GeoIPService, NullGeoIPService, shutdown_
 from app.services.integrations.slack_notifier import SlackNotifier
 from app.services.notification_preferences import NotificationPreferenceService
 from app.services.security_events import SecurityEventService
+from app.services.shared.event_partitions import EventPartitionMaintainer
+from app.services.shared.leader_election import (
+    BackgroundJob,
+    LeaderElectedJob,
+    RedisLeaderLease,
+    default_holder_id,
+)
 from app.services.shared.rate_limit_service import RateLimiter
 from app.services.signup.email_verification_service import EmailVerificationService
 from app.services.signup.password_recovery_service import PasswordRecoveryService
+from app.services.sso.metadata_cache import (
+    reset_oidc_metadata_cache,
+    shutdown_oidc_metadata_cache,
+)
 from app.services.status.status_alert_dispatcher import StatusAlertDispatcher
 from app.services.status.status_subscription_service import StatusSubscriptionService
 from app.services.storage.service import StorageService
@@ -49,6 +83,7 @@ from app.services.vector_stores import (
     VectorStoreService,
     VectorStoreSyncWorker,
 )
+from app.services.workflows.dispatch import InMemoryWorkflowRunBackend, WorkflowRunBackend
 from app.services.workflows.service import WorkflowService
 
 if TYPE_CHECKING:  # pragma: no cover - type hints only
@@ -68,12 +103,17 @@ if TYPE_CHECKING:  # pragma: no cover - type hints only
     from app.services.team.invite_service import TeamInviteService
     from app.services.team.membership_service import TenantMembershipService
 
+logger = logging.getLogger("api-service.bootstrap.container")
+
+ProcessRole = Literal["api", "worker"]
+
 
 @dataclass(slots=True)
 class ApplicationContainer:
     """Holds long-lived application services and infrastructure handles."""
 
     session_factory: async_sessionmaker[AsyncSession] | None = None
+    read_session_factory: async_sessionmaker[AsyncSession] | None = None
     conversation_service: ConversationService = field(default_factory=ConversationService)
     billing_service: BillingService = field(default_factory=BillingService)
     billing_events_service: BillingEventsService = field(default_factory=BillingEventsService)
@@ -124,14 +164,18 @@ class ApplicationContainer:
     vector_limit_resolver: VectorLimitResolver | None = None
     vector_store_service: VectorStoreService | None = None
     vector_store_sync_worker: VectorStoreSyncWorker | None = None
+    event_partition_maintainer: EventPartitionMaintainer | None = None
+    leader_elected_jobs: list[LeaderElectedJob] = field(default_factory=list)
     container_service: ContainerService | None = None
     title_service: TitleService | None = None
     usage_recorder: UsageRecorder = field(default_factory=UsageRecorder)
     usage_policy_service: UsagePolicyService | None = None
     storage_service: StorageService | None = None
     asset_service: AssetService | None = None
+    asset_thumbnail_backfill: AssetThumbnailBackfill | None = None
     workflow_run_repository: SqlAlchemyWorkflowRunRepository | None = None
     workflow_service: WorkflowService | None = None
+    chat_run_manager: ChatRunManager | None = None
     consent_service: ConsentService | None = None
     notification_preference_service: NotificationPreferenceService | None = None
     usage_counter_service: UsageCounterService | None = None
@@ -139,20 +183,41 @@ class ApplicationContainer:
     async def shutdown(self) -> None:
         """Gracefully tear down managed services."""
 
+        # Stop elections first so no job restarts mid-teardown; releasing the
+        # leases lets another replica take over without waiting out the TTL.
+        leader_elected_jobs, self.leader_elected_jobs = self.leader_elected_jobs, []
+        await asyncio.gather(*(job.shutdown() for job in leader_elected_jobs))
         await asyncio.gather(
             self.billing_events_service.shutdown(),
             self.stripe_dispatch_retry_worker.shutdown(),
             *(
                 [self.vector_store_sync_worker.shutdown()] if self.vector_store_sync_worker else []
             ),
+            *(
+                [self.event_partition_maintainer.shutdown()]
+                if self.event_partition_maintainer
+                else []
+            ),
             self.rate_limiter.shutdown(),
+            *([self.workflow_service.shutdown()] if self.workflow_service else []),
+            *([self.chat_run_manager.shutdown()] if self.chat_run_manager else []),
+            *([self.asset_service.shutdown()] if self.asset_service else []),
+            *(
+                [self.asset_thumbnail_backfill.shutdown()]
+                if self.asset_thumbnail_backfill
+                else []
+            ),
             return_exceptions=False,
         )
         if self.slack_notifier:
             await self.slack_notifier.shutdown()
         await shutdown_geoip_service(self.geoip_service)
         await shutdown_redis_factory()
+        await shutdown_oidc_metadata_cache()
+        await shutdown_secret_provider()
+        shutdown_integration_executors()
         self.session_factory = None
+        self.read_session_factory = None
         self.stripe_event_repository = None
         self.user_service = None
         self.auth_service = None
@@ -173,6 +238,8 @@ class ApplicationContainer:
         self.notification_preference_service = None
         self.usage_counter_service = None
         self.asset_service = None
+        self.asset_thumbnail_backfill = None
+        self.event_partition_maintainer = None
         self.team_membership_service = None
         self.team_invite_service = None
         self.signup_service = None
@@ -185,6 +252,7 @@ class ApplicationContainer:
         self.geoip_service = NullGeoIPService()
         self.usage_policy_service = None
         self.vector_store_sync_worker = None
+        self.chat_run_manager = None
         self.container_service = None
 
 
@@ -222,6 +290,9 @@ def reset_container() -> ApplicationContainer:
     """Reset the container to a fresh, unconfigured instance (used in tests)."""
 
     reset_redis_factory()
+    reset_oidc_metadata_cache()
+    reset_vault_verification_cache()
+    shutdown_integration_executors()
     container = ApplicationContainer()
     set_container(container)
     return container
@@ -270,6 +341,7 @@ def wire_storage_service(container: ApplicationContainer) -> None:
         container.storage_service = StorageService(
             container.session_factory,
             lambda: settings,
+            presign_cache=build_presigned_url_cache(settings),
         )
 
 
@@ -284,9 +356,29 @@ def wire_asset_service(container: ApplicationContainer) -> None:
         if container.storage_service is None:  # pragma: no cover - defensive
             raise RuntimeError("Storage service must be configured before asset service")
         storage_service = cast(StorageService, container.storage_service)
+        settings = get_settings()
+        repository = SqlAlchemyAssetRepository(container.session_factory)
+        thumbnail_pipeline = None
+        if settings.asset_thumbnails_enabled:
+            if thumbnails_available():
+                thumbnail_pipeline = AssetThumbnailPipeline(
+                    storage_service=storage_service,
+                    repository=repository,
+                    settings_provider=lambda: settings,
+                )
+                container.asset_thumbnail_backfill = AssetThumbnailBackfill(
+                    pipeline=thumbnail_pipeline, repository=repository
+                )
+            else:
+                logger.warning(
+                    "Asset thumbnails enabled but Pillow is not installed; "
+                    "galleries will presign original images."
+                )
         container.asset_service = AssetService(
             container.session_factory,
             storage_service,
+            repository=repository,
+            thumbnail_pipeline=thumbnail_pipeline,
         )
 
 
@@ -415,6 +507,102 @@ def wire_workflow_services(container: ApplicationContainer) -> None:
             asset_service=asset_service,
             container_service=container.container_service,
         )
+        settings = get_settings()
+        container.workflow_service.configure_dispatch(
+            build_workflow_run_backend(settings),
+            worker_concurrency=settings.workflow_worker_concurrency,
+            max_attempts=settings.workflow_run_max_attempts,
+        )
+
+
+async def start_singleton_job(
+    container: ApplicationContainer,
+    name: str,
+    job: BackgroundJob,
+    *,
+    settings: Settings,
+    role: ProcessRole = "api",
+) -> None:
+    """Start a background job that must run once across all replicas.
+
+    API processes leave it to the worker under ``BACKGROUND_JOBS_MODE=dedicated``.
+    Otherwise the job runs only while this process holds its Redis leader lease,
+    or unconditionally when leader election is off or has no Redis to use.
+    """
+
+    if role == "api" and settings.background_jobs_mode == "dedicated":
+        logger.info("Background job %s deferred to the dedicated worker", name)
+        return
+    if not settings.enable_leader_election:
+        await job.start()
+        return
+    if not settings.resolve_leader_election_redis_url():
+        logger.warning(
+            "Leader election unavailable for %s; LEADER_ELECTION_REDIS_URL/REDIS_URL "
+            "not configured, so every replica runs it.",
+            name,
+            extra={"environment": settings.environment},
+        )
+        await job.start()
+        return
+
+    client = cast(RedisBytesClient, get_redis_factory(settings).get_client("leader_election"))
+    ttl_seconds = settings.leader_election_lease_seconds
+    elected = LeaderElectedJob(
+        name,
+        job,
+        lease=RedisLeaderLease(
+            client,
+            name=name,
+            holder_id=default_holder_id(),
+            ttl_seconds=ttl_seconds,
+        ),
+        ttl_seconds=ttl_seconds,
+    )
+    container.leader_elected_jobs.append(elected)
+    await elected.start()
+
+
+def wire_chat_run_manager(container: ApplicationContainer) -> None:
+    """Install the detached chat run manager for the configured backend."""
+
+    if container.chat_run_manager is None:
+        container.chat_run_manager = ChatRunManager(build_chat_run_backend(get_settings()))
+
+
+def build_chat_run_backend(settings: Settings) -> ChatRunBackend:
+    """Return the configured chat run frame store (Redis or in-process)."""
+
+    if settings.chat_run_backend == "redis":
+        client = cast(RedisBytesClient, get_redis_factory(settings).get_client("chat_runs"))
+        return RedisChatRunBackend(
+            client,
+            ttl_seconds=settings.chat_run_events_ttl_seconds,
+            max_frames=settings.chat_run_stream_max_frames,
+            lease_seconds=settings.chat_run_lease_seconds,
+            owns_client=False,
+        )
+    return InMemoryChatRunBackend(
+        max_frames=settings.chat_run_stream_max_frames,
+        lease_seconds=settings.chat_run_lease_seconds,
+    )
+
+
+def build_workflow_run_backend(settings: Settings) -> WorkflowRunBackend:
+    """Return the configured workflow run backend (Redis or in-process)."""
+
+    if settings.workflow_run_backend == "redis":
+        client = cast(RedisBytesClient, get_redis_factory(settings).get_client("workflow_runs"))
+        return RedisWorkflowRunBackend(
+            client,
+            ttl_seconds=settings.workflow_run_events_ttl_seconds,
+            lease_seconds=settings.workflow_run_lease_seconds,
+            owns_client=False,
+        )
+    return InMemoryWorkflowRunBackend(
+        ttl_seconds=settings.workflow_run_events_ttl_seconds,
+        lease_seconds=settings.workflow_run_lease_seconds,
+    )
 
 
 __all__ = [
@@ -431,6 +619,11 @@ __all__ = [
     "wire_conversation_ledger_recorder",
     "wire_conversation_ledger_reader",
     "wire_workflow_services",
+    "wire_chat_run_manager",
+    "build_workflow_run_backend",
+    "build_chat_run_backend",
+    "ProcessRole",
+    "start_singleton_job",
     "VectorLimitResolver",
     "VectorStoreSyncWorker",
 ]
@@ -7,6 +7,7 @@ from .activity import ActivitySettingsMixin
 from .ai import AIProviderSettingsMixin
 from .application import ApplicationSettingsMixin
 from .base import VAULT_PROVIDER_KEYS, BaseAppSettings, SignupAccessPolicyLiteral
+from .chat import ChatRunSettingsMixin
 from .database import DatabaseAndBillingSettingsMixin
 from .integrations import IntegrationSettingsMixin
 from .mcp import MCPSettingsMixin
@@ -20,6 +21,8 @@ from .signup import SignupSettingsMixin
 from .sso import SsoSettingsMixin
 from .storage import StorageSettingsMixin
 from .usage import UsageGuardrailSettingsMixin
+from .workers import WorkerSettingsMixin
+from .workflows import WorkflowSettingsMixin
 
 
 class Settings(
@@ -27,6 +30,7 @@ class Settings(
     AIProviderSettingsMixin,
     ApplicationSettingsMixin,
     ActivitySettingsMixin,
+    ChatRunSettingsMixin,
     MCPSettingsMixin,
     IntegrationSettingsMixin,
     RedisSettingsMixin,
@@ -40,6 +44,8 @@ class Settings(
     UsageGuardrailSettingsMixin,
     SsoSettingsMixin,
     StorageSettingsMixin,
+    WorkerSettingsMixin,
+    WorkflowSettingsMixin,
 ):
     """Concrete application settings composed from mixins."""
 
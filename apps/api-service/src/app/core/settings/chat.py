@@ -0,0 +1,59 @@
+"""Settings for detached, resumable chat streams."""
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+from .utils import normalize_url
+
+
+class ChatRunSettingsMixin(BaseModel):
+    chat_run_backend: Literal["memory", "redis"] = Field(
+        default="memory",
+        description=(
+            "Where detached chat runs buffer their SSE frames. 'memory' lets clients "
+            "resume only on the replica running the stream; 'redis' lets them reconnect "
+            "to any replica."
+        ),
+        alias="CHAT_RUN_BACKEND",
+    )
+    chat_runs_redis_url: str | None = Field(
+        default=None,
+        description="Redis URL used for chat run frame streams (defaults to REDIS_URL).",
+        alias="CHAT_RUNS_REDIS_URL",
+    )
+    chat_run_stream_max_frames: int = Field(
+        default=5000,
+        ge=100,
+        description=(
+            "Frames retained per chat run for reconnecting clients; older frames are "
+            "trimmed and resuming before them returns 410."
+        ),
+        alias="CHAT_RUN_STREAM_MAX_FRAMES",
+    )
+    chat_run_events_ttl_seconds: int = Field(
+        default=900,
+        ge=60,
+        description="How long a chat run's frames stay resumable after its last frame.",
+        alias="CHAT_RUN_EVENTS_TTL_SECONDS",
+    )
+    chat_run_lease_seconds: int = Field(
+        default=30,
+        ge=1,
+        le=3600,
+        description=(
+            "Lease the process running a chat run renews while the run is alive. Clients "
+            "watching a run get an error frame after four leases without new frames or "
+            "a live lease (the process running it exited)."
+        ),
+        alias="CHAT_RUN_LEASE_SECONDS",
+    )
+
+    def resolve_chat_runs_redis_url(self) -> str | None:
+        redis_source = getattr(self, "redis_url", None)
+        return normalize_url(self.chat_runs_redis_url) or normalize_url(redis_source)
+
+
+__all__ = ["ChatRunSettingsMixin"]
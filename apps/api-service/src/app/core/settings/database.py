@@ -15,6 +15,15 @@ class DatabaseAndBillingSettingsMixin(BaseModel):
         description="Async SQLAlchemy URL for the primary Postgres database",
         alias="DATABASE_URL",
     )
+    database_replica_url: str | None = Field(
+        default=None,
+        description=(
+            "Async SQLAlchemy URL for a read replica. When set, read-only queries "
+            "(conversation listing/search, activity feed, usage counters) run on it; a "
+            "request that has already written keeps reading from the primary."
+        ),
+        alias="DATABASE_REPLICA_URL",
+    )
     database_pool_size: int = Field(default=5, description="SQLAlchemy async pool size")
     database_max_overflow: int = Field(
         default=10,
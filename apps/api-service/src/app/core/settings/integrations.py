@@ -1,9 +1,9 @@
-"""Integration provider configuration (Slack, etc.)."""
+"""Integration provider configuration (Slack, executor bulkheads, etc.)."""
 
 from __future__ import annotations
 
 import json
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 
@@ -86,6 +86,55 @@ class IntegrationSettingsMixin(BaseModel):
         ge=1,
     )
 
+    integration_executor_stripe_workers: int = Field(
+        default=8,
+        alias="INTEGRATION_EXECUTOR_STRIPE_WORKERS",
+        description="Worker threads reserved for blocking Stripe SDK calls.",
+        ge=1,
+    )
+    integration_executor_stripe_queue: int = Field(
+        default=32,
+        alias="INTEGRATION_EXECUTOR_STRIPE_QUEUE",
+        description="Queued Stripe calls allowed before new calls fail fast.",
+        ge=0,
+    )
+    integration_executor_storage_workers: int = Field(
+        default=16,
+        alias="INTEGRATION_EXECUTOR_STORAGE_WORKERS",
+        description="Worker threads reserved for blocking object-storage SDK calls.",
+        ge=1,
+    )
+    integration_executor_storage_queue: int = Field(
+        default=64,
+        alias="INTEGRATION_EXECUTOR_STORAGE_QUEUE",
+        description="Queued storage calls allowed before new calls fail fast.",
+        ge=0,
+    )
+    integration_executor_geoip_workers: int = Field(
+        default=4,
+        alias="INTEGRATION_EXECUTOR_GEOIP_WORKERS",
+        description="Worker threads reserved for local GeoIP database lookups.",
+        ge=1,
+    )
+    integration_executor_geoip_queue: int = Field(
+        default=32,
+        alias="INTEGRATION_EXECUTOR_GEOIP_QUEUE",
+        description="Queued GeoIP lookups allowed before new lookups fail fast.",
+        ge=0,
+    )
+    integration_executor_images_workers: int = Field(
+        default=2,
+        alias="INTEGRATION_EXECUTOR_IMAGES_WORKERS",
+        description="Worker threads reserved for CPU-bound image work (thumbnail rendering).",
+        ge=1,
+    )
+    integration_executor_images_queue: int = Field(
+        default=64,
+        alias="INTEGRATION_EXECUTOR_IMAGES_QUEUE",
+        description="Queued image jobs allowed before new jobs fail fast.",
+        ge=0,
+    )
+
     @field_validator("slack_status_default_channels", mode="before")
     @classmethod
     def _coerce_default_channels(cls, value: Any) -> list[str]:
@@ -110,6 +159,31 @@ class IntegrationSettingsMixin(BaseModel):
             result[str(key).lower()] = _parse_channel_list(raw)
         return result
 
+    def integration_executor_limits(
+        self, name: Literal["stripe", "storage", "geoip", "images"]
+    ) -> tuple[int, int]:
+        """Return ``(max_workers, max_queue)`` for the named integration executor."""
+
+        limits = {
+            "stripe": (
+                self.integration_executor_stripe_workers,
+                self.integration_executor_stripe_queue,
+            ),
+            "storage": (
+                self.integration_executor_storage_workers,
+                self.integration_executor_storage_queue,
+            ),
+            "geoip": (
+                self.integration_executor_geoip_workers,
+                self.integration_executor_geoip_queue,
+            ),
+            "images": (
+                self.integration_executor_images_workers,
+                self.integration_executor_images_queue,
+            ),
+        }
+        return limits[name]
+
     @model_validator(mode="after")
     def _validate_slack_configuration(self) -> IntegrationSettingsMixin:
         if not self.enable_slack_status_notifications:
@@ -49,6 +49,29 @@ class SecretsProviderSettingsMixin(BaseModel):
         description="When true, enforce Vault Transit verification for service-account issuance.",
         alias="VAULT_VERIFY_ENABLED",
     )
+    vault_verify_cache_ttl_seconds: int = Field(
+        default=60,
+        ge=0,
+        le=600,
+        description=(
+            "How long (seconds) a successfully verified Vault envelope is remembered so "
+            "retried service-account issuance skips the Transit round-trip. 0 disables."
+        ),
+        alias="VAULT_VERIFY_CACHE_TTL_SECONDS",
+    )
+    vault_verify_cache_max_entries: int = Field(
+        default=1024,
+        ge=1,
+        description="Maximum verified envelope digests kept in memory.",
+        alias="VAULT_VERIFY_CACHE_MAX_ENTRIES",
+    )
+    vault_http_max_connections: int = Field(
+        default=10,
+        ge=1,
+        le=100,
+        description="Size of the pooled HTTP connection set used for Vault Transit calls.",
+        alias="VAULT_HTTP_MAX_CONNECTIONS",
+    )
     infisical_base_url: str | None = Field(
         default=None,
         description="Base URL for Infisical API (set when using Infisical providers).",
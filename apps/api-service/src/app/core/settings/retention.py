@@ -44,6 +44,16 @@ class RetentionSettingsMixin(BaseModel):
         alias="ACTIVITY_EVENTS_CLEANUP_SLEEP_MS",
     )
 
+    event_partitions_months_ahead: int = Field(
+        default=3,
+        ge=1,
+        description=(
+            "Monthly partitions to keep pre-created ahead of the current month for "
+            "partitioned event tables (Postgres only)."
+        ),
+        alias="EVENT_PARTITIONS_MONTHS_AHEAD",
+    )
+
     workflow_min_purge_age_hours: int = Field(
         default=0,
         ge=0,
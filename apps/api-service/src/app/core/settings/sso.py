@@ -23,6 +23,45 @@ class SsoSettingsMixin(BaseModel):
         ),
         alias="SSO_CLIENT_SECRET_ENCRYPTION_KEY",
     )
+    sso_metadata_cache_default_ttl_seconds: int = Field(
+        default=3600,
+        ge=0,
+        description=(
+            "Cache TTL for OIDC discovery/JWKS documents when the IdP sends no "
+            "Cache-Control max-age or Expires header (seconds)."
+        ),
+        alias="SSO_METADATA_CACHE_DEFAULT_TTL_SECONDS",
+    )
+    sso_metadata_cache_min_ttl_seconds: int = Field(
+        default=60,
+        ge=0,
+        description="Lower bound applied to IdP-provided metadata cache lifetimes (seconds).",
+        alias="SSO_METADATA_CACHE_MIN_TTL_SECONDS",
+    )
+    sso_metadata_cache_max_ttl_seconds: int = Field(
+        default=86400,
+        ge=1,
+        description="Upper bound applied to IdP-provided metadata cache lifetimes (seconds).",
+        alias="SSO_METADATA_CACHE_MAX_TTL_SECONDS",
+    )
+    sso_metadata_cache_max_stale_seconds: int = Field(
+        default=86400,
+        ge=0,
+        description=(
+            "How long past expiry cached OIDC metadata may still be served when the "
+            "IdP is unreachable (seconds)."
+        ),
+        alias="SSO_METADATA_CACHE_MAX_STALE_SECONDS",
+    )
+    sso_jwks_force_refresh_interval_seconds: int = Field(
+        default=30,
+        ge=0,
+        description=(
+            "Minimum interval between forced JWKS refreshes triggered by an unknown "
+            "key id (seconds)."
+        ),
+        alias="SSO_JWKS_FORCE_REFRESH_INTERVAL_SECONDS",
+    )
 
 
 __all__ = ["SsoSettingsMixin"]
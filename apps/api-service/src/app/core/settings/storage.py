@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Literal
+
 from pydantic import BaseModel, Field
 from starter_contracts.storage.models import (
     AzureBlobProviderConfig,
@@ -11,6 +13,8 @@ from starter_contracts.storage.models import (
     StorageProviderLiteral,
 )
 
+from .utils import normalize_url
+
 
 class StorageSettingsMixin(BaseModel):
     storage_provider: StorageProviderLiteral = Field(
@@ -30,11 +34,76 @@ class StorageSettingsMixin(BaseModel):
         ge=60,
         description="TTL (seconds) for presigned URLs returned to clients.",
     )
+    storage_presign_cache_backend: Literal["none", "memory", "redis"] = Field(
+        default="none",
+        description=(
+            "Cache for presigned download URLs. 'redis' shares them across replicas so "
+            "browsers and CDNs see identical URLs; 'memory' reuses them within one process "
+            "and is only safe for single-process deployments, since deletes in other "
+            "processes do not invalidate it."
+        ),
+    )
+    storage_presign_cache_min_remaining: float = Field(
+        default=0.5,
+        gt=0.0,
+        lt=1.0,
+        description=(
+            "Fraction of a presigned URL's lifetime that must remain for the cached URL "
+            "to be handed out again."
+        ),
+    )
+    storage_presign_cache_redis_url: str | None = Field(
+        default=None,
+        description="Redis URL for the shared presigned URL cache (defaults to REDIS_URL).",
+    )
     storage_max_file_mb: int = Field(
         default=512,
         ge=1,
         description="Maximum upload size enforced by the service (MB).",
     )
+    storage_stream_chunk_bytes: int = Field(
+        default=1024 * 1024,
+        ge=64 * 1024,
+        le=64 * 1024 * 1024,
+        description=(
+            "Chunk size (bytes) used when streaming objects through the API "
+            "(vector store attach, server-side reads)."
+        ),
+    )
+    storage_multipart_part_bytes: int = Field(
+        default=8 * 1024 * 1024,
+        ge=5 * 1024 * 1024,
+        le=512 * 1024 * 1024,
+        description=(
+            "Part size (bytes) for streaming/multipart uploads of server-generated "
+            "objects. S3 requires at least 5 MiB per part."
+        ),
+    )
+    storage_multipart_concurrency: int = Field(
+        default=4,
+        ge=1,
+        le=16,
+        description="Maximum parts uploaded concurrently per streaming upload.",
+    )
+    asset_thumbnails_enabled: bool = Field(
+        default=True,
+        description=(
+            "Render WebP thumbnails for image assets in the background so galleries "
+            "download previews instead of full-size originals (requires Pillow)."
+        ),
+    )
+    asset_thumbnail_max_edge_px: int = Field(
+        default=320,
+        ge=32,
+        le=2048,
+        description="Longest edge (pixels) of generated asset thumbnails.",
+    )
+    asset_thumbnail_quality: int = Field(
+        default=80,
+        ge=1,
+        le=100,
+        description="WebP quality (1-100) used for generated asset thumbnails.",
+    )
     storage_allowed_mime_types: list[str] = Field(
         default_factory=lambda: [
             "application/json",
@@ -152,6 +221,10 @@ class StorageSettingsMixin(BaseModel):
         description="Azure Blob connection string (optional, overrides account URL auth).",
     )
 
+    def resolve_storage_cache_redis_url(self) -> str | None:
+        redis_source = getattr(self, "redis_url", None)
+        return normalize_url(self.storage_presign_cache_redis_url) or normalize_url(redis_source)
+
     @property
     def minio_settings(self) -> MinioProviderConfig:
         return MinioProviderConfig(
@@ -0,0 +1,51 @@
+"""Settings for background job placement and leader election."""
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+from .utils import normalize_url
+
+
+class WorkerSettingsMixin(BaseModel):
+    background_jobs_mode: Literal["inline", "dedicated"] = Field(
+        default="inline",
+        description=(
+            "Where singleton background jobs (Stripe dispatch retries, vector store sync) "
+            "run. 'inline' starts them in API processes; 'dedicated' leaves them to the "
+            "worker entry point (src/worker.py)."
+        ),
+        alias="BACKGROUND_JOBS_MODE",
+    )
+    enable_leader_election: bool = Field(
+        default=True,
+        description=(
+            "Run singleton background jobs only on the process holding a Redis lease, "
+            "so each job runs once across replicas and fails over when the holder dies."
+        ),
+        alias="ENABLE_LEADER_ELECTION",
+    )
+    leader_election_lease_seconds: float = Field(
+        default=30.0,
+        ge=3.0,
+        le=600.0,
+        description=(
+            "Leader lease TTL. Holders renew every third of it; a dead leader is "
+            "replaced within one TTL."
+        ),
+        alias="LEADER_ELECTION_LEASE_SECONDS",
+    )
+    leader_election_redis_url: str | None = Field(
+        default=None,
+        description="Redis URL used for leader election leases (defaults to REDIS_URL).",
+        alias="LEADER_ELECTION_REDIS_URL",
+    )
+
+    def resolve_leader_election_redis_url(self) -> str | None:
+        redis_source = getattr(self, "redis_url", None)
+        return normalize_url(self.leader_election_redis_url) or normalize_url(redis_source)
+
+
+__all__ = ["WorkerSettingsMixin"]
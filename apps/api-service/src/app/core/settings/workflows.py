@@ -0,0 +1,84 @@
+"""Settings for detached workflow execution and cross-node run signals."""
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+from .utils import normalize_url
+
+
+class WorkflowSettingsMixin(BaseModel):
+    workflow_run_backend: Literal["memory", "redis"] = Field(
+        default="memory",
+        description=(
+            "Backend for the workflow run queue, per-run event streams and cancellation "
+            "signals. 'memory' keeps everything in-process (single node); 'redis' lets any "
+            "replica dispatch, cancel or attach to runs executing on another."
+        ),
+        alias="WORKFLOW_RUN_BACKEND",
+    )
+    workflow_runs_redis_url: str | None = Field(
+        default=None,
+        description="Redis URL used for workflow run dispatch (defaults to REDIS_URL).",
+        alias="WORKFLOW_RUNS_REDIS_URL",
+    )
+    workflow_worker_concurrency: int = Field(
+        default=4,
+        ge=0,
+        le=256,
+        description=(
+            "Detached workflow runs executed concurrently by this process "
+            "(0 = dispatch and cancel only; another node executes)."
+        ),
+        alias="WORKFLOW_WORKER_CONCURRENCY",
+    )
+    workflow_run_events_ttl_seconds: int = Field(
+        default=3600,
+        ge=60,
+        description=(
+            "How long queued jobs, per-run event streams and cancel flags are kept "
+            "for clients attaching by run id."
+        ),
+        alias="WORKFLOW_RUN_EVENTS_TTL_SECONDS",
+    )
+    workflow_run_lease_seconds: int = Field(
+        default=30,
+        ge=1,
+        le=3600,
+        description=(
+            "Lease a worker holds on a detached run while it heartbeats. When a worker "
+            "stops heartbeating for this long, another worker takes the run over; "
+            "clients watching the run get an error frame after four leases without "
+            "progress or a live worker."
+        ),
+        alias="WORKFLOW_RUN_LEASE_SECONDS",
+    )
+    workflow_run_max_attempts: int = Field(
+        default=3,
+        ge=1,
+        le=20,
+        description=(
+            "Deliveries of a detached run before it is abandoned with an error frame "
+            "(each redelivery resumes from the run's step checkpoints)."
+        ),
+        alias="WORKFLOW_RUN_MAX_ATTEMPTS",
+    )
+    workflow_resume_stale_seconds: int = Field(
+        default=600,
+        ge=0,
+        description=(
+            "Seconds without a worker heartbeat after which a run still marked running "
+            "is treated as interrupted and may be resumed from its checkpoints. Workers "
+            "heartbeat four times per window."
+        ),
+        alias="WORKFLOW_RESUME_STALE_SECONDS",
+    )
+
+    def resolve_workflow_runs_redis_url(self) -> str | None:
+        redis_source = getattr(self, "redis_url", None)
+        return normalize_url(self.workflow_runs_redis_url) or normalize_url(redis_source)
+
+
+__all__ = ["WorkflowSettingsMixin"]
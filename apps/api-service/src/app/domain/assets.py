@@ -30,6 +30,8 @@ class AssetRecord:
     container_id: str | None
     openai_file_id: str | None
     metadata: dict[str, object] = field(default_factory=dict)
+    thumbnail_object_id: uuid.UUID | None = None
+    thumbnail_failures: int = 0
     created_at: datetime | None = None
     updated_at: datetime | None = None
     deleted_at: datetime | None = None
@@ -87,6 +89,23 @@ class AssetRepository(Protocol):
 
     async def mark_deleted(self, *, tenant_id: uuid.UUID, asset_id: uuid.UUID) -> None: ...
 
+    async def set_thumbnail(
+        self, *, tenant_id: uuid.UUID, asset_id: uuid.UUID, thumbnail_object_id: uuid.UUID
+    ) -> None: ...
+
+    async def record_thumbnail_failure(
+        self, *, tenant_id: uuid.UUID, asset_id: uuid.UUID
+    ) -> None: ...
+
+    async def list_missing_thumbnails(
+        self,
+        *,
+        created_before: datetime,
+        after: tuple[datetime, uuid.UUID] | None,
+        limit: int,
+        max_failures: int | None = None,
+    ) -> Sequence[AssetRecord]: ...
+
     async def link_message(
         self,
         *,
@@ -213,6 +213,17 @@ class ConversationRunUsage:
     created_at: datetime
 
 
+@dataclass(slots=True)
+class ConversationTurn:
+    """Writes produced by one completed agent turn, persisted in a single transaction."""
+
+    message: ConversationMessage
+    metadata: ConversationMetadata
+    session_state: ConversationSessionState | None = None
+    run_usage: ConversationRunUsage | None = None
+    run_events: list[ConversationEvent] = field(default_factory=list)
+
+
 class ConversationRepository(Protocol):
     """Persistence contract for storing conversation histories."""
 
@@ -225,6 +236,14 @@ class ConversationRepository(Protocol):
         metadata: ConversationMetadata,
     ) -> int | None: ...
 
+    async def record_turn(
+        self,
+        conversation_id: str,
+        *,
+        tenant_id: str,
+        turn: ConversationTurn,
+    ) -> int | None: ...
+
     async def get_messages(
         self,
         conversation_id: str,
@@ -399,6 +418,7 @@ __all__ = [
     "ConversationMemoryConfig",
     "ConversationSummary",
     "ConversationRunUsage",
+    "ConversationTurn",
     "ensure_metadata_tenant",
     "MessagePage",
 ]
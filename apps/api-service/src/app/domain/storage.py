@@ -1,6 +1,9 @@
 """Backend-facing aliases for shared storage provider models."""
 
 from starter_contracts.storage.models import (
+    DEFAULT_MULTIPART_CONCURRENCY,
+    DEFAULT_MULTIPART_PART_BYTES,
+    DEFAULT_STREAM_CHUNK_BYTES,
     AzureBlobProviderConfig,
     GCSProviderConfig,
     MinioProviderConfig,
@@ -14,6 +17,9 @@ from starter_contracts.storage.models import (
 )
 
 __all__ = [
+    "DEFAULT_MULTIPART_CONCURRENCY",
+    "DEFAULT_MULTIPART_PART_BYTES",
+    "DEFAULT_STREAM_CHUNK_BYTES",
     "AzureBlobProviderConfig",
     "GCSProviderConfig",
     "MinioProviderConfig",
@@ -25,6 +25,7 @@ class WorkflowRun:
     deleted_at: datetime | None = None
     deleted_by: str | None = None
     deleted_reason: str | None = None
+    heartbeat_at: datetime | None = None
 
 
 @dataclass(slots=True)
@@ -46,6 +47,11 @@ class WorkflowRunStep:
     stage_name: str | None = None
     parallel_group: str | None = None
     branch_index: int | None = None
+    # Checkpoint fields used to resume a run without re-executing finished steps.
+    node_id: str | None = None
+    input_fingerprint: str | None = None
+    output: Any | None = None
+    session_items: list[dict[str, Any]] | None = None
     deleted_at: datetime | None = None
     deleted_by: str | None = None
     deleted_reason: str | None = None
@@ -78,6 +84,10 @@ class WorkflowRunRepository(Protocol):
         include_deleted: bool = False,
     ) -> WorkflowRunListPage: ...
 
+    async def claim_run(
+        self, run_id: str, *, stale_before: datetime, claimed_at: datetime
+    ) -> bool: ...
+
     async def cancel_run(self, run_id: str, *, ended_at: datetime) -> None: ...
 
     async def cancel_running_steps(self, run_id: str, *, ended_at: datetime) -> None: ...
@@ -0,0 +1,71 @@
+"""Redis-backed run records and frame streams for detached chat runs."""
+
+from __future__ import annotations
+
+from app.infrastructure.redis.run_streams import RedisRunStreamStore
+from app.infrastructure.redis_types import RedisBytesClient
+from app.services.agents.detached_runs import ChatRun, ChatRunBackend
+from app.services.shared.run_streams import RunStreamStore
+
+
+class RedisChatRunBackend(ChatRunBackend):
+    """Lets clients reconnect to a chat run from any replica.
+
+    Keys (under ``prefix``):
+
+    - ``run:<run_id>`` — the ownership record, kept for ``ttl_seconds`` after the
+      run's last heartbeat.
+    - ``events:<run_id>`` / ``lease:<run_id>`` — the run's frame stream (explicit
+      ``<seq>-0`` ids, trimmed to about ``max_frames`` entries) and producer lease
+      (see :class:`RedisRunStreamStore`).
+    """
+
+    def __init__(
+        self,
+        redis: RedisBytesClient,
+        *,
+        prefix: str = "chat-runs",
+        ttl_seconds: int = 900,
+        max_frames: int = 5000,
+        lease_seconds: float = 30.0,
+        owns_client: bool = True,
+    ) -> None:
+        self._redis = redis
+        self._prefix = prefix
+        self._ttl_seconds = ttl_seconds
+        self._lease_seconds = lease_seconds
+        self._owns_client = owns_client
+        self._streams = RedisRunStreamStore(
+            redis, prefix=prefix, ttl_seconds=ttl_seconds, max_length=max_frames
+        )
+
+    @property
+    def streams(self) -> RunStreamStore:
+        return self._streams
+
+    @property
+    def lease_seconds(self) -> float:
+        return self._lease_seconds
+
+    async def create_run(self, run: ChatRun) -> None:
+        await self._redis.set(self._key("run", run.run_id), run.to_json(), ex=self._ttl_seconds)
+
+    async def get_run(self, run_id: str) -> ChatRun | None:
+        payload = await self._redis.get(self._key("run", run_id))
+        if payload is None:
+            return None
+        return ChatRun.from_json(payload)
+
+    async def heartbeat(self, run_id: str) -> None:
+        await self._redis.expire(self._key("run", run_id), self._ttl_seconds)
+        await self._streams.touch(run_id, lease_seconds=self._lease_seconds)
+
+    async def close(self) -> None:
+        if self._owns_client:
+            await self._redis.aclose()
+
+    def _key(self, *parts: str) -> str:
+        return ":".join((self._prefix, *parts))
+
+
+__all__ = ["RedisChatRunBackend"]
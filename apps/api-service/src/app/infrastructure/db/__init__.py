@@ -4,10 +4,13 @@ from .engine import (
     dispose_engine,
     get_async_sessionmaker,
     get_engine,
+    get_read_sessionmaker,
+    get_replica_engine,
     init_engine,
     run_migrations_if_configured,
     verify_database_connection,
 )
+from .routing import read_your_writes
 from .session import get_db_session
 
 __all__ = [
@@ -15,7 +18,10 @@ __all__ = [
     "get_async_sessionmaker",
     "get_engine",
     "get_db_session",
+    "get_read_sessionmaker",
+    "get_replica_engine",
     "init_engine",
+    "read_your_writes",
     "run_migrations_if_configured",
     "verify_database_connection",
 ]
@@ -20,11 +20,15 @@ from sqlalchemy.pool import NullPool
 
 from app.core.settings import get_settings
 
+from .routing import PrimarySession, ReplicaSessionmaker
+
 logger = logging.getLogger("api-service.db")
 
 _engine_lock = asyncio.Lock()
 _engine: AsyncEngine | None = None
 _session_factory: async_sessionmaker[AsyncSession] | None = None
+_replica_engine: AsyncEngine | None = None
+_read_session_factory: async_sessionmaker[AsyncSession] | None = None
 
 
 def get_engine() -> AsyncEngine | None:
@@ -44,6 +48,42 @@ def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
     return _session_factory
 
 
+def get_replica_engine() -> AsyncEngine | None:
+    """Return the read-replica engine, if one is configured."""
+
+    return _replica_engine
+
+
+def get_read_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    """Return the session factory for read-only queries.
+
+    Sessions land on the read replica when ``DATABASE_REPLICA_URL`` is set, and on
+    the primary once the current request has written (see ``read_your_writes``).
+    Without a replica this is the primary session factory.
+    """
+
+    if _read_session_factory is not None:
+        return _read_session_factory
+    return get_async_sessionmaker()
+
+
+def _engine_kwargs(database_url: str) -> dict[str, object]:
+    settings = get_settings()
+    engine_kwargs: dict[str, object] = {
+        "echo": settings.database_echo,
+    }
+    if database_url.startswith("sqlite+"):
+        engine_kwargs["poolclass"] = NullPool
+    else:
+        engine_kwargs.update(
+            pool_size=settings.database_pool_size,
+            max_overflow=settings.database_max_overflow,
+            pool_recycle=settings.database_pool_recycle,
+            pool_timeout=settings.database_pool_timeout,
+        )
+    return engine_kwargs
+
+
 async def init_engine(*, run_migrations: bool = False) -> AsyncEngine | None:
     """Initialise the async engine based on application settings."""
 
@@ -56,40 +96,42 @@ async def init_engine(*, run_migrations: bool = False) -> AsyncEngine | None:
             "Set DATABASE_URL or disable durable persistence."
         )
 
-    global _engine, _session_factory
+    global _engine, _session_factory, _replica_engine, _read_session_factory
 
     if _engine is not None:
         return _engine
 
     async with _engine_lock:
         if _engine is None:
-            engine_kwargs: dict[str, object] = {
-                "echo": settings.database_echo,
-            }
-            if database_url.startswith("sqlite+"):
-                engine_kwargs["poolclass"] = NullPool
-            else:
-                engine_kwargs.update(
-                    pool_size=settings.database_pool_size,
-                    max_overflow=settings.database_max_overflow,
-                    pool_recycle=settings.database_pool_recycle,
-                    pool_timeout=settings.database_pool_timeout,
-                )
-
             logger.info(
                 "Initialising async engine (url=%s)",
                 database_url,
             )
             _engine = create_async_engine(
                 database_url,
-                **engine_kwargs,
+                **_engine_kwargs(database_url),
             )
             _session_factory = async_sessionmaker(
                 _engine,
                 expire_on_commit=False,
                 autoflush=False,
+                sync_session_class=PrimarySession,
             )
 
+            replica_url = settings.database_replica_url
+            if replica_url:
+                logger.info("Initialising read-replica engine (url=%s)", replica_url)
+                _replica_engine = create_async_engine(
+                    replica_url,
+                    **_engine_kwargs(replica_url),
+                )
+                _read_session_factory = ReplicaSessionmaker(
+                    _replica_engine,
+                    primary=_session_factory,
+                    expire_on_commit=False,
+                    autoflush=False,
+                )
+
             if run_migrations:
                 logger.debug("init_engine: running migrations (run_migrations=%s)", run_migrations)
                 await run_migrations_if_configured(force=True)
@@ -105,12 +147,16 @@ async def init_engine(*, run_migrations: bool = False) -> AsyncEngine | None:
 async def dispose_engine() -> None:
     """Dispose of the shared async engine and reset the session factory."""
 
-    global _engine, _session_factory
+    global _engine, _session_factory, _replica_engine, _read_session_factory
     async with _engine_lock:
+        if _replica_engine is not None:
+            await _replica_engine.dispose()
         if _engine is not None:
             await _engine.dispose()
         _engine = None
         _session_factory = None
+        _replica_engine = None
+        _read_session_factory = None
 
 
 async def verify_database_connection(timeout: float | None = None) -> None:
@@ -124,8 +170,11 @@ async def verify_database_connection(timeout: float | None = None) -> None:
     logger.debug("Verifying database connectivity (timeout=%s)", timeout)
 
     async with asyncio.timeout(timeout):
-        async with _engine.connect() as connection:
-            await connection.execute(text("SELECT 1"))
+        for engine in (_engine, _replica_engine):
+            if engine is None:
+                continue
+            async with engine.connect() as connection:
+                await connection.execute(text("SELECT 1"))
 
 
 async def run_migrations_if_configured(*, force: bool = False) -> None:
@@ -0,0 +1,104 @@
+"""Read-replica routing with per-request read-your-writes.
+
+Read-only repository paths take the *read* session factory from
+:func:`app.infrastructure.db.get_read_sessionmaker`. When a replica is
+configured that factory opens sessions on the replica engine, except once the
+current request has written through the primary: from then on it hands out
+primary sessions so the request observes its own writes despite replication
+lag.
+
+Writes are detected on :class:`PrimarySession` (flushes with pending changes
+and INSERT/UPDATE/DELETE statements) and recorded on a tracker that
+:func:`read_your_writes` installs for the duration of a request or job. Code
+running outside such a scope is not tracked and always reads from the replica.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from sqlalchemy import TextClause, event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import ORMExecuteState, Session, UOWTransaction
+
+
+class _WriteTracker:
+    __slots__ = ("wrote",)
+
+    def __init__(self) -> None:
+        self.wrote = False
+
+
+_tracker: ContextVar[_WriteTracker | None] = ContextVar("db_write_tracker", default=None)
+
+
+@contextmanager
+def read_your_writes() -> Iterator[None]:
+    """Route reads to the primary for the rest of this scope once it has written."""
+
+    token = _tracker.set(_WriteTracker())
+    try:
+        yield
+    finally:
+        _tracker.reset(token)
+
+
+def mark_write() -> None:
+    tracker = _tracker.get()
+    if tracker is not None:
+        tracker.wrote = True
+
+
+def has_written() -> bool:
+    tracker = _tracker.get()
+    return tracker is not None and tracker.wrote
+
+
+class PrimarySession(Session):
+    """Sync session class behind primary ``AsyncSession`` objects; reports writes."""
+
+
+@event.listens_for(PrimarySession, "after_flush")
+def _after_flush(session: Session, flush_context: UOWTransaction) -> None:
+    mark_write()
+
+
+@event.listens_for(PrimarySession, "do_orm_execute")
+def _on_execute(orm_execute_state: ORMExecuteState) -> None:
+    if orm_execute_state.is_select:
+        return
+    statement = orm_execute_state.statement
+    if isinstance(statement, TextClause) and statement.text.lstrip()[:6].upper() == "SELECT":
+        return
+    mark_write()
+
+
+class ReplicaSessionmaker(async_sessionmaker[AsyncSession]):
+    """Session factory bound to the replica that falls back to the primary after a write."""
+
+    def __init__(
+        self,
+        replica: AsyncEngine,
+        *,
+        primary: async_sessionmaker[AsyncSession],
+        **kw: Any,
+    ) -> None:
+        super().__init__(replica, **kw)
+        self._primary = primary
+
+    def __call__(self, **local_kw: Any) -> AsyncSession:
+        if has_written():
+            return self._primary(**local_kw)
+        return super().__call__(**local_kw)
+
+
+__all__ = [
+    "PrimarySession",
+    "ReplicaSessionmaker",
+    "has_written",
+    "mark_write",
+    "read_your_writes",
+]
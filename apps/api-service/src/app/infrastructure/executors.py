@@ -0,0 +1,194 @@
+"""Bounded, per-integration thread pools (bulkheads) for blocking SDK calls.
+
+Blocking client libraries (Stripe, boto3, GCS, Azure Blob, MaxMind readers) used to
+share the event loop's default executor, so one slow dependency could occupy every
+worker thread and starve unrelated integrations. Each integration now owns a named
+pool with a fixed number of workers and a bounded queue; once both are full new
+calls fail fast with :class:`IntegrationExecutorSaturatedError` instead of piling up.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Literal, ParamSpec, TypeVar
+
+from app.core.settings import Settings, get_settings
+from app.observability.metrics import (
+    observe_integration_executor_queue_depth,
+    observe_integration_executor_wait,
+    record_integration_executor_in_flight,
+    record_integration_executor_rejection,
+)
+
+IntegrationExecutorName = Literal["stripe", "storage", "geoip", "images"]
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+logger = logging.getLogger("api-service.infrastructure.executors")
+
+
+class IntegrationExecutorSaturatedError(RuntimeError):
+    """Raised when an integration's workers and queue are both full."""
+
+    def __init__(self, name: str, capacity: int) -> None:
+        super().__init__(
+            f"Integration executor '{name}' is saturated ({capacity} calls in flight)."
+        )
+        self.name = name
+        self.capacity = capacity
+
+
+class IntegrationExecutor:
+    """Thread pool with a hard cap on running + queued calls."""
+
+    def __init__(self, name: str, *, max_workers: int, max_queue: int) -> None:
+        self._name = name
+        self._max_workers = max(1, max_workers)
+        self._max_queue = max(0, max_queue)
+        self._pool = ThreadPoolExecutor(
+            max_workers=self._max_workers,
+            thread_name_prefix=f"integration-{name}",
+        )
+        self._lock = threading.Lock()
+        self._in_flight = 0
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def capacity(self) -> int:
+        return self._max_workers + self._max_queue
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def limits(self) -> tuple[int, int]:
+        return self._max_workers, self._max_queue
+
+    async def run(self, func: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs) -> T:
+        """Run ``func`` on this integration's pool, failing fast when saturated."""
+
+        with self._lock:
+            if self._in_flight >= self.capacity:
+                record_integration_executor_rejection(executor=self._name)
+                raise IntegrationExecutorSaturatedError(self._name, self.capacity)
+            self._in_flight += 1
+            in_flight = self._in_flight
+        record_integration_executor_in_flight(executor=self._name, value=in_flight)
+        observe_integration_executor_queue_depth(
+            executor=self._name,
+            depth=max(0, in_flight - self._max_workers),
+        )
+
+        context = contextvars.copy_context()
+        enqueued_at = time.perf_counter()
+
+        def _call() -> T:
+            observe_integration_executor_wait(
+                executor=self._name,
+                duration_seconds=time.perf_counter() - enqueued_at,
+            )
+            return context.run(func, *args, **kwargs)
+
+        try:
+            future = self._pool.submit(_call)
+        except RuntimeError:
+            self._release(None)
+            raise
+        # Release the slot when the thread finishes, not when the awaiting task gives up:
+        # a hung call keeps occupying its worker and must keep counting against capacity.
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def shutdown(self, *, cancel_pending: bool = True) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=cancel_pending)
+
+    def _release(self, _future: Future[T] | None) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            in_flight = self._in_flight
+        record_integration_executor_in_flight(executor=self._name, value=in_flight)
+
+
+class IntegrationExecutorRegistry:
+    """Build and cache one executor per integration, keyed by its configured limits.
+
+    When the limits for an integration change (new settings), the next lookup builds a
+    fresh pool and retires the old one: calls already submitted to it still finish.
+    """
+
+    def __init__(self) -> None:
+        self._executors: dict[IntegrationExecutorName, IntegrationExecutor] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: IntegrationExecutorName, settings: Settings) -> IntegrationExecutor:
+        max_workers, max_queue = settings.integration_executor_limits(name)
+        limits = (max(1, max_workers), max(0, max_queue))
+        with self._lock:
+            executor = self._executors.get(name)
+            if executor is not None and executor.limits == limits:
+                return executor
+            if executor is not None:
+                executor.shutdown(cancel_pending=False)
+            executor = IntegrationExecutor(name, max_workers=max_workers, max_queue=max_queue)
+            self._executors[name] = executor
+            logger.debug(
+                "Initialized integration executor",
+                extra={"executor": name, "max_workers": max_workers, "max_queue": max_queue},
+            )
+            return executor
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executors = list(self._executors.values())
+            self._executors.clear()
+        for executor in executors:
+            executor.shutdown()
+
+
+_REGISTRY: IntegrationExecutorRegistry | None = None
+
+
+def get_integration_executor(
+    name: IntegrationExecutorName, settings: Settings | None = None
+) -> IntegrationExecutor:
+    """Return the shared executor for ``name`` sized from ``settings`` (or the app settings).
+
+    Long-lived clients should call this per operation rather than keep the result: the
+    pool is replaced when its limits change and shut down on container reset.
+    """
+
+    global _REGISTRY
+    if _REGISTRY is None:
+        _REGISTRY = IntegrationExecutorRegistry()
+    return _REGISTRY.get(name, settings or get_settings())
+
+
+def shutdown_integration_executors() -> None:
+    """Stop all integration pools and forget the registry."""
+
+    global _REGISTRY
+    if _REGISTRY is None:
+        return
+    _REGISTRY.shutdown()
+    _REGISTRY = None
+
+
+__all__ = [
+    "IntegrationExecutor",
+    "IntegrationExecutorName",
+    "IntegrationExecutorRegistry",
+    "IntegrationExecutorSaturatedError",
+    "get_integration_executor",
+    "shutdown_integration_executors",
+]
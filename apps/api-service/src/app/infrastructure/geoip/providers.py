@@ -13,6 +13,11 @@ from geoip2 import database
 from geoip2.errors import AddressNotFoundError
 
 from app.domain.auth import SessionLocation
+from app.infrastructure.executors import (
+    IntegrationExecutor,
+    IntegrationExecutorSaturatedError,
+    get_integration_executor,
+)
 from app.observability.logging import log_event
 
 _ip2location_import_error: ImportError | None
@@ -194,6 +199,7 @@ class MaxMindDBGeoIPService(BaseGeoIPService):
         db_path: str | Path,
         cache_ttl_seconds: float = 900.0,
         cache_max_entries: int = 4096,
+        executor: IntegrationExecutor | None = None,
     ) -> None:
         path = Path(db_path)
         if not path.exists():
@@ -203,6 +209,11 @@ class MaxMindDBGeoIPService(BaseGeoIPService):
             cache_max_entries=cache_max_entries,
         )
         self._reader = database.Reader(str(path))
+        self._executor_override = executor
+
+    @property
+    def _executor(self) -> IntegrationExecutor:
+        return self._executor_override or get_integration_executor("geoip")
 
     async def lookup(self, ip_address: str) -> SessionLocation | None:
         normalized = _normalize_ip(ip_address)
@@ -212,7 +223,11 @@ class MaxMindDBGeoIPService(BaseGeoIPService):
         if cached is not _MISS:
             return cached  # type: ignore[return-value]
         try:
-            response = await asyncio.to_thread(self._reader.city, normalized)
+            response = await self._executor.run(self._reader.city, normalized)
+        except IntegrationExecutorSaturatedError:
+            # Lookups are best-effort; skip (and do not cache) while the pool is full.
+            log_event("geoip.lookup_saturated", provider="maxmind_db", ip=normalized)
+            return None
         except AddressNotFoundError:
             result = None
         except ValueError as exc:
@@ -343,6 +358,7 @@ class IP2LocationDatabaseService(BaseGeoIPService):
         db_path: str | Path,
         cache_ttl_seconds: float = 900.0,
         cache_max_entries: int = 4096,
+        executor: IntegrationExecutor | None = None,
     ) -> None:
         if IP2Location is None:  # pragma: no cover - dependency guard
             raise RuntimeError("IP2Location package is not available.") from (
@@ -356,6 +372,11 @@ class IP2LocationDatabaseService(BaseGeoIPService):
             cache_max_entries=cache_max_entries,
         )
         self._reader = IP2Location.IP2Location(str(path))
+        self._executor_override = executor
+
+    @property
+    def _executor(self) -> IntegrationExecutor:
+        return self._executor_override or get_integration_executor("geoip")
 
     async def lookup(self, ip_address: str) -> SessionLocation | None:
         normalized = _normalize_ip(ip_address)
@@ -365,7 +386,10 @@ class IP2LocationDatabaseService(BaseGeoIPService):
         if cached is not _MISS:
             return cached  # type: ignore[return-value]
         try:
-            response = await asyncio.to_thread(self._reader.get_all, normalized)
+            response = await self._executor.run(self._reader.get_all, normalized)
+        except IntegrationExecutorSaturatedError:
+            log_event("geoip.lookup_saturated", provider="ip2location_db", ip=normalized)
+            return None
         except Exception as exc:  # pragma: no cover - best effort logging
             log_event(
                 "geoip.lookup_error",
@@ -13,6 +13,12 @@ from app.infrastructure.persistence.models.base import UTC_NOW, Base, uuid_pk
 
 
 class ActivityEventRow(Base):
+    """Append-only activity entry; range-partitioned by month on ``created_at`` in Postgres.
+
+    There the primary key is ``(id, created_at)``; the model keeps ``id`` alone
+    (Alembic does not compare primary keys).
+    """
+
     __tablename__ = "activity_events"
     __table_args__ = (
         Index("ix_activity_events_tenant_created", "tenant_id", "created_at"),
@@ -57,9 +63,9 @@ class ActivityReceiptRow(Base):
     user_id: Mapped[uuid.UUID] = mapped_column(
         PG_UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
-    event_id: Mapped[uuid.UUID] = mapped_column(
-        PG_UUID(as_uuid=True), ForeignKey("activity_events.id", ondelete="CASCADE"), nullable=False
-    )
+    # No foreign key: activity_events is partitioned on Postgres, so its unique keys
+    # include created_at. Retention purges receipts whose event has aged out.
+    event_id: Mapped[uuid.UUID] = mapped_column(PG_UUID(as_uuid=True), nullable=False)
     status: Mapped[str] = mapped_column(String(16), nullable=False)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -32,8 +32,15 @@ def _decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
 
 
 class SqlAlchemyActivityEventRepository(ActivityEventRepository):
-    def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        read_session_factory: async_sessionmaker[AsyncSession] | None = None,
+    ):
         self._session_factory = session_factory
+        # Feed listing tolerates replica lag; point lookups stay on the primary.
+        self._read_session_factory = read_session_factory or session_factory
 
     async def record(self, event: ActivityEvent) -> None:
         row = ActivityEventRow(
@@ -143,7 +150,7 @@ class SqlAlchemyActivityEventRepository(ActivityEventRepository):
             .limit(limit + 1)
         )
 
-        async with self._session_factory() as session:
+        async with self._read_session_factory() as session:
             rows = list((await session.execute(stmt)).scalars().all())
 
         next_cursor = None
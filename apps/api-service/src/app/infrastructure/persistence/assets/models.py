@@ -5,7 +5,7 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Index, String, UniqueConstraint
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -33,6 +33,14 @@ class AgentAsset(Base):
         ForeignKey("storage_objects.id", ondelete="CASCADE"),
         nullable=False,
     )
+    thumbnail_object_id: Mapped[uuid.UUID | None] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("storage_objects.id", ondelete="SET NULL"),
+        nullable=True,
+    )
+    thumbnail_failures: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
     asset_type: Mapped[str] = mapped_column(String(16), nullable=False)
     source_tool: Mapped[str | None] = mapped_column(String(32))
     conversation_id: Mapped[uuid.UUID | None] = mapped_column(
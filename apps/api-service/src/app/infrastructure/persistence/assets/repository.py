@@ -8,7 +8,7 @@ from collections.abc import Sequence
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import Select, and_, select
+from sqlalchemy import Select, and_, or_, select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
@@ -161,6 +161,69 @@ class SqlAlchemyAssetRepository(AssetRepository):
             session.add(row)
             await session.commit()
 
+    async def set_thumbnail(
+        self, *, tenant_id: uuid.UUID, asset_id: uuid.UUID, thumbnail_object_id: uuid.UUID
+    ) -> None:
+        async with self._session_factory() as session:
+            stmt = (
+                update(AgentAsset)
+                .where(AgentAsset.tenant_id == tenant_id, AgentAsset.id == asset_id)
+                .values(thumbnail_object_id=thumbnail_object_id)
+            )
+            await session.execute(stmt)
+            await session.commit()
+
+    async def record_thumbnail_failure(self, *, tenant_id: uuid.UUID, asset_id: uuid.UUID) -> None:
+        async with self._session_factory() as session:
+            stmt = (
+                update(AgentAsset)
+                .where(AgentAsset.tenant_id == tenant_id, AgentAsset.id == asset_id)
+                .values(thumbnail_failures=AgentAsset.thumbnail_failures + 1)
+            )
+            await session.execute(stmt)
+            await session.commit()
+
+    async def list_missing_thumbnails(
+        self,
+        *,
+        created_before: datetime,
+        after: tuple[datetime, uuid.UUID] | None,
+        limit: int,
+        max_failures: int | None = None,
+    ) -> builtins.list[AssetRecord]:
+        """Live image assets without a thumbnail, oldest first, across tenants.
+
+        ``after`` is the ``(created_at, id)`` of the last asset of the previous page.
+        Assets whose render already failed ``max_failures`` times are left out.
+        """
+
+        async with self._session_factory() as session:
+            stmt = (
+                select(AgentAsset)
+                .join(StorageObject, AgentAsset.storage_object_id == StorageObject.id)
+                .where(
+                    AgentAsset.asset_type == "image",
+                    AgentAsset.thumbnail_object_id.is_(None),
+                    AgentAsset.deleted_at.is_(None),
+                    AgentAsset.created_at < created_before,
+                    StorageObject.deleted_at.is_(None),
+                )
+                .order_by(AgentAsset.created_at, AgentAsset.id)
+                .limit(limit)
+            )
+            if max_failures is not None:
+                stmt = stmt.where(AgentAsset.thumbnail_failures < max_failures)
+            if after is not None:
+                after_created_at, after_id = after
+                stmt = stmt.where(
+                    or_(
+                        AgentAsset.created_at > after_created_at,
+                        and_(AgentAsset.created_at == after_created_at, AgentAsset.id > after_id),
+                    )
+                )
+            result = await session.execute(stmt)
+            return [_to_domain(row) for row in result.scalars().all()]
+
     async def link_message(
         self,
         *,
@@ -241,6 +304,8 @@ def _to_domain(row: AgentAsset) -> AssetRecord:
         container_id=row.container_id,
         openai_file_id=row.openai_file_id,
         metadata=row.metadata_json or {},
+        thumbnail_object_id=row.thumbnail_object_id,
+        thumbnail_failures=row.thumbnail_failures or 0,
         created_at=row.created_at,
         updated_at=row.updated_at,
         deleted_at=row.deleted_at,
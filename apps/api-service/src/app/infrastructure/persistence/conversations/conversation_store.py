@@ -220,13 +220,7 @@ class ConversationStore:
                     "session state cannot be updated."
                 )
 
-            conversation.sdk_session_id = state.sdk_session_id
-            conversation.session_cursor = state.session_cursor
-            conversation.last_session_sync_at = state.last_session_sync_at
-            conversation.provider = state.provider or conversation.provider
-            if state.provider_conversation_id:
-                conversation.provider_conversation_id = state.provider_conversation_id
-
+            apply_session_state(conversation, state=state)
             await session.commit()
 
     async def set_display_name(
@@ -457,4 +451,15 @@ def apply_message_metadata(
         conversation.last_session_sync_at = metadata.last_session_sync_at
 
 
-__all__ = ["ConversationStore", "apply_message_metadata"]
+def apply_session_state(
+    conversation: AgentConversation, *, state: ConversationSessionState
+) -> None:
+    conversation.sdk_session_id = state.sdk_session_id
+    conversation.session_cursor = state.session_cursor
+    conversation.last_session_sync_at = state.last_session_sync_at
+    conversation.provider = state.provider or conversation.provider
+    if state.provider_conversation_id:
+        conversation.provider_conversation_id = state.provider_conversation_id
+
+
+__all__ = ["ConversationStore", "apply_message_metadata", "apply_session_state"]
@@ -83,16 +83,17 @@ class ConversationLedgerSegment(Base):
 
 
 class ConversationLedgerEvent(Base):
-    """Single persisted `public_sse_v1` frame (inline JSON or spilled to object storage)."""
+    """Single persisted `public_sse_v1` frame (inline JSON or spilled to object storage).
+
+    Range-partitioned by month on ``ingested_at`` in Postgres (see
+    ``app.infrastructure.persistence.partitions``), where the primary key is
+    ``(id, ingested_at)``; the model keeps ``id`` alone so SQLite can still
+    autoincrement it. Uniqueness of ``(conversation_id, stream_id, event_id)`` is
+    enforced by :class:`ConversationLedgerEventKey`.
+    """
 
     __tablename__ = "conversation_ledger_events"
     __table_args__ = (
-        UniqueConstraint(
-            "conversation_id",
-            "stream_id",
-            "event_id",
-            name="uq_conversation_ledger_events_conversation_stream_event",
-        ),
         Index(
             "ix_conversation_ledger_events_tenant_conversation_id_id",
             "tenant_id",
@@ -155,6 +156,27 @@ class ConversationLedgerEvent(Base):
     )
 
 
+class ConversationLedgerEventKey(Base):
+    """Claims ``(conversation_id, stream_id, event_id)`` for one ledger frame.
+
+    Inserted with the frame so a replayed frame raises ``IntegrityError``.
+    """
+
+    __tablename__ = "conversation_ledger_event_keys"
+    __table_args__ = (Index("ix_conversation_ledger_event_keys_ingested_at", "ingested_at"),)
+
+    conversation_id: Mapped[uuid.UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("agent_conversations.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    stream_id: Mapped[str] = mapped_column(String(255), primary_key=True)
+    event_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    ingested_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=UTC_NOW, nullable=False
+    )
+
+
 class ConversationRunQueueItem(Base):
     """Durable FIFO queue item for user messages when a run is already active."""
 
@@ -210,6 +232,7 @@ class ConversationRunQueueItem(Base):
 
 __all__ = [
     "ConversationLedgerEvent",
+    "ConversationLedgerEventKey",
     "ConversationLedgerSegment",
     "ConversationRunQueueItem",
 ]
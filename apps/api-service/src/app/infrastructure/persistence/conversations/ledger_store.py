@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import uuid
 from collections.abc import Sequence
+from datetime import UTC, datetime
 
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
@@ -15,6 +16,7 @@ from app.infrastructure.persistence.conversations.ids import (
 )
 from app.infrastructure.persistence.conversations.ledger_models import (
     ConversationLedgerEvent,
+    ConversationLedgerEventKey,
     ConversationLedgerSegment,
 )
 from app.infrastructure.persistence.conversations.ledger_segments import (
@@ -51,8 +53,18 @@ class ConversationLedgerStore:
                 session, tenant_id=tenant_uuid, conversation_id=conversation_uuid
             )
 
-            rows: list[ConversationLedgerEvent] = []
+            ingested_at = datetime.now(UTC)
+            rows: list[ConversationLedgerEvent | ConversationLedgerEventKey] = []
             for record in events:
+                # Claims the frame's logical key; a replayed frame fails on it.
+                rows.append(
+                    ConversationLedgerEventKey(
+                        conversation_id=conversation_uuid,
+                        stream_id=record.stream_id,
+                        event_id=record.event_id,
+                        ingested_at=ingested_at,
+                    )
+                )
                 rows.append(
                     ConversationLedgerEvent(
                         tenant_id=tenant_uuid,
@@ -74,6 +86,7 @@ class ConversationLedgerStore:
                         payload_size_bytes=record.payload_size_bytes,
                         payload_json=record.payload_json,
                         payload_object_id=record.payload_object_id,
+                        ingested_at=ingested_at,
                     )
                 )
 
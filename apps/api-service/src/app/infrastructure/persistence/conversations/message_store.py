@@ -43,7 +43,7 @@ from app.infrastructure.persistence.conversations.mappers import (
     serialize_attachments,
     to_utc,
 )
-from app.infrastructure.persistence.conversations.models import AgentMessage
+from app.infrastructure.persistence.conversations.models import AgentConversation, AgentMessage
 
 logger = logging.getLogger("api-service.persistence")
 
@@ -68,48 +68,11 @@ class ConversationMessageStore:
         tenant_id: str,
         metadata: ConversationMetadata,
     ) -> int | None:
-        conversation_uuid = coerce_conversation_uuid(conversation_id)
-        conversation_key = derive_conversation_key(conversation_id)
-        tenant_uuid = parse_tenant_id(tenant_id)
         ensure_metadata_tenant(metadata, tenant_id)
         async with self._session_factory() as session:
-            conversation = await self._conversations.get_or_create_for_message(
-                session,
-                conversation_uuid,
-                conversation_key=conversation_key,
-                tenant_id=tenant_uuid,
-                metadata=metadata,
-            )
-            segment = await get_or_create_active_segment(
-                session,
-                tenant_id=tenant_uuid,
-                conversation_id=conversation.id,
-            )
-
-            position = conversation.message_count
-            conversation.message_count = position + 1
-            conversation.last_message_at = to_utc(message.timestamp)
-            conversation.updated_at = datetime.now(UTC)
-            apply_message_metadata(conversation, metadata=metadata)
-
-            db_message = AgentMessage(
-                conversation_id=conversation.id,
-                segment_id=segment.id,
-                position=position,
-                role=message.role,
-                agent_type=metadata.active_agent if message.role == "assistant" else None,
-                content={"text": message.content},
-                attachments=serialize_attachments(message.attachments),
-                token_count_prompt=metadata.total_tokens_prompt
-                if message.role == "assistant"
-                else None,
-                token_count_completion=metadata.total_tokens_completion
-                if message.role == "assistant"
-                else None,
-                reasoning_tokens=metadata.reasoning_tokens if message.role == "assistant" else None,
-                created_at=to_utc(message.timestamp),
+            _, db_message = await self.add_message_in_session(
+                session, conversation_id, message, tenant_id=tenant_id, metadata=metadata
             )
-            session.add(db_message)
             await session.commit()
             await session.refresh(db_message)
             logger.debug(
@@ -120,6 +83,63 @@ class ConversationMessageStore:
             )
             return getattr(db_message, "id", None)
 
+    async def add_message_in_session(
+        self,
+        session: AsyncSession,
+        conversation_id: str,
+        message: ConversationMessage,
+        *,
+        tenant_id: str,
+        metadata: ConversationMetadata,
+    ) -> tuple[AgentConversation, AgentMessage]:
+        """Stage a message (and its conversation bump) without committing.
+
+        The conversation row comes back locked for update so callers can fold
+        further changes into the same UPDATE before they commit.
+        """
+
+        conversation_uuid = coerce_conversation_uuid(conversation_id)
+        conversation_key = derive_conversation_key(conversation_id)
+        tenant_uuid = parse_tenant_id(tenant_id)
+        conversation = await self._conversations.get_or_create_for_message(
+            session,
+            conversation_uuid,
+            conversation_key=conversation_key,
+            tenant_id=tenant_uuid,
+            metadata=metadata,
+        )
+        segment = await get_or_create_active_segment(
+            session,
+            tenant_id=tenant_uuid,
+            conversation_id=conversation.id,
+        )
+
+        position = conversation.message_count
+        conversation.message_count = position + 1
+        conversation.last_message_at = to_utc(message.timestamp)
+        conversation.updated_at = datetime.now(UTC)
+        apply_message_metadata(conversation, metadata=metadata)
+
+        db_message = AgentMessage(
+            conversation_id=conversation.id,
+            segment_id=segment.id,
+            position=position,
+            role=message.role,
+            agent_type=metadata.active_agent if message.role == "assistant" else None,
+            content={"text": message.content},
+            attachments=serialize_attachments(message.attachments),
+            token_count_prompt=metadata.total_tokens_prompt
+            if message.role == "assistant"
+            else None,
+            token_count_completion=metadata.total_tokens_completion
+            if message.role == "assistant"
+            else None,
+            reasoning_tokens=metadata.reasoning_tokens if message.role == "assistant" else None,
+            created_at=to_utc(message.timestamp),
+        )
+        session.add(db_message)
+        return conversation, db_message
+
     async def get_messages(
         self, conversation_id: str, *, tenant_id: str
     ) -> list[ConversationMessage]:
@@ -177,11 +177,17 @@ class ConversationSummary(Base):
 
 
 class AgentRunEvent(Base):
-    """Structured event log entry mirroring SDK run items."""
+    """Structured event log entry mirroring SDK run items.
+
+    Range-partitioned by month on ``ingested_at`` in Postgres (see
+    ``app.infrastructure.persistence.partitions``), where the primary key is
+    ``(id, ingested_at)``. The model keeps ``id`` alone so SQLite can still
+    autoincrement it; Alembic does not compare primary keys. Uniqueness of
+    ``(conversation_id, sequence_no)`` is enforced by :class:`AgentRunEventKey`.
+    """
 
     __tablename__ = "agent_run_events"
     __table_args__ = (
-        UniqueConstraint("conversation_id", "sequence_no", name="uq_agent_run_events_seq"),
         Index("ix_agent_run_events_conv_seq", "conversation_id", "sequence_no"),
         Index("ix_agent_run_events_toolcall", "tool_call_id"),
         Index(
@@ -227,6 +233,27 @@ class AgentRunEvent(Base):
     )
 
 
+class AgentRunEventKey(Base):
+    """Claims ``(conversation_id, sequence_no)`` for one run event.
+
+    Inserted with the event so a duplicate raises ``IntegrityError`` even though
+    the partitioned event table cannot hold a unique key without ``ingested_at``.
+    """
+
+    __tablename__ = "agent_run_event_keys"
+    __table_args__ = (Index("ix_agent_run_event_keys_ingested_at", "ingested_at"),)
+
+    conversation_id: Mapped[uuid.UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("agent_conversations.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    sequence_no: Mapped[int] = mapped_column(Integer, primary_key=True)
+    ingested_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=UTC_NOW, nullable=False
+    )
+
+
 class AgentRunUsageModel(Base):
     """Per-run usage snapshot for audit and analytics."""
 
@@ -265,6 +292,7 @@ __all__ = [
     "AgentConversation",
     "AgentMessage",
     "AgentRunEvent",
+    "AgentRunEventKey",
     "AgentRunUsageModel",
     "ConversationSummary",
 ]
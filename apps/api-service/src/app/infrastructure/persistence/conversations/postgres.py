@@ -17,6 +17,7 @@ from app.domain.conversations import (
     ConversationRunUsage,
     ConversationSearchPage,
     ConversationSessionState,
+    ConversationTurn,
 )
 from app.infrastructure.persistence.conversations.conversation_reader import ConversationReader
 from app.infrastructure.persistence.conversations.conversation_store import ConversationStore
@@ -24,22 +25,41 @@ from app.infrastructure.persistence.conversations.message_store import Conversat
 from app.infrastructure.persistence.conversations.run_event_store import RunEventStore
 from app.infrastructure.persistence.conversations.search_store import ConversationSearchStore
 from app.infrastructure.persistence.conversations.summary_store import ConversationSummaryStore
+from app.infrastructure.persistence.conversations.turn_store import ConversationTurnStore
 from app.infrastructure.persistence.conversations.usage_store import RunUsageStore
 
 
 class PostgresConversationRepository(ConversationRepository):
-    """Facade that delegates to focused stores for each capability."""
+    """Facade that delegates to focused stores for each capability.
 
-    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+    Conversation listing and search use ``read_session_factory`` (a read replica
+    when configured); everything else, including single-conversation loads on the
+    chat path, stays on the primary.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        read_session_factory: async_sessionmaker[AsyncSession] | None = None,
+    ) -> None:
+        read_session_factory = read_session_factory or session_factory
         self._conversations = ConversationStore(session_factory)
         self._messages = ConversationMessageStore(
             session_factory, conversation_store=self._conversations
         )
         self._reader = ConversationReader(session_factory)
-        self._search = ConversationSearchStore(session_factory)
+        self._listing = ConversationReader(read_session_factory)
+        self._search = ConversationSearchStore(read_session_factory)
         self._run_events = RunEventStore(session_factory)
         self._summaries = ConversationSummaryStore(session_factory)
         self._run_usage = RunUsageStore(session_factory)
+        self._turns = ConversationTurnStore(
+            session_factory,
+            message_store=self._messages,
+            run_usage_store=self._run_usage,
+            run_event_store=self._run_events,
+        )
 
     # --- messages / conversations ------------------------------------
     async def add_message(
@@ -54,6 +74,15 @@ class PostgresConversationRepository(ConversationRepository):
             conversation_id, message, tenant_id=tenant_id, metadata=metadata
         )
 
+    async def record_turn(
+        self,
+        conversation_id: str,
+        *,
+        tenant_id: str,
+        turn: ConversationTurn,
+    ) -> int | None:
+        return await self._turns.record_turn(conversation_id, tenant_id=tenant_id, turn=turn)
+
     async def get_messages(
         self, conversation_id: str, *, tenant_id: str
     ) -> list[ConversationMessage]:
@@ -68,7 +97,7 @@ class PostgresConversationRepository(ConversationRepository):
         return await self._conversations.list_conversation_ids(tenant_id=tenant_id)
 
     async def iter_conversations(self, *, tenant_id: str) -> list[ConversationRecord]:
-        return await self._reader.iter_conversations(tenant_id=tenant_id)
+        return await self._listing.iter_conversations(tenant_id=tenant_id)
 
     async def paginate_conversations(
         self,
@@ -79,7 +108,7 @@ class PostgresConversationRepository(ConversationRepository):
         agent_entrypoint: str | None = None,
         updated_after: datetime | None = None,
     ) -> ConversationPage:
-        return await self._reader.paginate_conversations(
+        return await self._listing.paginate_conversations(
             tenant_id=tenant_id,
             limit=limit,
             cursor=cursor,
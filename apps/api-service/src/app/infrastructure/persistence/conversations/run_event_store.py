@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import uuid
 from collections.abc import Sequence
 from datetime import UTC, datetime
 from time import perf_counter
@@ -22,7 +23,11 @@ from app.infrastructure.persistence.conversations.mappers import (
     serialize_attachments,
     to_utc,
 )
-from app.infrastructure.persistence.conversations.models import AgentConversation, AgentRunEvent
+from app.infrastructure.persistence.conversations.models import (
+    AgentConversation,
+    AgentRunEvent,
+    AgentRunEventKey,
+)
 
 
 class RunEventStore:
@@ -49,72 +54,12 @@ class RunEventStore:
             if conversation is None or conversation.tenant_id != tenant_uuid:
                 raise ValueError(f"Conversation {conversation_id} does not exist")
 
-            # Determine the next sequence number to preserve ordering.
-            current_seq = await session.execute(
-                select(func.coalesce(func.max(AgentRunEvent.sequence_no), -1)).where(
-                    AgentRunEvent.conversation_id == conversation_uuid
-                )
-            )
-            start_seq = int(current_seq.scalar_one() or -1) + 1
-
-            # Deduplicate on response_id when present to keep idempotence.
-            response_ids = {ev.response_id for ev in events if ev.response_id}
-            existing_keys: set[tuple[str | None, str | None, str | None]] = set()
-            if response_ids:
-                result = await session.execute(
-                    select(
-                        AgentRunEvent.response_id,
-                        AgentRunEvent.run_item_name,
-                        AgentRunEvent.tool_call_id,
-                    )
-                    .where(
-                        AgentRunEvent.conversation_id == conversation_uuid,
-                        AgentRunEvent.response_id.in_(response_ids),
-                    )
-                )
-                existing_keys = {(row[0], row[1], row[2]) for row in result.all()}
-
-            rows: list[AgentRunEvent] = []
-            batch_keys: set[tuple[str | None, str | None, str | None]] = set()
-            seq = start_seq
-            for event in events:
-                key = (event.response_id, event.run_item_name, event.tool_call_id)
-                if event.response_id:
-                    if key in existing_keys:
-                        continue
-                    if key in batch_keys:
-                        continue
-                    batch_keys.add(key)
-
-                rows.append(
-                    AgentRunEvent(
-                        conversation_id=conversation_uuid,
-                        sequence_no=event.sequence_no if event.sequence_no is not None else seq,
-                        response_id=event.response_id,
-                        workflow_run_id=event.workflow_run_id,
-                        run_item_type=event.run_item_type,
-                        run_item_name=event.run_item_name,
-                        role=event.role,
-                        agent=event.agent,
-                        tool_call_id=event.tool_call_id,
-                        tool_name=event.tool_name,
-                        model=event.model,
-                        content_text=event.content_text,
-                        reasoning_text=event.reasoning_text,
-                        call_arguments=coerce_mapping(event.call_arguments),
-                        call_output=coerce_mapping(event.call_output),
-                        attachments=serialize_attachments(event.attachments),
-                        created_at=to_utc(event.timestamp),
-                        ingested_at=datetime.now(UTC),
-                    )
-                )
-                seq += 1
-
+            rows = await self._build_rows(session, conversation_uuid, events)
             if not rows:
                 return
 
             metrics = RunEventMetrics(tenant_id, events[0].agent if events else None)
-            session.add_all(rows)
+            session.add_all([*rows, *self._key_rows(rows)])
             try:
                 await session.commit()
             except IntegrityError:
@@ -128,6 +73,121 @@ class RunEventStore:
             else:
                 metrics.projection_success(op_start)
 
+    async def add_run_events_in_session(
+        self,
+        session: AsyncSession,
+        conversation: AgentConversation,
+        *,
+        tenant_id: str,
+        events: list[ConversationEvent],
+    ) -> None:
+        """Insert events inside the caller's transaction, isolated by a savepoint.
+
+        Projection stays best-effort: a failure rolls back to the savepoint and
+        re-raises without discarding the caller's other pending writes.
+        """
+
+        if not events:
+            return
+        op_start = perf_counter()
+        rows = await self._build_rows(session, conversation.id, events)
+        if not rows:
+            return
+
+        metrics = RunEventMetrics(tenant_id, events[0].agent)
+        try:
+            async with session.begin_nested():
+                session.add_all([*rows, *self._key_rows(rows)])
+        except IntegrityError:
+            metrics.projection_conflict()
+            raise
+        except Exception:
+            metrics.projection_error()
+            raise
+        else:
+            metrics.projection_success(op_start)
+
+    @staticmethod
+    def _key_rows(rows: list[AgentRunEvent]) -> list[AgentRunEventKey]:
+        # The key table holds the unique (conversation_id, sequence_no) that the
+        # month-partitioned event table cannot, so a conflicting writer fails here.
+        return [
+            AgentRunEventKey(
+                conversation_id=row.conversation_id,
+                sequence_no=row.sequence_no,
+                ingested_at=row.ingested_at,
+            )
+            for row in rows
+        ]
+
+    async def _build_rows(
+        self,
+        session: AsyncSession,
+        conversation_uuid: uuid.UUID,
+        events: list[ConversationEvent],
+    ) -> list[AgentRunEvent]:
+        # Determine the next sequence number to preserve ordering.
+        current_seq = await session.execute(
+            select(func.coalesce(func.max(AgentRunEvent.sequence_no), -1)).where(
+                AgentRunEvent.conversation_id == conversation_uuid
+            )
+        )
+        start_seq = int(current_seq.scalar_one() or -1) + 1
+
+        # Deduplicate on response_id when present to keep idempotence.
+        response_ids = {ev.response_id for ev in events if ev.response_id}
+        existing_keys: set[tuple[str | None, str | None, str | None]] = set()
+        if response_ids:
+            result = await session.execute(
+                select(
+                    AgentRunEvent.response_id,
+                    AgentRunEvent.run_item_name,
+                    AgentRunEvent.tool_call_id,
+                )
+                .where(
+                    AgentRunEvent.conversation_id == conversation_uuid,
+                    AgentRunEvent.response_id.in_(response_ids),
+                )
+            )
+            existing_keys = {(row[0], row[1], row[2]) for row in result.all()}
+
+        rows: list[AgentRunEvent] = []
+        batch_keys: set[tuple[str | None, str | None, str | None]] = set()
+        seq = start_seq
+        for event in events:
+            key = (event.response_id, event.run_item_name, event.tool_call_id)
+            if event.response_id:
+                if key in existing_keys:
+                    continue
+                if key in batch_keys:
+                    continue
+                batch_keys.add(key)
+
+            rows.append(
+                AgentRunEvent(
+                    conversation_id=conversation_uuid,
+                    sequence_no=event.sequence_no if event.sequence_no is not None else seq,
+                    response_id=event.response_id,
+                    workflow_run_id=event.workflow_run_id,
+                    run_item_type=event.run_item_type,
+                    run_item_name=event.run_item_name,
+                    role=event.role,
+                    agent=event.agent,
+                    tool_call_id=event.tool_call_id,
+                    tool_name=event.tool_name,
+                    model=event.model,
+                    content_text=event.content_text,
+                    reasoning_text=event.reasoning_text,
+                    call_arguments=coerce_mapping(event.call_arguments),
+                    call_output=coerce_mapping(event.call_output),
+                    attachments=serialize_attachments(event.attachments),
+                    created_at=to_utc(event.timestamp),
+                    ingested_at=datetime.now(UTC),
+                )
+            )
+            seq += 1
+        return rows
+
     async def get_run_events(
         self,
         conversation_id: str,
@@ -0,0 +1,88 @@
+"""Single-transaction persistence for a completed chat turn."""
+
+from __future__ import annotations
+
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.domain.conversations import ConversationTurn
+from app.infrastructure.persistence.conversations.conversation_store import apply_session_state
+from app.infrastructure.persistence.conversations.message_store import ConversationMessageStore
+from app.infrastructure.persistence.conversations.run_event_store import RunEventStore
+from app.infrastructure.persistence.conversations.usage_store import RunUsageStore
+
+logger = logging.getLogger("api-service.persistence")
+
+
+class ConversationTurnStore:
+    """Write a turn's message, session state, usage, and run events in one commit.
+
+    The conversation row is locked once and every aggregate change (message
+    count, timestamps, session cursor, token totals) is folded into a single
+    UPDATE. Run events are staged behind a savepoint so a projection failure
+    keeps the rest of the turn.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        message_store: ConversationMessageStore,
+        run_usage_store: RunUsageStore,
+        run_event_store: RunEventStore,
+    ) -> None:
+        self._session_factory = session_factory
+        self._messages = message_store
+        self._run_usage = run_usage_store
+        self._run_events = run_event_store
+
+    async def record_turn(
+        self,
+        conversation_id: str,
+        *,
+        tenant_id: str,
+        turn: ConversationTurn,
+    ) -> int | None:
+        async with self._session_factory() as session:
+            conversation, db_message = await self._messages.add_message_in_session(
+                session,
+                conversation_id,
+                turn.message,
+                tenant_id=tenant_id,
+                metadata=turn.metadata,
+            )
+            if turn.session_state is not None:
+                apply_session_state(conversation, state=turn.session_state)
+            if turn.run_usage is not None:
+                self._run_usage.add_run_usage_in_session(session, conversation, turn.run_usage)
+            await session.flush()
+            message_id = db_message.id
+
+            if turn.run_events:
+                try:
+                    await self._run_events.add_run_events_in_session(
+                        session,
+                        conversation,
+                        tenant_id=tenant_id,
+                        events=turn.run_events,
+                    )
+                except Exception:
+                    logger.exception(
+                        "conversation.turn.run_events_failed",
+                        extra={"conversation_id": conversation_id, "tenant_id": tenant_id},
+                    )
+
+            await session.commit()
+            logger.debug(
+                "conversation.turn.recorded",
+                extra={
+                    "conversation_id": conversation_id,
+                    "message_id": message_id,
+                    "run_events": len(turn.run_events),
+                },
+            )
+            return message_id
+
+
+__all__ = ["ConversationTurnStore"]
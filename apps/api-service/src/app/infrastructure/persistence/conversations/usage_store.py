@@ -60,6 +60,36 @@ class RunUsageStore:
             rows: Iterable[AgentRunUsageModel] = result.scalars().all()
             return [self._to_domain(row) for row in rows]
 
+    def add_run_usage_in_session(
+        self,
+        session: AsyncSession,
+        conversation: AgentConversation,
+        usage: ConversationRunUsage,
+    ) -> None:
+        """Stage a usage row and bump the aggregates on an already locked conversation row.
+
+        The aggregates ride along with whatever else the caller changed on the
+        row, so they cost no extra statement.
+        """
+
+        session.add(self._build_row(conversation.id, conversation.tenant_id, usage))
+        conversation.total_tokens_prompt = (conversation.total_tokens_prompt or 0) + (
+            usage.input_tokens or 0
+        )
+        conversation.total_tokens_completion = (conversation.total_tokens_completion or 0) + (
+            usage.output_tokens or 0
+        )
+        conversation.reasoning_tokens = (conversation.reasoning_tokens or 0) + (
+            usage.reasoning_output_tokens or 0
+        )
+        conversation.total_cached_input_tokens = (conversation.total_cached_input_tokens or 0) + (
+            usage.cached_input_tokens or 0
+        )
+        conversation.total_requests = (conversation.total_requests or 0) + _normalize_requests(
+            usage.requests
+        )
+        conversation.updated_at = datetime.now(UTC)
+
     async def _insert_usage(
         self,
         session: AsyncSession,
@@ -68,23 +98,7 @@ class RunUsageStore:
         usage: ConversationRunUsage,
     ) -> None:
         requests = _normalize_requests(usage.requests)
-        model = AgentRunUsageModel(
-            tenant_id=tenant_uuid,
-            conversation_id=conversation_uuid,
-            response_id=usage.response_id,
-            run_id=usage.run_id,
-            agent_key=usage.agent_key,
-            provider=usage.provider,
-            requests=requests,
-            input_tokens=usage.input_tokens,
-            output_tokens=usage.output_tokens,
-            total_tokens=usage.total_tokens,
-            cached_input_tokens=usage.cached_input_tokens,
-            reasoning_output_tokens=usage.reasoning_output_tokens,
-            request_usage_entries=usage.request_usage_entries,
-            created_at=to_utc(usage.created_at) if usage.created_at else datetime.now(UTC),
-        )
-        session.add(model)
+        session.add(self._build_row(conversation_uuid, tenant_uuid, usage))
 
         # Increment aggregates on conversation for quick reads.
         await session.execute(
@@ -104,6 +118,27 @@ class RunUsageStore:
             )
         )
 
+    @staticmethod
+    def _build_row(
+        conversation_uuid, tenant_uuid, usage: ConversationRunUsage
+    ) -> AgentRunUsageModel:
+        return AgentRunUsageModel(
+            tenant_id=tenant_uuid,
+            conversation_id=conversation_uuid,
+            response_id=usage.response_id,
+            run_id=usage.run_id,
+            agent_key=usage.agent_key,
+            provider=usage.provider,
+            requests=_normalize_requests(usage.requests),
+            input_tokens=usage.input_tokens,
+            output_tokens=usage.output_tokens,
+            total_tokens=usage.total_tokens,
+            cached_input_tokens=usage.cached_input_tokens,
+            reasoning_output_tokens=usage.reasoning_output_tokens,
+            request_usage_entries=usage.request_usage_entries,
+            created_at=to_utc(usage.created_at) if usage.created_at else datetime.now(UTC),
+        )
+
     def _to_domain(self, row: AgentRunUsageModel) -> ConversationRunUsage:
         return ConversationRunUsage(
             conversation_id=str(row.conversation_id),
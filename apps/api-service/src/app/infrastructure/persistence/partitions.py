@@ -0,0 +1,313 @@
+"""Monthly range partitions for the high-volume event tables (Postgres only).
+
+On Postgres, ``agent_run_events``, ``conversation_ledger_events`` and
+``activity_events`` are range-partitioned by time (see the
+``20261018_140000`` migration), one partition per UTC month plus a DEFAULT
+partition that catches anything outside the pre-created range. Retention then
+drops (or detaches) whole expired partitions instead of deleting rows, which
+avoids table bloat and lock contention with writers.
+
+Postgres requires the partition column in every unique key, so the logical
+keys that writers rely on for dedupe live in small non-partitioned key tables
+(``agent_run_event_keys``, ``conversation_ledger_event_keys``) inserted in the
+same transaction as the event row. Retention purges them alongside the events.
+
+Other dialects (SQLite in dev/tests) keep plain tables; callers check
+:func:`is_partitioned` and fall back to batched deletes.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from datetime import UTC, date, datetime
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@dataclass(frozen=True, slots=True)
+class PartitionedTable:
+    name: str
+    column: str
+    key_table: str | None = None
+
+    @property
+    def default_partition(self) -> str:
+        return f"{self.name}_default"
+
+
+RUN_EVENTS = PartitionedTable("agent_run_events", "ingested_at", "agent_run_event_keys")
+LEDGER_EVENTS = PartitionedTable(
+    "conversation_ledger_events", "ingested_at", "conversation_ledger_event_keys"
+)
+ACTIVITY_EVENTS = PartitionedTable("activity_events", "created_at")
+PARTITIONED_TABLES: tuple[PartitionedTable, ...] = (RUN_EVENTS, LEDGER_EVENTS, ACTIVITY_EVENTS)
+
+_NAME_SUFFIX = re.compile(r"_p(\d{4})(\d{2})$")
+
+
+@dataclass(frozen=True, slots=True)
+class MonthlyPartition:
+    """One ``[start, end)`` UTC month of a partitioned table."""
+
+    table: str
+    start: date
+
+    @property
+    def end(self) -> date:
+        return add_months(self.start, 1)
+
+    @property
+    def name(self) -> str:
+        return f"{self.table}_p{self.start:%Y%m}"
+
+    @property
+    def start_at(self) -> datetime:
+        return datetime(self.start.year, self.start.month, 1, tzinfo=UTC)
+
+    @property
+    def end_at(self) -> datetime:
+        return datetime(self.end.year, self.end.month, 1, tzinfo=UTC)
+
+    def _bounds_sql(self) -> str:
+        return (
+            f"FOR VALUES FROM ('{self.start.isoformat()} 00:00:00+00') "
+            f"TO ('{self.end.isoformat()} 00:00:00+00')"
+        )
+
+    def create_sql(self) -> str:
+        return (
+            f'CREATE TABLE IF NOT EXISTS "{self.name}" PARTITION OF "{self.table}" '
+            f"{self._bounds_sql()}"
+        )
+
+    def attach_sql(self) -> str:
+        return f'ALTER TABLE "{self.table}" ATTACH PARTITION "{self.name}" {self._bounds_sql()}'
+
+    @classmethod
+    def from_name(cls, table: str, name: str) -> MonthlyPartition | None:
+        if not name.startswith(f"{table}_p"):
+            return None
+        match = _NAME_SUFFIX.search(name)
+        if match is None:
+            return None
+        year, month = int(match.group(1)), int(match.group(2))
+        if not 1 <= month <= 12:
+            return None
+        return cls(table=table, start=date(year, month, 1))
+
+
+def is_partition_name(name: str) -> bool:
+    """Whether ``name`` is a monthly or DEFAULT partition of a partitioned event table."""
+
+    return any(
+        name == table.default_partition or MonthlyPartition.from_name(table.name, name)
+        for table in PARTITIONED_TABLES
+    )
+
+
+def month_start(value: date | datetime) -> date:
+    if isinstance(value, datetime):
+        value = value.astimezone(UTC) if value.tzinfo else value
+    return date(value.year, value.month, 1)
+
+
+def add_months(value: date, months: int) -> date:
+    index = value.year * 12 + (value.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def monthly_partitions(table: str, *, first: date, last: date) -> list[MonthlyPartition]:
+    """Partitions covering every month from ``first`` through ``last`` inclusive."""
+
+    current, stop = month_start(first), month_start(last)
+    partitions: list[MonthlyPartition] = []
+    while current <= stop:
+        partitions.append(MonthlyPartition(table=table, start=current))
+        current = add_months(current, 1)
+    return partitions
+
+
+def expired_partitions(
+    partitions: list[MonthlyPartition], *, cutoff: datetime
+) -> list[MonthlyPartition]:
+    """Partitions whose whole range is older than ``cutoff``.
+
+    The month containing the cutoff is kept until it fully ages out, so
+    retention is month-granular: rows live between the TTL and TTL + 1 month.
+    """
+
+    return sorted(
+        (partition for partition in partitions if partition.end_at <= cutoff),
+        key=lambda partition: partition.start,
+    )
+
+
+async def is_partitioned(session: AsyncSession, table: str) -> bool:
+    if session.get_bind().dialect.name != "postgresql":
+        return False
+    result = await session.execute(
+        text(
+            "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table "
+            "WHERE partrelid = to_regclass(:table))"
+        ),
+        {"table": table},
+    )
+    return bool(result.scalar())
+
+
+async def list_partitions(session: AsyncSession, table: str) -> list[MonthlyPartition]:
+    """Monthly partitions currently attached to ``table`` (DEFAULT excluded)."""
+
+    result = await session.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = to_regclass(:table)"
+        ),
+        {"table": table},
+    )
+    partitions = [MonthlyPartition.from_name(table, name) for name in result.scalars()]
+    return sorted(
+        (partition for partition in partitions if partition is not None),
+        key=lambda partition: partition.start,
+    )
+
+
+async def ensure_partitions(
+    session: AsyncSession,
+    table: PartitionedTable,
+    *,
+    now: datetime,
+    months_ahead: int,
+) -> list[str]:
+    """Create the current month's partition and ``months_ahead`` after it.
+
+    Rows written past the last pre-created month land in the DEFAULT partition,
+    and Postgres refuses to create a month while DEFAULT holds rows for it. Such
+    rows are moved into a standalone table that is then attached as the month's
+    partition, with DEFAULT locked so no new row for that month slips in.
+    """
+
+    existing = {partition.name for partition in await list_partitions(session, table.name)}
+    wanted = monthly_partitions(
+        table.name, first=month_start(now), last=add_months(month_start(now), months_ahead)
+    )
+    default = table.default_partition
+    created: list[str] = []
+    for partition in wanted:
+        if partition.name in existing:
+            continue
+        bounds = {"start": partition.start_at, "end": partition.end_at}
+        in_range = f'"{table.column}" >= :start AND "{table.column}" < :end'
+        spilled = await session.execute(
+            text(f'SELECT EXISTS (SELECT 1 FROM "{default}" WHERE {in_range})'), bounds
+        )
+        if spilled.scalar():
+            await session.execute(text(f'LOCK TABLE "{default}" IN ACCESS EXCLUSIVE MODE'))
+            await session.execute(
+                text(
+                    f'CREATE TABLE "{partition.name}" '
+                    f'(LIKE "{table.name}" INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'
+                )
+            )
+            await session.execute(
+                text(
+                    f'WITH moved AS (DELETE FROM "{default}" WHERE {in_range} RETURNING *) '
+                    f'INSERT INTO "{partition.name}" SELECT * FROM moved'
+                ),
+                bounds,
+            )
+            await session.execute(text(partition.attach_sql()))
+        else:
+            await session.execute(text(partition.create_sql()))
+        # One transaction per month keeps any DEFAULT lock brief.
+        await session.commit()
+        created.append(partition.name)
+    return created
+
+
+async def drop_expired_partitions(
+    session: AsyncSession,
+    table: PartitionedTable,
+    *,
+    cutoff: datetime,
+    detach: bool = False,
+    dry_run: bool = False,
+    batch_size: int = 10_000,
+) -> list[str]:
+    """Drop (or only detach) every partition entirely older than ``cutoff``.
+
+    Detached partitions become standalone tables that can be archived and
+    dropped later. Rows of those months that spilled into DEFAULT are deleted,
+    and so are the matching rows of the table's key table (in batches of
+    ``batch_size``). Returns the affected partition names, DEFAULT included
+    when it held expired rows.
+    """
+
+    expired = expired_partitions(await list_partitions(session, table.name), cutoff=cutoff)
+    first_kept = month_start(cutoff)
+    horizon = {"horizon": datetime(first_kept.year, first_kept.month, 1, tzinfo=UTC)}
+    default = table.default_partition
+    spilled = bool(
+        (
+            await session.execute(
+                text(
+                    f'SELECT EXISTS (SELECT 1 FROM "{default}" '
+                    f'WHERE "{table.column}" < :horizon)'
+                ),
+                horizon,
+            )
+        ).scalar()
+    )
+    affected = [partition.name for partition in expired] + ([default] if spilled else [])
+    if dry_run:
+        return affected
+    for partition in expired:
+        if detach:
+            await session.execute(
+                text(f'ALTER TABLE "{table.name}" DETACH PARTITION "{partition.name}"')
+            )
+        else:
+            await session.execute(text(f'DROP TABLE "{partition.name}"'))
+        # One short transaction per partition keeps the parent's lock brief.
+        await session.commit()
+    if spilled:
+        await session.execute(
+            text(f'DELETE FROM "{default}" WHERE "{table.column}" < :horizon'), horizon
+        )
+        await session.commit()
+    if table.key_table is not None:
+        while True:
+            result = await session.execute(
+                text(
+                    f'DELETE FROM "{table.key_table}" WHERE ctid = ANY (ARRAY('
+                    f'SELECT ctid FROM "{table.key_table}" '
+                    f"WHERE ingested_at < :horizon LIMIT :limit))"
+                ),
+                {**horizon, "limit": batch_size},
+            )
+            await session.commit()
+            if (getattr(result, "rowcount", 0) or 0) < batch_size:
+                break
+    return affected
+
+
+__all__ = [
+    "ACTIVITY_EVENTS",
+    "LEDGER_EVENTS",
+    "PARTITIONED_TABLES",
+    "RUN_EVENTS",
+    "MonthlyPartition",
+    "PartitionedTable",
+    "add_months",
+    "drop_expired_partitions",
+    "ensure_partitions",
+    "expired_partitions",
+    "is_partition_name",
+    "is_partitioned",
+    "list_partitions",
+    "month_start",
+    "monthly_partitions",
+]
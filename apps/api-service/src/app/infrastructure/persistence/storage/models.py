@@ -78,6 +78,10 @@ class StorageObject(Base):
         PG_UUID(as_uuid=True), ForeignKey("agent_conversations.id", ondelete="SET NULL")
     )
     metadata_json: Mapped[dict[str, object]] = mapped_column(JSONBCompat, default=dict)
+    # Set on derivatives (thumbnails): hidden from listings, deleted with their source.
+    derived_from_id: Mapped[uuid.UUID | None] = mapped_column(
+        PG_UUID(as_uuid=True), ForeignKey("storage_objects.id", ondelete="CASCADE")
+    )
     expires_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     deleted_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     created_at: Mapped[datetime] = mapped_column(
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import uuid
+from collections.abc import Sequence
 from datetime import datetime
 from typing import Any
 
@@ -69,6 +70,7 @@ class StorageRepository:
         conversation_id: uuid.UUID | None,
         metadata_json: dict[str, Any],
         expires_at,
+        derived_from_id: uuid.UUID | None = None,
     ) -> StorageObject:
         async with self._session_factory() as session:
             obj = StorageObject(
@@ -86,6 +88,7 @@ class StorageRepository:
                 conversation_id=conversation_id,
                 metadata_json=metadata_json,
                 expires_at=expires_at,
+                derived_from_id=derived_from_id,
             )
             session.add(obj)
             await session.commit()
@@ -107,6 +110,26 @@ class StorageRepository:
             result = await session.execute(stmt)
             return result.scalar_one_or_none()
 
+    async def list_objects_for_tenant(
+        self, *, tenant_id: uuid.UUID, object_ids: Sequence[uuid.UUID]
+    ) -> list[StorageObject]:
+        """Load several live objects (with their buckets) in a single query."""
+
+        if not object_ids:
+            return []
+        async with self._session_factory() as session:
+            stmt = (
+                select(StorageObject)
+                .options(selectinload(StorageObject.bucket))
+                .where(
+                    StorageObject.id.in_(set(object_ids)),
+                    StorageObject.tenant_id == tenant_id,
+                    StorageObject.deleted_at.is_(None),
+                )
+            )
+            result = await session.execute(stmt)
+            return list(result.scalars().all())
+
     async def list_objects(
         self,
         *,
@@ -122,6 +145,7 @@ class StorageRepository:
                 .where(
                     StorageObject.tenant_id == tenant_id,
                     StorageObject.deleted_at.is_(None),
+                    StorageObject.derived_from_id.is_(None),
                 )
                 .order_by(StorageObject.created_at.desc())
                 .offset(offset)
@@ -132,6 +156,20 @@ class StorageRepository:
             result = await session.execute(stmt)
             return list(result.scalars().all())
 
+    async def list_derived_objects(
+        self, *, tenant_id: uuid.UUID, object_id: uuid.UUID
+    ) -> list[StorageObject]:
+        """Return the live derivatives (e.g. thumbnails) of ``object_id``."""
+
+        async with self._session_factory() as session:
+            stmt = select(StorageObject).where(
+                StorageObject.tenant_id == tenant_id,
+                StorageObject.derived_from_id == object_id,
+                StorageObject.deleted_at.is_(None),
+            )
+            result = await session.execute(stmt)
+            return list(result.scalars().all())
+
     async def mark_deleted(self, *, object_id: uuid.UUID) -> None:
         async with self._session_factory() as session:
             stmt = select(StorageObject).where(StorageObject.id == object_id)
@@ -16,6 +16,8 @@ class WorkflowRunModel(ModelBase):
     status = Column(String, nullable=False)
     started_at = Column(DateTime(timezone=True), nullable=False)
     ended_at = Column(DateTime(timezone=True), nullable=True)
+    # Refreshed by the executing worker; resumes treat a run without one as dead.
+    heartbeat_at = Column(DateTime(timezone=True), nullable=True)
     final_output_text = Column(String, nullable=True)
     final_output_structured = Column(JSONBCompat, nullable=True)
     trace_id = Column(String, nullable=True)
@@ -52,6 +54,10 @@ class WorkflowRunStepModel(ModelBase):
     stage_name = Column(String, nullable=True)
     parallel_group = Column(String, nullable=True)
     branch_index = Column(Integer, nullable=True)
+    node_id = Column(String, nullable=True)
+    input_fingerprint = Column(String(64), nullable=True)
+    output = Column(JSONBCompat, nullable=True)
+    session_items = Column(JSONBCompat, nullable=True)
     deleted_at = Column(DateTime(timezone=True), nullable=True, index=True)
     deleted_by = Column(String, nullable=True)
     deleted_reason = Column(String, nullable=True)
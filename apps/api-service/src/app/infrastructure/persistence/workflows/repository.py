@@ -39,6 +39,7 @@ class SqlAlchemyWorkflowRunRepository(WorkflowRunRepository):
                     request_message=run.request_message,
                     conversation_id=run.conversation_id,
                     metadata_json=run.metadata,
+                    heartbeat_at=run.heartbeat_at,
                 )
             )
             await session.commit()
@@ -71,6 +72,10 @@ class SqlAlchemyWorkflowRunRepository(WorkflowRunRepository):
                     stage_name=step.stage_name,
                     parallel_group=step.parallel_group,
                     branch_index=step.branch_index,
+                    node_id=step.node_id,
+                    input_fingerprint=step.input_fingerprint,
+                    output=step.output,
+                    session_items=step.session_items,
                 )
             )
             await session.commit()
@@ -122,6 +127,7 @@ class SqlAlchemyWorkflowRunRepository(WorkflowRunRepository):
             deleted_at=getattr(run_row, "deleted_at", None),
             deleted_by=getattr(run_row, "deleted_by", None),
             deleted_reason=getattr(run_row, "deleted_reason", None),
+            heartbeat_at=getattr(run_row, "heartbeat_at", None),
         )
 
         steps = [
@@ -143,6 +149,10 @@ class SqlAlchemyWorkflowRunRepository(WorkflowRunRepository):
                 stage_name=getattr(row, "stage_name", None),
                 parallel_group=getattr(row, "parallel_group", None),
                 branch_index=getattr(row, "branch_index", None),
+                node_id=getattr(row, "node_id", None),
+                input_fingerprint=getattr(row, "input_fingerprint", None),
+                output=getattr(row, "output", None),
+                session_items=getattr(row, "session_items", None),
                 deleted_at=getattr(row, "deleted_at", None),
                 deleted_by=getattr(row, "deleted_by", None),
                 deleted_reason=getattr(row, "deleted_reason", None),
@@ -240,6 +250,30 @@ class SqlAlchemyWorkflowRunRepository(WorkflowRunRepository):
 
         return WorkflowRunListPage(items=items, next_cursor=next_cursor)
 
+    async def claim_run(
+        self, run_id: str, *, stale_before: datetime, claimed_at: datetime
+    ) -> bool:
+        """Flip a resumable run to running; ``False`` if it finished or is still alive.
+
+        A single conditional UPDATE, so only one of several concurrent resumes wins.
+        """
+
+        last_seen = func.coalesce(WorkflowRunModel.heartbeat_at, WorkflowRunModel.started_at)
+        async with self._session_factory() as session:
+            result = await session.execute(
+                update(WorkflowRunModel)
+                .where(
+                    WorkflowRunModel.id == run_id,
+                    or_(
+                        WorkflowRunModel.status.in_(("failed", "cancelled")),
+                        and_(WorkflowRunModel.status == "running", last_seen < stale_before),
+                    ),
+                )
+                .values(status="running", ended_at=None, heartbeat_at=claimed_at)
+            )
+            await session.commit()
+            return bool(result.rowcount)
+
     async def cancel_run(self, run_id: str, *, ended_at: datetime) -> None:
         async with self._session_factory() as session:
             result = await session.execute(
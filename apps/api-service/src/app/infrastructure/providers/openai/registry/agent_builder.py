@@ -24,8 +24,9 @@ from app.agents._shared.specs import (
 )
 from app.core.settings import Settings
 from app.domain.ai import StreamEventBus
+from app.observability.metrics import record_agent_prompt_stable_prefix
 
-from .prompt import PromptRenderer
+from .prompt import PromptRenderer, compose_instructions
 from .streaming_hooks import build_agent_tool_stream_handler
 from .tool_resolver import ToolResolver
 
@@ -81,13 +82,17 @@ class AgentBuilder:
             allow_unresolved_file_search=allow_unresolved_file_search,
         )
         spec.ensure_model_config()
-        instructions, _ = self._prompt_renderer.render_instructions(
+        stable_prefix, runtime_context, _ = self._prompt_renderer.render_sections(
             spec=spec,
             runtime_ctx=runtime_ctx,
             validate_prompts=validate_prompts,
         )
         if spec.wrap_with_handoff_prompt and spec.handoff_keys:
-            instructions = prompt_with_handoff_instructions(instructions)
+            stable_prefix = prompt_with_handoff_instructions(stable_prefix)
+        record_agent_prompt_stable_prefix(
+            agent=spec.key, size_bytes=len(stable_prefix.encode("utf-8"))
+        )
+        instructions = compose_instructions(stable_prefix, runtime_context)
 
         handoff_targets = self._build_handoffs(spec, agents, static_agents=static_agents)
         agent_tools, agent_tool_map = self._build_agent_tools(
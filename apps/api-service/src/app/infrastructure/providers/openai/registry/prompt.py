@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from functools import cache
 from typing import Any
 
-from app.agents._shared.loaders import resolve_prompt
+from app.agents._shared.loaders import load_prompt, resolve_prompt
 from app.agents._shared.prompt_context import (
+    RUNTIME_CONTEXT_PROMPT_PATH,
     PromptRuntimeContext,
     build_prompt_context,
 )
@@ -41,12 +43,52 @@ class PromptRenderer:
         runtime_ctx: PromptRuntimeContext | None,
         validate_prompts: bool,
     ) -> tuple[str, dict[str, Any]]:
+        stable_prefix, runtime_context, prompt_ctx = self.render_sections(
+            spec=spec,
+            runtime_ctx=runtime_ctx,
+            validate_prompts=validate_prompts,
+        )
+        return compose_instructions(stable_prefix, runtime_context), prompt_ctx
+
+    def render_sections(
+        self,
+        *,
+        spec: AgentSpec,
+        runtime_ctx: PromptRuntimeContext | None,
+        validate_prompts: bool,
+    ) -> tuple[str, str, dict[str, Any]]:
+        """Render the agent prompt and the runtime-context trailer separately.
+
+        The first section is the agent's own template and should only depend on
+        values that are fixed per deployment; the second carries the per-user and
+        per-run values the agent opted into via ``spec.runtime_context`` and is
+        empty when it opted into none or there is no runtime context.
+        """
+
         raw_prompt = resolve_prompt(spec)
         prompt_ctx = {}
         if runtime_ctx is not None:
             prompt_ctx = build_prompt_context(spec=spec, runtime_ctx=runtime_ctx, base=None)
-        instructions = render_prompt(raw_prompt, context=prompt_ctx, validate=validate_prompts)
-        return instructions, prompt_ctx
+        stable_prefix = render_prompt(raw_prompt, context=prompt_ctx, validate=validate_prompts)
+        runtime_context = ""
+        if runtime_ctx is not None and spec.runtime_context:
+            runtime_context = render_prompt(
+                _runtime_context_template(),
+                context={**prompt_ctx, "sections": set(spec.runtime_context)},
+                validate=False,
+            )
+        return stable_prefix, runtime_context, prompt_ctx
+
+
+def compose_instructions(stable_prefix: str, runtime_context: str) -> str:
+    if not runtime_context:
+        return stable_prefix
+    return f"{stable_prefix.rstrip()}\n\n{runtime_context.strip()}"
+
+
+@cache
+def _runtime_context_template() -> str:
+    return load_prompt(RUNTIME_CONTEXT_PROMPT_PATH)
 
 
-__all__ = ["PromptRenderer"]
+__all__ = ["PromptRenderer", "compose_instructions"]
@@ -19,6 +19,10 @@ RedisPurpose = Literal[
     "billing_events",
     "usage_cache",
     "activity_events",
+    "workflow_runs",
+    "chat_runs",
+    "storage_cache",
+    "leader_election",
 ]
 RedisClient = RedisBytesClient | RedisStrClient
 
@@ -79,6 +83,10 @@ class RedisClientFactory:
             "billing_events": self._settings.resolve_billing_events_redis_url,
             "usage_cache": self._settings.resolve_usage_guardrail_redis_url,
             "activity_events": self._settings.resolve_activity_events_redis_url,
+            "workflow_runs": self._settings.resolve_workflow_runs_redis_url,
+            "chat_runs": self._settings.resolve_chat_runs_redis_url,
+            "storage_cache": self._settings.resolve_storage_cache_redis_url,
+            "leader_election": self._settings.resolve_leader_election_redis_url,
         }
         resolver = resolver_map[purpose]
         url = resolver()
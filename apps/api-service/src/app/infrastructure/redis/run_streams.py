@@ -0,0 +1,103 @@
+"""Redis-backed per-run frame streams and producer leases."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from redis.typing import EncodableT, FieldT
+
+from app.infrastructure.redis_types import RedisBytesClient
+from app.services.shared.run_streams import RunStreamEntry, RunStreamStore
+
+
+class RedisRunStreamStore(RunStreamStore):
+    """Shares run streams across replicas.
+
+    Keys (under ``prefix``):
+
+    - ``events:<run_id>`` — stream of frames, trimmed to about ``max_length`` entries
+      and kept for ``ttl_seconds`` after the last append; the entry without ``data``
+      marks the end. Entry ids double as SSE event ids for resumption.
+    - ``lease:<run_id>`` — present while the run's producer is alive.
+    """
+
+    def __init__(
+        self,
+        redis: RedisBytesClient,
+        *,
+        prefix: str,
+        ttl_seconds: int,
+        max_length: int,
+    ) -> None:
+        self._redis = redis
+        self._prefix = prefix
+        self._ttl_seconds = ttl_seconds
+        self._max_length = max_length
+
+    async def append(self, run_id: str, data: str | None, *, seq: int | None = None) -> str:
+        key = self._key("events", run_id)
+        fields: dict[FieldT, EncodableT] = {"data": data} if data is not None else {"end": "1"}
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.xadd(
+                key,
+                fields,
+                id=f"{seq}-0" if seq is not None else "*",
+                maxlen=self._max_length,
+                approximate=True,
+            )
+            pipe.expire(key, self._ttl_seconds)
+            entry_id, _ = await pipe.execute()
+        return _decode(entry_id)
+
+    async def read(
+        self, run_id: str, *, after: str | None, timeout: float, count: int = 100
+    ) -> list[RunStreamEntry]:
+        streams = await self._redis.xread(
+            {self._key("events", run_id): after or "0-0"},
+            count=count,
+            block=max(int(timeout * 1000), 1),
+        )
+        if not streams:
+            return []
+        _, entries = streams[0]
+        return [
+            RunStreamEntry(entry_id=_decode(entry_id), data=_data_field(fields))
+            for entry_id, fields in entries
+        ]
+
+    async def first_entry_id(self, run_id: str) -> str | None:
+        entries = await self._redis.xrange(self._key("events", run_id), count=1)
+        if not entries:
+            return None
+        entry_id, _ = entries[0]
+        return _decode(entry_id)
+
+    async def touch(self, run_id: str, *, lease_seconds: float) -> None:
+        await self._redis.set(
+            self._key("lease", run_id), "1", px=max(int(lease_seconds * 1000), 1)
+        )
+
+    async def is_alive(self, run_id: str) -> bool:
+        return bool(await self._redis.exists(self._key("lease", run_id)))
+
+    async def close(self) -> None:
+        return None
+
+    def _key(self, *parts: str) -> str:
+        return ":".join((self._prefix, *parts))
+
+
+def _decode(value: Any) -> str:
+    if isinstance(value, bytes):
+        return value.decode("utf-8")
+    return str(value)
+
+
+def _data_field(fields: dict[Any, Any]) -> str | None:
+    data = fields.get(b"data", fields.get("data"))
+    if data is None:
+        return None
+    return _decode(data)
+
+
+__all__ = ["RedisRunStreamStore"]
@@ -42,6 +42,16 @@ def reset_secret_provider_cache() -> None:
     _PROVIDER_KEY = None
 
 
+async def shutdown_secret_provider() -> None:
+    """Release pooled connections held by the cached provider and forget it."""
+
+    global _PROVIDER_CACHE, _PROVIDER_KEY
+    provider, _PROVIDER_CACHE, _PROVIDER_KEY = _PROVIDER_CACHE, None, None
+    aclose = getattr(provider, "aclose", None)
+    if aclose is not None:
+        await aclose()
+
+
 def get_secret_provider(settings: Settings | None = None) -> SecretProviderProtocol:
     """Return (and cache) the configured SecretProvider implementation."""
 
@@ -66,4 +76,4 @@ def get_secret_provider(settings: Settings | None = None) -> SecretProviderProto
     return provider
 
 
-__all__ = ["get_secret_provider", "reset_secret_provider_cache"]
+__all__ = ["get_secret_provider", "reset_secret_provider_cache", "shutdown_secret_provider"]
@@ -7,7 +7,6 @@ from collections.abc import Sequence
 from dataclasses import dataclass
 
 import httpx
-from anyio import to_thread
 
 from app.core.settings import Settings
 from app.domain.secrets import (
@@ -18,7 +17,7 @@ from app.domain.secrets import (
     SecretScope,
     SignedPayload,
 )
-from app.infrastructure.security.vault import VaultTransitClient, VaultVerificationError
+from app.infrastructure.security.vault import AsyncVaultTransitClient, VaultVerificationError
 
 
 def _b64encode(data: bytes) -> str:
@@ -30,10 +29,9 @@ def _b64encode(data: bytes) -> str:
 
 @dataclass
 class VaultSecretProvider(SecretProviderProtocol):
-    """Bridges the SecretProvider protocol to the existing Vault Transit client."""
+    """Bridges the SecretProvider protocol to the pooled async Vault Transit client."""
 
-    client: VaultTransitClient
-    health_timeout: float = 5.0
+    client: AsyncVaultTransitClient
 
     async def get_secret(self, key: str, *, scope: SecretScope | None = None) -> str:
         raise NotImplementedError("Vault KV access is not yet implemented for SecretProvider.")
@@ -45,7 +43,7 @@ class VaultSecretProvider(SecretProviderProtocol):
 
     async def sign(self, payload: bytes, *, purpose: SecretPurpose) -> SignedPayload:
         payload_b64 = _b64encode(payload)
-        signature = await to_thread.run_sync(self.client.sign_payload, payload_b64)
+        signature = await self.client.sign_payload(payload_b64)
         return SignedPayload(
             signature=signature,
             algorithm="vault-transit",
@@ -56,22 +54,11 @@ class VaultSecretProvider(SecretProviderProtocol):
         self, payload: bytes, signature: str, *, purpose: SecretPurpose
     ) -> bool:
         payload_b64 = _b64encode(payload)
-        return await to_thread.run_sync(
-            self.client.verify_signature,
-            payload_b64,
-            signature,
-        )
+        return await self.client.verify_signature(payload_b64, signature)
 
     async def health_check(self) -> SecretProviderHealth:
-        url = f"{self.client.base_url.rstrip('/')}/v1/sys/health"
-
-        def _probe() -> tuple[int, str]:
-            with httpx.Client(timeout=self.health_timeout) as session:
-                response = session.get(url, headers={"X-Vault-Token": self.client.token})
-                return response.status_code, response.text
-
         try:
-            status_code, body = await to_thread.run_sync(_probe)
+            status_code, body = await self.client.health()
         except httpx.HTTPError as exc:  # pragma: no cover - defensive
             return SecretProviderHealth(
                 status=SecretProviderStatus.UNAVAILABLE,
@@ -90,16 +77,20 @@ class VaultSecretProvider(SecretProviderProtocol):
             details={"status_code": status_code, "body": body[:200]},
         )
 
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
 
 def build_vault_secret_provider(settings: Settings) -> SecretProviderProtocol:
     config = settings.vault_settings
     if not config.addr or not config.token:
         raise VaultVerificationError("Vault address and token must be configured.")
-    client = VaultTransitClient(
+    client = AsyncVaultTransitClient(
         base_url=config.addr,
         token=config.token,
         key_name=config.transit_key,
         namespace=config.namespace,
+        max_connections=settings.vault_http_max_connections,
     )
     return VaultSecretProvider(client=client)
 
@@ -1,9 +1,13 @@
-"""Vault Transit client for request signature verification."""
+"""Vault Transit client for request signature verification and signing."""
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any, Generic, TypeVar
 
 import httpx
 
@@ -26,86 +30,329 @@ class VaultSigningError(VaultError):
     """Raised when Transit signing fails."""
 
 
-@dataclass
-class VaultTransitClient:
-    base_url: str
-    token: str
-    key_name: str
-    timeout: float = 5.0
-    namespace: str | None = None
+ItemT = TypeVar("ItemT")
+ResultT = TypeVar("ResultT")
 
-    def verify_signature(
-        self, payload_b64: str, signature: str, transport: httpx.BaseTransport | None = None
-    ) -> bool:
-        """Verify a Vault Transit signature for the given payload."""
 
-        url = f"{self.base_url.rstrip('/')}/v1/transit/verify/{self.key_name}"
-        headers = {"X-Vault-Token": self.token}
-        if self.namespace:
-            headers["X-Vault-Namespace"] = self.namespace
-        body = {"input": payload_b64, "signature": signature}
+class _TransitBatcher(Generic[ItemT, ResultT]):
+    """Collects calls made in the same event-loop pass and sends them as one batch.
 
-        with httpx.Client(timeout=self.timeout, transport=transport) as client:
-            try:
-                response = client.post(url, json=body, headers=headers)
-            except httpx.HTTPError as exc:
-                raise VaultVerificationError(f"Vault request failed: {exc}") from exc
+    ``send`` receives every queued item and returns one result per item, in order;
+    an exception in that list fails only its own caller.
+    """
 
-        if response.status_code >= 400:
-            raise VaultVerificationError(
-                f"Vault verification request failed ({response.status_code}): {response.text}"
-            )
+    def __init__(
+        self, send: Callable[[list[ItemT]], Awaitable[Sequence[ResultT | Exception]]]
+    ) -> None:
+        self._send = send
+        self._pending: list[tuple[ItemT, asyncio.Future[ResultT]]] = []
+        self._tasks: set[asyncio.Task[None]] = set()
 
-        data: dict[str, Any] = response.json()
-        valid = data.get("data", {}).get("valid")
-        if valid is True:
-            return True
-        if valid is False:
-            return False
-        raise VaultVerificationError("Vault verification response missing 'valid' flag.")
+    async def submit(self, item: ItemT) -> ResultT:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[ResultT] = loop.create_future()
+        if not self._pending:
+            task = loop.create_task(self._flush())
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        self._pending.append((item, future))
+        return await future
+
+    async def _flush(self) -> None:
+        pending, self._pending = self._pending, []
+        try:
+            results = await self._send([item for item, _ in pending])
+        except Exception as exc:
+            results = [exc] * len(pending)
+        for (_, future), result in zip(pending, results, strict=True):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+class AsyncVaultTransitClient:
+    """Async Transit client that reuses one pooled HTTP connection set.
 
-    def sign_payload(
+    Keeps an ``httpx.AsyncClient`` for the life of the process so sign/verify calls
+    do not pay a fresh connection (and TLS handshake) each time. Single-payload
+    calls issued concurrently are coalesced into one ``batch_input`` request, and
+    :meth:`sign_batch` / :meth:`verify_batch` expose the batch form directly.
+    """
+
+    def __init__(
         self,
-        payload_b64: str,
         *,
-        signature_algorithm: str = "sha2-256",
-        transport: httpx.BaseTransport | None = None,
+        base_url: str,
+        token: str,
+        key_name: str,
+        namespace: str | None = None,
+        timeout: float = 5.0,
+        max_connections: int = 10,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.token = token
+        self.key_name = key_name
+        self.namespace = namespace
+        self._timeout = timeout
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        )
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+        self._verify_batcher: _TransitBatcher[tuple[str, str], bool] = _TransitBatcher(
+            self._verify_items
+        )
+        self._sign_batchers: dict[str, _TransitBatcher[str, str]] = {}
+
+    async def verify_signature(self, payload_b64: str, signature: str) -> bool:
+        """Verify a single Vault Transit signature."""
+
+        return await self._verify_batcher.submit((payload_b64, signature))
+
+    async def verify_batch(self, items: Sequence[tuple[str, str]]) -> list[bool]:
+        """Verify ``(payload_b64, signature)`` pairs in one request, preserving order."""
+
+        results = await self._verify_items(list(items))
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+        return [bool(result) for result in results]
+
+    async def sign_payload(
+        self, payload_b64: str, *, signature_algorithm: str = "sha2-256"
     ) -> str:
         """Sign the provided payload and return the Vault-formatted signature."""
 
-        url = f"{self.base_url.rstrip('/')}/v1/transit/sign/{self.key_name}"
-        headers = {"X-Vault-Token": self.token}
-        if self.namespace:
-            headers["X-Vault-Namespace"] = self.namespace
-        body = {"input": payload_b64, "signature_algorithm": signature_algorithm}
+        batcher = self._sign_batchers.get(signature_algorithm)
+        if batcher is None:
 
-        with httpx.Client(timeout=self.timeout, transport=transport) as client:
+            async def send(payloads: list[str]) -> list[str | Exception]:
+                return await self._sign_items(payloads, signature_algorithm=signature_algorithm)
+
+            batcher = self._sign_batchers[signature_algorithm] = _TransitBatcher(send)
+        return await batcher.submit(payload_b64)
+
+    async def sign_batch(
+        self, payloads_b64: Sequence[str], *, signature_algorithm: str = "sha2-256"
+    ) -> list[str]:
+        """Sign several payloads in one request, preserving order."""
+
+        results = await self._sign_items(
+            list(payloads_b64), signature_algorithm=signature_algorithm
+        )
+        signatures: list[str] = []
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+            signatures.append(result)
+        return signatures
+
+    async def health(self) -> tuple[int, str]:
+        """Return the status code and body of ``/v1/sys/health``."""
+
+        response = await self._http().get(f"{self.base_url}/v1/sys/health")
+        return response.status_code, response.text
+
+    async def aclose(self) -> None:
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    async def _verify_items(self, items: list[tuple[str, str]]) -> list[bool | Exception]:
+        if not items:
+            return []
+        if len(items) == 1:
+            payload_b64, signature = items[0]
+            data = await self._post(
+                "verify",
+                {"input": payload_b64, "signature": signature},
+                error=VaultVerificationError,
+            )
+            return [_parse_valid(data)]
+        data = await self._post(
+            "verify",
+            {
+                "batch_input": [
+                    {"input": payload_b64, "signature": signature}
+                    for payload_b64, signature in items
+                ]
+            },
+            error=VaultVerificationError,
+        )
+        results = _batch_results(data, expected=len(items), error=VaultVerificationError)
+        # Per-item errors (e.g. malformed signature) mean "not valid", not a failed call.
+        return [False if result.get("error") else _parse_valid(result) for result in results]
+
+    async def _sign_items(
+        self, payloads: list[str], *, signature_algorithm: str
+    ) -> list[str | Exception]:
+        if not payloads:
+            return []
+        if len(payloads) == 1:
+            data = await self._post(
+                "sign",
+                {"input": payloads[0], "signature_algorithm": signature_algorithm},
+                error=VaultSigningError,
+            )
+            return [_parse_signature(data)]
+        data = await self._post(
+            "sign",
+            {
+                "batch_input": [{"input": payload_b64} for payload_b64 in payloads],
+                "signature_algorithm": signature_algorithm,
+            },
+            error=VaultSigningError,
+        )
+        results = _batch_results(data, expected=len(payloads), error=VaultSigningError)
+        signatures: list[str | Exception] = []
+        for result in results:
+            if result.get("error"):
+                signatures.append(VaultSigningError(f"Vault signing failed: {result['error']}"))
+                continue
             try:
-                response = client.post(url, json=body, headers=headers)
-            except httpx.HTTPError as exc:
-                raise VaultSigningError(f"Vault sign request failed: {exc}") from exc
+                signatures.append(_parse_signature(result))
+            except VaultSigningError as exc:
+                signatures.append(exc)
+        return signatures
+
+    def _http(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self._timeout,
+                limits=self._limits,
+                headers=_vault_headers(self.token, self.namespace),
+                transport=self._transport,
+            )
+        return self._client
 
+    async def _post(
+        self, operation: str, body: dict[str, Any], *, error: type[VaultError]
+    ) -> dict[str, Any]:
+        url = f"{self.base_url}/v1/transit/{operation}/{self.key_name}"
+        try:
+            response = await self._http().post(url, json=body)
+        except httpx.HTTPError as exc:
+            raise error(f"Vault {operation} request failed: {exc}") from exc
         if response.status_code >= 400:
-            raise VaultSigningError(
-                f"Vault signing request failed ({response.status_code}): {response.text}"
+            raise error(
+                f"Vault {operation} request failed ({response.status_code}): {response.text}"
             )
+        payload: dict[str, Any] = response.json()
+        data = payload.get("data")
+        return data if isinstance(data, dict) else {}
+
+
+class VaultVerificationCache:
+    """Short-lived, bounded memo of envelopes Vault has already verified.
+
+    Keys are SHA-256 digests of ``payload || signature`` so neither value is retained.
+    Only successful verifications are cached: a rejected signature is always re-checked,
+    and the TTL bounds how long a rotated or revoked key can keep being honoured.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = 60.0,
+        max_entries: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl = max(ttl_seconds, 0.0)
+        self._max_entries = max(max_entries, 1)
+        self._clock = clock
+        self._entries: OrderedDict[str, float] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl > 0
+
+    @staticmethod
+    def digest(payload: bytes, signature: str) -> str:
+        hasher = hashlib.sha256(payload)
+        hasher.update(b"\x00")
+        hasher.update(signature.encode("utf-8"))
+        return hasher.hexdigest()
+
+    def contains(self, digest: str) -> bool:
+        expires_at = self._entries.get(digest)
+        if expires_at is None:
+            return False
+        if expires_at <= self._clock():
+            del self._entries[digest]
+            return False
+        self._entries.move_to_end(digest)
+        return True
+
+    def add(self, digest: str, *, ttl_seconds: float | None = None) -> None:
+        """Remember ``digest`` for the configured TTL (or less, when ``ttl_seconds`` is set)."""
+
+        ttl = self._ttl if ttl_seconds is None else min(self._ttl, ttl_seconds)
+        if ttl <= 0:
+            return
+        self._entries[digest] = self._clock() + ttl
+        self._entries.move_to_end(digest)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def _vault_headers(token: str, namespace: str | None) -> dict[str, str]:
+    headers = {"X-Vault-Token": token}
+    if namespace:
+        headers["X-Vault-Namespace"] = namespace
+    return headers
+
+
+def _parse_valid(data: dict[str, Any]) -> bool:
+    valid = data.get("valid")
+    if valid is True:
+        return True
+    if valid is False:
+        return False
+    raise VaultVerificationError("Vault verification response missing 'valid' flag.")
+
+
+def _parse_signature(data: dict[str, Any]) -> str:
+    signature = data.get("signature")
+    if isinstance(signature, str) and signature.strip():
+        return signature
+    raise VaultSigningError("Vault signing response missing signature.")
+
+
+def _batch_results(
+    data: dict[str, Any], *, expected: int, error: type[VaultError]
+) -> list[dict[str, Any]]:
+    results = data.get("batch_results")
+    if not isinstance(results, list) or len(results) != expected:
+        raise error("Vault batch response did not match the request.")
+    return [item if isinstance(item, dict) else {} for item in results]
+
+
+_VERIFICATION_CACHE: VaultVerificationCache | None = None
+
 
-        data: dict[str, Any] = response.json()
-        signature = data.get("data", {}).get("signature")
-        if isinstance(signature, str) and signature.strip():
-            return signature
-        raise VaultSigningError("Vault signing response missing signature.")
+def get_vault_verification_cache() -> VaultVerificationCache:
+    """Return the process-wide verification cache, built lazily from settings."""
 
+    global _VERIFICATION_CACHE
+    if _VERIFICATION_CACHE is None:
+        settings = get_settings()
+        _VERIFICATION_CACHE = VaultVerificationCache(
+            ttl_seconds=settings.vault_verify_cache_ttl_seconds,
+            max_entries=settings.vault_verify_cache_max_entries,
+        )
+    return _VERIFICATION_CACHE
 
-def get_vault_transit_client() -> VaultTransitClient:
-    settings = get_settings()
 
-    if not settings.vault_addr or not settings.vault_token:
-        raise VaultClientUnavailable("Vault address/token not configured.")
+def reset_vault_verification_cache() -> None:
+    """Forget the shared verification cache (test helper)."""
 
-    return VaultTransitClient(
-        base_url=settings.vault_addr,
-        token=settings.vault_token,
-        key_name=settings.vault_transit_key,
-        namespace=settings.vault_namespace,
-    )
+    global _VERIFICATION_CACHE
+    _VERIFICATION_CACHE = None
@@ -0,0 +1,162 @@
+"""Helpers shared by providers that upload objects from async byte streams."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable
+from typing import Any, TypeVar
+
+from app.domain.storage import StorageObjectRef
+from app.infrastructure.executors import IntegrationExecutor
+
+T = TypeVar("T")
+
+# S3 rejects non-final parts smaller than 5 MiB.
+S3_MIN_PART_BYTES = 5 * 1024 * 1024
+
+
+async def iter_parts(chunks: AsyncIterable[bytes], part_size: int) -> AsyncIterator[bytes]:
+    """Re-slice an arbitrary chunk stream into ``part_size`` parts (last may be short)."""
+
+    part_size = max(1, part_size)
+    buffer = bytearray()
+    async for chunk in chunks:
+        if not chunk:
+            continue
+        buffer.extend(chunk)
+        while len(buffer) >= part_size:
+            yield bytes(buffer[:part_size])
+            del buffer[:part_size]
+    if buffer:
+        yield bytes(buffer)
+
+
+async def upload_parts(
+    parts: AsyncIterable[bytes],
+    upload: Callable[[int, bytes], Awaitable[T]],
+    *,
+    concurrency: int,
+) -> list[T]:
+    """Upload numbered parts (1-based) with at most ``concurrency`` in flight.
+
+    Parts are pulled from ``parts`` only when a slot frees up, so memory stays bounded
+    by ``concurrency * part_size``. Results are returned in part order. The first
+    failure cancels the remaining uploads and is re-raised.
+    """
+
+    limit = max(1, concurrency)
+    pending: set[asyncio.Task[tuple[int, T]]] = set()
+    results: dict[int, T] = {}
+
+    async def _upload(number: int, data: bytes) -> tuple[int, T]:
+        return number, await upload(number, data)
+
+    async def _drain(return_when: str) -> None:
+        nonlocal pending
+        done, pending = await asyncio.wait(pending, return_when=return_when)
+        for task in done:
+            number, result = task.result()
+            results[number] = result
+
+    try:
+        number = 0
+        async for data in parts:
+            number += 1
+            pending.add(asyncio.create_task(_upload(number, data)))
+            if len(pending) >= limit:
+                await _drain(asyncio.FIRST_COMPLETED)
+        while pending:
+            await _drain(asyncio.FIRST_COMPLETED)
+    except BaseException:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        raise
+    return [results[index] for index in sorted(results)]
+
+
+async def put_s3_object_stream(
+    client: Any,
+    executor: IntegrationExecutor,
+    *,
+    bucket: str,
+    key: str,
+    chunks: AsyncIterable[bytes],
+    content_type: str | None,
+    part_size: int,
+    concurrency: int,
+) -> StorageObjectRef:
+    """Multipart upload for boto3 S3 clients (AWS S3 and MinIO).
+
+    Objects that fit in a single part fall back to one ``put_object`` call. Failed
+    multipart uploads are aborted so the bucket does not accumulate orphaned parts.
+    """
+
+    part_size = max(part_size, S3_MIN_PART_BYTES)
+    extra: dict[str, Any] = {"ContentType": content_type} if content_type else {}
+    parts = iter_parts(chunks, part_size).__aiter__()
+
+    first = await anext(parts, b"")
+    second = await anext(parts, None)
+    if second is None:
+        await executor.run(client.put_object, Bucket=bucket, Key=key, Body=first, **extra)
+        return StorageObjectRef(
+            bucket=bucket,
+            key=key,
+            size_bytes=len(first),
+            mime_type=content_type,
+            checksum_sha256=None,
+        )
+
+    created = await executor.run(client.create_multipart_upload, Bucket=bucket, Key=key, **extra)
+    upload_id = created["UploadId"]
+    size = 0
+
+    async def _replay() -> AsyncIterator[bytes]:
+        nonlocal size
+        for data in (first, second):
+            size += len(data)
+            yield data
+        async for data in parts:
+            size += len(data)
+            yield data
+
+    async def _upload(number: int, data: bytes) -> dict[str, Any]:
+        resp = await executor.run(
+            client.upload_part,
+            Bucket=bucket,
+            Key=key,
+            UploadId=upload_id,
+            PartNumber=number,
+            Body=data,
+        )
+        return {"PartNumber": number, "ETag": resp["ETag"]}
+
+    try:
+        completed = await upload_parts(_replay(), _upload, concurrency=concurrency)
+        await executor.run(
+            client.complete_multipart_upload,
+            Bucket=bucket,
+            Key=key,
+            UploadId=upload_id,
+            MultipartUpload={"Parts": completed},
+        )
+    except BaseException:
+        with contextlib.suppress(Exception):
+            await asyncio.shield(
+                executor.run(
+                    client.abort_multipart_upload, Bucket=bucket, Key=key, UploadId=upload_id
+                )
+            )
+        raise
+    return StorageObjectRef(
+        bucket=bucket,
+        key=key,
+        size_bytes=size,
+        mime_type=content_type,
+        checksum_sha256=None,
+    )
+
+
+__all__ = ["S3_MIN_PART_BYTES", "iter_parts", "put_s3_object_stream", "upload_parts"]
@@ -0,0 +1,223 @@
+"""Caches for presigned download URLs, keyed by tenant and storage object."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from datetime import datetime
+from typing import Any, Protocol, cast
+
+from app.core.settings import Settings
+from app.domain.storage import StorageObjectRef, StoragePresignedUrl
+from app.infrastructure.redis.factory import get_redis_factory
+from app.infrastructure.redis_types import RedisBytesClient
+
+PresignedDownload = tuple[StoragePresignedUrl, StorageObjectRef]
+
+# Upper bound on URLs kept by the in-process cache.
+_MEMORY_CACHE_MAX_ENTRIES = 10_000
+
+
+class PresignedUrlCache(Protocol):
+    backend: str
+
+    async def get_many(
+        self, tenant_id: uuid.UUID, object_ids: Sequence[uuid.UUID]
+    ) -> dict[uuid.UUID, PresignedDownload]: ...
+
+    async def set_many(
+        self,
+        tenant_id: uuid.UUID,
+        entries: Mapping[uuid.UUID, PresignedDownload],
+        *,
+        reuse_seconds: int,
+    ) -> None: ...
+
+    async def invalidate(self, tenant_id: uuid.UUID, object_id: uuid.UUID) -> None: ...
+
+
+class NullPresignedUrlCache:
+    backend = "none"
+
+    async def get_many(
+        self, tenant_id: uuid.UUID, object_ids: Sequence[uuid.UUID]
+    ) -> dict[uuid.UUID, PresignedDownload]:
+        return {}
+
+    async def set_many(
+        self,
+        tenant_id: uuid.UUID,
+        entries: Mapping[uuid.UUID, PresignedDownload],
+        *,
+        reuse_seconds: int,
+    ) -> None:
+        return None
+
+    async def invalidate(self, tenant_id: uuid.UUID, object_id: uuid.UUID) -> None:
+        return None
+
+
+class InMemoryPresignedUrlCache:
+    """Per-process LRU of presigned URLs that expire once they stop being reusable."""
+
+    backend = "memory"
+
+    def __init__(self, *, max_entries: int = _MEMORY_CACHE_MAX_ENTRIES) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple[uuid.UUID, uuid.UUID], tuple[float, PresignedDownload]]
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def get_many(
+        self, tenant_id: uuid.UUID, object_ids: Sequence[uuid.UUID]
+    ) -> dict[uuid.UUID, PresignedDownload]:
+        now = time.monotonic()
+        found: dict[uuid.UUID, PresignedDownload] = {}
+        with self._lock:
+            for object_id in object_ids:
+                key = (tenant_id, object_id)
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                reuse_until, value = entry
+                if reuse_until <= now:
+                    del self._entries[key]
+                    continue
+                self._entries.move_to_end(key)
+                found[object_id] = value
+        return found
+
+    async def set_many(
+        self,
+        tenant_id: uuid.UUID,
+        entries: Mapping[uuid.UUID, PresignedDownload],
+        *,
+        reuse_seconds: int,
+    ) -> None:
+        if reuse_seconds <= 0:
+            return
+        reuse_until = time.monotonic() + reuse_seconds
+        with self._lock:
+            for object_id, value in entries.items():
+                key = (tenant_id, object_id)
+                self._entries[key] = (reuse_until, value)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    async def invalidate(self, tenant_id: uuid.UUID, object_id: uuid.UUID) -> None:
+        with self._lock:
+            self._entries.pop((tenant_id, object_id), None)
+
+
+class RedisPresignedUrlCache:
+    """Redis-shared cache so every replica hands out the same URL for an object."""
+
+    backend = "redis"
+
+    def __init__(self, client: RedisBytesClient, *, prefix: str = "storage:presign") -> None:
+        self._client = client
+        self._prefix = prefix
+
+    async def get_many(
+        self, tenant_id: uuid.UUID, object_ids: Sequence[uuid.UUID]
+    ) -> dict[uuid.UUID, PresignedDownload]:
+        if not object_ids:
+            return {}
+        payloads = await self._client.mget([self._key(tenant_id, oid) for oid in object_ids])
+        found: dict[uuid.UUID, PresignedDownload] = {}
+        for object_id, payload in zip(object_ids, payloads, strict=True):
+            if payload:
+                found[object_id] = _decode(payload)
+        return found
+
+    async def set_many(
+        self,
+        tenant_id: uuid.UUID,
+        entries: Mapping[uuid.UUID, PresignedDownload],
+        *,
+        reuse_seconds: int,
+    ) -> None:
+        if reuse_seconds <= 0 or not entries:
+            return
+        pipe = self._client.pipeline(transaction=False)
+        for object_id, value in entries.items():
+            pipe.set(self._key(tenant_id, object_id), _encode(value), ex=reuse_seconds)
+        await pipe.execute()
+
+    async def invalidate(self, tenant_id: uuid.UUID, object_id: uuid.UUID) -> None:
+        await self._client.delete(self._key(tenant_id, object_id))
+
+    def _key(self, tenant_id: uuid.UUID, object_id: uuid.UUID) -> str:
+        return f"{self._prefix}:{tenant_id}:{object_id}"
+
+
+def _encode(value: PresignedDownload) -> str:
+    url, ref = value
+    return json.dumps(
+        {
+            "url": url.url,
+            "method": url.method,
+            "headers": url.headers,
+            "ref": {
+                "bucket": ref.bucket,
+                "key": ref.key,
+                "size_bytes": ref.size_bytes,
+                "mime_type": ref.mime_type,
+                "checksum_sha256": ref.checksum_sha256,
+                "id": str(ref.id) if ref.id else None,
+                "filename": ref.filename,
+                "status": ref.status,
+                "created_at": ref.created_at.isoformat() if ref.created_at else None,
+                "conversation_id": str(ref.conversation_id) if ref.conversation_id else None,
+                "agent_key": ref.agent_key,
+            },
+        }
+    )
+
+
+def _decode(payload: bytes | str) -> PresignedDownload:
+    data = json.loads(payload)
+    ref: dict[str, Any] = data["ref"]
+    return (
+        StoragePresignedUrl(url=data["url"], method=data["method"], headers=data["headers"]),
+        StorageObjectRef(
+            bucket=ref["bucket"],
+            key=ref["key"],
+            size_bytes=ref.get("size_bytes"),
+            mime_type=ref.get("mime_type"),
+            checksum_sha256=ref.get("checksum_sha256"),
+            id=uuid.UUID(ref["id"]) if ref.get("id") else None,
+            filename=ref.get("filename"),
+            status=ref.get("status"),
+            created_at=datetime.fromisoformat(ref["created_at"]) if ref.get("created_at") else None,
+            conversation_id=(
+                uuid.UUID(ref["conversation_id"]) if ref.get("conversation_id") else None
+            ),
+            agent_key=ref.get("agent_key"),
+        ),
+    )
+
+
+def build_presigned_url_cache(settings: Settings) -> PresignedUrlCache:
+    backend = settings.storage_presign_cache_backend
+    if backend == "redis":
+        client = cast(RedisBytesClient, get_redis_factory(settings).get_client("storage_cache"))
+        return RedisPresignedUrlCache(client)
+    if backend == "memory":
+        return InMemoryPresignedUrlCache()
+    return NullPresignedUrlCache()
+
+
+__all__ = [
+    "InMemoryPresignedUrlCache",
+    "NullPresignedUrlCache",
+    "PresignedDownload",
+    "PresignedUrlCache",
+    "RedisPresignedUrlCache",
+    "build_presigned_url_cache",
+]
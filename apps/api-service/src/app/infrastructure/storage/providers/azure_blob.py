@@ -2,20 +2,27 @@
 
 from __future__ import annotations
 
-import asyncio
+import base64
+import threading
+from collections.abc import AsyncIterable, AsyncIterator, Sequence
 from datetime import UTC, datetime, timedelta
 from urllib.parse import urlparse
 
 from azure.core.exceptions import AzureError, ResourceNotFoundError
 from azure.identity import DefaultAzureCredential
 from azure.storage.blob import (
+    BlobBlock,
     BlobSasPermissions,
     BlobServiceClient,
     ContentSettings,
+    UserDelegationKey,
     generate_blob_sas,
 )
 
 from app.domain.storage import (
+    DEFAULT_MULTIPART_CONCURRENCY,
+    DEFAULT_MULTIPART_PART_BYTES,
+    DEFAULT_STREAM_CHUNK_BYTES,
     AzureBlobProviderConfig,
     StorageObjectRef,
     StoragePresignedUrl,
@@ -23,16 +30,28 @@ from app.domain.storage import (
     StorageProviderProtocol,
     StorageProviderStatus,
 )
+from app.infrastructure.executors import IntegrationExecutor, get_integration_executor
+from app.infrastructure.storage.multipart import iter_parts, upload_parts
+
+# User delegation keys are requested for at least this long and reused for every SAS
+# that expires before the key does, instead of one key round trip per presigned URL.
+_DELEGATION_KEY_LIFETIME = timedelta(hours=1)
 
 
 class AzureBlobStorageProvider(StorageProviderProtocol):
     """Azure Blob provider using SAS URLs for uploads/downloads."""
 
-    def __init__(self, config: AzureBlobProviderConfig) -> None:
+    def __init__(
+        self, config: AzureBlobProviderConfig, *, executor: IntegrationExecutor | None = None
+    ) -> None:
         self._config = config
+        self._executor_override = executor
         self._account_name: str | None = None
         self._account_key: str | None = None
         self._credential = None
+        self._delegation_key: UserDelegationKey | None = None
+        self._delegation_key_expiry: datetime | None = None
+        self._delegation_key_lock = threading.Lock()
 
         if config.connection_string:
             self._account_name, self._account_key = _parse_connection_string(
@@ -54,6 +73,10 @@ class AzureBlobStorageProvider(StorageProviderProtocol):
                 account_url=config.account_url, credential=self._credential
             )
 
+    @property
+    def _executor(self) -> IntegrationExecutor:
+        return self._executor_override or get_integration_executor("storage")
+
     async def ensure_bucket(
         self, bucket: str, *, region: str | None = None, create_if_missing: bool = True
     ) -> None:
@@ -67,7 +90,7 @@ class AzureBlobStorageProvider(StorageProviderProtocol):
                     raise FileNotFoundError(f"Container {bucket} not found") from exc
                 container.create_container()
 
-        await asyncio.to_thread(_ensure)
+        await self._executor.run(_ensure)
 
     async def get_presigned_upload(
         self,
@@ -107,6 +130,32 @@ class AzureBlobStorageProvider(StorageProviderProtocol):
         url = f"{blob_client.url}?{sas}"
         return StoragePresignedUrl(url=url, method="GET", headers={})
 
+    async def get_presigned_downloads(
+        self, *, objects: Sequence[tuple[str, str]], expires_in: int
+    ) -> list[StoragePresignedUrl]:
+        account_name = self._require_account_name()
+        expiry = datetime.now(UTC) + timedelta(seconds=expires_in)
+
+        def _sign_all() -> list[StoragePresignedUrl]:
+            results: list[StoragePresignedUrl] = []
+            for bucket, key in objects:
+                sas = self._sign(
+                    account_name,
+                    bucket=bucket,
+                    key=key,
+                    permissions=BlobSasPermissions(read=True),
+                    expiry=expiry,
+                )
+                blob_client = self._service_client.get_blob_client(container=bucket, blob=key)
+                results.append(
+                    StoragePresignedUrl(url=f"{blob_client.url}?{sas}", method="GET", headers={})
+                )
+            return results
+
+        if not objects:
+            return []
+        return await self._executor.run(_sign_all)
+
     async def head_object(self, *, bucket: str, key: str) -> StorageObjectRef | None:
         def _head() -> StorageObjectRef | None:
             blob_client = self._service_client.get_blob_client(container=bucket, blob=key)
@@ -122,7 +171,7 @@ class AzureBlobStorageProvider(StorageProviderProtocol):
                 checksum_sha256=None,
             )
 
-        return await asyncio.to_thread(_head)
+        return await self._executor.run(_head)
 
     async def get_object_bytes(self, *, bucket: str, key: str) -> bytes:
         def _get() -> bytes:
@@ -133,11 +182,41 @@ class AzureBlobStorageProvider(StorageProviderProtocol):
                 raise FileNotFoundError(f"Object {key} not found") from exc
             return downloader.readall()
 
-        return await asyncio.to_thread(_get)
+        return await self._executor.run(_get)
+
+    async def iter_object_bytes(
+        self,
+        *,
+        bucket: str,
+        key: str,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_BYTES,
+        start: int = 0,
+        end: int | None = None,
+    ) -> AsyncIterator[bytes]:
+        blob_client = self._service_client.get_blob_client(container=bucket, blob=key)
+
+        def _size() -> int:
+            try:
+                props = blob_client.get_blob_properties()
+            except ResourceNotFoundError as exc:
+                raise FileNotFoundError(f"Object {key} not found") from exc
+            return int(getattr(props, "size", 0) or 0)
+
+        def _read(offset: int, length: int) -> bytes:
+            return blob_client.download_blob(offset=offset, length=length).readall()
+
+        # Ranged GETs per chunk; a plain download_blob() buffers its first 32 MiB.
+        size = await self._executor.run(_size)
+        stop = size - 1 if end is None else min(end, size - 1)
+        offset = start
+        while offset <= stop:
+            length = min(max(1, chunk_size), stop - offset + 1)
+            yield await self._executor.run(_read, offset, length)
+            offset += length
 
     async def delete_object(self, *, bucket: str, key: str) -> None:
         blob_client = self._service_client.get_blob_client(container=bucket, blob=key)
-        await asyncio.to_thread(blob_client.delete_blob, delete_snapshots="include")
+        await self._executor.run(blob_client.delete_blob, delete_snapshots="include")
 
     async def put_object(
         self, *, bucket: str, key: str, data: bytes, content_type: str | None
@@ -158,7 +237,47 @@ class AzureBlobStorageProvider(StorageProviderProtocol):
                 checksum_sha256=None,
             )
 
-        return await asyncio.to_thread(_put)
+        return await self._executor.run(_put)
+
+    async def put_object_stream(
+        self,
+        *,
+        bucket: str,
+        key: str,
+        chunks: AsyncIterable[bytes],
+        content_type: str | None,
+        part_size: int = DEFAULT_MULTIPART_PART_BYTES,
+        concurrency: int = DEFAULT_MULTIPART_CONCURRENCY,
+    ) -> StorageObjectRef:
+        blob_client = self._service_client.get_blob_client(container=bucket, blob=key)
+        content_settings = ContentSettings(content_type=content_type)
+        size = 0
+
+        async def _counted() -> AsyncIterator[bytes]:
+            nonlocal size
+            async for part in iter_parts(chunks, part_size):
+                size += len(part)
+                yield part
+
+        async def _stage(number: int, data: bytes) -> BlobBlock:
+            # Block ids must share one length within a blob.
+            block_id = base64.b64encode(f"{number:08d}".encode()).decode()
+            await self._executor.run(blob_client.stage_block, block_id, data, length=len(data))
+            return BlobBlock(block_id=block_id)
+
+        # Uncommitted blocks are garbage-collected by the service, so failures need no
+        # explicit cleanup.
+        blocks = await upload_parts(_counted(), _stage, concurrency=concurrency)
+        await self._executor.run(
+            blob_client.commit_block_list, blocks, content_settings=content_settings
+        )
+        return StorageObjectRef(
+            bucket=bucket,
+            key=key,
+            size_bytes=size,
+            mime_type=content_type,
+            checksum_sha256=None,
+        )
 
     async def health_check(self) -> StorageProviderHealth:
         def _check() -> StorageProviderHealth:
@@ -174,7 +293,7 @@ class AzureBlobStorageProvider(StorageProviderProtocol):
                     details={"error": str(exc)},
                 )
 
-        return await asyncio.to_thread(_check)
+        return await self._executor.run(_check)
 
     async def _generate_sas(
         self,
@@ -184,39 +303,69 @@ class AzureBlobStorageProvider(StorageProviderProtocol):
         permissions: BlobSasPermissions,
         expires_in: int,
     ) -> str:
-        if not self._account_name:
-            raise RuntimeError("Azure storage account name is unavailable")
-        account_name = self._account_name
-        assert account_name is not None
-
+        account_name = self._require_account_name()
         expiry = datetime.now(UTC) + timedelta(seconds=expires_in)
-        start = datetime.now(UTC) - timedelta(minutes=5)
-
-        def _sas() -> str:
-            if self._account_key:
-                return generate_blob_sas(
-                    account_name=account_name,
-                    container_name=bucket,
-                    blob_name=key,
-                    account_key=self._account_key,
-                    permission=permissions,
-                    expiry=expiry,
-                )
+        return await self._executor.run(
+            self._sign,
+            account_name,
+            bucket=bucket,
+            key=key,
+            permissions=permissions,
+            expiry=expiry,
+        )
 
-            if not self._credential:
-                raise RuntimeError("Azure credential is required for SAS generation")
+    def _require_account_name(self) -> str:
+        if not self._account_name:
+            raise RuntimeError("Azure storage account name is unavailable")
+        return self._account_name
 
-            delegation_key = self._service_client.get_user_delegation_key(start, expiry)
+    def _sign(
+        self,
+        account_name: str,
+        *,
+        bucket: str,
+        key: str,
+        permissions: BlobSasPermissions,
+        expiry: datetime,
+    ) -> str:
+        if self._account_key:
             return generate_blob_sas(
                 account_name=account_name,
                 container_name=bucket,
                 blob_name=key,
-                user_delegation_key=delegation_key,
+                account_key=self._account_key,
                 permission=permissions,
                 expiry=expiry,
             )
 
-        return await asyncio.to_thread(_sas)
+        if not self._credential:
+            raise RuntimeError("Azure credential is required for SAS generation")
+
+        return generate_blob_sas(
+            account_name=account_name,
+            container_name=bucket,
+            blob_name=key,
+            user_delegation_key=self._user_delegation_key(expiry),
+            permission=permissions,
+            expiry=expiry,
+        )
+
+    def _user_delegation_key(self, expiry: datetime) -> UserDelegationKey:
+        """Return a cached delegation key valid until at least ``expiry``."""
+
+        with self._delegation_key_lock:
+            if (
+                self._delegation_key is None
+                or self._delegation_key_expiry is None
+                or self._delegation_key_expiry < expiry
+            ):
+                now = datetime.now(UTC)
+                key_expiry = max(expiry, now + _DELEGATION_KEY_LIFETIME)
+                self._delegation_key = self._service_client.get_user_delegation_key(
+                    now - timedelta(minutes=5), key_expiry
+                )
+                self._delegation_key_expiry = key_expiry
+            return self._delegation_key
 
 
 def _parse_connection_string(connection_string: str) -> tuple[str | None, str | None]:
@@ -2,16 +2,20 @@
 
 from __future__ import annotations
 
-import asyncio
 import json
+from collections.abc import AsyncIterable, AsyncIterator, Sequence
 from datetime import timedelta
-from typing import Any
+from typing import Any, cast
 
 import google.cloud.storage as storage
 from google.api_core import exceptions as gcs_exceptions
+from google.cloud.storage.fileio import BlobWriter
 from google.oauth2 import service_account
 
 from app.domain.storage import (
+    DEFAULT_MULTIPART_CONCURRENCY,
+    DEFAULT_MULTIPART_PART_BYTES,
+    DEFAULT_STREAM_CHUNK_BYTES,
     GCSProviderConfig,
     StorageObjectRef,
     StoragePresignedUrl,
@@ -19,15 +23,27 @@ from app.domain.storage import (
     StorageProviderProtocol,
     StorageProviderStatus,
 )
+from app.infrastructure.executors import IntegrationExecutor, get_integration_executor
+from app.infrastructure.storage.multipart import iter_parts
+
+# Resumable upload chunks must be a multiple of 256 KiB.
+_GCS_CHUNK_ALIGNMENT = 256 * 1024
 
 
 class GCSStorageProvider(StorageProviderProtocol):
     """GCS-backed provider with V4 signed URLs."""
 
-    def __init__(self, config: GCSProviderConfig) -> None:
+    def __init__(
+        self, config: GCSProviderConfig, *, executor: IntegrationExecutor | None = None
+    ) -> None:
         self._config = config
+        self._executor_override = executor
         self._client = self._build_client(config)
 
+    @property
+    def _executor(self) -> IntegrationExecutor:
+        return self._executor_override or get_integration_executor("storage")
+
     def _build_client(self, config: GCSProviderConfig) -> storage.Client:
         if config.credentials_json:
             info = config.credentials_json
@@ -58,7 +74,7 @@ class GCSStorageProvider(StorageProviderProtocol):
             )
             bkt.create()
 
-        await asyncio.to_thread(_ensure)
+        await self._executor.run(_ensure)
 
     async def get_presigned_upload(
         self,
@@ -89,7 +105,7 @@ class GCSStorageProvider(StorageProviderProtocol):
                 headers["x-goog-content-sha256"] = checksum_sha256
             return StoragePresignedUrl(url=url, method="PUT", headers=headers)
 
-        return await asyncio.to_thread(_sign)
+        return await self._executor.run(_sign)
 
     async def get_presigned_download(
         self, *, bucket: str, key: str, expires_in: int
@@ -105,7 +121,33 @@ class GCSStorageProvider(StorageProviderProtocol):
             )
             return StoragePresignedUrl(url=url, method="GET", headers={})
 
-        return await asyncio.to_thread(_sign)
+        return await self._executor.run(_sign)
+
+    async def get_presigned_downloads(
+        self, *, objects: Sequence[tuple[str, str]], expires_in: int
+    ) -> list[StoragePresignedUrl]:
+        def _sign_all() -> list[StoragePresignedUrl]:
+            expiration = timedelta(seconds=expires_in)
+            return [
+                StoragePresignedUrl(
+                    url=self._client.bucket(bucket)
+                    .blob(key)
+                    .generate_signed_url(
+                        version="v4",
+                        expiration=expiration,
+                        method="GET",
+                        credentials=self._client._credentials,
+                        service_account_email=self._config.signing_email,
+                    ),
+                    method="GET",
+                    headers={},
+                )
+                for bucket, key in objects
+            ]
+
+        if not objects:
+            return []
+        return await self._executor.run(_sign_all)
 
     async def head_object(self, *, bucket: str, key: str) -> StorageObjectRef | None:
         def _head() -> StorageObjectRef | None:
@@ -122,7 +164,7 @@ class GCSStorageProvider(StorageProviderProtocol):
                 checksum_sha256=blob.crc32c,  # crc32c available; sha256 not exposed
             )
 
-        return await asyncio.to_thread(_head)
+        return await self._executor.run(_head)
 
     async def get_object_bytes(self, *, bucket: str, key: str) -> bytes:
         def _get() -> bytes:
@@ -132,7 +174,33 @@ class GCSStorageProvider(StorageProviderProtocol):
             except gcs_exceptions.NotFound as exc:
                 raise FileNotFoundError(f"Object {key} not found") from exc
 
-        return await asyncio.to_thread(_get)
+        return await self._executor.run(_get)
+
+    async def iter_object_bytes(
+        self,
+        *,
+        bucket: str,
+        key: str,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_BYTES,
+        start: int = 0,
+        end: int | None = None,
+    ) -> AsyncIterator[bytes]:
+        blob = self._client.bucket(bucket).blob(key)
+
+        def _size() -> int:
+            try:
+                blob.reload()
+            except gcs_exceptions.NotFound as exc:
+                raise FileNotFoundError(f"Object {key} not found") from exc
+            return int(blob.size or 0)
+
+        size = await self._executor.run(_size)
+        stop = size - 1 if end is None else min(end, size - 1)
+        offset = start
+        while offset <= stop:
+            last = min(offset + max(1, chunk_size) - 1, stop)
+            yield await self._executor.run(blob.download_as_bytes, start=offset, end=last)
+            offset = last + 1
 
     async def delete_object(self, *, bucket: str, key: str) -> None:
         def _delete() -> None:
@@ -142,7 +210,7 @@ class GCSStorageProvider(StorageProviderProtocol):
             except gcs_exceptions.NotFound:
                 return
 
-        await asyncio.to_thread(_delete)
+        await self._executor.run(_delete)
 
     async def put_object(
         self, *, bucket: str, key: str, data: bytes, content_type: str | None
@@ -162,7 +230,45 @@ class GCSStorageProvider(StorageProviderProtocol):
                 checksum_sha256=blob.crc32c,
             )
 
-        return await asyncio.to_thread(_put)
+        return await self._executor.run(_put)
+
+    async def put_object_stream(
+        self,
+        *,
+        bucket: str,
+        key: str,
+        chunks: AsyncIterable[bytes],
+        content_type: str | None,
+        part_size: int = DEFAULT_MULTIPART_PART_BYTES,
+        concurrency: int = DEFAULT_MULTIPART_CONCURRENCY,
+    ) -> StorageObjectRef:
+        # GCS resumable uploads accept chunks strictly in order, so ``concurrency``
+        # does not apply; memory stays bounded by one chunk either way.
+        chunk_size = max(_GCS_CHUNK_ALIGNMENT, part_size - part_size % _GCS_CHUNK_ALIGNMENT)
+        blob = self._client.bucket(bucket).blob(key)
+        # ``open("wb")`` returns a BlobWriter; the SDK annotates every mode's return type.
+        writer = cast(
+            BlobWriter,
+            await self._executor.run(
+                blob.open, "wb", chunk_size=chunk_size, content_type=content_type
+            ),
+        )
+        # On failure the resumable session is left unfinalized and expires server-side.
+        async for part in iter_parts(chunks, chunk_size):
+            await self._executor.run(writer.write, part)
+        await self._executor.run(writer.close)
+
+        def _describe() -> StorageObjectRef:
+            blob.reload()
+            return StorageObjectRef(
+                bucket=bucket,
+                key=key,
+                size_bytes=blob.size,
+                mime_type=blob.content_type,
+                checksum_sha256=blob.crc32c,
+            )
+
+        return await self._executor.run(_describe)
 
     async def health_check(self) -> StorageProviderHealth:
         def _check() -> StorageProviderHealth:
@@ -178,7 +284,7 @@ class GCSStorageProvider(StorageProviderProtocol):
                     details={"error": str(exc)},
                 )
 
-        return await asyncio.to_thread(_check)
+        return await self._executor.run(_check)
 
 
 __all__ = ["GCSStorageProvider"]
@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import hashlib
-from collections.abc import MutableMapping
+from collections.abc import AsyncIterable, AsyncIterator, MutableMapping, Sequence
 from typing import Final
 
 from app.domain.storage import (
+    DEFAULT_MULTIPART_CONCURRENCY,
+    DEFAULT_MULTIPART_PART_BYTES,
+    DEFAULT_STREAM_CHUNK_BYTES,
     StorageObjectRef,
     StoragePresignedUrl,
     StorageProviderHealth,
@@ -66,6 +69,14 @@ class MemoryStorageProvider(StorageProviderProtocol):
             headers={"X-Memory-Expires-In": str(expires_in)},
         )
 
+    async def get_presigned_downloads(
+        self, *, objects: Sequence[tuple[str, str]], expires_in: int
+    ) -> list[StoragePresignedUrl]:
+        return [
+            await self.get_presigned_download(bucket=bucket, key=key, expires_in=expires_in)
+            for bucket, key in objects
+        ]
+
     async def head_object(self, *, bucket: str, key: str) -> StorageObjectRef | None:
         bucket_data = self._buckets.get(bucket)
         if not bucket_data:
@@ -91,6 +102,20 @@ class MemoryStorageProvider(StorageProviderProtocol):
             raise FileNotFoundError(f"Object {key} not found")
         return bucket_data[key]
 
+    async def iter_object_bytes(
+        self,
+        *,
+        bucket: str,
+        key: str,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_BYTES,
+        start: int = 0,
+        end: int | None = None,
+    ) -> AsyncIterator[bytes]:
+        data = await self.get_object_bytes(bucket=bucket, key=key)
+        stop = len(data) if end is None else min(end + 1, len(data))
+        for offset in range(start, stop, max(1, chunk_size)):
+            yield data[offset : min(offset + chunk_size, stop)]
+
     async def delete_object(self, *, bucket: str, key: str) -> None:
         if bucket in self._buckets and key in self._buckets[bucket]:
             del self._buckets[bucket][key]
@@ -111,6 +136,23 @@ class MemoryStorageProvider(StorageProviderProtocol):
             checksum_sha256=checksum,
         )
 
+    async def put_object_stream(
+        self,
+        *,
+        bucket: str,
+        key: str,
+        chunks: AsyncIterable[bytes],
+        content_type: str | None,
+        part_size: int = DEFAULT_MULTIPART_PART_BYTES,
+        concurrency: int = DEFAULT_MULTIPART_CONCURRENCY,
+    ) -> StorageObjectRef:
+        buffer = bytearray()
+        async for chunk in chunks:
+            buffer.extend(chunk)
+        return await self.put_object(
+            bucket=bucket, key=key, data=bytes(buffer), content_type=content_type
+        )
+
     async def health_check(self) -> StorageProviderHealth:
         return StorageProviderHealth(status=StorageProviderStatus.HEALTHY, details={})
 
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import asyncio
+from collections.abc import AsyncIterable, AsyncIterator, Sequence
 from typing import Any
 
 import boto3
@@ -10,6 +10,9 @@ from botocore.config import Config
 from botocore.exceptions import BotoCoreError, ClientError
 
 from app.domain.storage import (
+    DEFAULT_MULTIPART_CONCURRENCY,
+    DEFAULT_MULTIPART_PART_BYTES,
+    DEFAULT_STREAM_CHUNK_BYTES,
     MinioProviderConfig,
     StorageObjectRef,
     StoragePresignedUrl,
@@ -17,13 +20,18 @@ from app.domain.storage import (
     StorageProviderProtocol,
     StorageProviderStatus,
 )
+from app.infrastructure.executors import IntegrationExecutor, get_integration_executor
+from app.infrastructure.storage.multipart import put_s3_object_stream
 
 
 class MinioStorageProvider(StorageProviderProtocol):
     """S3-compatible provider targeting MinIO."""
 
-    def __init__(self, config: MinioProviderConfig) -> None:
+    def __init__(
+        self, config: MinioProviderConfig, *, executor: IntegrationExecutor | None = None
+    ) -> None:
         self._config = config
+        self._executor_override = executor
         self._client = boto3.client(
             "s3",
             endpoint_url=config.endpoint,
@@ -34,6 +42,10 @@ class MinioStorageProvider(StorageProviderProtocol):
             config=Config(signature_version="s3v4"),
         )
 
+    @property
+    def _executor(self) -> IntegrationExecutor:
+        return self._executor_override or get_integration_executor("storage")
+
     async def ensure_bucket(
         self, bucket: str, *, region: str | None = None, create_if_missing: bool = True
     ) -> None:
@@ -55,7 +67,7 @@ class MinioStorageProvider(StorageProviderProtocol):
                 }
             self._client.create_bucket(**create_kwargs)
 
-        await asyncio.to_thread(_ensure)
+        await self._executor.run(_ensure)
 
     async def get_presigned_upload(
         self,
@@ -70,7 +82,7 @@ class MinioStorageProvider(StorageProviderProtocol):
         params = {"Bucket": bucket, "Key": key}
         if content_type:
             params["ContentType"] = content_type
-        url = await asyncio.to_thread(
+        url = await self._executor.run(
             self._client.generate_presigned_url,
             ClientMethod="put_object",
             Params=params,
@@ -88,7 +100,7 @@ class MinioStorageProvider(StorageProviderProtocol):
     async def get_presigned_download(
         self, *, bucket: str, key: str, expires_in: int
     ) -> StoragePresignedUrl:
-        url = await asyncio.to_thread(
+        url = await self._executor.run(
             self._client.generate_presigned_url,
             ClientMethod="get_object",
             Params={"Bucket": bucket, "Key": key},
@@ -96,6 +108,28 @@ class MinioStorageProvider(StorageProviderProtocol):
         )
         return StoragePresignedUrl(url=url, method="GET", headers={})
 
+    async def get_presigned_downloads(
+        self, *, objects: Sequence[tuple[str, str]], expires_in: int
+    ) -> list[StoragePresignedUrl]:
+        # SigV4 presigning is local; sign the whole batch in one pool hop.
+        def _sign_all() -> list[StoragePresignedUrl]:
+            return [
+                StoragePresignedUrl(
+                    url=self._client.generate_presigned_url(
+                        ClientMethod="get_object",
+                        Params={"Bucket": bucket, "Key": key},
+                        ExpiresIn=expires_in,
+                    ),
+                    method="GET",
+                    headers={},
+                )
+                for bucket, key in objects
+            ]
+
+        if not objects:
+            return []
+        return await self._executor.run(_sign_all)
+
     async def head_object(self, *, bucket: str, key: str) -> StorageObjectRef | None:
         def _head() -> StorageObjectRef | None:
             try:
@@ -112,7 +146,7 @@ class MinioStorageProvider(StorageProviderProtocol):
                 checksum_sha256=None,
             )
 
-        return await asyncio.to_thread(_head)
+        return await self._executor.run(_head)
 
     async def get_object_bytes(self, *, bucket: str, key: str) -> bytes:
         def _get() -> bytes:
@@ -128,10 +162,43 @@ class MinioStorageProvider(StorageProviderProtocol):
                 return b""
             return body.read()
 
-        return await asyncio.to_thread(_get)
+        return await self._executor.run(_get)
+
+    async def iter_object_bytes(
+        self,
+        *,
+        bucket: str,
+        key: str,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_BYTES,
+        start: int = 0,
+        end: int | None = None,
+    ) -> AsyncIterator[bytes]:
+        def _open() -> Any:
+            params: dict[str, Any] = {"Bucket": bucket, "Key": key}
+            if start or end is not None:
+                params["Range"] = f"bytes={start}-{'' if end is None else end}"
+            try:
+                resp = self._client.get_object(**params)
+            except ClientError as exc:
+                if exc.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+                    raise FileNotFoundError(f"Object {key} not found") from exc
+                raise
+            return resp.get("Body")
+
+        body = await self._executor.run(_open)
+        if body is None:
+            return
+        try:
+            while True:
+                chunk = await self._executor.run(body.read, chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            body.close()
 
     async def delete_object(self, *, bucket: str, key: str) -> None:
-        await asyncio.to_thread(self._client.delete_object, Bucket=bucket, Key=key)
+        await self._executor.run(self._client.delete_object, Bucket=bucket, Key=key)
 
     async def put_object(
         self, *, bucket: str, key: str, data: bytes, content_type: str | None
@@ -149,7 +216,28 @@ class MinioStorageProvider(StorageProviderProtocol):
                 checksum_sha256=None,
             )
 
-        return await asyncio.to_thread(_put)
+        return await self._executor.run(_put)
+
+    async def put_object_stream(
+        self,
+        *,
+        bucket: str,
+        key: str,
+        chunks: AsyncIterable[bytes],
+        content_type: str | None,
+        part_size: int = DEFAULT_MULTIPART_PART_BYTES,
+        concurrency: int = DEFAULT_MULTIPART_CONCURRENCY,
+    ) -> StorageObjectRef:
+        return await put_s3_object_stream(
+            self._client,
+            self._executor,
+            bucket=bucket,
+            key=key,
+            chunks=chunks,
+            content_type=content_type,
+            part_size=part_size,
+            concurrency=concurrency,
+        )
 
     async def health_check(self) -> StorageProviderHealth:
         def _check() -> StorageProviderHealth:
@@ -165,7 +253,7 @@ class MinioStorageProvider(StorageProviderProtocol):
                     details={"error": str(exc)},
                 )
 
-        return await asyncio.to_thread(_check)
+        return await self._executor.run(_check)
 
 
 __all__ = ["MinioStorageProvider"]
@@ -9,6 +9,11 @@ import time
 from collections.abc import Callable
 from typing import Any
 
+from app.infrastructure.executors import (
+    IntegrationExecutor,
+    IntegrationExecutorSaturatedError,
+    get_integration_executor,
+)
 from app.infrastructure.stripe.errors import (
     RETRYABLE_ERRORS,
     StripeClientError,
@@ -30,10 +35,16 @@ class StripeRequestExecutor:
         max_attempts: int = 3,
         initial_backoff_seconds: float = 0.5,
         retryable_errors: tuple[type[Exception], ...] = RETRYABLE_ERRORS,
+        executor: IntegrationExecutor | None = None,
     ) -> None:
         self._max_attempts = max(1, max_attempts)
         self._initial_backoff = max(0.1, initial_backoff_seconds)
         self._retryable_errors = retryable_errors
+        self._executor_override = executor
+
+    @property
+    def _executor(self) -> IntegrationExecutor:
+        return self._executor_override or get_integration_executor("stripe")
 
     async def request(self, operation: str, func: Callable[[], Any]) -> Any:
         attempt = 0
@@ -42,14 +53,25 @@ class StripeRequestExecutor:
             attempt += 1
             start = time.perf_counter()
             try:
-                loop = asyncio.get_running_loop()
-                result = await loop.run_in_executor(None, func)
+                result = await self._executor.run(func)
                 observe_stripe_api_call(
                     operation=operation,
                     result="success",
                     duration_seconds=time.perf_counter() - start,
                 )
                 return result
+            except IntegrationExecutorSaturatedError as exc:
+                observe_stripe_api_call(
+                    operation=operation,
+                    result="saturated",
+                    duration_seconds=time.perf_counter() - start,
+                )
+                logger.warning("Stripe executor saturated; rejecting %s", operation)
+                raise StripeClientError(
+                    operation,
+                    "Stripe is not accepting more requests right now; try again shortly.",
+                    code="executor_saturated",
+                ) from exc
             except StripeLibraryError as exc:
                 observe_stripe_api_call(
                     operation=operation,
@@ -0,0 +1,223 @@
+"""Redis-backed run queue, event streams and cancellation signals for workflows."""
+
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import uuid
+from collections.abc import AsyncIterator
+from typing import Any
+
+from redis.exceptions import ResponseError
+from redis.typing import EncodableT, FieldT
+
+from app.infrastructure.redis.run_streams import RedisRunStreamStore
+from app.infrastructure.redis_types import RedisBytesClient
+from app.services.shared.run_streams import RunStreamStore
+from app.services.workflows.dispatch import WorkflowRunBackend, WorkflowRunJob
+
+_GROUP = "workers"
+
+logger = logging.getLogger("app.infrastructure.workflows.redis_backend")
+
+
+class RedisWorkflowRunBackend(WorkflowRunBackend):
+    """Shares workflow runs across replicas.
+
+    Keys (under ``prefix``):
+
+    - ``queue`` — stream of serialized jobs read through the ``workers`` consumer
+      group. A delivered job stays pending until the worker acknowledges it; workers
+      reset its idle time while they heartbeat, and any worker claims entries idle for
+      longer than ``lease_seconds`` (its worker died), so delivery is at-least-once.
+    - ``job:<run_id>`` — the job, kept for ``ttl_seconds`` so any node can authorize
+      attach/cancel requests before the run row exists.
+    - ``events:<run_id>`` / ``lease:<run_id>`` — the run's frame stream and worker
+      lease (see :class:`RedisRunStreamStore`).
+    - ``cancel:<run_id>`` — cancel flag for workers that dequeue after the broadcast,
+      plus the ``cancel`` pub/sub channel for runs already executing.
+    """
+
+    def __init__(
+        self,
+        redis: RedisBytesClient,
+        *,
+        prefix: str = "workflow-runs",
+        ttl_seconds: int = 3600,
+        stream_max_length: int = 10_000,
+        lease_seconds: float = 30.0,
+        owns_client: bool = True,
+        consumer_name: str | None = None,
+    ) -> None:
+        self._redis = redis
+        self._prefix = prefix
+        self._ttl_seconds = ttl_seconds
+        self._lease_seconds = lease_seconds
+        self._owns_client = owns_client
+        self._consumer = consumer_name or (
+            f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        )
+        self._streams = RedisRunStreamStore(
+            redis, prefix=prefix, ttl_seconds=ttl_seconds, max_length=stream_max_length
+        )
+        self._deliveries: dict[str, str] = {}
+        self._group_ready = False
+
+    @property
+    def streams(self) -> RunStreamStore:
+        return self._streams
+
+    @property
+    def lease_seconds(self) -> float:
+        return self._lease_seconds
+
+    async def enqueue(self, job: WorkflowRunJob) -> None:
+        await self._ensure_group()
+        payload = job.to_json()
+        fields: dict[FieldT, EncodableT] = {"job": payload}
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.set(self._key("job", job.run_id), payload, ex=self._ttl_seconds)
+            pipe.xadd(self._key("queue"), fields)
+            await pipe.execute()
+        # A queued run counts as alive until a worker claims it or its job expires.
+        await self._streams.touch(job.run_id, lease_seconds=self._ttl_seconds)
+
+    async def dequeue(self, timeout: float) -> WorkflowRunJob | None:
+        await self._ensure_group()
+        job = await self._reclaim()
+        if job is not None:
+            return job
+        streams = await self._redis.xreadgroup(
+            _GROUP,
+            self._consumer,
+            {self._key("queue"): ">"},
+            count=1,
+            block=max(int(timeout * 1000), 1),
+        )
+        if not streams:
+            return None
+        _, entries = streams[0]
+        if not entries:
+            return None
+        entry_id, fields = entries[0]
+        return await self._delivered(entry_id, fields, attempt=1)
+
+    async def heartbeat(self, run_id: str) -> None:
+        entry_id = self._deliveries.get(run_id)
+        if entry_id is not None:
+            # Re-claiming our own entry resets its idle time so nobody else takes it.
+            await self._redis.xclaim(
+                self._key("queue"), _GROUP, self._consumer, 0, [entry_id], justid=True
+            )
+        await self._streams.touch(run_id, lease_seconds=self._lease_seconds)
+
+    async def ack(self, run_id: str) -> None:
+        entry_id = self._deliveries.pop(run_id, None)
+        if entry_id is None:
+            return
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.xack(self._key("queue"), _GROUP, entry_id)
+            pipe.xdel(self._key("queue"), entry_id)
+            await pipe.execute()
+
+    async def get_job(self, run_id: str) -> WorkflowRunJob | None:
+        payload = await self._redis.get(self._key("job", run_id))
+        if payload is None:
+            return None
+        return WorkflowRunJob.from_json(payload)
+
+    async def request_cancel(self, run_id: str) -> None:
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.set(self._key("cancel", run_id), "1", ex=self._ttl_seconds)
+            pipe.publish(self._key("cancel"), run_id)
+            await pipe.execute()
+
+    async def is_cancel_requested(self, run_id: str) -> bool:
+        return bool(await self._redis.exists(self._key("cancel", run_id)))
+
+    async def cancellations(self) -> AsyncIterator[str]:
+        pubsub = self._redis.pubsub()
+        await pubsub.subscribe(self._key("cancel"))
+        try:
+            while True:
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                if message and message.get("type") == "message":
+                    yield _decode(message["data"])
+        finally:
+            await pubsub.unsubscribe()
+            await pubsub.aclose()
+
+    async def close(self) -> None:
+        if self._owns_client:
+            await self._redis.aclose()
+
+    async def _reclaim(self) -> WorkflowRunJob | None:
+        """Claim one job whose worker stopped heartbeating, if any."""
+
+        min_idle_ms = max(int(self._lease_seconds * 1000), 1)
+        pending = await self._redis.xpending_range(
+            self._key("queue"), _GROUP, min="-", max="+", count=10, idle=min_idle_ms
+        )
+        for item in pending:
+            # XCLAIM re-checks the idle time, so only one worker wins each entry.
+            claimed = await self._redis.xclaim(
+                self._key("queue"), _GROUP, self._consumer, min_idle_ms, [item["message_id"]]
+            )
+            for entry_id, fields in claimed:
+                if not fields:
+                    # Deleted before it was acknowledged; nothing left to run.
+                    await self._redis.xack(self._key("queue"), _GROUP, entry_id)
+                    continue
+                attempt = int(item["times_delivered"]) + 1
+                job = await self._delivered(entry_id, fields, attempt=attempt)
+                if job is not None:
+                    return job
+        return None
+
+    async def _delivered(
+        self, entry_id: Any, fields: dict[Any, Any], *, attempt: int
+    ) -> WorkflowRunJob | None:
+        payload = fields.get(b"job", fields.get("job"))
+        try:
+            if payload is None:
+                raise ValueError("entry has no job payload")
+            job = WorkflowRunJob.from_json(payload)
+        except (ValueError, TypeError, AttributeError):
+            # A malformed entry would fail every delivery; drop it instead of retrying.
+            logger.warning(
+                "workflow_run.queue.malformed_entry",
+                extra={"entry_id": _decode(entry_id)},
+                exc_info=True,
+            )
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.xack(self._key("queue"), _GROUP, entry_id)
+                pipe.xdel(self._key("queue"), entry_id)
+                await pipe.execute()
+            return None
+        job.attempt = attempt
+        self._deliveries[job.run_id] = _decode(entry_id)
+        await self._streams.touch(job.run_id, lease_seconds=self._lease_seconds)
+        return job
+
+    async def _ensure_group(self) -> None:
+        if self._group_ready:
+            return
+        try:
+            await self._redis.xgroup_create(self._key("queue"), _GROUP, id="0", mkstream=True)
+        except ResponseError as exc:
+            if "BUSYGROUP" not in str(exc):
+                raise
+        self._group_ready = True
+
+    def _key(self, *parts: str) -> str:
+        return ":".join((self._prefix, *parts))
+
+
+def _decode(value: Any) -> str:
+    if isinstance(value, bytes):
+        return value.decode("utf-8")
+    return str(value)
+
+
+__all__ = ["RedisWorkflowRunBackend"]
@@ -1,41 +1,70 @@
+"""Request/response logging with per-request correlation ids."""
+
+from __future__ import annotations
+
 import time
 import uuid
-from collections.abc import Awaitable, Callable
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import URL, Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.observability.logging import log_context, log_event
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    """Custom logging middleware for request and response logging."""
+class LoggingMiddleware:
+    """Log each HTTP request and response under a fresh correlation id.
+
+    Pure ASGI: the downstream app runs in the caller's task, so the log context
+    (and any other context variables) stays active while streamed bodies are
+    produced, and body chunks are forwarded as they are sent. The correlation id
+    is exposed as ``request.state.correlation_id`` and the ``X-Correlation-ID``
+    response header. ``http.response`` is logged once the body has been sent, so
+    ``duration_ms`` covers streamed responses; ``X-Process-Time`` is the time to
+    the response headers.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:
         correlation_id = str(uuid.uuid4())
-        request.state.correlation_id = correlation_id
+        scope.setdefault("state", {})["correlation_id"] = correlation_id
         start_time = time.perf_counter()
-        client_ip = request.client.host if request.client else None
+        client = scope.get("client")
+        client_ip = client[0] if client else None
+        method = scope["method"]
+        url = str(URL(scope=scope))
+        request_headers = Headers(scope=scope)
+        response_start: Message | None = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_start
+            if message["type"] == "http.response.start":
+                response_start = message
+                headers = MutableHeaders(scope=message)
+                headers["X-Correlation-ID"] = correlation_id
+                headers["X-Process-Time"] = str(round(time.perf_counter() - start_time, 4))
+            await send(message)
 
         with log_context(
             correlation_id=correlation_id,
-            http_method=request.method,
-            http_path=str(request.url),
+            http_method=method,
+            http_path=url,
             client_ip=client_ip,
         ):
             log_event(
                 "http.request",
-                method=request.method,
-                path=str(request.url),
+                method=method,
+                path=url,
                 client_ip=client_ip,
-                user_agent=request.headers.get("user-agent"),
+                user_agent=request_headers.get("user-agent"),
             )
             try:
-                response = await call_next(request)
+                await self.app(scope, receive, send_wrapper)
             except Exception as exc:  # pragma: no cover - bubbled to handlers
                 duration_ms = round((time.perf_counter() - start_time) * 1000, 3)
                 log_event(
@@ -47,17 +76,13 @@ class LoggingMiddleware(BaseHTTPMiddleware):
                 )
                 raise
 
-            process_time = time.perf_counter() - start_time
-            duration_ms = round(process_time * 1000, 3)
-
+            duration_ms = round((time.perf_counter() - start_time) * 1000, 3)
+            response_headers = Headers(raw=response_start["headers"] if response_start else [])
             log_event(
                 "http.response",
-                status_code=response.status_code,
+                status_code=response_start["status"] if response_start else None,
                 duration_ms=duration_ms,
-                content_length=response.headers.get("content-length"),
-                content_type=response.headers.get("content-type"),
+                content_length=response_headers.get("content-length"),
+                content_type=response_headers.get("content-type"),
             )
 
-            response.headers["X-Correlation-ID"] = correlation_id
-            response.headers["X-Process-Time"] = str(round(process_time, 4))
-            return response
@@ -0,0 +1,47 @@
+"""HTTP RED metrics middleware (request rate, errors, duration per route template)."""
+
+from __future__ import annotations
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.observability.metrics import observe_http_request
+
+
+class HttpMetricsMiddleware:
+    """Observe every HTTP request in ``http_request_duration_seconds``.
+
+    Requests are labelled with the matched route's path template (e.g.
+    ``/api/v1/conversations/{conversation_id}``) rather than the raw path, so
+    label cardinality is bounded by the route table. Duration covers the whole
+    response, including streamed bodies; requests that fail before a response
+    starts count as 500.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            observe_http_request(
+                method=scope["method"],
+                route=getattr(scope.get("route"), "path", None),
+                status_code=status_code,
+                duration_seconds=time.perf_counter() - started,
+            )
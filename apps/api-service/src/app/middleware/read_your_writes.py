@@ -0,0 +1,26 @@
+"""Per-request read-your-writes scope for read-replica routing."""
+
+from __future__ import annotations
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.infrastructure.db import read_your_writes
+
+
+class ReadYourWritesMiddleware:
+    """Give each HTTP request its own write tracker.
+
+    Once a request writes through the primary, its remaining read-only queries
+    (listing, search, feeds) skip the replica so the response reflects those
+    writes. Streaming responses stay inside the scope until the body is sent.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with read_your_writes():
+            await self.app(scope, receive, send)
@@ -2,12 +2,25 @@
 
 from __future__ import annotations
 
+import os
+import threading
 from typing import Final
 
-from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram
+from prometheus_client import (
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
 
 REGISTRY: Final = CollectorRegistry(auto_describe=True)
 
+# prometheus_client switches every metric to file-backed values when this is set
+# before it is imported; each worker process then writes its own files there.
+MULTIPROCESS_DIR_ENV: Final = "PROMETHEUS_MULTIPROC_DIR"
+
 _LATENCY_BUCKETS: Final = (
     0.005,
     0.01,
@@ -21,6 +34,19 @@ _LATENCY_BUCKETS: Final = (
     5.0,
 )
 
+_HTTP_LATENCY_BUCKETS: Final = (*_LATENCY_BUCKETS, 10.0, 30.0)
+
+_HTTP_METHODS: Final = frozenset(
+    {"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"}
+)
+
+# Upper bound on distinct route labels; anything beyond is folded into "other".
+_HTTP_ROUTE_LABEL_LIMIT: Final = 512
+_http_route_labels: set[str] = set()
+_http_route_labels_lock = threading.Lock()
+
+_QUEUE_DEPTH_BUCKETS: Final = (0, 1, 2, 4, 8, 16, 32, 64, 128, 256)
+
 _TOKEN_BUCKETS: Final = (
     50,
     100,
@@ -66,6 +92,10 @@ def _sanitize_agent(value: str | None) -> str:
     return (value or "unknown").lower()
 
 
+def _sanitize_model(value: str | None) -> str:
+    return (value or "unknown").lower()
+
+
 JWKS_REQUESTS_TOTAL = Counter(
     "jwks_requests_total",
     "Total number of JWKS responses served.",
@@ -191,6 +221,64 @@ STRIPE_BILLING_STREAM_BACKLOG_SECONDS = Gauge(
     "stripe_billing_stream_backlog_seconds",
     "Age in seconds between the most recently processed Stripe event and now.",
     registry=REGISTRY,
+    multiprocess_mode="max",
+)
+
+# Integration executors (per-integration bulkheads)
+INTEGRATION_EXECUTOR_QUEUE_DEPTH = Histogram(
+    "integration_executor_queue_depth",
+    "Calls waiting for a worker when a call is submitted, segmented by executor.",
+    ("executor",),
+    buckets=_QUEUE_DEPTH_BUCKETS,
+    registry=REGISTRY,
+)
+
+INTEGRATION_EXECUTOR_WAIT_SECONDS = Histogram(
+    "integration_executor_wait_seconds",
+    "Time calls spend queued before a worker picks them up, segmented by executor.",
+    ("executor",),
+    buckets=_LATENCY_BUCKETS,
+    registry=REGISTRY,
+)
+
+INTEGRATION_EXECUTOR_IN_FLIGHT = Gauge(
+    "integration_executor_in_flight",
+    "Running plus queued calls per integration executor.",
+    ("executor",),
+    registry=REGISTRY,
+    multiprocess_mode="livesum",
+)
+
+INTEGRATION_EXECUTOR_REJECTIONS_TOTAL = Counter(
+    "integration_executor_rejections_total",
+    "Count of calls rejected because an integration executor was saturated.",
+    ("executor",),
+    registry=REGISTRY,
+)
+
+# SSO metadata cache (OIDC discovery + JWKS)
+_METADATA_AGE_BUCKETS = (1, 10, 60, 300, 900, 1800, 3600, 7200, 21600, 86400)
+
+OIDC_METADATA_LOOKUPS_TOTAL = Counter(
+    "oidc_metadata_lookups_total",
+    "Count of OIDC metadata lookups segmented by kind and result (hit/miss/stale/...).",
+    ("kind", "result"),
+    registry=REGISTRY,
+)
+
+OIDC_METADATA_REFRESHES_TOTAL = Counter(
+    "oidc_metadata_refreshes_total",
+    "Count of upstream OIDC metadata fetches segmented by kind, mode, and result.",
+    ("kind", "mode", "result"),
+    registry=REGISTRY,
+)
+
+OIDC_METADATA_AGE_SECONDS = Histogram(
+    "oidc_metadata_age_seconds",
+    "Age of OIDC metadata at the time it is served (since last successful validation).",
+    ("kind",),
+    buckets=_METADATA_AGE_BUCKETS,
+    registry=REGISTRY,
 )
 
 RATE_LIMIT_HITS_TOTAL = Counter(
@@ -208,6 +296,36 @@ WORKFLOW_RUN_DELETES_TOTAL = Counter(
     registry=REGISTRY,
 )
 
+WORKFLOW_RUN_DISPATCH_TOTAL = Counter(
+    "workflow_run_dispatch_total",
+    "Count of detached workflow run transitions "
+    "(queued/started/completed/failed/skipped/redelivered/abandoned).",
+    ("result",),
+    registry=REGISTRY,
+)
+
+WORKFLOW_RUN_QUEUE_WAIT_SECONDS = Histogram(
+    "workflow_run_queue_wait_seconds",
+    "Time detached workflow runs wait in the queue before a worker starts them.",
+    buckets=_LATENCY_BUCKETS,
+    registry=REGISTRY,
+)
+
+WORKFLOW_RUN_WORKERS_BUSY = Gauge(
+    "workflow_run_workers_busy",
+    "Detached workflow runs currently executing in this process.",
+    registry=REGISTRY,
+    multiprocess_mode="livesum",
+)
+
+WORKFLOW_OUTPUT_VALIDATION_DURATION_SECONDS = Histogram(
+    "workflow_output_validation_duration_seconds",
+    "Time spent validating step and workflow outputs against their compiled schemas.",
+    ("target", "result"),
+    buckets=(0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1),
+    registry=REGISTRY,
+)
+
 # Vector store operations
 VECTOR_STORE_OPERATIONS_TOTAL = Counter(
     "vector_store_operations_total",
@@ -313,6 +431,47 @@ AGENT_RUN_EVENTS_DRIFT = Gauge(
     "Difference between SDK session message count and run-event log count (per conversation).",
     ("tenant", "conversation_id"),
     registry=REGISTRY,
+    multiprocess_mode="max",
+)
+
+# Streamed agent responses
+_TTFT_BUCKETS: Final = (0.1, 0.25, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0, 10.0, 20.0, 60.0)
+
+_TOKENS_PER_SECOND_BUCKETS: Final = (5, 10, 20, 30, 50, 75, 100, 150, 200, 300, 500)
+
+_RATIO_BUCKETS: Final = (0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 0.95, 1.0)
+
+AGENT_STREAM_TIME_TO_FIRST_TOKEN_SECONDS = Histogram(
+    "agent_stream_time_to_first_token_seconds",
+    "Time from starting a streamed agent run to its first output text delta.",
+    ("agent", "model"),
+    buckets=_TTFT_BUCKETS,
+    registry=REGISTRY,
+)
+
+AGENT_STREAM_OUTPUT_TOKENS_PER_SECOND = Histogram(
+    "agent_stream_output_tokens_per_second",
+    "Visible (non-reasoning) output tokens per second of one streamed model response, "
+    "from its first text delta until it completes.",
+    ("agent", "model"),
+    buckets=_TOKENS_PER_SECOND_BUCKETS,
+    registry=REGISTRY,
+)
+
+AGENT_STREAM_CACHED_INPUT_RATIO = Histogram(
+    "agent_stream_cached_input_ratio",
+    "Share of a streamed run's input tokens the provider served from its prompt cache.",
+    ("agent", "model"),
+    buckets=_RATIO_BUCKETS,
+    registry=REGISTRY,
+)
+
+AGENT_PROMPT_STABLE_PREFIX_BYTES = Gauge(
+    "agent_prompt_stable_prefix_bytes",
+    "Size of the last rendered agent prompt ahead of the per-run context trailer.",
+    ("agent",),
+    registry=REGISTRY,
+    multiprocess_mode="max",
 )
 
 __all__ = [
@@ -350,6 +509,22 @@ STORAGE_OPERATION_DURATION_SECONDS = Histogram(
     registry=REGISTRY,
 )
 
+STORAGE_PRESIGN_CACHE_LOOKUPS_TOTAL = Counter(
+    "storage_presign_cache_lookups_total",
+    "Presigned download URL cache lookups segmented by backend and result (hit/miss/error).",
+    ("backend", "result"),
+    registry=REGISTRY,
+)
+
+# HTTP RED metrics: rate and errors come from the histogram's _count series.
+HTTP_REQUEST_DURATION_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request duration segmented by method, route template, and status class.",
+    ("method", "route", "status_class"),
+    buckets=_HTTP_LATENCY_BUCKETS,
+    registry=REGISTRY,
+)
+
 USAGE_GUARDRAIL_DECISIONS_TOTAL = Counter(
     "usage_guardrail_decisions_total",
     "Count of usage guardrail evaluations segmented by decision and plan.",
@@ -454,6 +629,77 @@ def observe_service_account_issuance(
     ).observe(max(duration_seconds, 0.0))
 
 
+def observe_service_account_vault_verification(
+    *,
+    account: str | None,
+    result: str,
+    cached: bool,
+    duration_seconds: float,
+) -> None:
+    """Record the Vault signature check as its own slice of issuance latency.
+
+    Observed under ``reason="vault_verify"`` with ``reused`` marking cache hits; the
+    issuance counter is left alone so outcome totals are not double counted.
+    """
+
+    SERVICE_ACCOUNT_ISSUANCE_LATENCY_SECONDS.labels(
+        account=_sanitize_account(account),
+        result=result,
+        reason="vault_verify",
+        reused=_bool_label(cached),
+    ).observe(max(duration_seconds, 0.0))
+
+
+def observe_integration_executor_queue_depth(*, executor: str, depth: int) -> None:
+    INTEGRATION_EXECUTOR_QUEUE_DEPTH.labels(executor=executor).observe(max(depth, 0))
+
+
+def observe_integration_executor_wait(*, executor: str, duration_seconds: float) -> None:
+    INTEGRATION_EXECUTOR_WAIT_SECONDS.labels(executor=executor).observe(
+        max(duration_seconds, 0.0)
+    )
+
+
+def record_integration_executor_in_flight(*, executor: str, value: int) -> None:
+    INTEGRATION_EXECUTOR_IN_FLIGHT.labels(executor=executor).set(max(value, 0))
+
+
+def record_integration_executor_rejection(*, executor: str) -> None:
+    INTEGRATION_EXECUTOR_REJECTIONS_TOTAL.labels(executor=executor).inc()
+
+
+def record_oidc_metadata_lookup(*, kind: str, result: str) -> None:
+    OIDC_METADATA_LOOKUPS_TOTAL.labels(kind=kind, result=result).inc()
+
+
+def record_oidc_metadata_refresh(*, kind: str, mode: str, result: str) -> None:
+    OIDC_METADATA_REFRESHES_TOTAL.labels(kind=kind, mode=mode, result=result).inc()
+
+
+def observe_oidc_metadata_age(*, kind: str, age_seconds: float) -> None:
+    OIDC_METADATA_AGE_SECONDS.labels(kind=kind).observe(max(age_seconds, 0.0))
+
+
+def record_workflow_run_dispatch(*, result: str) -> None:
+    WORKFLOW_RUN_DISPATCH_TOTAL.labels(result=result).inc()
+
+
+def observe_workflow_run_queue_wait(*, wait_seconds: float) -> None:
+    WORKFLOW_RUN_QUEUE_WAIT_SECONDS.observe(max(wait_seconds, 0.0))
+
+
+def record_workflow_run_workers_busy(*, value: int) -> None:
+    WORKFLOW_RUN_WORKERS_BUSY.set(max(value, 0))
+
+
+def observe_workflow_output_validation(
+    *, target: str, result: str, duration_seconds: float
+) -> None:
+    WORKFLOW_OUTPUT_VALIDATION_DURATION_SECONDS.labels(target=target, result=result).observe(
+        max(duration_seconds, 0.0)
+    )
+
+
 def record_rate_limit_hit(*, quota: str, scope: str) -> None:
     RATE_LIMIT_HITS_TOTAL.labels(quota=quota, scope=(scope or "unknown")).inc()
 
@@ -568,3 +814,82 @@ def observe_storage_operation(
     STORAGE_OPERATION_DURATION_SECONDS.labels(
         operation=operation, provider=provider_label, result=result
     ).observe(max(duration_seconds, 0.0))
+
+
+def record_storage_presign_cache_lookup(*, backend: str, result: str, count: int = 1) -> None:
+    if count > 0:
+        STORAGE_PRESIGN_CACHE_LOOKUPS_TOTAL.labels(backend=backend, result=result).inc(count)
+
+
+def observe_http_request(
+    *, method: str, route: str | None, status_code: int, duration_seconds: float
+) -> None:
+    """Record one HTTP request. ``route`` is the matched path template, if any."""
+
+    HTTP_REQUEST_DURATION_SECONDS.labels(
+        method=method if method in _HTTP_METHODS else "OTHER",
+        route=_http_route_label(route),
+        status_class=f"{status_code // 100}xx" if 100 <= status_code < 600 else "other",
+    ).observe(max(duration_seconds, 0.0))
+
+
+def _http_route_label(route: str | None) -> str:
+    if not route:
+        return "unmatched"
+    if route in _http_route_labels:
+        return route
+    with _http_route_labels_lock:
+        if len(_http_route_labels) >= _HTTP_ROUTE_LABEL_LIMIT:
+            return "other"
+        _http_route_labels.add(route)
+    return route
+
+
+def render_latest() -> bytes:
+    """Exposition payload for ``/metrics``.
+
+    In multiprocess mode the payload aggregates every worker's files, so a
+    scrape that lands on any worker sees totals for all of them.
+    """
+
+    path = os.environ.get(MULTIPROCESS_DIR_ENV)
+    if not path:
+        return generate_latest(REGISTRY)
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry, path=path)
+    return generate_latest(registry)
+
+
+def mark_process_exited(pid: int | None = None) -> None:
+    """Drop this worker's live gauges from the multiprocess aggregate."""
+
+    path = os.environ.get(MULTIPROCESS_DIR_ENV)
+    if path:
+        multiprocess.mark_process_dead(pid if pid is not None else os.getpid(), path)
+
+
+def observe_agent_stream(
+    *,
+    agent: str | None,
+    model: str | None,
+    time_to_first_token_seconds: float | None,
+    output_tokens_per_second: float | None,
+    cached_input_ratio: float | None,
+) -> None:
+    labels = {"agent": _sanitize_agent(agent), "model": _sanitize_model(model)}
+    if time_to_first_token_seconds is not None:
+        AGENT_STREAM_TIME_TO_FIRST_TOKEN_SECONDS.labels(**labels).observe(
+            max(time_to_first_token_seconds, 0.0)
+        )
+    if output_tokens_per_second is not None:
+        AGENT_STREAM_OUTPUT_TOKENS_PER_SECOND.labels(**labels).observe(
+            max(output_tokens_per_second, 0.0)
+        )
+    if cached_input_ratio is not None:
+        AGENT_STREAM_CACHED_INPUT_RATIO.labels(**labels).observe(
+            min(max(cached_input_ratio, 0.0), 1.0)
+        )
+
+
+def record_agent_prompt_stable_prefix(*, agent: str | None, size_bytes: int) -> None:
+    AGENT_PROMPT_STABLE_PREFIX_BYTES.labels(agent=_sanitize_agent(agent)).set(max(size_bytes, 0))
@@ -21,7 +21,6 @@ from app.services.agents.provider_registry import AgentProviderRegistry
 from app.services.agents.run_finalize import RunFinalizer
 from app.services.agents.run_options import build_run_options
 from app.services.agents.run_pipeline import (
-    persist_assistant_message,
     prepare_run_context,
     record_user_message,
 )
@@ -149,9 +148,11 @@ class ChatRunOrchestrator:
             response_id=result.response_id,
         )
         attachments = [*image_attachments, *container_attachments]
-        message_id = await persist_assistant_message(
+        message_id = await self._finalizer.finalize(
             ctx=ctx,
-            conversation_service=self._conversation_service,
+            tenant_id=actor.tenant_id,
+            response_id=result.response_id,
+            usage=result.usage,
             response_text=response_text,
             attachments=attachments,
             active_agent=result.final_agent,
@@ -172,12 +173,6 @@ class ChatRunOrchestrator:
                 "response_id": result.response_id,
             },
         )
-        await self._finalizer.finalize(
-            ctx=ctx,
-            tenant_id=actor.tenant_id,
-            response_id=result.response_id,
-            usage=result.usage,
-        )
 
         def _resolve_output_schema(agent_key: str | None) -> Any:
             if not agent_key:
@@ -24,7 +24,6 @@ from app.services.agents.provider_registry import AgentProviderRegistry
 from app.services.agents.run_finalize import RunFinalizer
 from app.services.agents.run_options import build_run_options
 from app.services.agents.run_pipeline import (
-    persist_assistant_message,
     prepare_run_context,
     record_user_message,
 )
@@ -101,6 +100,7 @@ class ChatStreamOrchestrator:
             entrypoint_agent=ctx.descriptor.key,
             entrypoint_output_schema=ctx.descriptor.output_schema,
             attachment_service=self._attachment_service,
+            entrypoint_model=ctx.descriptor.model,
         )
 
         guardrail_forwarder = GuardrailStreamForwarder(
@@ -238,9 +238,13 @@ class ChatStreamOrchestrator:
                 else:
                     terminal_event.attachments.extend(payloads)
 
-        message_id = await persist_assistant_message(
+        message_id = await self._finalizer.finalize(
             ctx=ctx,
-            conversation_service=self._conversation_service,
+            tenant_id=actor.tenant_id,
+            response_id=getattr(stream_handle, "last_response_id", None)
+            if stream_handle is not None
+            else None,
+            usage=getattr(stream_handle, "usage", None) if stream_handle is not None else None,
             response_text=processor.outcome.complete_response,
             attachments=processor.outcome.attachments,
             active_agent=processor.outcome.current_agent or ctx.descriptor.key,
@@ -263,14 +267,6 @@ class ChatStreamOrchestrator:
                 else None,
             },
         )
-        await self._finalizer.finalize(
-            ctx=ctx,
-            tenant_id=actor.tenant_id,
-            response_id=getattr(stream_handle, "last_response_id", None)
-            if stream_handle is not None
-            else None,
-            usage=getattr(stream_handle, "usage", None) if stream_handle is not None else None,
-        )
         if terminal_event is not None:
             yield terminal_event
 
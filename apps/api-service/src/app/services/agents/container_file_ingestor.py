@@ -7,7 +7,7 @@ from dataclasses import dataclass
 
 from app.domain.conversations import ConversationAttachment
 from app.services.agents.attachment_utils import coerce_conversation_uuid
-from app.services.containers.files_gateway import ContainerFileContent, ContainerFilesGateway
+from app.services.containers.files_gateway import ContainerFilesGateway
 from app.services.storage.service import StorageService
 from app.utils.filenames import sanitize_download_filename
 
@@ -82,41 +82,45 @@ async def ingest_container_file_citation(
     gateway: ContainerFilesGateway,
     storage_service: StorageService,
 ) -> IngestedContainerFile:
-    """Download a container file from OpenAI and persist it to tenant storage."""
+    """Stream a container file from OpenAI into tenant storage.
 
-    content: ContainerFileContent = await gateway.download_file_content(
-        tenant_id=uuid.UUID(tenant_id),
-        container_id=citation.container_id,
-        file_id=citation.file_id,
-    )
-    size_bytes = len(content.data)
+    The body is piped chunk by chunk into ``StorageService.put_object_stream`` so large
+    generated artifacts (PDFs, archives) are never held in memory in full.
+    """
 
     preferred_filename = sanitize_download_filename(citation.filename)
-    remote_filename = sanitize_download_filename(content.filename)
-    filename = preferred_filename or remote_filename or f"{citation.file_id}.bin"
-
-    mime = _infer_mime(filename)
 
-    storage_obj = await storage_service.put_object(
+    async with gateway.stream_file_content(
         tenant_id=uuid.UUID(tenant_id),
-        user_id=uuid.UUID(user_id) if user_id else None,
-        data=content.data,
-        filename=filename,
-        mime_type=mime,
-        agent_key=agent_key,
-        conversation_id=coerce_conversation_uuid(conversation_id),
-        metadata={
-            "tool_call_id": tool_call_id,
-            "response_id": response_id,
-            "container_id": citation.container_id,
-            "file_id": citation.file_id,
-            "filename": filename,
-            "size_bytes": size_bytes,
-        },
-    )
+        container_id=citation.container_id,
+        file_id=citation.file_id,
+    ) as content:
+        remote_filename = sanitize_download_filename(content.filename)
+        filename = preferred_filename or remote_filename or f"{citation.file_id}.bin"
+        mime = _infer_mime(filename)
+
+        storage_obj = await storage_service.put_object_stream(
+            tenant_id=uuid.UUID(tenant_id),
+            user_id=uuid.UUID(user_id) if user_id else None,
+            chunks=content.chunks,
+            filename=filename,
+            mime_type=mime,
+            size_hint=content.size_bytes,
+            agent_key=agent_key,
+            conversation_id=coerce_conversation_uuid(conversation_id),
+            metadata={
+                "tool_call_id": tool_call_id,
+                "response_id": response_id,
+                "container_id": citation.container_id,
+                "file_id": citation.file_id,
+                "filename": filename,
+                "size_bytes": content.size_bytes,
+            },
+        )
 
     if storage_obj.id is None:
         raise RuntimeError("Storage provider returned object without id")
+    size_bytes = storage_obj.size_bytes or 0
 
     attachment = ConversationAttachment(
         object_id=str(storage_obj.id),
@@ -0,0 +1,287 @@
+"""Detached chat runs whose SSE frames survive client disconnects.
+
+``POST /chat/stream`` used to drive the agent from inside the response generator,
+so a dropped connection aborted the run and the client could only recover by
+replaying the conversation ledger. The manager runs each stream in its own task
+instead and appends every public frame to the run's bounded frame stream (the
+shared :mod:`app.services.shared.run_streams` store also used by detached workflow
+runs). The original response and any reconnect read from that stream: frame ids
+are ``<seq>-0``, so a client that sends back the last id it saw (``Last-Event-ID``)
+resumes with the next frame and receives each frame exactly once.
+
+``InMemoryChatRunBackend`` keeps streams in this process; the Redis backend in
+``app.infrastructure.chat.redis_backend`` lets a client reconnect to any replica
+while the run keeps executing where it started.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import re
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, AsyncIterator
+from dataclasses import asdict, dataclass
+from typing import Any, Protocol
+
+from app.api.v1.shared.public_stream_projector import PublicStreamProjector
+from app.services.shared.run_streams import (
+    InMemoryRunStreamStore,
+    RunStreamEntry,
+    RunStreamStore,
+    entry_id_key,
+    follow_run_stream,
+)
+
+logger = logging.getLogger("app.services.agents.detached_runs")
+
+_EVENT_ID_PATTERN = re.compile(r"^(\d+)-0$")
+
+
+class ChatRunNotFoundError(LookupError):
+    """The run does not exist, has expired, or belongs to another user."""
+
+
+class ChatRunExpiredError(Exception):
+    """Frames after the requested id were trimmed from the bounded stream."""
+
+
+@dataclass(slots=True, frozen=True)
+class ChatRun:
+    """Ownership record used to authorize reconnects."""
+
+    run_id: str
+    tenant_id: str
+    user_id: str
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def from_json(cls, raw: str | bytes) -> ChatRun:
+        payload: dict[str, Any] = json.loads(raw)
+        return cls(**payload)
+
+
+ChatRunStreamEntry = RunStreamEntry
+
+
+class ChatRunBackend(Protocol):
+    """Run records plus the frame streams and producer leases of their runs."""
+
+    @property
+    def streams(self) -> RunStreamStore: ...
+
+    @property
+    def lease_seconds(self) -> float: ...
+
+    async def create_run(self, run: ChatRun) -> None: ...
+
+    async def get_run(self, run_id: str) -> ChatRun | None: ...
+
+    async def heartbeat(self, run_id: str) -> None:
+        """Keep the run's record and producer lease alive while its task runs."""
+        ...
+
+    async def close(self) -> None: ...
+
+
+class InMemoryChatRunBackend(ChatRunBackend):
+    """Single-process backend; bounded by run count and frames per run."""
+
+    def __init__(
+        self,
+        *,
+        max_frames: int = 5000,
+        max_retained_runs: int = 1024,
+        lease_seconds: float = 30.0,
+    ) -> None:
+        self._max_retained_runs = max_retained_runs
+        self._lease_seconds = lease_seconds
+        self._runs: OrderedDict[str, ChatRun] = OrderedDict()
+        self._streams = InMemoryRunStreamStore(max_entries=max_frames, max_runs=max_retained_runs)
+
+    @property
+    def streams(self) -> RunStreamStore:
+        return self._streams
+
+    @property
+    def lease_seconds(self) -> float:
+        return self._lease_seconds
+
+    async def create_run(self, run: ChatRun) -> None:
+        self._runs[run.run_id] = run
+        while len(self._runs) > self._max_retained_runs:
+            self._runs.popitem(last=False)
+
+    async def get_run(self, run_id: str) -> ChatRun | None:
+        return self._runs.get(run_id)
+
+    async def heartbeat(self, run_id: str) -> None:
+        await self._streams.touch(run_id, lease_seconds=self._lease_seconds)
+
+    async def close(self) -> None:
+        return None
+
+
+class ChatRunManager:
+    """Starts detached chat runs and serves their frames to (re)connecting clients.
+
+    The task pumping a run heartbeats its lease every third of ``lease_seconds``.
+    Readers that see neither new frames nor a live lease for ``IDLE_TIMEOUT_LEASES``
+    leases (the process running it died) end with a retryable ``error`` frame.
+    """
+
+    IDLE_TIMEOUT_LEASES = 4
+
+    def __init__(self, backend: ChatRunBackend, *, poll_interval_seconds: float = 1.0) -> None:
+        self._backend = backend
+        self._poll_interval = poll_interval_seconds
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    @property
+    def backend(self) -> ChatRunBackend:
+        return self._backend
+
+    async def start(self, run: ChatRun, frames: AsyncIterator[str]) -> None:
+        """Record ``run`` and pump ``frames`` into its stream in a background task.
+
+        The task is independent of the caller: closing the HTTP response that
+        started the run does not stop it.
+        """
+
+        await self._backend.create_run(run)
+        await self._backend.heartbeat(run.run_id)
+        task = asyncio.create_task(self._pump(run, frames), name=f"chat-run:{run.run_id}")
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def get_run(self, run_id: str, *, tenant_id: str, user_id: str) -> ChatRun:
+        run = await self._backend.get_run(run_id)
+        if run is None or run.tenant_id != tenant_id or run.user_id != user_id:
+            raise ChatRunNotFoundError(f"Chat run {run_id} not found")
+        return run
+
+    async def events(
+        self, run_id: str, *, after: str | None = None
+    ) -> AsyncGenerator[ChatRunStreamEntry | None, None]:
+        """Yield frames after ``after`` until the end marker.
+
+        ``None`` is yielded whenever a poll interval passes without new frames so SSE
+        callers can emit heartbeats. Raises :class:`ChatRunExpiredError` up front when
+        frames the client has not seen were already trimmed.
+        """
+
+        cursor = self.parse_event_id(after)
+        first = await self._backend.streams.first_entry_id(run_id)
+        if first is not None and entry_id_key(first)[0] > cursor + 1:
+            raise ChatRunExpiredError(
+                f"Chat run {run_id} no longer retains frames after event {after or '0-0'}"
+            )
+
+        async def _abandoned() -> str:
+            return interrupted_chat_run_frame(
+                run_id,
+                "Chat run stopped reporting progress; the server running it may have exited.",
+            )
+
+        return follow_run_stream(
+            self._backend.streams,
+            run_id,
+            after=after,
+            poll_interval=self._poll_interval,
+            idle_timeout=self._backend.lease_seconds * self.IDLE_TIMEOUT_LEASES,
+            abandoned_frame=_abandoned,
+        )
+
+    @staticmethod
+    def parse_event_id(value: str | None) -> int:
+        if value is None:
+            return 0
+        match = _EVENT_ID_PATTERN.match(value)
+        if match is None:
+            raise ValueError("Invalid event id; expected the id of a previously received event.")
+        return int(match.group(1))
+
+    async def shutdown(self) -> None:
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
+        await self._backend.close()
+
+    # ------------------------------------------------------------------ internals
+
+    async def _pump(self, run: ChatRun, frames: AsyncIterator[str]) -> None:
+        streams = self._backend.streams
+        heartbeat = asyncio.create_task(self._heartbeat(run.run_id))
+        seq = 0
+        try:
+            async for frame in frames:
+                seq += 1
+                await streams.append(run.run_id, frame, seq=seq)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("chat_run.failed", extra={"chat_run_id": run.run_id})
+        finally:
+            heartbeat.cancel()
+            try:
+                await streams.append(run.run_id, None, seq=seq + 1)
+            except Exception:
+                logger.warning(
+                    "chat_run.end_marker_failed",
+                    extra={"chat_run_id": run.run_id},
+                    exc_info=True,
+                )
+
+    async def _heartbeat(self, run_id: str) -> None:
+        while True:
+            await asyncio.sleep(self._backend.lease_seconds / 3)
+            try:
+                await self._backend.heartbeat(run_id)
+            except Exception:
+                logger.warning(
+                    "chat_run.heartbeat_failed", extra={"chat_run_id": run_id}, exc_info=True
+                )
+
+
+def interrupted_chat_run_frame(run_id: str, message: str) -> str:
+    """Serialized public ``error`` frame for a run that ended without its own terminal frame."""
+
+    event = PublicStreamProjector(stream_id=run_id).project_error(
+        conversation_id="unknown",
+        response_id=None,
+        agent=None,
+        workflow_meta=None,
+        code="run_interrupted",
+        message=message,
+        source="server",
+        is_retryable=True,
+    )
+    return event.model_dump_json(by_alias=True)
+
+
+def get_chat_run_manager() -> ChatRunManager:
+    from app.bootstrap.container import get_container, wire_chat_run_manager
+
+    container = get_container()
+    wire_chat_run_manager(container)
+    if container.chat_run_manager is None:  # pragma: no cover - defensive
+        raise RuntimeError("ChatRunManager was not configured")
+    return container.chat_run_manager
+
+
+__all__ = [
+    "ChatRun",
+    "ChatRunBackend",
+    "ChatRunExpiredError",
+    "ChatRunManager",
+    "ChatRunNotFoundError",
+    "ChatRunStreamEntry",
+    "InMemoryChatRunBackend",
+    "get_chat_run_manager",
+    "interrupted_chat_run_frame",
+]
@@ -30,6 +30,29 @@ class EventProjector:
         response_id: str | None,
         workflow_run_id: str | None = None,
     ) -> None:
+        await self._conversations.append_run_events(
+            conversation_id,
+            tenant_id=tenant_id,
+            events=self.build_events(
+                session_items=session_items,
+                agent=agent,
+                model=model,
+                response_id=response_id,
+                workflow_run_id=workflow_run_id,
+            ),
+        )
+
+    def build_events(
+        self,
+        *,
+        session_items: Sequence[Mapping[str, Any]],
+        agent: str | None,
+        model: str | None,
+        response_id: str | None,
+        workflow_run_id: str | None = None,
+    ) -> list[ConversationEvent]:
+        """Map session items to events without persisting them."""
+
         events = [
             self._map_item(
                 _to_mapping(item),
@@ -41,12 +64,7 @@ class EventProjector:
             for item in session_items
         ]
         # Filter out items we failed to map (None)
-        filtered = [ev for ev in events if ev is not None]
-        await self._conversations.append_run_events(
-            conversation_id,
-            tenant_id=tenant_id,
-            events=filtered,
-        )
+        return [ev for ev in events if ev is not None]
 
     @staticmethod
     def _map_item(
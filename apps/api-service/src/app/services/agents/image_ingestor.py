@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import base64
+import re
 import uuid
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 
 from app.core.settings import get_settings
@@ -30,6 +32,31 @@ def _infer_mime(fmt: str) -> str:
     return mapping.get(fmt.lower(), "application/octet-stream")
 
 
+_NON_BASE64 = re.compile(r"[^A-Za-z0-9+/]")
+
+
+def _normalize_b64(image_b64: str) -> str:
+    """Drop non-alphabet characters and restore padding, like a lenient ``b64decode``."""
+
+    compact = _NON_BASE64.sub("", image_b64)
+    if len(compact) % 4 == 1:
+        raise ValueError("Image payload is not valid base64")
+    return compact + "=" * (-len(compact) % 4)
+
+
+def _decoded_size(image_b64: str) -> int:
+    padding = len(image_b64) - len(image_b64.rstrip("="))
+    return len(image_b64) // 4 * 3 - padding
+
+
+async def _iter_b64_decoded(image_b64: str, chunk_bytes: int) -> AsyncIterator[bytes]:
+    """Decode base64 in aligned slices so the raw image is never fully materialized."""
+
+    step = max(1, chunk_bytes // 3) * 4
+    for offset in range(0, len(image_b64), step):
+        yield base64.b64decode(image_b64[offset : offset + step], validate=True)
+
+
 async def ingest_image_output(
     *,
     image_b64: str,
@@ -47,8 +74,10 @@ async def ingest_image_output(
     """Decode and persist an image returned by the image_generation tool."""
 
     settings = get_settings()
-    raw_bytes = base64.b64decode(image_b64)
-    size_bytes = len(raw_bytes)
+    # Once normalized (whitespace dropped, padding restored) the decoded size is known
+    # up front and the payload can be decoded in aligned slices while uploading.
+    image_b64 = _normalize_b64(image_b64)
+    size_bytes = _decoded_size(image_b64)
     if size_bytes > settings.image_output_max_mb * 1024 * 1024:
         raise ValueError("Image exceeds configured size limit")
 
@@ -59,12 +88,13 @@ async def ingest_image_output(
     mime = _infer_mime(fmt)
     file_name = f"image-{tool_call_id or response_id or uuid.uuid4().hex}.{fmt}"
 
-    storage_obj = await storage_service.put_object(
+    storage_obj = await storage_service.put_object_stream(
         tenant_id=uuid.UUID(tenant_id),
         user_id=uuid.UUID(user_id) if user_id else None,
-        data=raw_bytes,
+        chunks=_iter_b64_decoded(image_b64, settings.storage_stream_chunk_bytes),
         filename=file_name,
         mime_type=mime,
+        size_hint=size_bytes,
         agent_key=agent_key,
         conversation_id=coerce_conversation_uuid(conversation_id),
         metadata={
@@ -3,15 +3,18 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping, Sequence
 from datetime import datetime
 from typing import Any
 
+from app.domain.ai.models import AgentStreamEvent
+from app.domain.conversations import ConversationAttachment, ConversationEvent, ConversationTurn
 from app.services.agents.container_context import ContainerContextService
 from app.services.agents.event_log import EventProjector
 from app.services.agents.run_pipeline import (
     RunContext,
-    project_compaction_events,
-    project_new_session_items,
+    build_assistant_message,
+    collect_new_session_items,
 )
 from app.services.agents.session_manager import SessionManager
 from app.services.agents.usage import UsageService
@@ -45,98 +48,108 @@ class RunFinalizer:
         tenant_id: str,
         response_id: str | None,
         usage: Any,
-    ) -> None:
-        await self._sync_session_state(
-            tenant_id=tenant_id,
-            conversation_id=ctx.conversation_id,
-            session_id=ctx.session_id,
-            provider_name=ctx.provider.name,
-            provider_conversation_id=ctx.provider_conversation_id,
-        )
-        await self._record_usage_metrics(
-            tenant_id=tenant_id,
-            conversation_id=ctx.conversation_id,
-            response_id=response_id,
-            usage=usage,
-            agent_key=ctx.descriptor.key,
-            provider_name=ctx.provider.name,
-        )
-        await self._append_container_context(
+        response_text: str,
+        attachments: list[ConversationAttachment],
+        active_agent: str | None = None,
+        handoff_count: int | None = None,
+    ) -> int | None:
+        """Persist the finished turn in one transaction, then record billing.
+
+        Returns the stored assistant message id.
+        """
+
+        message, metadata = build_assistant_message(
             ctx=ctx,
-            tenant_id=tenant_id,
-            response_id=response_id,
+            response_text=response_text,
+            attachments=attachments,
+            active_agent=active_agent,
+            handoff_count=handoff_count,
         )
-        await project_compaction_events(
-            event_projector=self._event_projector,
-            compaction_events=ctx.compaction_events,
-            conversation_id=ctx.conversation_id,
+        run_events = [
+            *await self._container_context_events(
+                ctx=ctx, tenant_id=tenant_id, response_id=response_id
+            ),
+            *self._project(
+                [AgentStreamEvent._to_mapping(ev) or {} for ev in ctx.compaction_events],
+                ctx=ctx,
+                response_id=response_id,
+            ),
+            *self._project(
+                await collect_new_session_items(
+                    session_handle=ctx.session_handle,
+                    pre_items=ctx.pre_session_items,
+                    conversation_id=ctx.conversation_id,
+                    tenant_id=tenant_id,
+                ),
+                ctx=ctx,
+                response_id=response_id,
+            ),
+        ]
+        message_id = await self._conversation_service.record_turn(
+            ctx.conversation_id,
             tenant_id=tenant_id,
-            agent=ctx.descriptor.key,
-            model=ctx.descriptor.model,
-            response_id=response_id,
+            turn=ConversationTurn(
+                message=message,
+                metadata=metadata,
+                session_state=self._session_manager.build_session_state(
+                    session_id=ctx.session_id,
+                    provider_name=ctx.provider.name,
+                    provider_conversation_id=ctx.provider_conversation_id,
+                ),
+                run_usage=self._usage_service.build_run_usage(
+                    conversation_id=ctx.conversation_id,
+                    response_id=response_id,
+                    usage=usage,
+                    agent_key=ctx.descriptor.key,
+                    provider=ctx.provider.name,
+                ),
+                run_events=run_events,
+            ),
         )
-        await project_new_session_items(
-            event_projector=self._event_projector,
-            session_handle=ctx.session_handle,
-            pre_items=ctx.pre_session_items,
-            conversation_id=ctx.conversation_id,
+        await self._usage_service.record_billing(
             tenant_id=tenant_id,
-            agent=ctx.descriptor.key,
-            model=ctx.descriptor.model,
+            conversation_id=ctx.conversation_id,
             response_id=response_id,
+            usage=usage,
         )
         ctx.provider.mark_seen(ctx.descriptor.key, datetime.utcnow())
+        return message_id
 
-    async def _sync_session_state(
-        self,
-        *,
-        tenant_id: str,
-        conversation_id: str,
-        session_id: str,
-        provider_name: str | None,
-        provider_conversation_id: str | None,
-    ) -> None:
-        await self._session_manager.sync_session_state(
-            tenant_id=tenant_id,
-            conversation_id=conversation_id,
-            session_id=session_id,
-            provider_name=provider_name,
-            provider_conversation_id=provider_conversation_id,
-        )
-
-    async def _record_usage_metrics(
+    def _project(
         self,
+        session_items: Sequence[Mapping[str, Any]],
         *,
-        tenant_id: str,
-        conversation_id: str,
+        ctx: RunContext,
         response_id: str | None,
-        usage: Any,
-        agent_key: str | None,
-        provider_name: str | None,
-    ) -> None:
-        await self._usage_service.record(
-            tenant_id=tenant_id,
-            conversation_id=conversation_id,
-            response_id=response_id,
-            usage=usage,
-            agent_key=agent_key,
-            provider=provider_name,
-        )
+    ) -> list[ConversationEvent]:
+        if not session_items:
+            return []
+        try:
+            return self._event_projector.build_events(
+                session_items=session_items,
+                agent=ctx.descriptor.key,
+                model=ctx.descriptor.model,
+                response_id=response_id,
+            )
+        except Exception:  # pragma: no cover - defensive, best-effort
+            logger.exception(
+                "event_projection_failed",
+                extra={"conversation_id": ctx.conversation_id, "agent": ctx.descriptor.key},
+            )
+            return []
 
-    async def _append_container_context(
+    async def _container_context_events(
         self,
         *,
         ctx: RunContext,
         tenant_id: str,
         response_id: str | None,
-    ) -> None:
+    ) -> list[ConversationEvent]:
         try:
-            await self._container_context_service.append_run_events(
-                conversation_service=self._conversation_service,
-                conversation_id=ctx.conversation_id,
-                tenant_id=tenant_id,
+            return await self._container_context_service.build_run_events(
                 agent_keys=[ctx.descriptor.key],
                 runtime_ctx=ctx.runtime_ctx,
+                tenant_id=tenant_id,
                 response_id=response_id,
             )
         except Exception as exc:  # pragma: no cover - best effort
@@ -145,3 +158,4 @@ class RunFinalizer:
                 extra={"tenant_id": tenant_id, "conversation_id": ctx.conversation_id},
                 exc_info=exc,
             )
+            return []
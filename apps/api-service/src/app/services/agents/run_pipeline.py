@@ -198,16 +198,15 @@ async def record_user_message(
     return metadata, message_id
 
 
-async def persist_assistant_message(
+def build_assistant_message(
     *,
     ctx: RunContext,
-    conversation_service: ConversationService,
     response_text: str,
     attachments,
     active_agent: str | None = None,
     handoff_count: int | None = None,
-) -> int | None:
-    """Store assistant response with aligned metadata."""
+) -> tuple[ConversationMessage, ConversationMetadata]:
+    """Build the assistant response and its aligned conversation metadata."""
 
     agent_name = active_agent or ctx.descriptor.key
     assistant_message = ConversationMessage(
@@ -215,23 +214,72 @@ async def persist_assistant_message(
         content=response_text,
         attachments=attachments,
     )
+    metadata = build_metadata(
+        tenant_id=ctx.actor.tenant_id,
+        provider=ctx.provider.name,
+        provider_conversation_id=ctx.provider_conversation_id,
+        agent_entrypoint=ctx.descriptor.key,
+        active_agent=agent_name,
+        session_id=ctx.session_id,
+        user_id=ctx.actor.user_id,
+        handoff_count=handoff_count,
+    )
+    return assistant_message, metadata
+
+
+async def persist_assistant_message(
+    *,
+    ctx: RunContext,
+    conversation_service: ConversationService,
+    response_text: str,
+    attachments,
+    active_agent: str | None = None,
+    handoff_count: int | None = None,
+) -> int | None:
+    """Store assistant response with aligned metadata."""
+
+    assistant_message, metadata = build_assistant_message(
+        ctx=ctx,
+        response_text=response_text,
+        attachments=attachments,
+        active_agent=active_agent,
+        handoff_count=handoff_count,
+    )
     return await conversation_service.append_message(
         ctx.conversation_id,
         assistant_message,
         tenant_id=ctx.actor.tenant_id,
-        metadata=build_metadata(
-            tenant_id=ctx.actor.tenant_id,
-            provider=ctx.provider.name,
-            provider_conversation_id=ctx.provider_conversation_id,
-            agent_entrypoint=ctx.descriptor.key,
-            active_agent=agent_name,
-            session_id=ctx.session_id,
-            user_id=ctx.actor.user_id,
-            handoff_count=handoff_count,
-        ),
+        metadata=metadata,
     )
 
 
+async def collect_new_session_items(
+    *,
+    session_handle: Any,
+    pre_items: list[dict[str, Any]],
+    conversation_id: str,
+    tenant_id: str,
+) -> list[Mapping[str, Any]]:
+    """Return the session items the run appended since ``pre_items`` was captured."""
+
+    post_items = await get_session_items(session_handle)
+    if not post_items:
+        return []
+
+    delta = compute_session_delta(pre_items, post_items)
+    if not delta and len(post_items) != len(pre_items):
+        logging.getLogger(__name__).debug(
+            "session_delta_empty_after_rewrite",
+            extra={
+                "pre_len": len(pre_items),
+                "post_len": len(post_items),
+                "conversation_id": conversation_id,
+                "tenant_id": tenant_id,
+            },
+        )
+    return delta
+
+
 async def project_new_session_items(
     *,
     event_projector: EventProjector,
@@ -246,22 +294,13 @@ async def project_new_session_items(
 ) -> None:
     """Ingest newly created session items into the event log (best-effort)."""
 
-    post_items = await get_session_items(session_handle)
-    if not post_items:
-        return
-
-    delta = compute_session_delta(pre_items, post_items)
+    delta = await collect_new_session_items(
+        session_handle=session_handle,
+        pre_items=pre_items,
+        conversation_id=conversation_id,
+        tenant_id=tenant_id,
+    )
     if not delta:
-        if len(post_items) != len(pre_items):
-            logging.getLogger(__name__).debug(
-                "session_delta_empty_after_rewrite",
-                extra={
-                    "pre_len": len(pre_items),
-                    "post_len": len(post_items),
-                    "conversation_id": conversation_id,
-                    "tenant_id": tenant_id,
-                },
-            )
         return
     try:
         await event_projector.ingest_session_items(
@@ -346,7 +385,9 @@ __all__ = [
     "RunContext",
     "prepare_run_context",
     "record_user_message",
+    "build_assistant_message",
     "persist_assistant_message",
+    "collect_new_session_items",
     "project_new_session_items",
     "project_compaction_events",
     "build_metadata",
@@ -145,14 +145,27 @@ class SessionManager:
         await self._conversation_service.update_session_state(
             conversation_id,
             tenant_id=tenant_id,
-            state=ConversationSessionState(
-                provider=provider_name,
+            state=self.build_session_state(
+                session_id=session_id,
+                provider_name=provider_name,
                 provider_conversation_id=provider_conversation_id,
-                sdk_session_id=session_id,
-                last_session_sync_at=datetime.now(UTC),
             ),
         )
 
+    @staticmethod
+    def build_session_state(
+        *,
+        session_id: str,
+        provider_name: str | None,
+        provider_conversation_id: str | None,
+    ) -> ConversationSessionState:
+        return ConversationSessionState(
+            provider=provider_name,
+            provider_conversation_id=provider_conversation_id,
+            sdk_session_id=session_id,
+            last_session_sync_at=datetime.now(UTC),
+        )
+
 
 def _is_session_handle(obj: Any) -> bool:
     return hasattr(obj, "get_items") and hasattr(obj, "add_items")
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from collections.abc import AsyncIterator, Callable, Mapping
 from dataclasses import dataclass, field
 from typing import Any
@@ -15,6 +16,7 @@ from typing import Any
 from app.domain.ai.lifecycle import LifecycleEventSink
 from app.domain.ai.models import AgentStreamEvent
 from app.domain.conversations import ConversationAttachment
+from app.observability.metrics import observe_agent_stream
 from app.services.agents.attachment_utils import collect_container_file_citations_from_event
 from app.services.agents.attachments import AttachmentService
 from app.services.agents.context import ConversationActorContext
@@ -45,6 +47,8 @@ class AgentStreamProcessor:
         entrypoint_agent: str,
         entrypoint_output_schema: Mapping[str, Any] | None,
         attachment_service: AttachmentService,
+        entrypoint_model: str | None = None,
+        clock: Callable[[], float] = time.perf_counter,
     ) -> None:
         self._bus = lifecycle_bus
         self._provider = provider
@@ -52,6 +56,7 @@ class AgentStreamProcessor:
         self._conversation_id = conversation_id
         self._entrypoint_agent = entrypoint_agent
         self._attachments = attachment_service
+        self._clock = clock
 
         self.outcome = StreamOutcome(
             current_agent=entrypoint_agent,
@@ -60,12 +65,20 @@ class AgentStreamProcessor:
         self._seen_tool_calls: set[str] = set()
         self._pending_container_file_citations: list[Mapping[str, Any]] = []
         self._seen_container_files: set[str] = set()
+        self._entrypoint_model = entrypoint_model
+        self._current_model = entrypoint_model
+        self._started_at: float | None = None
+        self._first_token_at: float | None = None
+        # Start of visible output in the model response being streamed right now.
+        self._window_started_at: float | None = None
+        self._windows_observed = 0
 
     @property
     def pending_container_file_citations(self) -> list[Mapping[str, Any]]:
         return list(self._pending_container_file_citations)
 
     async def iter_events(self, stream_handle: Any) -> AsyncIterator[AgentStreamEvent]:
+        self._started_at = self._clock()
         async for event in stream_handle.events():
             processed = await self._process_event(event)
             is_terminal = processed.is_terminal and processed.scope is None
@@ -75,6 +88,7 @@ class AgentStreamProcessor:
                     processed.response_text = text or None
                 if processed.usage is None and hasattr(stream_handle, "usage"):
                     processed.usage = getattr(stream_handle, "usage", None)
+                self._observe_stream(processed)
             yield processed
             if is_terminal:
                 break
@@ -103,6 +117,7 @@ class AgentStreamProcessor:
                 descriptor = self._provider.get_agent(self.outcome.current_agent)
                 if descriptor:
                     self.outcome.current_output_schema = descriptor.output_schema
+                self._current_model = getattr(descriptor, "model", None)
                 self.outcome.handoff_count += 1
                 event.agent = event.new_agent
 
@@ -114,10 +129,17 @@ class AgentStreamProcessor:
 
         if not is_scoped:
             if event.text_delta:
+                if self._window_started_at is None:
+                    self._window_started_at = self._clock()
+                    if self._first_token_at is None:
+                        self._first_token_at = self._window_started_at
                 self.outcome.complete_response += event.text_delta
             elif event.response_text and not self.outcome.complete_response:
                 self.outcome.complete_response = event.response_text
 
+        if not is_scoped and event.raw_type == "response.completed":
+            self._observe_response_window(event.payload)
+
         if not is_scoped:
             self._collect_container_file_citations(event)
 
@@ -171,6 +193,80 @@ class AgentStreamProcessor:
 
         return event
 
+    def _observe_response_window(self, payload: Mapping[str, Any] | None) -> None:
+        """Record output throughput for one finished model response.
+
+        Only visible output counts: the window opens at the response's first text
+        delta and closes when the response completes, and reasoning tokens are
+        subtracted, so tool calls, later turns and hidden reasoning do not skew it.
+        """
+
+        started_at, self._window_started_at = self._window_started_at, None
+        if started_at is None:
+            return
+        response = payload.get("response") if isinstance(payload, Mapping) else None
+        usage = response.get("usage") if isinstance(response, Mapping) else None
+        if not isinstance(usage, Mapping):
+            return
+        details = usage.get("output_tokens_details")
+        reasoning = details.get("reasoning_tokens") if isinstance(details, Mapping) else None
+        self._windows_observed += 1
+        self._observe_throughput(usage.get("output_tokens"), reasoning, self._clock() - started_at)
+
+    def _observe_throughput(
+        self, output_tokens: Any, reasoning_tokens: Any, seconds: float
+    ) -> None:
+        if not isinstance(output_tokens, int) or seconds <= 0:
+            return
+        visible = output_tokens - (reasoning_tokens if isinstance(reasoning_tokens, int) else 0)
+        if visible <= 0:
+            return
+        observe_agent_stream(
+            agent=self.outcome.current_agent or self._entrypoint_agent,
+            model=self._current_model,
+            time_to_first_token_seconds=None,
+            output_tokens_per_second=visible / seconds,
+            cached_input_ratio=None,
+        )
+
+    def _observe_stream(self, terminal: AgentStreamEvent) -> None:
+        """Record latency and prompt-cache metrics for the finished run.
+
+        Time to first token is attributed to the agent the run started with, even
+        when a later agent (after a handoff) produced the first token.
+        """
+
+        if terminal.kind == "error" or self._started_at is None:
+            return
+        usage = terminal.usage
+        input_tokens = usage.input_tokens if usage else None
+        cached_tokens = usage.cached_input_tokens if usage else None
+
+        if self._window_started_at is not None and not self._windows_observed and usage:
+            # The provider did not report per-response completions; treat the run as a
+            # single response.
+            self._observe_throughput(
+                usage.output_tokens,
+                usage.reasoning_output_tokens,
+                self._clock() - self._window_started_at,
+            )
+        if self._first_token_at is not None:
+            observe_agent_stream(
+                agent=self._entrypoint_agent,
+                model=self._entrypoint_model,
+                time_to_first_token_seconds=self._first_token_at - self._started_at,
+                output_tokens_per_second=None,
+                cached_input_ratio=None,
+            )
+        if input_tokens:
+            observe_agent_stream(
+                agent=self.outcome.current_agent or self._entrypoint_agent,
+                model=self._current_model,
+                time_to_first_token_seconds=None,
+                output_tokens_per_second=None,
+                cached_input_ratio=(cached_tokens or 0) / input_tokens,
+            )
+
     def _collect_container_file_citations(self, event: AgentStreamEvent) -> None:
         new = collect_container_file_citations_from_event(event, seen=self._seen_container_files)
         self._pending_container_file_citations.extend(new)
@@ -7,6 +7,7 @@ from datetime import UTC, datetime
 from uuid import UUID
 
 from app.domain.ai import AgentRunUsage
+from app.domain.conversations import ConversationRunUsage
 from app.infrastructure.persistence.usage.models import UsageCounterGranularity
 from app.services.conversation_service import ConversationService
 from app.services.usage.counters import UsageCounterService
@@ -50,7 +51,48 @@ class UsageService:
                     created_at=timestamp,
                 ),
             )
+        await self.record_billing(
+            tenant_id=tenant_id,
+            conversation_id=conversation_id,
+            response_id=response_id,
+            usage=usage,
+            timestamp=timestamp,
+        )
 
+    def build_run_usage(
+        self,
+        *,
+        conversation_id: str,
+        response_id: str | None,
+        usage: AgentRunUsage | None,
+        agent_key: str | None,
+        provider: str | None,
+    ) -> ConversationRunUsage | None:
+        """Return the conversation-level usage row for a run, for the caller to persist."""
+
+        if usage is None:
+            return None
+        return _to_conversation_run_usage(
+            conversation_id=conversation_id,
+            response_id=response_id,
+            agent_key=agent_key,
+            provider=provider,
+            usage=usage,
+            created_at=datetime.now(UTC),
+        )
+
+    async def record_billing(
+        self,
+        *,
+        tenant_id: str,
+        conversation_id: str,
+        response_id: str | None,
+        usage: AgentRunUsage | None,
+        timestamp: datetime | None = None,
+    ) -> None:
+        """Record billable usage entries and usage counters for a run."""
+
+        timestamp = timestamp or datetime.now(UTC)
         if not self._recorder:
             return
         base_key = response_id or f"{conversation_id}:{uuid.uuid4()}"
@@ -107,9 +149,7 @@ def _to_conversation_run_usage(
     provider: str | None,
     usage: AgentRunUsage,
     created_at: datetime,
-):
-    from app.domain.conversations import ConversationRunUsage
-
+) -> ConversationRunUsage:
     return ConversationRunUsage(
         conversation_id=conversation_id,
         response_id=response_id,
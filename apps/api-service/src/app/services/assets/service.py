@@ -17,6 +17,7 @@ from app.domain.assets import (
     AssetView,
 )
 from app.infrastructure.persistence.assets.repository import SqlAlchemyAssetRepository
+from app.services.assets.thumbnails import AssetThumbnailPipeline
 from app.services.storage.service import StorageService
 
 logger = logging.getLogger(__name__)
@@ -29,9 +30,11 @@ class AssetService:
         session_factory,
         storage_service: StorageService,
         repository: AssetRepository | None = None,
+        thumbnail_pipeline: AssetThumbnailPipeline | None = None,
     ) -> None:
         self._repository = repository or SqlAlchemyAssetRepository(session_factory)
         self._storage_service = storage_service
+        self._thumbnail_pipeline = thumbnail_pipeline
 
     async def create_asset(
         self,
@@ -62,7 +65,10 @@ class AssetService:
             openai_file_id=openai_file_id,
             metadata=metadata or {},
         )
-        return await self._repository.create(asset)
+        record = await self._repository.create(asset)
+        if self._thumbnail_pipeline is not None:
+            self._thumbnail_pipeline.schedule(record)
+        return record
 
     async def list_assets(
         self,
@@ -131,33 +137,47 @@ class AssetService:
         items: list[AssetThumbnailUrl] = []
         ttl = self.signed_url_ttl()
 
+        # Prefer the generated thumbnail; images without one fall back to the original.
+        wanted: dict[uuid.UUID, list[uuid.UUID]] = {}
         for asset_id in ids:
             view = view_by_id.get(asset_id)
             if view is None:
-                missing.append(asset_id)
                 continue
             if view.asset.asset_type != "image":
-                unsupported.append(asset_id)
                 continue
-            try:
-                presign, storage_obj = await self._storage_service.get_presigned_download(
-                    tenant_id=tenant_id,
-                    object_id=view.asset.storage_object_id,
-                )
-            except FileNotFoundError:
+            wanted[asset_id] = [
+                object_id
+                for object_id in (view.asset.thumbnail_object_id, view.asset.storage_object_id)
+                if object_id is not None
+            ]
+        try:
+            presigned = await self._storage_service.get_presigned_downloads(
+                tenant_id=tenant_id,
+                object_ids=list({oid for candidates in wanted.values() for oid in candidates}),
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.warning(
+                "asset.thumbnail_presign_failed",
+                extra={"tenant_id": str(tenant_id), "asset_count": len(wanted)},
+                exc_info=exc,
+            )
+            presigned = {}
+
+        for asset_id in ids:
+            view = view_by_id.get(asset_id)
+            if view is None:
                 missing.append(asset_id)
                 continue
-            except Exception as exc:  # pragma: no cover - defensive
-                logger.warning(
-                    "asset.thumbnail_presign_failed",
-                    extra={
-                        "tenant_id": str(tenant_id),
-                        "asset_id": str(asset_id),
-                    },
-                    exc_info=exc,
-                )
+            if view.asset.asset_type != "image":
+                unsupported.append(asset_id)
+                continue
+            match = next(
+                (presigned[oid] for oid in wanted[asset_id] if oid in presigned), None
+            )
+            if match is None:
                 missing.append(asset_id)
                 continue
+            presign, storage_obj = match
             if storage_obj.id is None:
                 missing.append(asset_id)
                 continue
@@ -176,6 +196,10 @@ class AssetService:
     def signed_url_ttl(self) -> int:
         return self._storage_service.signed_url_ttl()
 
+    async def shutdown(self) -> None:
+        if self._thumbnail_pipeline is not None:
+            await self._thumbnail_pipeline.shutdown()
+
     async def delete_asset(self, *, tenant_id: uuid.UUID, asset_id: uuid.UUID) -> None:
         asset = await self._repository.get_record(tenant_id=tenant_id, asset_id=asset_id)
         if asset is None:
@@ -184,6 +208,12 @@ class AssetService:
             tenant_id=tenant_id,
             object_id=asset.storage_object_id,
         )
+        if asset.thumbnail_object_id is not None:
+            await self._storage_service.delete_object(
+                tenant_id=tenant_id,
+                object_id=asset.thumbnail_object_id,
+                include_derived=True,
+            )
         await self._repository.mark_deleted(tenant_id=tenant_id, asset_id=asset_id)
 
     async def link_assets_to_message(
@@ -0,0 +1,316 @@
+"""Background thumbnail derivatives for image assets."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import logging
+import uuid
+from collections.abc import AsyncGenerator, Callable
+from contextlib import aclosing
+from datetime import UTC, datetime, timedelta
+from typing import cast
+
+from app.core.settings import Settings
+from app.domain.assets import AssetRecord, AssetRepository
+from app.infrastructure.executors import IntegrationExecutor, get_integration_executor
+from app.services.storage.service import StorageService
+
+_pillow_import_error: ImportError | None
+try:  # pragma: no cover - optional dependency imported lazily
+    from PIL import Image, ImageOps
+except ImportError as exc:  # pragma: no cover - should be installed via pyproject
+    _pillow_import_error = exc
+else:
+    _pillow_import_error = None
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_MIME_TYPE = "image/webp"
+# Sources above this many pixels are refused before decoding (decompression bombs).
+MAX_SOURCE_PIXELS = 50_000_000
+# Dimensions are read from this much of the original before the rest is downloaded.
+SOURCE_HEADER_BYTES = 64 * 1024
+# The backfill stops retrying an asset once its render has failed this many times.
+MAX_THUMBNAIL_ATTEMPTS = 3
+
+ThumbnailRenderer = Callable[..., bytes]
+
+
+def thumbnails_available() -> bool:
+    """Return whether the image library needed to render thumbnails is installed."""
+
+    return _pillow_import_error is None
+
+
+def read_image_size(header: bytes) -> tuple[int, int] | None:
+    """Return ``(width, height)`` from the leading bytes of an image, if they are enough."""
+
+    if _pillow_import_error is not None:
+        return None
+    try:
+        # ``open`` parses the header only; the truncated remainder is never touched.
+        with Image.open(io.BytesIO(header)) as image:
+            return image.size
+    except Exception:
+        return None
+
+
+def render_thumbnail(data: bytes, *, max_edge: int, quality: int) -> bytes:
+    """Downscale an image so its longest edge is ``max_edge`` and encode it as WebP.
+
+    CPU-bound; callers run it on the ``images`` integration executor.
+    """
+
+    if _pillow_import_error is not None:
+        raise RuntimeError("Pillow is required to render asset thumbnails") from (
+            _pillow_import_error
+        )
+    try:
+        with Image.open(io.BytesIO(data)) as source:
+            # Only the header has been read so far; refuse oversized images before
+            # any pixel data is decoded.
+            width, height = source.size
+            if width * height > MAX_SOURCE_PIXELS:
+                raise ValueError(f"Image is too large to thumbnail ({width}x{height} pixels)")
+            # JPEG decoders can shrink while decoding, which skips most of the resize work.
+            source.draft("RGB", (max_edge, max_edge))
+            image = ImageOps.exif_transpose(source) or source
+            image.thumbnail((max_edge, max_edge))
+            if image.mode not in ("RGB", "RGBA"):
+                image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+            buffer = io.BytesIO()
+            image.save(buffer, format="WEBP", quality=quality, method=4)
+    except Image.DecompressionBombError as exc:
+        raise ValueError(str(exc)) from exc
+    return buffer.getvalue()
+
+
+class AssetThumbnailPipeline:
+    """Render thumbnails for new image assets off the request path.
+
+    Each scheduled asset is read from storage, downscaled on the bounded ``images``
+    executor, stored as its own storage object and linked back through
+    ``agent_assets.thumbnail_object_id``. Failures are logged and leave the asset
+    without a thumbnail; galleries then fall back to the original.
+    """
+
+    def __init__(
+        self,
+        *,
+        storage_service: StorageService,
+        repository: AssetRepository,
+        settings_provider: Callable[[], Settings],
+        renderer: ThumbnailRenderer = render_thumbnail,
+        executor: IntegrationExecutor | None = None,
+    ) -> None:
+        self._storage_service = storage_service
+        self._repository = repository
+        self._settings_provider = settings_provider
+        self._renderer = renderer
+        self._executor = executor
+        self._tasks: set[asyncio.Task[uuid.UUID | None]] = set()
+
+    def schedule(self, asset: AssetRecord) -> None:
+        """Queue thumbnail generation for ``asset`` without waiting for it."""
+
+        if asset.asset_type != "image" or asset.thumbnail_object_id is not None:
+            return
+        task = asyncio.create_task(self.generate(asset))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def generate(self, asset: AssetRecord) -> uuid.UUID | None:
+        """Render, store and link the thumbnail; return its storage object id."""
+
+        settings = self._settings_provider()
+        executor = self._executor or get_integration_executor("images", settings)
+        try:
+            original = await self._read_source(asset)
+            rendered = await executor.run(
+                self._renderer,
+                original,
+                max_edge=settings.asset_thumbnail_max_edge_px,
+                quality=settings.asset_thumbnail_quality,
+            )
+            thumbnail = await self._storage_service.put_object(
+                tenant_id=asset.tenant_id,
+                user_id=None,
+                data=rendered,
+                filename=f"thumbnail-{asset.id}.webp",
+                mime_type=THUMBNAIL_MIME_TYPE,
+                conversation_id=asset.conversation_id,
+                metadata={
+                    "derived_from": str(asset.storage_object_id),
+                    "variant": "thumbnail",
+                },
+                derived_from=asset.storage_object_id,
+            )
+            if thumbnail.id is None:  # pragma: no cover - defensive
+                return None
+            await self._repository.set_thumbnail(
+                tenant_id=asset.tenant_id,
+                asset_id=asset.id,
+                thumbnail_object_id=thumbnail.id,
+            )
+        except Exception as exc:
+            logger.warning(
+                "asset.thumbnail_failed",
+                extra={
+                    "tenant_id": str(asset.tenant_id),
+                    "asset_id": str(asset.id),
+                },
+                exc_info=exc,
+            )
+            await self._record_failure(asset)
+            return None
+        return thumbnail.id
+
+    async def _read_source(self, asset: AssetRecord) -> bytes:
+        """Download the original, refusing oversized images as soon as the header is in."""
+
+        buffer = bytearray()
+        checked = False
+        chunks = cast(
+            AsyncGenerator[bytes, None],
+            self._storage_service.iter_object_bytes(
+                tenant_id=asset.tenant_id, object_id=asset.storage_object_id
+            ),
+        )
+        async with aclosing(chunks):
+            async for chunk in chunks:
+                buffer.extend(chunk)
+                if checked or len(buffer) < SOURCE_HEADER_BYTES:
+                    continue
+                checked = True
+                size = read_image_size(bytes(buffer))
+                if size is not None and size[0] * size[1] > MAX_SOURCE_PIXELS:
+                    raise ValueError(
+                        f"Image is too large to thumbnail ({size[0]}x{size[1]} pixels)"
+                    )
+        # Smaller originals are checked by ``render_thumbnail`` before decoding.
+        return bytes(buffer)
+
+    async def _record_failure(self, asset: AssetRecord) -> None:
+        try:
+            await self._repository.record_thumbnail_failure(
+                tenant_id=asset.tenant_id, asset_id=asset.id
+            )
+        except Exception as exc:  # pragma: no cover - defensive logging
+            logger.warning(
+                "asset.thumbnail_failure_not_recorded",
+                extra={"asset_id": str(asset.id)},
+                exc_info=exc,
+            )
+
+    async def shutdown(self) -> None:
+        tasks = list(self._tasks)
+        self._tasks.clear()
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class AssetThumbnailBackfill:
+    """Periodically render thumbnails for image assets that still lack one.
+
+    Covers assets stored before thumbnails were enabled and those whose scheduled
+    render was lost (process restart, storage hiccup). Assets younger than
+    ``grace_seconds`` are left to the pipeline that is scheduling them right now,
+    and assets whose render failed ``max_attempts`` times (corrupt or oversized
+    originals) are not retried.
+    """
+
+    def __init__(
+        self,
+        *,
+        pipeline: AssetThumbnailPipeline,
+        repository: AssetRepository,
+        poll_interval_seconds: float = 3600.0,
+        batch_size: int = 50,
+        grace_seconds: float = 600.0,
+        max_attempts: int = MAX_THUMBNAIL_ATTEMPTS,
+    ) -> None:
+        self._pipeline = pipeline
+        self._repository = repository
+        self._poll_interval_seconds = poll_interval_seconds
+        self._batch_size = batch_size
+        self._grace_seconds = grace_seconds
+        self._max_attempts = max_attempts
+        self._task: asyncio.Task[None] | None = None
+        self._stop_event: asyncio.Event | None = None
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._stop_event = asyncio.Event()
+        self._task = asyncio.create_task(self._run(), name="asset-thumbnail-backfill")
+
+    async def shutdown(self) -> None:
+        if self._task is None:
+            return
+        if self._stop_event is not None:
+            self._stop_event.set()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:  # pragma: no cover - normal shutdown path
+            pass
+        finally:
+            self._task = None
+            self._stop_event = None
+
+    async def run_once(self) -> int:
+        """Walk every asset missing a thumbnail once; return how many were rendered."""
+
+        created_before = datetime.now(UTC) - timedelta(seconds=self._grace_seconds)
+        after: tuple[datetime, uuid.UUID] | None = None
+        rendered = 0
+        while True:
+            assets = await self._repository.list_missing_thumbnails(
+                created_before=created_before,
+                after=after,
+                limit=self._batch_size,
+                max_failures=self._max_attempts,
+            )
+            for asset in assets:
+                if self._stop_event is not None and self._stop_event.is_set():
+                    return rendered
+                if await self._pipeline.generate(asset) is not None:
+                    rendered += 1
+            if len(assets) < self._batch_size:
+                return rendered
+            last = assets[-1]
+            if last.created_at is None:  # pragma: no cover - defensive
+                return rendered
+            after = (last.created_at, last.id)
+
+    async def _run(self) -> None:
+        stop_event = self._stop_event
+        assert stop_event is not None
+        while not stop_event.is_set():
+            try:
+                rendered = await self.run_once()
+            except Exception as exc:  # pragma: no cover - defensive logging
+                logger.warning("asset.thumbnail_backfill_failed", exc_info=exc)
+            else:
+                if rendered:
+                    logger.info("asset.thumbnail_backfill_rendered", extra={"rendered": rendered})
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=self._poll_interval_seconds)
+            except TimeoutError:
+                continue
+
+
+__all__ = [
+    "AssetThumbnailBackfill",
+    "AssetThumbnailPipeline",
+    "MAX_SOURCE_PIXELS",
+    "MAX_THUMBNAIL_ATTEMPTS",
+    "SOURCE_HEADER_BYTES",
+    "THUMBNAIL_MIME_TYPE",
+    "read_image_size",
+    "render_thumbnail",
+    "thumbnails_available",
+]
@@ -3,13 +3,15 @@
 from __future__ import annotations
 
 import uuid
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
 from dataclasses import dataclass
 from typing import Any, Protocol, cast, runtime_checkable
 
 from openai import AsyncOpenAI
 
 from app.core.settings import Settings
+from app.domain.storage import DEFAULT_STREAM_CHUNK_BYTES
 
 
 @dataclass(slots=True)
@@ -18,6 +20,13 @@ class ContainerFileContent:
     filename: str | None = None
 
 
+@dataclass(slots=True)
+class ContainerFileStream:
+    chunks: AsyncIterator[bytes]
+    filename: str | None = None
+    size_bytes: int | None = None
+
+
 @runtime_checkable
 class ContainerFilesGateway(Protocol):
     async def download_file_content(
@@ -28,6 +37,15 @@ class ContainerFilesGateway(Protocol):
         file_id: str,
     ) -> ContainerFileContent: ...
 
+    def stream_file_content(
+        self,
+        *,
+        tenant_id: uuid.UUID | str,
+        container_id: str,
+        file_id: str,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_BYTES,
+    ) -> AbstractAsyncContextManager[ContainerFileStream]: ...
+
 
 class OpenAIContainerFilesGateway:
     """Thin wrapper around OpenAI SDK to enable DI and future provider swaps."""
@@ -75,6 +93,27 @@ class OpenAIContainerFilesGateway:
         data = await resp.aread()
         return ContainerFileContent(data=data, filename=filename)
 
+    @asynccontextmanager
+    async def stream_file_content(
+        self,
+        *,
+        tenant_id: uuid.UUID | str,
+        container_id: str,
+        file_id: str,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_BYTES,
+    ) -> AsyncIterator[ContainerFileStream]:
+        """Open the container file as a chunked stream without buffering the body."""
+
+        client = self._client(tenant_id)
+        streaming = cast(Any, client).containers.files.content.with_streaming_response
+        async with streaming.retrieve(file_id, container_id=container_id) as resp:
+            length = resp.headers.get("content-length")
+            yield ContainerFileStream(
+                chunks=resp.iter_bytes(chunk_size),
+                filename=getattr(resp, "filename", None),
+                size_bytes=int(length) if length and length.isdigit() else None,
+            )
+
 
 async def _fetch_container_file_content(
     client: AsyncOpenAI, *, container_id: str, file_id: str
@@ -92,6 +131,7 @@ async def _fetch_container_file_content(
 
 __all__ = [
     "ContainerFileContent",
+    "ContainerFileStream",
     "ContainerFilesGateway",
     "OpenAIContainerFilesGateway",
 ]
@@ -18,6 +18,7 @@ from app.domain.conversations import (
     ConversationRepository,
     ConversationRunUsage,
     ConversationSessionState,
+    ConversationTurn,
     MessagePage,
     ensure_metadata_tenant,
 )
@@ -123,6 +124,28 @@ class ConversationService:
             metadata=metadata,
         )
 
+    async def record_turn(
+        self,
+        conversation_id: str,
+        *,
+        tenant_id: str,
+        turn: ConversationTurn,
+    ) -> int | None:
+        """Persist an assistant reply with its session state, usage, and run events.
+
+        Everything commits together, so a turn costs one transaction instead of
+        one per write. Returns the stored message id.
+        """
+
+        repository = self._require_repository()
+        normalized_tenant = _require_tenant_id(tenant_id)
+        ensure_metadata_tenant(turn.metadata, normalized_tenant)
+        return await repository.record_turn(
+            conversation_id,
+            tenant_id=normalized_tenant,
+            turn=turn,
+        )
+
     async def get_messages(
         self,
         conversation_id: str,
@@ -2,6 +2,12 @@
 
 from __future__ import annotations
 
+from .leader_election import (
+    BackgroundJob,
+    LeaderElectedJob,
+    RedisLeaderLease,
+    default_holder_id,
+)
 from .rate_limit_service import (
     ConcurrencyQuota,
     RateLimiter,
@@ -15,13 +21,17 @@ from .rate_limit_service import (
 )
 
 __all__ = [
+    "BackgroundJob",
     "build_rate_limit_identity",
+    "default_holder_id",
     "ConcurrencyQuota",
     "get_rate_limiter",
     "hash_user_agent",
+    "LeaderElectedJob",
     "RateLimitExceeded",
     "RateLimitLease",
     "RateLimitQuota",
     "RateLimiter",
+    "RedisLeaderLease",
     "rate_limiter",
 ]
@@ -0,0 +1,95 @@
+"""Background job that keeps monthly event partitions created ahead of time."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import UTC, datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.infrastructure.persistence.partitions import (
+    PARTITIONED_TABLES,
+    ensure_partitions,
+    is_partitioned,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class EventPartitionMaintainer:
+    """Pre-create upcoming monthly partitions for the partitioned event tables.
+
+    Runs as a leader-elected job so that rows never reach the DEFAULT partition
+    merely because nobody created the month in time. Tables that are not
+    partitioned (SQLite, or Postgres before the partitioning migration) are
+    skipped.
+    """
+
+    def __init__(
+        self,
+        *,
+        session_factory: async_sessionmaker[AsyncSession],
+        months_ahead: int,
+        poll_interval_seconds: float = 6 * 3600.0,
+    ) -> None:
+        self._session_factory = session_factory
+        self._months_ahead = months_ahead
+        self._poll_interval_seconds = poll_interval_seconds
+        self._task: asyncio.Task[None] | None = None
+        self._stop_event: asyncio.Event | None = None
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._stop_event = asyncio.Event()
+        self._task = asyncio.create_task(self._run(), name="event-partitions")
+
+    async def shutdown(self) -> None:
+        if self._task is None:
+            return
+        if self._stop_event is not None:
+            self._stop_event.set()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:  # pragma: no cover - normal shutdown path
+            pass
+        finally:
+            self._task = None
+            self._stop_event = None
+
+    async def run_once(self) -> dict[str, list[str]]:
+        """Ensure partitions for every table once; return the partitions created per table."""
+
+        now = datetime.now(UTC)
+        created: dict[str, list[str]] = {}
+        async with self._session_factory() as session:
+            for table in PARTITIONED_TABLES:
+                if not await is_partitioned(session, table.name):
+                    continue
+                names = await ensure_partitions(
+                    session, table, now=now, months_ahead=self._months_ahead
+                )
+                if names:
+                    created[table.name] = names
+        return created
+
+    async def _run(self) -> None:
+        stop_event = self._stop_event
+        assert stop_event is not None
+        while not stop_event.is_set():
+            try:
+                created = await self.run_once()
+            except Exception as exc:  # pragma: no cover - defensive logging
+                logger.warning("event_partitions.ensure_failed", exc_info=exc)
+            else:
+                if created:
+                    logger.info("event_partitions.created", extra={"partitions": created})
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=self._poll_interval_seconds)
+            except TimeoutError:
+                continue
+
+
+__all__ = ["EventPartitionMaintainer"]
@@ -0,0 +1,204 @@
+"""Redis-lease leader election for singleton background jobs."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import socket
+import uuid
+from typing import Protocol
+
+from redis.commands.core import AsyncScript
+from redis.exceptions import RedisError
+
+from app.infrastructure.redis_types import RedisBytesClient
+
+logger = logging.getLogger(__name__)
+
+# Takes the lease when free and extends it when this holder already owns it.
+# KEYS: lease key. ARGV: holder id, ttl_ms. Returns 1 when held, 0 when another
+# holder owns it.
+_ACQUIRE_SCRIPT = """
+local holder = redis.call('GET', KEYS[1])
+if not holder then
+  redis.call('SET', KEYS[1], ARGV[1], 'PX', ARGV[2])
+  return 1
+end
+if holder == ARGV[1] then
+  redis.call('PEXPIRE', KEYS[1], ARGV[2])
+  return 1
+end
+return 0
+"""
+
+# Deletes the lease only if this holder owns it. KEYS: lease key. ARGV: holder id.
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+  return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+def default_holder_id() -> str:
+    """Identify this process in lease values (host, pid, and a random suffix)."""
+
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class RedisLeaderLease:
+    """One named lease in Redis, owned by whichever contender holds its key.
+
+    The key expires on its own if the holder stops renewing (crash, network
+    partition), so another contender takes over within ``ttl_seconds``.
+    """
+
+    def __init__(
+        self,
+        redis: RedisBytesClient,
+        *,
+        name: str,
+        holder_id: str,
+        ttl_seconds: float,
+        prefix: str = "leader",
+    ) -> None:
+        self._redis = redis
+        self.key = f"{prefix}:{name}"
+        self.holder_id = holder_id
+        self._ttl_ms = max(1, int(ttl_seconds * 1000))
+        self._acquire_script: AsyncScript | None = None
+        self._release_script: AsyncScript | None = None
+
+    async def acquire(self) -> bool:
+        """Take or extend the lease; ``False`` when another holder owns it."""
+
+        if self._acquire_script is None:
+            self._acquire_script = self._redis.register_script(_ACQUIRE_SCRIPT)
+        held = await self._acquire_script(keys=[self.key], args=[self.holder_id, self._ttl_ms])
+        return bool(held)
+
+    async def release(self) -> None:
+        if self._release_script is None:
+            self._release_script = self._redis.register_script(_RELEASE_SCRIPT)
+        await self._release_script(keys=[self.key], args=[self.holder_id])
+
+
+class BackgroundJob(Protocol):
+    async def start(self) -> None: ...
+
+    async def shutdown(self) -> None: ...
+
+
+class LeaderElectedJob:
+    """Run ``job`` only while this process holds the job's lease.
+
+    Every contender polls at a third of the lease TTL: followers try to acquire,
+    the leader renews. A failed or erroring renewal stops the job straight away,
+    before the lease can expire and a new leader start, so at most one copy runs
+    at a time (barring a leader stalled longer than the TTL). Shutting down
+    stops the job and releases the lease so a follower takes over on its next
+    poll instead of waiting out the TTL.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        job: BackgroundJob,
+        *,
+        lease: RedisLeaderLease,
+        ttl_seconds: float,
+    ) -> None:
+        self.name = name
+        self._job = job
+        self._lease = lease
+        self._interval = ttl_seconds / 3
+        self._leading = False
+        self._task: asyncio.Task[None] | None = None
+        self._stop_event: asyncio.Event | None = None
+
+    @property
+    def is_leader(self) -> bool:
+        return self._leading
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._stop_event = asyncio.Event()
+        await self.poll()
+        self._task = asyncio.create_task(
+            self._run(self._stop_event), name=f"leader-election:{self.name}"
+        )
+
+    async def shutdown(self) -> None:
+        task, self._task = self._task, None
+        if task is None:
+            return
+        if self._stop_event is not None:
+            self._stop_event.set()
+        try:
+            await task
+        finally:
+            self._stop_event = None
+            await self._step_down(release=True)
+
+    async def poll(self) -> None:
+        """Run one election round: acquire when following, renew when leading."""
+
+        try:
+            # Bounded so a hung Redis cannot keep a stale leader running past its TTL.
+            held = await asyncio.wait_for(self._lease.acquire(), timeout=self._interval)
+        except (RedisError, TimeoutError) as exc:
+            logger.warning(
+                "leader_election.poll_failed",
+                extra={"job": self.name, "leading": self._leading},
+                exc_info=exc,
+            )
+            held = False
+
+        if held and not self._leading:
+            self._leading = True
+            logger.info(
+                "leader_election.acquired",
+                extra={"job": self.name, "holder": self._lease.holder_id},
+            )
+            await self._job.start()
+        elif not held and self._leading:
+            logger.warning(
+                "leader_election.lost",
+                extra={"job": self.name, "holder": self._lease.holder_id},
+            )
+            await self._step_down(release=False)
+
+    async def _run(self, stop_event: asyncio.Event) -> None:
+        while not stop_event.is_set():
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=self._interval)
+            except TimeoutError:
+                await self.poll()
+
+    async def _step_down(self, *, release: bool) -> None:
+        if not self._leading:
+            return
+        self._leading = False
+        try:
+            await self._job.shutdown()
+        finally:
+            if release:
+                try:
+                    await self._lease.release()
+                except RedisError as exc:  # pragma: no cover - lease expires on its own
+                    logger.warning(
+                        "leader_election.release_failed",
+                        extra={"job": self.name},
+                        exc_info=exc,
+                    )
+            logger.info("leader_election.stepped_down", extra={"job": self.name})
+
+
+__all__ = [
+    "BackgroundJob",
+    "LeaderElectedJob",
+    "RedisLeaderLease",
+    "default_holder_id",
+]
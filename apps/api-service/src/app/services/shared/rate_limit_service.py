@@ -5,10 +5,13 @@ from __future__ import annotations
 import asyncio
 import hashlib
 import logging
+import math
+import uuid
 from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 from types import TracebackType
 
+from redis.commands.core import AsyncScript
 from redis.exceptions import RedisError
 
 from app.infrastructure.redis_types import RedisBytesClient
@@ -16,7 +19,7 @@ from app.infrastructure.redis_types import RedisBytesClient
 
 @dataclass(slots=True, frozen=True)
 class RateLimitQuota:
-    """Fixed-window quota definition."""
+    """Rate quota: at most ``limit`` requests per ``window_seconds``, spread evenly (GCRA)."""
 
     name: str
     limit: int
@@ -26,7 +29,11 @@ class RateLimitQuota:
 
 @dataclass(slots=True, frozen=True)
 class ConcurrencyQuota:
-    """Concurrent-connection quota definition."""
+    """Concurrent-connection quota definition.
+
+    ``ttl_seconds`` is how long a lease survives without a heartbeat, i.e. how quickly
+    capacity held by a crashed process is returned.
+    """
 
     name: str
     limit: int
@@ -45,42 +52,188 @@ class RateLimitExceeded(RuntimeError):
         super().__init__(f"Rate limit exceeded for '{quota}'")
 
 
+QuotaCheck = tuple[RateLimitQuota, Sequence[str]]
+
+# Evaluates every rate quota (GCRA) and an optional concurrency lease in one round
+# trip. Nothing is charged unless all checks pass, so a rejected request consumes no
+# budget. Leases are sorted-set members scored by expiry; expired members (left by
+# crashed processes) are pruned before counting. KEYS: rate keys, then the lease key
+# (optional). ARGV: rate count, (limit, window_ms) per rate key, then
+# (limit, ttl_ms, lease id) when a lease key is present. Returns {0, 0} when
+# admitted, otherwise {1-based index of the rejecting key, retry-after in ms}.
+_ADMIT_SCRIPT = """
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) * 1000 + tonumber(clock[2]) / 1000
+local rate_count = tonumber(ARGV[1])
+local tats = {}
+local denied = 0
+local retry_ms = 0
+for i = 1, rate_count do
+  local limit = tonumber(ARGV[2 * i])
+  local window = tonumber(ARGV[2 * i + 1])
+  local tat = tonumber(redis.call('GET', KEYS[i])) or now
+  if tat < now then tat = now end
+  local next_tat = tat + window / limit
+  local wait = next_tat - now - window
+  if wait > 0 and wait > retry_ms then
+    denied = i
+    retry_ms = wait
+  end
+  tats[i] = next_tat
+end
+if denied > 0 then
+  return {denied, math.ceil(retry_ms)}
+end
+local slot = rate_count + 1
+local slot_ttl = 0
+if #KEYS >= slot then
+  local limit = tonumber(ARGV[2 * rate_count + 2])
+  slot_ttl = tonumber(ARGV[2 * rate_count + 3])
+  redis.call('ZREMRANGEBYSCORE', KEYS[slot], '-inf', now)
+  if redis.call('ZCARD', KEYS[slot]) >= limit then
+    local oldest = redis.call('ZRANGE', KEYS[slot], 0, 0, 'WITHSCORES')
+    local wait = slot_ttl
+    if oldest[2] then wait = tonumber(oldest[2]) - now end
+    return {slot, math.ceil(wait)}
+  end
+end
+for i = 1, rate_count do
+  redis.call('SET', KEYS[i], tostring(tats[i]), 'PX', math.ceil(tats[i] - now))
+end
+if slot_ttl > 0 then
+  redis.call('ZADD', KEYS[slot], now + slot_ttl, ARGV[2 * rate_count + 4])
+  redis.call('PEXPIRE', KEYS[slot], slot_ttl)
+end
+return {0, 0}
+"""
+
+# Extends every lease this process holds. KEYS: lease key per lease (repeats allowed).
+# ARGV: (lease id, ttl_ms) per key. XX keeps leases another process already pruned
+# from being resurrected past the limit.
+_RENEW_SCRIPT = """
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) * 1000 + tonumber(clock[2]) / 1000
+for i, key in ipairs(KEYS) do
+  local ttl = tonumber(ARGV[2 * i])
+  redis.call('ZADD', key, 'XX', now + ttl, ARGV[2 * i - 1])
+  redis.call('PEXPIRE', key, ttl)
+end
+return #KEYS
+"""
+
+# Never heartbeat more often than this, however short a lease TTL is.
+_MIN_HEARTBEAT_INTERVAL_SECONDS = 0.2
+
+
+class LeaseHeartbeat:
+    """Renews all of this process's open leases with one Redis call per tick.
+
+    Per-lease heartbeat tasks would issue one command per open stream per interval;
+    here the command count per tick is constant. The tick runs at a third of the
+    shortest tracked TTL so a lease survives two missed beats, and the task exits
+    when no leases remain.
+    """
+
+    def __init__(self, redis: RedisBytesClient) -> None:
+        self._redis = redis
+        self._leases: dict[tuple[str, str], int] = {}
+        self._task: asyncio.Task[None] | None = None
+        self._script: AsyncScript | None = None
+        self._logger = logging.getLogger(__name__)
+
+    @property
+    def active(self) -> int:
+        return len(self._leases)
+
+    def track(self, key: str, member: str, ttl_ms: int) -> None:
+        self._leases[(key, member)] = ttl_ms
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def release(self, key: str, member: str) -> None:
+        self._leases.pop((key, member), None)
+        await self._redis.zrem(key, member)
+
+    async def renew(self) -> None:
+        if not self._leases:
+            return
+        keys: list[str] = []
+        args: list[str | int] = []
+        for (key, member), ttl_ms in self._leases.items():
+            keys.append(key)
+            args.extend((member, ttl_ms))
+        if self._script is None:
+            self._script = self._redis.register_script(_RENEW_SCRIPT)
+        await self._script(keys=keys, args=args)
+
+    async def stop(self, *, release: bool = True) -> None:
+        """Stop renewing; by default also drop this process's leases from Redis."""
+
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        leases, self._leases = self._leases, {}
+        if not release or not leases:
+            return
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for key, member in leases:
+                    pipe.zrem(key, member)
+                await pipe.execute()
+        except RedisError as exc:  # pragma: no cover - redis outage path
+            self._logger.warning("Failed to release leases on shutdown", exc_info=exc)
+
+    def cancel(self) -> None:
+        """Stop renewing without touching Redis (synchronous test/reset helper)."""
+
+        if self._task is not None:
+            self._task.cancel()
+        self._task = None
+        self._leases.clear()
+
+    async def _run(self) -> None:
+        while self._leases:
+            shortest = min(self._leases.values()) / 1000
+            await asyncio.sleep(max(shortest / 3, _MIN_HEARTBEAT_INTERVAL_SECONDS))
+            try:
+                await self.renew()
+            except RedisError as exc:  # pragma: no cover - redis outage path
+                self._logger.warning("Lease heartbeat failed; retrying", exc_info=exc)
+
+
 class RateLimitLease:
-    """RAII helper ensuring concurrency counters are alive until released."""
+    """Holds one concurrency slot; heartbeats while entered and frees it on release.
+
+    The slot is claimed at acquisition but only renewed once the lease is entered, so
+    a lease that is never used lapses after its TTL instead of leaking.
+    """
 
-    __slots__ = ("_redis", "_key", "_released", "_ttl", "_heartbeat", "_stop")
+    __slots__ = ("_heartbeat", "_key", "_member", "_ttl_ms", "_released")
 
     def __init__(
-        self, redis: RedisBytesClient | None, key: str | None, ttl_seconds: int | None = None
+        self,
+        heartbeat: LeaseHeartbeat | None,
+        key: str | None,
+        member: str | None = None,
+        ttl_seconds: int | None = None,
     ) -> None:
-        self._redis = redis
+        self._heartbeat = heartbeat
         self._key = key
+        self._member = member
+        self._ttl_ms = max(int(ttl_seconds or 0), 1) * 1000
         self._released = False
-        self._ttl = float(ttl_seconds or 0)
-        self._heartbeat: asyncio.Task[None] | None = None
-        self._stop = asyncio.Event()
 
     async def release(self) -> None:
         if self._released:
             return
         self._released = True
-        self._stop.set()
-        if self._heartbeat:
-            self._heartbeat.cancel()
-            try:
-                await self._heartbeat
-            except asyncio.CancelledError:  # pragma: no cover - expected
-                pass
-        if not self._redis or not self._key:
-            return
-        value = await self._redis.decr(self._key)
-        if value <= 0:
-            await self._redis.delete(self._key)
+        if self._heartbeat and self._key and self._member:
+            await self._heartbeat.release(self._key, self._member)
 
     async def __aenter__(self) -> RateLimitLease:
-        if self._redis and self._key and self._ttl > 0:
-            interval = max(self._ttl / 2, 0.5)
-            self._heartbeat = asyncio.create_task(self._refresh_loop(interval))
+        if self._heartbeat and self._key and self._member and not self._released:
+            self._heartbeat.track(self._key, self._member, self._ttl_ms)
         return self
 
     async def __aexit__(
@@ -91,24 +244,24 @@ class RateLimitLease:
     ) -> None:
         await self.release()
 
-    async def _refresh_loop(self, interval: float) -> None:
-        try:
-            while not self._stop.is_set():
-                try:
-                    await asyncio.wait_for(self._stop.wait(), timeout=interval)
-                    break
-                except TimeoutError:
-                    if self._redis and self._key:
-                        await self._redis.expire(self._key, int(max(self._ttl, 1)))
-        except asyncio.CancelledError:  # pragma: no cover - expected
-            pass
-
 
 class RateLimiter:
-    """Redis-backed rate limit manager."""
+    """Redis-backed rate limit manager.
+
+    Rate quotas use GCRA (generic cell rate algorithm): each key stores a theoretical
+    arrival time, so a quota of ``limit`` per window admits at most ``limit`` requests
+    in any rolling window instead of allowing a 2x burst across fixed-window edges.
+
+    Every quota and lease of one admission is evaluated by a single multi-key EVALSHA,
+    so all of its keys must live on the same node. That holds for a standalone or
+    replicated Redis; Redis Cluster rejects the call with CROSSSLOT because keys are
+    not hash-tagged into one slot.
+    """
 
     def __init__(self) -> None:
         self._redis: RedisBytesClient | None = None
+        self._script: AsyncScript | None = None
+        self._leases: LeaseHeartbeat | None = None
         self._prefix = "rate-limit"
         self._owns_client = False
         self._logger = logging.getLogger(__name__)
@@ -120,81 +273,116 @@ class RateLimiter:
         prefix: str = "rate-limit",
         owns_client: bool = True,
     ) -> None:
+        if self._leases is not None:
+            self._leases.cancel()
         self._redis = redis
+        self._script = None
+        self._leases = LeaseHeartbeat(redis)
         self._prefix = prefix.strip() or "rate-limit"
         self._owns_client = owns_client
 
     async def shutdown(self) -> None:
+        if self._leases is not None:
+            await self._leases.stop()
+            self._leases = None
         if self._redis and self._owns_client:
             await self._redis.close()
         self._redis = None
+        self._script = None
         self._owns_client = False
 
     def reset(self) -> None:
         """Detach any configured backend without closing it (used in tests)."""
 
+        if self._leases is not None:
+            self._leases.cancel()
+        self._leases = None
         self._redis = None
+        self._script = None
         self._owns_client = False
 
     async def enforce(self, quota: RateLimitQuota, key_parts: Sequence[str]) -> None:
-        if not self._redis or quota.limit <= 0:
+        await self.enforce_many([(quota, key_parts)])
+
+    async def enforce_many(self, checks: Sequence[QuotaCheck]) -> None:
+        """Charge every quota in one atomic round trip, or none of them.
+
+        Raises :class:`RateLimitExceeded` for the quota with the longest wait.
+        """
+
+        active = [(quota, parts) for quota, parts in checks if quota.limit > 0]
+        if not self._redis or not active:
             return
-        key = self._composite_key("quota", quota.name, key_parts)
         try:
-            current = await self._redis.incr(key)
-            if current == 1:
-                await self._redis.expire(key, quota.window_seconds)
-            if current > quota.limit:
-                retry_after = await self._remaining_ttl(key, quota.window_seconds)
-                raise RateLimitExceeded(
-                    quota=quota.name,
-                    limit=quota.limit,
-                    retry_after=retry_after,
-                    scope=quota.scope,
-                )
+            await self._admit(active, None)
         except RedisError as exc:  # pragma: no cover - redis outage path
-            self._logger.warning(
-                "Rate limiter unavailable; allowing traffic (quota=%s)",
-                quota.name,
-                exc_info=exc,
-            )
+            self._log_unavailable(active[0][0].name, exc)
 
     async def acquire_concurrency(
         self,
         quota: ConcurrencyQuota,
         key_parts: Sequence[str],
+        *,
+        rate_quotas: Sequence[QuotaCheck] = (),
     ) -> RateLimitLease:
-        if not self._redis or quota.limit <= 0:
+        """Take a concurrency slot, charging ``rate_quotas`` in the same round trip."""
+
+        if quota.limit <= 0:
+            await self.enforce_many(rate_quotas)
+            return RateLimitLease(None, None)
+        if not self._redis or not self._leases:
             return RateLimitLease(None, None)
-        key = self._composite_key("concurrency", quota.name, key_parts)
+        active = [(rate, parts) for rate, parts in rate_quotas if rate.limit > 0]
+        key = self._composite_key("lease", quota.name, key_parts)
+        member = uuid.uuid4().hex
         try:
-            current = await self._redis.incr(key)
-            await self._redis.expire(key, max(quota.ttl_seconds, 1))
-            if current > quota.limit:
-                await self._redis.decr(key)
-                retry_after = await self._remaining_ttl(key, quota.ttl_seconds)
-                raise RateLimitExceeded(
-                    quota=quota.name,
-                    limit=quota.limit,
-                    retry_after=retry_after,
-                    scope=quota.scope,
-                )
+            await self._admit(active, (quota, key, member))
         except RedisError as exc:  # pragma: no cover - redis outage path
-            self._logger.warning(
-                "Rate limiter unavailable; allowing traffic (quota=%s)",
-                quota.name,
-                exc_info=exc,
-            )
+            self._log_unavailable(quota.name, exc)
             return RateLimitLease(None, None)
-        return RateLimitLease(self._redis, key, quota.ttl_seconds)
-
-    async def _remaining_ttl(self, key: str, fallback: int) -> int:
-        if not self._redis:
-            return fallback
-        ttl = await self._redis.ttl(key)
-        if ttl is None or ttl < 0:
-            return fallback
-        return ttl or fallback
+        return RateLimitLease(self._leases, key, member, quota.ttl_seconds)
+
+    async def _admit(
+        self,
+        rate_quotas: Sequence[QuotaCheck],
+        concurrency: tuple[ConcurrencyQuota, str, str] | None,
+    ) -> None:
+        assert self._redis is not None
+        keys: list[str] = []
+        args: list[int | str] = [len(rate_quotas)]
+        for quota, parts in rate_quotas:
+            keys.append(self._composite_key("quota", quota.name, parts))
+            args.extend((quota.limit, quota.window_seconds * 1000))
+        if concurrency is not None:
+            slot_quota, slot_key, member = concurrency
+            keys.append(slot_key)
+            args.extend((slot_quota.limit, max(slot_quota.ttl_seconds, 1) * 1000, member))
+
+        if self._script is None:
+            self._script = self._redis.register_script(_ADMIT_SCRIPT)
+        denied, retry_ms = await self._script(keys=keys, args=args)
+        denied = int(denied)
+        if denied == 0:
+            return
+        rejected: RateLimitQuota | ConcurrencyQuota
+        if denied <= len(rate_quotas):
+            rejected = rate_quotas[denied - 1][0]
+        else:
+            assert concurrency is not None
+            rejected = concurrency[0]
+        raise RateLimitExceeded(
+            quota=rejected.name,
+            limit=rejected.limit,
+            retry_after=math.ceil(int(retry_ms) / 1000),
+            scope=rejected.scope,
+        )
+
+    def _log_unavailable(self, quota_name: str, exc: Exception) -> None:
+        self._logger.warning(
+            "Rate limiter unavailable; allowing traffic (quota=%s)",
+            quota_name,
+            exc_info=exc,
+        )
 
     def _composite_key(self, prefix: str, quota_name: str, parts: Sequence[str]) -> str:
         segments: list[str] = [self._prefix, prefix, quota_name]
@@ -0,0 +1,193 @@
+"""Bounded, resumable per-run frame streams shared by detached chat and workflow runs.
+
+A run's producer appends serialized public frames to the run's stream and finally an
+end marker (an entry without data). Any number of readers follow the stream by entry
+id, so a client that reconnects with the last id it saw resumes with the next frame.
+While the producer is alive it refreshes a short lease on the run; a reader that sees
+neither new frames nor a live lease for its idle timeout ends with a terminal frame
+instead of waiting forever on a producer that died.
+
+``InMemoryRunStreamStore`` keeps streams in this process; the Redis store in
+``app.infrastructure.redis.run_streams`` shares them across replicas.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict, deque
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Protocol
+
+
+@dataclass(slots=True, frozen=True)
+class RunStreamEntry:
+    """One entry of a run's stream; ``data`` is ``None`` for the end marker."""
+
+    entry_id: str
+    data: str | None
+
+    @property
+    def seq(self) -> int:
+        return entry_id_key(self.entry_id)[0]
+
+
+class RunStreamStore(Protocol):
+    """Storage for per-run frame streams and producer leases."""
+
+    async def append(self, run_id: str, data: str | None, *, seq: int | None = None) -> str:
+        """Append a frame (or the end marker when ``data`` is ``None``) and return its id.
+
+        ``seq`` pins the id to ``<seq>-0``; without it the store assigns the next id.
+        """
+        ...
+
+    async def read(
+        self, run_id: str, *, after: str | None, timeout: float, count: int = 100
+    ) -> list[RunStreamEntry]:
+        """Return entries after ``after``, waiting up to ``timeout`` seconds for one."""
+        ...
+
+    async def first_entry_id(self, run_id: str) -> str | None:
+        """Id of the oldest retained entry, or ``None`` when the stream is empty."""
+        ...
+
+    async def touch(self, run_id: str, *, lease_seconds: float) -> None:
+        """Mark the run's producer alive for another ``lease_seconds``."""
+        ...
+
+    async def is_alive(self, run_id: str) -> bool:
+        """Whether the run's producer lease has not yet expired."""
+        ...
+
+    async def close(self) -> None: ...
+
+
+@dataclass(slots=True)
+class _RunStream:
+    entries: deque[RunStreamEntry]
+    changed: asyncio.Condition = field(default_factory=asyncio.Condition)
+    next_seq: int = 1
+    lease_expires_at: float = 0.0
+
+
+class InMemoryRunStreamStore:
+    """Single-process store; each run has its own condition so appends only wake its readers."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int | None = None,
+        max_runs: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max_entries
+        self._max_runs = max_runs
+        self._clock = clock
+        self._streams: OrderedDict[str, _RunStream] = OrderedDict()
+
+    async def append(self, run_id: str, data: str | None, *, seq: int | None = None) -> str:
+        stream = self._stream(run_id)
+        async with stream.changed:
+            entry_seq = stream.next_seq if seq is None else seq
+            entry = RunStreamEntry(entry_id=f"{entry_seq}-0", data=data)
+            stream.entries.append(entry)
+            stream.next_seq = entry_seq + 1
+            stream.changed.notify_all()
+        return entry.entry_id
+
+    async def read(
+        self, run_id: str, *, after: str | None, timeout: float, count: int = 100
+    ) -> list[RunStreamEntry]:
+        cursor = entry_id_key(after) if after else (0, 0)
+        stream = self._stream(run_id)
+
+        def _pending() -> list[RunStreamEntry]:
+            pending = [entry for entry in stream.entries if entry_id_key(entry.entry_id) > cursor]
+            return pending[:count]
+
+        async with stream.changed:
+            try:
+                await asyncio.wait_for(stream.changed.wait_for(lambda: bool(_pending())), timeout)
+            except TimeoutError:
+                pass
+            return _pending()
+
+    async def first_entry_id(self, run_id: str) -> str | None:
+        stream = self._streams.get(run_id)
+        return stream.entries[0].entry_id if stream and stream.entries else None
+
+    async def touch(self, run_id: str, *, lease_seconds: float) -> None:
+        self._stream(run_id).lease_expires_at = self._clock() + lease_seconds
+
+    async def is_alive(self, run_id: str) -> bool:
+        stream = self._streams.get(run_id)
+        return stream is not None and stream.lease_expires_at > self._clock()
+
+    async def close(self) -> None:
+        return None
+
+    def _stream(self, run_id: str) -> _RunStream:
+        stream = self._streams.get(run_id)
+        if stream is None:
+            stream = _RunStream(entries=deque(maxlen=self._max_entries))
+            self._streams[run_id] = stream
+            while len(self._streams) > self._max_runs:
+                self._streams.popitem(last=False)
+        return stream
+
+
+async def follow_run_stream(
+    store: RunStreamStore,
+    run_id: str,
+    *,
+    after: str | None,
+    poll_interval: float,
+    idle_timeout: float,
+    abandoned_frame: Callable[[], Awaitable[str]],
+    clock: Callable[[], float] = time.monotonic,
+) -> AsyncGenerator[RunStreamEntry | None, None]:
+    """Yield the run's entries after ``after`` until the end marker.
+
+    ``None`` is yielded whenever a poll interval passes without new entries so SSE
+    callers can emit heartbeats. Once ``idle_timeout`` passes with no new entries and
+    no live producer lease, the frame from ``abandoned_frame`` is yielded (with the
+    last id seen, so a reconnect resumes from the same place) and the stream ends.
+    """
+
+    cursor = after
+    idle_since = clock()
+    while True:
+        entries = await store.read(run_id, after=cursor, timeout=poll_interval)
+        if entries:
+            idle_since = clock()
+            for entry in entries:
+                cursor = entry.entry_id
+                if entry.data is None:
+                    return
+                yield entry
+            continue
+        if clock() - idle_since >= idle_timeout:
+            if await store.is_alive(run_id):
+                idle_since = clock()
+            else:
+                yield RunStreamEntry(entry_id=cursor or "0-0", data=await abandoned_frame())
+                return
+        yield None
+
+
+def entry_id_key(entry_id: str) -> tuple[int, int]:
+    """Sortable form of a ``<ms-or-seq>-<n>`` stream id."""
+
+    head, _, tail = entry_id.partition("-")
+    return int(head), int(tail or 0)
+
+
+__all__ = [
+    "InMemoryRunStreamStore",
+    "RunStreamEntry",
+    "RunStreamStore",
+    "entry_id_key",
+    "follow_run_stream",
+]
@@ -0,0 +1,319 @@
+"""Process-wide cache for OIDC discovery documents and JWKS.
+
+SSO start and callback both need the provider's discovery document, and the callback
+also needs its JWKS. Fetching them on every login adds two IdP round-trips and turns
+any IdP blip into a failed login. Entries are keyed by URL (so per provider), honour
+``Cache-Control: max-age`` / ``Expires`` within configured bounds, revalidate with
+``ETag`` / ``Last-Modified``, refresh in the background shortly before expiry, and
+keep serving the last good copy for a bounded window when the IdP is unreachable.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Any, Literal
+
+import httpx
+
+from app.core.settings import Settings, get_settings
+from app.observability.metrics import (
+    observe_oidc_metadata_age,
+    record_oidc_metadata_lookup,
+    record_oidc_metadata_refresh,
+)
+
+OidcMetadataKind = Literal["discovery", "jwks"]
+RefreshMode = Literal["foreground", "background", "forced"]
+
+# Start a background refresh once this fraction of the TTL has elapsed.
+_REFRESH_AHEAD_RATIO = 0.8
+_MAX_AGE_PATTERN = re.compile(r"(?:^|,)\s*(?:s-)?max-age\s*=\s*\"?(\d+)", re.IGNORECASE)
+
+logger = logging.getLogger("api-service.sso.metadata_cache")
+
+
+class OidcMetadataFetchError(RuntimeError):
+    """Raised when metadata cannot be fetched and no usable cached copy exists."""
+
+
+@dataclass(slots=True)
+class _CacheEntry:
+    payload: dict[str, Any]
+    etag: str | None
+    last_modified: str | None
+    validated_at: float
+    expires_at: float
+
+
+class OidcMetadataCache:
+    """Single-flight, stale-while-revalidate cache for IdP JSON metadata."""
+
+    def __init__(
+        self,
+        *,
+        default_ttl_seconds: int = 3600,
+        min_ttl_seconds: int = 60,
+        max_ttl_seconds: int = 86400,
+        max_stale_seconds: int = 86400,
+        force_refresh_interval_seconds: int = 30,
+        http_client: httpx.AsyncClient | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._default_ttl = default_ttl_seconds
+        self._min_ttl = min_ttl_seconds
+        self._max_ttl = max(max_ttl_seconds, min_ttl_seconds)
+        self._max_stale = max_stale_seconds
+        self._force_interval = force_refresh_interval_seconds
+        self._clock = clock
+        self._http_client = http_client
+        self._owns_client = http_client is None
+        self._entries: dict[str, _CacheEntry] = {}
+        self._inflight: dict[str, asyncio.Task[_CacheEntry]] = {}
+        self._background: set[asyncio.Task[Any]] = set()
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> OidcMetadataCache:
+        return cls(
+            default_ttl_seconds=settings.sso_metadata_cache_default_ttl_seconds,
+            min_ttl_seconds=settings.sso_metadata_cache_min_ttl_seconds,
+            max_ttl_seconds=settings.sso_metadata_cache_max_ttl_seconds,
+            max_stale_seconds=settings.sso_metadata_cache_max_stale_seconds,
+            force_refresh_interval_seconds=settings.sso_jwks_force_refresh_interval_seconds,
+        )
+
+    async def get(
+        self,
+        url: str,
+        *,
+        kind: OidcMetadataKind,
+        force_refresh: bool = False,
+    ) -> dict[str, Any]:
+        """Return the JSON object at ``url``, fetching or revalidating as needed.
+
+        Fetches always use the cache's own client: a single-flight fetch is shared by
+        every concurrent caller, so it must not depend on a client one of them may
+        close. ``force_refresh`` (used for unknown ``kid`` values) is rate-limited per
+        URL.
+        """
+
+        now = self._clock()
+        entry = self._entries.get(url)
+
+        if entry is not None and force_refresh:
+            if now - entry.validated_at < self._force_interval:
+                return self._serve(entry, kind=kind, result="hit", now=now)
+            try:
+                entry = await self._refresh(url, kind=kind, mode="forced")
+            except OidcMetadataFetchError:
+                return self._serve_stale_or_raise(url, kind=kind, now=now)
+            return self._serve(entry, kind=kind, result="refreshed", now=self._clock())
+
+        if entry is not None and now < entry.expires_at:
+            refresh_at = entry.expires_at - (entry.expires_at - entry.validated_at) * (
+                1 - _REFRESH_AHEAD_RATIO
+            )
+            if now >= refresh_at:
+                self._schedule_background_refresh(url, kind=kind)
+            return self._serve(entry, kind=kind, result="hit", now=now)
+
+        try:
+            entry = await self._refresh(url, kind=kind, mode="foreground")
+        except OidcMetadataFetchError:
+            return self._serve_stale_or_raise(url, kind=kind, now=now)
+        return self._serve(entry, kind=kind, result="miss", now=self._clock())
+
+    def invalidate(self, url: str | None = None) -> None:
+        if url is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(url, None)
+
+    async def aclose(self) -> None:
+        tasks = [*self._background, *self._inflight.values()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._background.clear()
+        self._inflight.clear()
+        if self._owns_client and self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    # ------------------------------------------------------------------ internals
+
+    def _serve(
+        self,
+        entry: _CacheEntry,
+        *,
+        kind: OidcMetadataKind,
+        result: str,
+        now: float,
+    ) -> dict[str, Any]:
+        record_oidc_metadata_lookup(kind=kind, result=result)
+        observe_oidc_metadata_age(kind=kind, age_seconds=now - entry.validated_at)
+        return entry.payload
+
+    def _serve_stale_or_raise(
+        self, url: str, *, kind: OidcMetadataKind, now: float
+    ) -> dict[str, Any]:
+        entry = self._entries.get(url)
+        if entry is None or now - entry.expires_at > self._max_stale:
+            record_oidc_metadata_lookup(kind=kind, result="error")
+            raise OidcMetadataFetchError(f"OIDC {kind} metadata is unavailable.")
+        logger.warning(
+            "sso.metadata_serving_stale",
+            extra={"url": url, "kind": kind, "age_seconds": round(now - entry.validated_at)},
+        )
+        return self._serve(entry, kind=kind, result="stale", now=now)
+
+    def _schedule_background_refresh(self, url: str, *, kind: OidcMetadataKind) -> None:
+        if url in self._inflight:
+            return
+
+        async def _run() -> None:
+            try:
+                await self._refresh(url, kind=kind, mode="background")
+            except OidcMetadataFetchError:
+                # Already recorded; the next lookup after expiry retries in the foreground.
+                pass
+
+        task = asyncio.create_task(_run())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    def _client(self) -> httpx.AsyncClient:
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(timeout=10)
+        return self._http_client
+
+    async def _refresh(
+        self,
+        url: str,
+        *,
+        kind: OidcMetadataKind,
+        mode: RefreshMode,
+    ) -> _CacheEntry:
+        # Single-flight: concurrent logins share one upstream request per URL.
+        task = self._inflight.get(url)
+        if task is None:
+            task = asyncio.create_task(self._fetch(url, kind=kind, mode=mode))
+            self._inflight[url] = task
+            task.add_done_callback(lambda _t: self._inflight.pop(url, None))
+        return await asyncio.shield(task)
+
+    async def _fetch(
+        self,
+        url: str,
+        *,
+        kind: OidcMetadataKind,
+        mode: RefreshMode,
+    ) -> _CacheEntry:
+        previous = self._entries.get(url)
+        headers: dict[str, str] = {}
+        if previous is not None:
+            if previous.etag:
+                headers["If-None-Match"] = previous.etag
+            if previous.last_modified:
+                headers["If-Modified-Since"] = previous.last_modified
+        try:
+            response = await self._client().get(url, headers=headers)
+            if response.status_code == 304 and previous is not None:
+                entry = _CacheEntry(
+                    payload=previous.payload,
+                    etag=response.headers.get("etag") or previous.etag,
+                    last_modified=response.headers.get("last-modified")
+                    or previous.last_modified,
+                    validated_at=self._clock(),
+                    expires_at=0.0,
+                )
+                result = "not_modified"
+            else:
+                response.raise_for_status()
+                payload = response.json()
+                if not isinstance(payload, dict):
+                    raise ValueError("metadata payload is not a JSON object")
+                entry = _CacheEntry(
+                    payload=payload,
+                    etag=response.headers.get("etag"),
+                    last_modified=response.headers.get("last-modified"),
+                    validated_at=self._clock(),
+                    expires_at=0.0,
+                )
+                result = "updated"
+        except (httpx.HTTPError, ValueError) as exc:
+            record_oidc_metadata_refresh(kind=kind, mode=mode, result="error")
+            logger.warning(
+                "sso.metadata_refresh_failed",
+                extra={"url": url, "kind": kind, "mode": mode, "error": str(exc)},
+            )
+            raise OidcMetadataFetchError(f"Failed to fetch OIDC {kind} metadata.") from exc
+
+        entry.expires_at = entry.validated_at + self._ttl_from(response.headers)
+        self._entries[url] = entry
+        record_oidc_metadata_refresh(kind=kind, mode=mode, result=result)
+        return entry
+
+    def _ttl_from(self, headers: httpx.Headers) -> float:
+        ttl: float | None = None
+        cache_control = headers.get("cache-control") or ""
+        match = _MAX_AGE_PATTERN.search(cache_control)
+        if match:
+            ttl = float(match.group(1))
+        elif "no-store" in cache_control.lower() or "no-cache" in cache_control.lower():
+            ttl = 0.0
+        elif expires := headers.get("expires"):
+            try:
+                ttl = (parsedate_to_datetime(expires) - datetime.now(UTC)).total_seconds()
+            except (TypeError, ValueError):
+                ttl = None
+        if ttl is None:
+            ttl = float(self._default_ttl)
+        # Clamp so a no-cache IdP still gets a short cache and a year-long max-age
+        # cannot pin rotated keys forever.
+        return min(max(ttl, float(self._min_ttl)), float(self._max_ttl))
+
+
+_CACHE: OidcMetadataCache | None = None
+
+
+def get_oidc_metadata_cache(settings: Settings | None = None) -> OidcMetadataCache:
+    """Return the shared metadata cache, instantiating it lazily from settings."""
+
+    global _CACHE
+    if _CACHE is None:
+        _CACHE = OidcMetadataCache.from_settings(settings or get_settings())
+    return _CACHE
+
+
+async def shutdown_oidc_metadata_cache() -> None:
+    """Cancel background refreshes, close the owned HTTP client and forget the cache."""
+
+    global _CACHE
+    if _CACHE is None:
+        return
+    cache, _CACHE = _CACHE, None
+    await cache.aclose()
+
+
+def reset_oidc_metadata_cache() -> None:
+    """Forget the shared cache without awaiting cleanup (test helper)."""
+
+    global _CACHE
+    _CACHE = None
+
+
+__all__ = [
+    "OidcMetadataCache",
+    "OidcMetadataFetchError",
+    "OidcMetadataKind",
+    "get_oidc_metadata_cache",
+    "reset_oidc_metadata_cache",
+    "shutdown_oidc_metadata_cache",
+]
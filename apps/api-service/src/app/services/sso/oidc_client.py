@@ -11,6 +11,8 @@ import httpx
 import jwt
 from jwt import PyJWTError
 
+from .metadata_cache import OidcMetadataCache, OidcMetadataFetchError, get_oidc_metadata_cache
+
 
 class OidcError(RuntimeError):
     """Base class for OIDC failures."""
@@ -49,11 +51,21 @@ class OidcTokenResponse:
 
 
 class OidcClient:
-    """Minimal async OIDC client with discovery and ID token verification."""
+    """Minimal async OIDC client with discovery and ID token verification.
+
+    Discovery documents and JWKS are served from a process-wide
+    :class:`OidcMetadataCache`, so per-request clients do not re-fetch them.
+    """
 
-    def __init__(self, client: httpx.AsyncClient | None = None) -> None:
+    def __init__(
+        self,
+        client: httpx.AsyncClient | None = None,
+        *,
+        metadata_cache: OidcMetadataCache | None = None,
+    ) -> None:
         self._client = client or httpx.AsyncClient(timeout=10)
         self._owns_client = client is None
+        self._metadata_cache = metadata_cache or get_oidc_metadata_cache()
 
     async def close(self) -> None:
         if self._owns_client:
@@ -67,13 +79,9 @@ class OidcClient:
     ) -> OidcDiscoveryDocument:
         url = discovery_url or issuer_url.rstrip("/") + "/.well-known/openid-configuration"
         try:
-            response = await self._client.get(url)
-            response.raise_for_status()
-            payload = response.json()
-        except (httpx.HTTPError, ValueError) as exc:
+            payload = await self._metadata_cache.get(url, kind="discovery")
+        except OidcMetadataFetchError as exc:
             raise OidcDiscoveryError("Failed to fetch OIDC discovery document.") from exc
-        if not isinstance(payload, dict):
-            raise OidcDiscoveryError("OIDC discovery document was not a JSON object.")
 
         def _require_str(key: str) -> str:
             value = payload.get(key)
@@ -194,6 +202,10 @@ class OidcClient:
 
         jwks = await self._fetch_jwks(jwks_uri)
         key = self._select_key(jwks, kid)
+        if not key:
+            # The IdP may have rotated keys since the JWKS was cached.
+            jwks = await self._fetch_jwks(jwks_uri, force_refresh=True)
+            key = self._select_key(jwks, kid)
         if not key:
             raise OidcTokenVerificationError("Matching JWKS key not found.")
 
@@ -215,14 +227,16 @@ class OidcClient:
         except PyJWTError as exc:
             raise OidcTokenVerificationError("ID token verification failed.") from exc
 
-    async def _fetch_jwks(self, jwks_uri: str) -> Mapping[str, Any]:
+    async def _fetch_jwks(
+        self, jwks_uri: str, *, force_refresh: bool = False
+    ) -> Mapping[str, Any]:
         try:
-            response = await self._client.get(jwks_uri)
-            response.raise_for_status()
-            payload = response.json()
-        except (httpx.HTTPError, ValueError) as exc:
+            payload = await self._metadata_cache.get(
+                jwks_uri, kind="jwks", force_refresh=force_refresh
+            )
+        except OidcMetadataFetchError as exc:
             raise OidcTokenVerificationError("Failed to fetch JWKS.") from exc
-        if not isinstance(payload, dict) or "keys" not in payload:
+        if "keys" not in payload:
             raise OidcTokenVerificationError("JWKS payload is invalid.")
         return payload
 
@@ -3,14 +3,22 @@
 from __future__ import annotations
 
 import hashlib
+import logging
 import time
 import uuid
-from collections.abc import Callable
+from collections import OrderedDict
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Sequence
 from dataclasses import dataclass
 
 from app.core.settings import Settings
 from app.domain.storage import StorageObjectRef, StoragePresignedUrl, StorageProviderProtocol
+from app.infrastructure.persistence.storage.models import StorageBucket, StorageObject
 from app.infrastructure.persistence.storage.postgres import StorageRepository
+from app.infrastructure.storage.presign_cache import (
+    NullPresignedUrlCache,
+    PresignedDownload,
+    PresignedUrlCache,
+)
 from app.infrastructure.storage.registry import get_storage_provider
 from app.observability import metrics
 from app.services.activity import activity_service
@@ -21,6 +29,11 @@ from app.services.storage.naming import (
     should_auto_create_bucket,
 )
 
+# Upper bound on memoized (provider, tenant) bucket entries kept per service.
+_BUCKET_CACHE_MAX_ENTRIES = 4096
+
+logger = logging.getLogger(__name__)
+
 
 @dataclass(slots=True)
 class PresignedUpload:
@@ -41,11 +54,14 @@ class StorageService:
         settings_provider: Callable[[], Settings],
         provider_resolver: Callable[[Settings], StorageProviderProtocol] = get_storage_provider,
         repository: StorageRepository | None = None,
+        presign_cache: PresignedUrlCache | None = None,
     ) -> None:
         self._session_factory = session_factory
         self._settings_provider = settings_provider
         self._provider_resolver = provider_resolver
         self._repository = repository or StorageRepository(session_factory)
+        self._presign_cache: PresignedUrlCache = presign_cache or NullPresignedUrlCache()
+        self._buckets: OrderedDict[tuple[str, uuid.UUID, str], StorageBucket] = OrderedDict()
 
     async def create_presigned_upload(
         self,
@@ -64,19 +80,8 @@ class StorageService:
         self._enforce_mime(mime_type, settings)
 
         provider = self._provider_resolver(settings)
-        bucket_name_value = bucket_name(settings, tenant_id)
-        await provider.ensure_bucket(
-            bucket_name_value,
-            region=bucket_region(settings),
-            create_if_missing=should_auto_create_bucket(settings),
-        )
-        bucket = await self._repository.get_or_create_bucket(
-            tenant_id=tenant_id,
-            provider=settings.storage_provider.value,
-            bucket_name=bucket_name_value,
-            region=bucket_region(settings),
-            prefix=settings.storage_bucket_prefix,
-        )
+        bucket = await self._resolve_bucket(settings, provider, tenant_id)
+        bucket_name_value = bucket.bucket_name
 
         object_id = uuid.uuid4()
         safe_name = safe_filename(filename)
@@ -143,6 +148,9 @@ class StorageService:
     async def get_presigned_download(
         self, *, tenant_id: uuid.UUID, object_id: uuid.UUID
     ) -> tuple[StoragePresignedUrl, StorageObjectRef]:
+        cached = await self._cached_downloads(tenant_id, [object_id])
+        if object_id in cached:
+            return cached[object_id]
         settings = self._settings_provider()
         provider = self._provider_resolver(settings)
         obj = await self._repository.get_object_for_tenant(tenant_id=tenant_id, object_id=object_id)
@@ -159,19 +167,45 @@ class StorageService:
             result="success",
             duration_seconds=0.0,
         )
-        return url, StorageObjectRef(
-            id=obj.id,
-            bucket=obj.bucket.bucket_name,
-            key=obj.object_key,
-            size_bytes=obj.size_bytes,
-            mime_type=obj.mime_type,
-            filename=obj.filename,
-            status=obj.status,
-            created_at=obj.created_at,
-            conversation_id=obj.conversation_id,
-            agent_key=obj.agent_key,
-            checksum_sha256=obj.checksum_sha256,
+        download = (url, _object_ref(obj))
+        await self._remember_downloads(settings, tenant_id, {obj.id: download})
+        return download
+
+    async def get_presigned_downloads(
+        self, *, tenant_id: uuid.UUID, object_ids: Sequence[uuid.UUID]
+    ) -> dict[uuid.UUID, tuple[StoragePresignedUrl, StorageObjectRef]]:
+        """Presign downloads for many objects with one lookup and one provider call.
+
+        Missing or deleted objects are left out of the result instead of raising.
+        """
+
+        if not object_ids:
+            return {}
+        cached = await self._cached_downloads(tenant_id, object_ids)
+        pending = [object_id for object_id in object_ids if object_id not in cached]
+        if not pending:
+            return cached
+        started = time.perf_counter()
+        settings = self._settings_provider()
+        provider = self._provider_resolver(settings)
+        objects = await self._repository.list_objects_for_tenant(
+            tenant_id=tenant_id, object_ids=pending
+        )
+        urls = await provider.get_presigned_downloads(
+            objects=[(obj.bucket.bucket_name, obj.object_key) for obj in objects],
+            expires_in=settings.storage_signed_url_ttl_seconds,
         )
+        metrics.observe_storage_operation(
+            operation="presign_download_batch",
+            provider=settings.storage_provider.value,
+            result="success",
+            duration_seconds=time.perf_counter() - started,
+        )
+        signed = {
+            obj.id: (url, _object_ref(obj)) for obj, url in zip(objects, urls, strict=True)
+        }
+        await self._remember_downloads(settings, tenant_id, signed)
+        return {**cached, **signed}
 
     async def get_object_bytes(
         self,
@@ -212,6 +246,51 @@ class StorageService:
 
         return data
 
+    async def iter_object_bytes(
+        self,
+        *,
+        tenant_id: uuid.UUID,
+        object_id: uuid.UUID,
+        chunk_size: int | None = None,
+        verify_sha256: bool = True,
+    ) -> AsyncIterator[bytes]:
+        """Stream an object on the server in bounded chunks.
+
+        Streaming counterpart to ``get_object_bytes`` for large objects. The recorded
+        checksum is verified incrementally; a mismatch raises ``ValueError`` once the
+        final chunk has been read, so consumers must not commit side effects before
+        the iterator is exhausted.
+        """
+
+        started = time.perf_counter()
+        settings = self._settings_provider()
+        provider = self._provider_resolver(settings)
+
+        obj = await self._repository.get_object_for_tenant(tenant_id=tenant_id, object_id=object_id)
+        if obj is None or obj.deleted_at is not None:
+            raise FileNotFoundError("Object not found")
+
+        checksum = obj.checksum_sha256 or ""
+        digest = hashlib.sha256() if verify_sha256 and len(checksum) == 64 else None
+        async for chunk in provider.iter_object_bytes(
+            bucket=obj.bucket.bucket_name,
+            key=obj.object_key,
+            chunk_size=chunk_size or settings.storage_stream_chunk_bytes,
+        ):
+            if digest is not None:
+                digest.update(chunk)
+            yield chunk
+
+        if digest is not None and digest.hexdigest() != checksum:
+            raise ValueError("Object checksum mismatch")
+
+        metrics.observe_storage_operation(
+            operation="iter_object_bytes",
+            provider=settings.storage_provider.value,
+            result="success",
+            duration_seconds=time.perf_counter() - started,
+        )
+
     async def list_objects(
         self,
         *,
@@ -223,23 +302,7 @@ class StorageService:
         objects = await self._repository.list_objects(
             tenant_id=tenant_id, limit=limit, offset=offset, conversation_id=conversation_id
         )
-        results: list[StorageObjectRef] = []
-        for obj in objects:
-            results.append(
-                StorageObjectRef(
-                    id=obj.id,
-                    bucket=obj.bucket.bucket_name,
-                    key=obj.object_key,
-                    size_bytes=obj.size_bytes,
-                    mime_type=obj.mime_type,
-                    checksum_sha256=obj.checksum_sha256,
-                    filename=obj.filename,
-                    status=obj.status,
-                    created_at=obj.created_at,
-                    conversation_id=obj.conversation_id,
-                    agent_key=obj.agent_key,
-                )
-            )
+        results = [_object_ref(obj) for obj in objects]
         metrics.observe_storage_operation(
             operation="list_objects",
             provider=self._settings_provider().storage_provider.value,
@@ -248,16 +311,26 @@ class StorageService:
         )
         return results
 
-    async def delete_object(self, *, tenant_id: uuid.UUID, object_id: uuid.UUID) -> None:
+    async def delete_object(
+        self, *, tenant_id: uuid.UUID, object_id: uuid.UUID, include_derived: bool = False
+    ) -> None:
+        """Delete an object together with its derivatives (e.g. thumbnails).
+
+        Derivatives themselves are only deleted directly with ``include_derived``.
+        """
+
         settings = self._settings_provider()
         provider = self._provider_resolver(settings)
         obj = await self._repository.get_object_for_tenant(tenant_id=tenant_id, object_id=object_id)
         if obj is None or obj.deleted_at is not None:
             return
+        if obj.derived_from_id is not None and not include_derived:
+            return
         try:
             await provider.delete_object(bucket=obj.bucket.bucket_name, key=obj.object_key)
         finally:
             await self._repository.mark_deleted(object_id=obj.id)
+            await self._forget_download(tenant_id, obj.id)
         metrics.observe_storage_operation(
             operation="delete_object",
             provider=settings.storage_provider.value,
@@ -277,6 +350,12 @@ class StorageService:
             )
         except Exception:  # pragma: no cover - best effort
             pass
+        for derived in await self._repository.list_derived_objects(
+            tenant_id=tenant_id, object_id=obj.id
+        ):
+            await self.delete_object(
+                tenant_id=tenant_id, object_id=derived.id, include_derived=True
+            )
 
     async def put_object(
         self,
@@ -290,11 +369,14 @@ class StorageService:
         agent_key: str | None = None,
         conversation_id: uuid.UUID | None = None,
         metadata: dict[str, object] | None = None,
+        derived_from: uuid.UUID | None = None,
     ) -> StorageObjectRef:
         """Store a small object directly and persist metadata.
 
         Intended for generated assets (e.g., images) where we already have bytes
-        server-side and want to avoid presign/roundtrip.
+        server-side and want to avoid presign/roundtrip. ``derived_from`` marks the
+        object as a derivative of another one (e.g. its thumbnail), which keeps it
+        out of object listings and user deletes.
         """
 
         size_bytes = len(data)
@@ -303,30 +385,23 @@ class StorageService:
         self._enforce_mime(mime_type, settings)
 
         provider = self._provider_resolver(settings)
-        bucket_name_value = bucket_name(settings, tenant_id)
-        await provider.ensure_bucket(
-            bucket_name_value,
-            region=bucket_region(settings),
-            create_if_missing=should_auto_create_bucket(settings),
-        )
-        bucket = await self._repository.get_or_create_bucket(
-            tenant_id=tenant_id,
-            provider=settings.storage_provider.value,
-            bucket_name=bucket_name_value,
-            region=bucket_region(settings),
-            prefix=settings.storage_bucket_prefix,
-        )
+        bucket = await self._resolve_bucket(settings, provider, tenant_id)
+        bucket_name_value = bucket.bucket_name
 
         object_id = uuid.uuid4()
         safe_name = safe_filename(filename)
         object_key = f"{tenant_id}/{object_id}/{safe_name}"
 
-        obj_ref = await provider.put_object(
-            bucket=bucket_name_value,
-            key=object_key,
-            data=data,
-            content_type=mime_type,
-        )
+        try:
+            obj_ref = await provider.put_object(
+                bucket=bucket_name_value,
+                key=object_key,
+                data=data,
+                content_type=mime_type,
+            )
+        except Exception:
+            self._forget_bucket(settings, tenant_id)
+            raise
         final_checksum = checksum_sha256 or getattr(obj_ref, "checksum_sha256", None)
 
         await self._repository.create_object(
@@ -344,6 +419,7 @@ class StorageService:
             conversation_id=conversation_id,
             metadata_json=metadata or {},
             expires_at=None,
+            derived_from_id=derived_from,
         )
 
         metrics.observe_storage_operation(
@@ -367,6 +443,192 @@ class StorageService:
             checksum_sha256=final_checksum,
         )
 
+    async def put_object_stream(
+        self,
+        *,
+        tenant_id: uuid.UUID,
+        user_id: uuid.UUID | None,
+        chunks: AsyncIterable[bytes],
+        filename: str,
+        mime_type: str | None,
+        size_hint: int | None = None,
+        agent_key: str | None = None,
+        conversation_id: uuid.UUID | None = None,
+        metadata: dict[str, object] | None = None,
+    ) -> StorageObjectRef:
+        """Store a server-generated object from an async byte stream.
+
+        Streaming counterpart to ``put_object`` for large artifacts (container files,
+        generated documents) so they are never fully buffered in memory. Providers
+        upload in parts of ``storage_multipart_part_bytes`` with up to
+        ``storage_multipart_concurrency`` parts in flight. The size limit is enforced
+        while streaming (``size_hint`` lets callers fail before the first byte) and the
+        sha256 is computed on the fly.
+        """
+
+        started = time.perf_counter()
+        settings = self._settings_provider()
+        if size_hint is not None:
+            self._enforce_size(size_hint, settings)
+        self._enforce_mime(mime_type, settings)
+        max_bytes = settings.storage_max_file_mb * 1024 * 1024
+
+        provider = self._provider_resolver(settings)
+        bucket = await self._resolve_bucket(settings, provider, tenant_id)
+
+        object_id = uuid.uuid4()
+        safe_name = safe_filename(filename)
+        object_key = f"{tenant_id}/{object_id}/{safe_name}"
+
+        digest = hashlib.sha256()
+        size_bytes = 0
+
+        async def _guarded() -> AsyncIterator[bytes]:
+            nonlocal size_bytes
+            async for chunk in chunks:
+                size_bytes += len(chunk)
+                if size_bytes > max_bytes:
+                    raise ValueError("File size exceeds allowed limit")
+                digest.update(chunk)
+                yield chunk
+
+        try:
+            obj_ref = await provider.put_object_stream(
+                bucket=bucket.bucket_name,
+                key=object_key,
+                chunks=_guarded(),
+                content_type=mime_type,
+                part_size=settings.storage_multipart_part_bytes,
+                concurrency=settings.storage_multipart_concurrency,
+            )
+        except ValueError:
+            raise
+        except Exception:
+            self._forget_bucket(settings, tenant_id)
+            raise
+        checksum = digest.hexdigest()
+
+        await self._repository.create_object(
+            tenant_id=tenant_id,
+            bucket=bucket,
+            object_id=object_id,
+            object_key=object_key,
+            filename=filename,
+            mime_type=mime_type,
+            size_bytes=size_bytes,
+            checksum_sha256=checksum,
+            status="ready",
+            created_by_user_id=user_id,
+            agent_key=agent_key,
+            conversation_id=conversation_id,
+            metadata_json=metadata or {},
+            expires_at=None,
+        )
+
+        metrics.observe_storage_operation(
+            operation="put_object_stream",
+            provider=settings.storage_provider.value,
+            result="success",
+            duration_seconds=time.perf_counter() - started,
+        )
+
+        return StorageObjectRef(
+            id=object_id,
+            bucket=bucket.bucket_name,
+            key=object_key,
+            size_bytes=size_bytes,
+            mime_type=mime_type,
+            filename=filename,
+            status="ready",
+            created_at=getattr(obj_ref, "created_at", None),
+            conversation_id=conversation_id,
+            agent_key=agent_key,
+            checksum_sha256=checksum,
+        )
+
+    async def _resolve_bucket(
+        self, settings: Settings, provider: StorageProviderProtocol, tenant_id: uuid.UUID
+    ) -> StorageBucket:
+        """Ensure the tenant bucket exists once per provider/tenant and memoize the row."""
+
+        bucket_name_value = bucket_name(settings, tenant_id)
+        cache_key = (settings.storage_provider.value, tenant_id, bucket_name_value)
+        cached = self._buckets.get(cache_key)
+        if cached is not None:
+            self._buckets.move_to_end(cache_key)
+            return cached
+
+        await provider.ensure_bucket(
+            bucket_name_value,
+            region=bucket_region(settings),
+            create_if_missing=should_auto_create_bucket(settings),
+        )
+        bucket = await self._repository.get_or_create_bucket(
+            tenant_id=tenant_id,
+            provider=settings.storage_provider.value,
+            bucket_name=bucket_name_value,
+            region=bucket_region(settings),
+            prefix=settings.storage_bucket_prefix,
+        )
+        self._buckets[cache_key] = bucket
+        while len(self._buckets) > _BUCKET_CACHE_MAX_ENTRIES:
+            self._buckets.popitem(last=False)
+        return bucket
+
+    def _forget_bucket(self, settings: Settings, tenant_id: uuid.UUID) -> None:
+        # A failed write may mean the bucket was removed out-of-band; re-check next time.
+        self._buckets.pop(
+            (settings.storage_provider.value, tenant_id, bucket_name(settings, tenant_id)), None
+        )
+
+    async def _cached_downloads(
+        self, tenant_id: uuid.UUID, object_ids: Sequence[uuid.UUID]
+    ) -> dict[uuid.UUID, PresignedDownload]:
+        backend = self._presign_cache.backend
+        if backend == "none":
+            return {}
+        try:
+            found = await self._presign_cache.get_many(tenant_id, object_ids)
+        except Exception as exc:
+            logger.warning("storage.presign_cache_read_failed", exc_info=exc)
+            metrics.record_storage_presign_cache_lookup(
+                backend=backend, result="error", count=len(object_ids)
+            )
+            return {}
+        metrics.record_storage_presign_cache_lookup(backend=backend, result="hit", count=len(found))
+        metrics.record_storage_presign_cache_lookup(
+            backend=backend, result="miss", count=len(object_ids) - len(found)
+        )
+        return found
+
+    async def _remember_downloads(
+        self,
+        settings: Settings,
+        tenant_id: uuid.UUID,
+        downloads: dict[uuid.UUID, PresignedDownload],
+    ) -> None:
+        if self._presign_cache.backend == "none" or not downloads:
+            return
+        # Only hand a URL out again while at least the configured share of its TTL remains.
+        ttl = settings.storage_signed_url_ttl_seconds
+        reuse_seconds = int(ttl * (1 - settings.storage_presign_cache_min_remaining))
+        try:
+            await self._presign_cache.set_many(
+                tenant_id, downloads, reuse_seconds=reuse_seconds
+            )
+        except Exception as exc:
+            logger.warning("storage.presign_cache_write_failed", exc_info=exc)
+
+    async def _forget_download(self, tenant_id: uuid.UUID, object_id: uuid.UUID) -> None:
+        try:
+            await self._presign_cache.invalidate(tenant_id, object_id)
+        except Exception as exc:
+            logger.warning(
+                "storage.presign_cache_invalidate_failed",
+                extra={"tenant_id": str(tenant_id), "object_id": str(object_id)},
+                exc_info=exc,
+            )
+
     def _enforce_size(self, size_bytes: int | None, settings: Settings) -> None:
         if size_bytes is None:
             raise ValueError("File size is required")
@@ -392,3 +654,19 @@ class StorageService:
             "status": health.status.value,
             **health.details,
         }
+
+
+def _object_ref(obj: StorageObject) -> StorageObjectRef:
+    return StorageObjectRef(
+        id=obj.id,
+        bucket=obj.bucket.bucket_name,
+        key=obj.object_key,
+        size_bytes=obj.size_bytes,
+        mime_type=obj.mime_type,
+        filename=obj.filename,
+        status=obj.status,
+        created_at=obj.created_at,
+        conversation_id=obj.conversation_id,
+        agent_key=obj.agent_key,
+        checksum_sha256=obj.checksum_sha256,
+    )
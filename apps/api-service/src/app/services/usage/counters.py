@@ -14,8 +14,14 @@ from app.infrastructure.persistence.usage.models import UsageCounter, UsageCount
 
 
 class UsageCounterService:
-    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        read_session_factory: async_sessionmaker[AsyncSession] | None = None,
+    ) -> None:
         self._session_factory = session_factory
+        self._read_session_factory = read_session_factory or session_factory
 
     async def increment(
         self,
@@ -89,7 +95,7 @@ class UsageCounterService:
         if before:
             query = query.where(UsageCounter.period_start < before)
         query = query.order_by(UsageCounter.period_start.desc()).limit(limit)
-        async with self._session_factory() as session:
+        async with self._read_session_factory() as session:
             result = await session.execute(query)
             return list(result.scalars().all())
 
@@ -109,7 +115,10 @@ def get_usage_counter_service() -> UsageCounterService:
     session_factory = container.session_factory or get_async_sessionmaker()
     container.session_factory = session_factory
     if container.usage_counter_service is None:
-        container.usage_counter_service = UsageCounterService(session_factory)
+        container.usage_counter_service = UsageCounterService(
+            session_factory,
+            read_session_factory=container.read_session_factory,
+        )
     return container.usage_counter_service
 
 
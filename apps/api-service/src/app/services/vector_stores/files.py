@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import tempfile
 import uuid
 from datetime import UTC, datetime
 from types import SimpleNamespace
@@ -27,6 +29,9 @@ from app.services.vector_stores.utils import coerce_uuid
 
 logger = logging.getLogger(__name__)
 
+# Objects larger than this are spooled to a temp file instead of held in memory.
+_SPOOL_MAX_MEMORY_BYTES = 8 * 1024 * 1024
+
 
 class FileService:
     def __init__(
@@ -238,26 +243,31 @@ class FileService:
 
         filename = storage_obj.filename or str(object_id)
         mime_type = storage_obj.mime_type
-        data = await self._storage_service.get_object_bytes(
-            tenant_id=store.tenant_id, object_id=object_id
-        )
-        size_bytes = len(data)
+        with tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_MEMORY_BYTES) as spool:
+            size_bytes = 0
+            async for chunk in self._storage_service.iter_object_bytes(
+                tenant_id=store.tenant_id, object_id=object_id
+            ):
+                # Past the memory threshold the spool writes to disk; keep that off the loop.
+                await asyncio.to_thread(spool.write, chunk)
+                size_bytes += len(chunk)
+            await asyncio.to_thread(spool.seek, 0)
 
-        file_meta = SimpleNamespace(bytes=size_bytes, mime_type=mime_type, filename=filename)
-        await self._policy.ensure_file_can_be_attached(
-            tenant_id=store.tenant_id,
-            store=store,
-            file_meta=file_meta,
-            store_repo=self._store_repo,
-            file_repo=self._file_repo,
-        )
+            file_meta = SimpleNamespace(bytes=size_bytes, mime_type=mime_type, filename=filename)
+            await self._policy.ensure_file_can_be_attached(
+                tenant_id=store.tenant_id,
+                store=store,
+                file_meta=file_meta,
+                store_repo=self._store_repo,
+                file_repo=self._file_repo,
+            )
 
-        openai_file = await self._gateway.upload_file(
-            tenant_id=store.tenant_id,
-            filename=filename,
-            data=data,
-            mime_type=mime_type,
-        )
+            openai_file = await self._gateway.upload_file(
+                tenant_id=store.tenant_id,
+                filename=filename,
+                data=spool,
+                mime_type=mime_type,
+            )
         file_id = getattr(openai_file, "id", None)
         if not file_id:
             raise RuntimeError("OpenAI file upload did not return a file id")
@@ -5,7 +5,7 @@ from __future__ import annotations
 import uuid
 from collections.abc import Callable
 from io import BytesIO
-from typing import Any, cast
+from typing import IO, Any, cast
 
 from openai import AsyncOpenAI
 
@@ -65,15 +65,18 @@ class OpenAIVectorStoreGateway:
         *,
         tenant_id: uuid.UUID,
         filename: str,
-        data: bytes,
+        data: bytes | IO[bytes],
         mime_type: str | None,
     ) -> object:
+        """Upload a file; pass a file object to let the HTTP client stream it."""
+
         client = self._client(tenant_id)
-        file_tuple: tuple[str, BytesIO] | tuple[str, BytesIO, str]
+        stream = BytesIO(data) if isinstance(data, bytes) else data
+        file_tuple: tuple[str, IO[bytes]] | tuple[str, IO[bytes], str]
         if mime_type:
-            file_tuple = (filename, BytesIO(data), mime_type)
+            file_tuple = (filename, stream, mime_type)
         else:
-            file_tuple = (filename, BytesIO(data))
+            file_tuple = (filename, stream)
         return await client.files.create(file=file_tuple, purpose="assistants")
 
     async def delete_openai_file(self, *, tenant_id: uuid.UUID, file_id: str) -> None:
@@ -0,0 +1,87 @@
+"""Step checkpoints used to resume workflow runs without re-executing finished steps."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from app.domain.ai import AgentRunResult, AgentRunUsage
+from app.domain.workflows import WorkflowRunStep
+from app.workflows._shared.graph import WorkflowNode
+from app.workflows._shared.schema_utils import shared_json_schema
+
+
+@dataclass(slots=True, frozen=True)
+class WorkflowStepCheckpoint:
+    """A succeeded step that can be replayed instead of calling the agent again."""
+
+    node_id: str
+    input_fingerprint: str
+    output: Any
+    response: AgentRunResult
+
+
+@dataclass(slots=True)
+class WorkflowRunResume:
+    """Checkpoints of an earlier attempt plus where new step records continue."""
+
+    checkpoints: dict[str, WorkflowStepCheckpoint] = field(default_factory=dict)
+    sequence_start: int = 0
+
+    @classmethod
+    def from_steps(cls, steps: Sequence[WorkflowRunStep]) -> WorkflowRunResume:
+        checkpoints: dict[str, WorkflowStepCheckpoint] = {}
+        for step in sorted(steps, key=lambda item: item.sequence_no):
+            if step.status != "succeeded" or step.deleted_at is not None:
+                continue
+            if step.node_id is None or step.input_fingerprint is None:
+                continue
+            # Later attempts of the same node supersede earlier ones.
+            checkpoints[step.node_id] = WorkflowStepCheckpoint(
+                node_id=step.node_id,
+                input_fingerprint=step.input_fingerprint,
+                output=step.output,
+                response=AgentRunResult(
+                    final_output=step.output,
+                    response_id=step.response_id,
+                    usage=AgentRunUsage(
+                        input_tokens=step.usage_input_tokens,
+                        output_tokens=step.usage_output_tokens,
+                    ),
+                    metadata=step.raw_payload,
+                    structured_output=step.structured_output,
+                    response_text=step.response_text,
+                ),
+            )
+        sequence_start = max((step.sequence_no for step in steps), default=-1) + 1
+        return cls(checkpoints=checkpoints, sequence_start=sequence_start)
+
+
+def step_fingerprint(node: WorkflowNode, step_input: Any) -> str:
+    """Hash of everything that determines a step's result within a run.
+
+    Covers the step definition (agent, hooks, turn limit, output schema) and the
+    exact input it receives, so a checkpoint is only replayed when neither the
+    spec nor anything upstream changed since it was recorded.
+    """
+
+    step = node.step
+    assert step is not None
+    payload = {
+        "node_id": node.node_id,
+        "agent_key": step.agent_key,
+        "name": step.display_name(),
+        "guard": step.guard,
+        "input_mapper": step.input_mapper,
+        "max_turns": step.max_turns,
+        "output_schema": shared_json_schema(step.output_schema),
+        "input": step_input,
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+__all__ = ["WorkflowRunResume", "WorkflowStepCheckpoint", "step_fingerprint"]
@@ -0,0 +1,563 @@
+"""Detached workflow execution: run queue, per-run event streams and cross-node cancellation.
+
+The blocking run endpoints tie a multi-agent run to one HTTP connection on one replica,
+and cancellation used to be a flag in that replica's memory. The dispatcher decouples
+them: the API enqueues a ``WorkflowRunJob`` and returns the run id immediately, any
+process with workers pulls and executes it, public frames are appended to a per-run
+event stream that clients attach to (and resume from) by run id, and cancel requests
+fan out to every node so the runner's cooperative check sees them wherever the run
+executes. Run capacity therefore scales with workers, not open connections.
+
+``InMemoryWorkflowRunBackend`` is the single-process stand-in; the Redis backend lives
+in ``app.infrastructure.workflows.redis_backend``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import re
+import time
+from collections import OrderedDict, deque
+from collections.abc import AsyncGenerator, AsyncIterator, Callable, MutableSet
+from dataclasses import asdict, dataclass, fields, replace
+from typing import TYPE_CHECKING, Any, Protocol
+
+from app.api.v1.shared.attachments import InputAttachment
+from app.api.v1.shared.public_stream_projector import PublicStreamProjector
+from app.observability.metrics import (
+    observe_workflow_run_queue_wait,
+    record_workflow_run_dispatch,
+    record_workflow_run_workers_busy,
+)
+from app.services.agents.context import ConversationActorContext
+from app.services.shared.run_streams import (
+    InMemoryRunStreamStore,
+    RunStreamEntry,
+    RunStreamStore,
+    follow_run_stream,
+)
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from app.services.workflows.service import WorkflowRunRequest
+
+logger = logging.getLogger("app.services.workflows.dispatch")
+
+_EVENT_ID_PATTERN = re.compile(r"^\d+-\d+$")
+
+
+@dataclass(slots=True)
+class WorkflowRunJob:
+    """Serializable description of a queued workflow run.
+
+    ``attempt`` counts deliveries: above 1 the previous worker died mid-run.
+    """
+
+    run_id: str
+    workflow_key: str
+    tenant_id: str
+    user_id: str
+    conversation_id: str
+    message: str
+    attachments: list[dict[str, Any]] | None = None
+    location: dict[str, Any] | None = None
+    share_location: bool | None = None
+    container_overrides: dict[str, str] | None = None
+    vector_store_overrides: dict[str, Any] | None = None
+    submitted_at: float | None = None
+    attempt: int = 1
+
+    @classmethod
+    def from_request(
+        cls,
+        *,
+        run_id: str,
+        workflow_key: str,
+        conversation_id: str,
+        request: WorkflowRunRequest,
+        actor: ConversationActorContext,
+    ) -> WorkflowRunJob:
+        return cls(
+            run_id=run_id,
+            workflow_key=workflow_key,
+            tenant_id=actor.tenant_id,
+            user_id=actor.user_id,
+            conversation_id=conversation_id,
+            message=request.message,
+            **snapshot_run_request(
+                attachments=request.attachments,
+                location=request.location,
+                share_location=request.share_location,
+                container_overrides=request.container_overrides,
+                vector_store_overrides=request.vector_store_overrides,
+            ),
+            submitted_at=time.time(),
+        )
+
+    def to_request(self) -> WorkflowRunRequest:
+        from app.api.v1.chat.schemas import LocationHint
+        from app.services.workflows.service import WorkflowRunRequest
+
+        return WorkflowRunRequest(
+            message=self.message,
+            attachments=(
+                [InputAttachment.model_validate(att) for att in self.attachments]
+                if self.attachments
+                else None
+            ),
+            conversation_id=self.conversation_id,
+            location=LocationHint.model_validate(self.location) if self.location else None,
+            share_location=self.share_location,
+            container_overrides=self.container_overrides,
+            vector_store_overrides=self.vector_store_overrides,
+        )
+
+    def actor(self) -> ConversationActorContext:
+        return ConversationActorContext(tenant_id=self.tenant_id, user_id=self.user_id)
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, raw: str | bytes) -> WorkflowRunJob:
+        payload = json.loads(raw)
+        known = {item.name for item in fields(cls)}
+        return cls(**{key: value for key, value in payload.items() if key in known})
+
+
+def snapshot_run_request(
+    *,
+    attachments: list[InputAttachment] | None,
+    location: Any | None,
+    share_location: bool | None,
+    container_overrides: dict[str, str] | None,
+    vector_store_overrides: Any | None,
+) -> dict[str, Any]:
+    """JSON-safe run options in ``WorkflowRunJob`` field form (minus the message)."""
+
+    if location is not None and hasattr(location, "model_dump"):
+        location = location.model_dump()
+    return {
+        "attachments": (
+            [att.model_dump(mode="json") for att in attachments] if attachments else None
+        ),
+        "location": location,
+        "share_location": share_location,
+        "container_overrides": container_overrides,
+        "vector_store_overrides": (
+            {
+                key: value.to_payload() if hasattr(value, "to_payload") else value
+                for key, value in vector_store_overrides.items()
+            }
+            if vector_store_overrides
+            else None
+        ),
+    }
+
+
+WorkflowRunStreamEntry = RunStreamEntry
+
+
+class WorkflowRunBackend(Protocol):
+    """Transport for queued runs, per-run event streams and cancellation signals.
+
+    Delivery is at-least-once: a dequeued job stays claimed by its worker while the
+    worker heartbeats, is handed to another worker (with ``attempt`` incremented) once
+    ``lease_seconds`` pass without one, and is only dropped when acknowledged.
+    """
+
+    @property
+    def streams(self) -> RunStreamStore: ...
+
+    @property
+    def lease_seconds(self) -> float: ...
+
+    async def enqueue(self, job: WorkflowRunJob) -> None: ...
+
+    async def dequeue(self, timeout: float) -> WorkflowRunJob | None: ...
+
+    async def heartbeat(self, run_id: str) -> None: ...
+
+    async def ack(self, run_id: str) -> None: ...
+
+    async def get_job(self, run_id: str) -> WorkflowRunJob | None: ...
+
+    async def request_cancel(self, run_id: str) -> None: ...
+
+    async def is_cancel_requested(self, run_id: str) -> bool: ...
+
+    def cancellations(self) -> AsyncIterator[str]: ...
+
+    async def close(self) -> None: ...
+
+
+class InMemoryWorkflowRunBackend(WorkflowRunBackend):
+    """Single-process backend; bounded by run count instead of TTLs."""
+
+    def __init__(
+        self,
+        *,
+        max_retained_runs: int = 1024,
+        ttl_seconds: float = 3600.0,
+        lease_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_retained_runs = max_retained_runs
+        self._ttl_seconds = ttl_seconds
+        self._lease_seconds = lease_seconds
+        self._clock = clock
+        self._streams = InMemoryRunStreamStore(max_runs=max_retained_runs, clock=clock)
+        self._queue: deque[WorkflowRunJob] = deque()
+        self._claimed: dict[str, tuple[WorkflowRunJob, float]] = {}
+        self._jobs: OrderedDict[str, WorkflowRunJob] = OrderedDict()
+        self._cancelled: set[str] = set()
+        self._listeners: set[asyncio.Queue[str]] = set()
+        self._queue_changed: asyncio.Condition | None = None
+
+    @property
+    def streams(self) -> RunStreamStore:
+        return self._streams
+
+    @property
+    def lease_seconds(self) -> float:
+        return self._lease_seconds
+
+    async def enqueue(self, job: WorkflowRunJob) -> None:
+        cond = self._cond()
+        async with cond:
+            self._jobs[job.run_id] = job
+            self._queue.append(job)
+            self._evict()
+            cond.notify()
+        # A queued run counts as alive until a worker claims it or its job expires.
+        await self._streams.touch(job.run_id, lease_seconds=self._ttl_seconds)
+
+    async def dequeue(self, timeout: float) -> WorkflowRunJob | None:
+        job = self._reclaim()
+        if job is None:
+            cond = self._cond()
+            async with cond:
+                try:
+                    await asyncio.wait_for(cond.wait_for(lambda: bool(self._queue)), timeout)
+                except TimeoutError:
+                    return self._reclaim()
+                job = self._queue.popleft()
+        self._claimed[job.run_id] = (job, self._clock() + self._lease_seconds)
+        await self._streams.touch(job.run_id, lease_seconds=self._lease_seconds)
+        return job
+
+    async def heartbeat(self, run_id: str) -> None:
+        claimed = self._claimed.get(run_id)
+        if claimed is not None:
+            self._claimed[run_id] = (claimed[0], self._clock() + self._lease_seconds)
+        await self._streams.touch(run_id, lease_seconds=self._lease_seconds)
+
+    async def ack(self, run_id: str) -> None:
+        self._claimed.pop(run_id, None)
+
+    async def get_job(self, run_id: str) -> WorkflowRunJob | None:
+        return self._jobs.get(run_id)
+
+    async def request_cancel(self, run_id: str) -> None:
+        self._cancelled.add(run_id)
+        for listener in self._listeners:
+            listener.put_nowait(run_id)
+
+    async def is_cancel_requested(self, run_id: str) -> bool:
+        return run_id in self._cancelled
+
+    async def cancellations(self) -> AsyncIterator[str]:
+        listener: asyncio.Queue[str] = asyncio.Queue()
+        self._listeners.add(listener)
+        try:
+            while True:
+                yield await listener.get()
+        finally:
+            self._listeners.discard(listener)
+
+    async def close(self) -> None:
+        self._listeners.clear()
+
+    def _cond(self) -> asyncio.Condition:
+        if self._queue_changed is None:
+            self._queue_changed = asyncio.Condition()
+        return self._queue_changed
+
+    def _reclaim(self) -> WorkflowRunJob | None:
+        now = self._clock()
+        for run_id, (job, expires_at) in self._claimed.items():
+            if expires_at <= now:
+                redelivered = replace(job, attempt=job.attempt + 1)
+                self._claimed[run_id] = (redelivered, now + self._lease_seconds)
+                return redelivered
+        return None
+
+    def _evict(self) -> None:
+        while len(self._jobs) > self._max_retained_runs:
+            run_id, _ = self._jobs.popitem(last=False)
+            self._cancelled.discard(run_id)
+
+
+JobExecutor = Callable[[WorkflowRunJob], AsyncIterator[str]]
+
+
+class WorkflowRunDispatcher:
+    """Queue producer, worker pool and cancellation listener for detached runs.
+
+    Workers heartbeat each run they execute. Readers that see neither new frames nor
+    a live heartbeat for ``IDLE_TIMEOUT_LEASES`` leases end with an ``error`` frame;
+    a run whose worker died is redelivered to another worker up to ``max_attempts``
+    times in total.
+    """
+
+    IDLE_TIMEOUT_LEASES = 4
+
+    def __init__(
+        self,
+        backend: WorkflowRunBackend,
+        *,
+        execute: JobExecutor,
+        cancellations: MutableSet[str],
+        concurrency: int,
+        poll_interval_seconds: float = 1.0,
+        max_attempts: int = 3,
+    ) -> None:
+        self._backend = backend
+        self._execute = execute
+        self._cancellations = cancellations
+        self._concurrency = concurrency
+        self._poll_interval = poll_interval_seconds
+        self._max_attempts = max_attempts
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._running: set[str] = set()
+        self._started = False
+
+    @property
+    def backend(self) -> WorkflowRunBackend:
+        return self._backend
+
+    @property
+    def running(self) -> frozenset[str]:
+        return frozenset(self._running)
+
+    async def start(self) -> None:
+        """Start the cancellation listener and ``concurrency`` workers (idempotent)."""
+
+        if self._started:
+            return
+        self._started = True
+        self._spawn(self._listen_for_cancellations())
+        for _ in range(self._concurrency):
+            self._spawn(self._work())
+
+    async def shutdown(self) -> None:
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
+        self._started = False
+        await self._backend.close()
+
+    async def submit(self, job: WorkflowRunJob) -> None:
+        await self.start()
+        await self._backend.enqueue(job)
+        record_workflow_run_dispatch(result="queued")
+
+    async def cancel(self, run_id: str) -> None:
+        # Flag locally first so a run executing here stops at its next check even if
+        # the broadcast is slow; other nodes pick it up from the backend.
+        self._cancellations.add(run_id)
+        await self._backend.request_cancel(run_id)
+
+    async def get_job(self, run_id: str) -> WorkflowRunJob | None:
+        return await self._backend.get_job(run_id)
+
+    def events(
+        self, run_id: str, *, after: str | None = None
+    ) -> AsyncGenerator[WorkflowRunStreamEntry | None, None]:
+        """Yield the run's entries from ``after`` until the end marker.
+
+        ``None`` is yielded whenever a poll interval passes without new entries so SSE
+        callers can emit heartbeats. If the run stops making progress and no worker
+        holds its lease, the stream ends with an ``error`` frame.
+        """
+
+        async def _abandoned() -> str:
+            job = await self._backend.get_job(run_id)
+            return interrupted_run_frame(
+                run_id,
+                job,
+                "Workflow run stopped reporting progress; its worker may have exited.",
+            )
+
+        return follow_run_stream(
+            self._backend.streams,
+            run_id,
+            after=after,
+            poll_interval=self._poll_interval,
+            idle_timeout=self._backend.lease_seconds * self.IDLE_TIMEOUT_LEASES,
+            abandoned_frame=_abandoned,
+        )
+
+    @staticmethod
+    def validate_event_id(value: str | None) -> None:
+        if value is not None and not _EVENT_ID_PATTERN.match(value):
+            raise ValueError("Invalid event id; expected the id of a previously received event.")
+
+    # ------------------------------------------------------------------ internals
+
+    def _spawn(self, coro: Any) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _listen_for_cancellations(self) -> None:
+        while True:
+            try:
+                async for run_id in self._backend.cancellations():
+                    self._cancellations.add(run_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("workflow_run.dispatch.cancel_listener_failed", exc_info=True)
+            await asyncio.sleep(self._poll_interval)
+
+    async def _work(self) -> None:
+        while True:
+            try:
+                job = await self._backend.dequeue(timeout=self._poll_interval)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("workflow_run.dispatch.dequeue_failed", exc_info=True)
+                await asyncio.sleep(self._poll_interval)
+                continue
+            if job is not None:
+                await self._run(job)
+
+    async def _run(self, job: WorkflowRunJob) -> None:
+        if job.attempt > 1:
+            record_workflow_run_dispatch(result="redelivered")
+        elif job.submitted_at is not None:
+            observe_workflow_run_queue_wait(wait_seconds=time.time() - job.submitted_at)
+        if job.attempt > self._max_attempts:
+            await self._abandon(job)
+            return
+
+        heartbeat = asyncio.create_task(self._heartbeat(job.run_id))
+        settled = False
+        try:
+            if job.run_id in self._cancellations or await self._backend.is_cancel_requested(
+                job.run_id
+            ):
+                # Cancelled while queued: never start it.
+                record_workflow_run_dispatch(result="skipped")
+                settled = True
+                return
+            self._running.add(job.run_id)
+            record_workflow_run_workers_busy(value=len(self._running))
+            record_workflow_run_dispatch(result="started")
+            async for frame in self._execute(job):
+                await self._backend.streams.append(job.run_id, frame)
+            record_workflow_run_dispatch(result="completed")
+            settled = True
+        except asyncio.CancelledError:
+            # Shutting down: leave the job claimed so another worker picks it up once
+            # the lease lapses.
+            raise
+        except Exception:
+            settled = True
+            record_workflow_run_dispatch(result="failed")
+            logger.exception(
+                "workflow_run.dispatch.failed",
+                extra={"workflow_run_id": job.run_id, "workflow_key": job.workflow_key},
+            )
+        finally:
+            heartbeat.cancel()
+            self._running.discard(job.run_id)
+            self._cancellations.discard(job.run_id)
+            record_workflow_run_workers_busy(value=len(self._running))
+            if settled:
+                await self._settle(job.run_id)
+
+    async def _heartbeat(self, run_id: str) -> None:
+        while True:
+            try:
+                await self._backend.heartbeat(run_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning(
+                    "workflow_run.dispatch.heartbeat_failed",
+                    extra={"workflow_run_id": run_id},
+                    exc_info=True,
+                )
+            await asyncio.sleep(self._backend.lease_seconds / 3)
+
+    async def _abandon(self, job: WorkflowRunJob) -> None:
+        record_workflow_run_dispatch(result="abandoned")
+        logger.error(
+            "workflow_run.dispatch.max_attempts_exceeded",
+            extra={"workflow_run_id": job.run_id, "attempt": job.attempt},
+        )
+        message = f"Workflow run was interrupted {job.attempt - 1} times and was not retried."
+        try:
+            await self._backend.streams.append(
+                job.run_id, interrupted_run_frame(job.run_id, job, message)
+            )
+        except Exception:
+            logger.warning(
+                "workflow_run.dispatch.error_frame_failed",
+                extra={"workflow_run_id": job.run_id},
+                exc_info=True,
+            )
+        await self._settle(job.run_id)
+
+    async def _settle(self, run_id: str) -> None:
+        """Write the end marker, then acknowledge the job so it is not redelivered."""
+
+        try:
+            await self._backend.streams.append(run_id, None)
+            await self._backend.ack(run_id)
+        except Exception:
+            logger.warning(
+                "workflow_run.dispatch.end_marker_failed",
+                extra={"workflow_run_id": run_id},
+                exc_info=True,
+            )
+
+
+def interrupted_run_frame(run_id: str, job: WorkflowRunJob | None, message: str) -> str:
+    """Serialized public ``error`` frame for a run that ended without its own terminal frame."""
+
+    projector = PublicStreamProjector(
+        stream_id=PublicStreamProjector.new_stream_id(prefix="workflow")
+    )
+    event = projector.project_error(
+        conversation_id=job.conversation_id if job else "unknown",
+        response_id=None,
+        agent=None,
+        workflow_meta={
+            "workflow_key": job.workflow_key if job else None,
+            "workflow_run_id": run_id,
+        },
+        code="run_interrupted",
+        message=message,
+        source="server",
+        is_retryable=True,
+    )
+    return event.model_dump_json(by_alias=True)
+
+
+__all__ = [
+    "InMemoryWorkflowRunBackend",
+    "JobExecutor",
+    "WorkflowRunBackend",
+    "WorkflowRunDispatcher",
+    "WorkflowRunJob",
+    "WorkflowRunStreamEntry",
+    "interrupted_run_frame",
+    "snapshot_run_request",
+]
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import json
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from app.domain.ai import AgentRunResult, RunOptions
-from app.workflows._shared.schema_utils import validate_against_schema
+from app.domain.ai.models import AgentStreamEvent
+from app.services.workflows.output import validate_output
 from app.workflows._shared.specs import WorkflowStep
 
 
@@ -58,12 +61,112 @@ async def execute_agent_step(
         tool_outputs=result.tool_outputs,
     )
 
-    validate_against_schema(
+    validate_output(
         step.output_schema,
         chosen_output,
         label=f"step '{step.display_name()}' output",
+        target="step",
     )
     return chosen_output, response
 
 
-__all__ = ["execute_agent_step"]
+async def stream_agent_step(
+    step: WorkflowStep,
+    step_input: Any,
+    provider,
+    conversation_id: str,
+    metadata: dict[str, Any],
+    options: RunOptions | None,
+    *,
+    labels: dict[str, Any],
+    emit: Callable[[AgentStreamEvent], Awaitable[None]],
+    check_cancel: Callable[[], None],
+    session_handle: Any | None = None,
+) -> tuple[Any | None, AgentRunResult]:
+    """Stream one step, passing annotated events to ``emit``, and return its result.
+
+    ``labels`` carries the workflow/stage fields stamped onto every event; keys
+    without a value are left out of the event metadata.
+    """
+
+    stream_handle = provider.runtime.run_stream(
+        step.agent_key,
+        step_input,
+        # Avoid passing internal UUIDs to provider; session carries continuity.
+        conversation_id=None,
+        metadata=metadata,
+        options=options,
+        session=session_handle,
+    )
+
+    event_labels = {
+        **{key: value for key, value in labels.items() if value is not None},
+        "step_name": step.display_name(),
+        "step_agent": step.agent_key,
+    }
+    last_text: str | None = None
+    text_buffer: list[str] = []
+    last_structured: Any | None = None
+    step_metadata = getattr(stream_handle, "metadata", None)
+    async for event in stream_handle.events():
+        check_cancel()
+        is_scoped = event.scope is not None
+        event.conversation_id = conversation_id
+        event.agent = event.agent or step.agent_key
+        event.step_name = step.display_name()
+        event.step_agent = step.agent_key
+        event.stage_name = labels.get("stage_name")
+        event.parallel_group = labels.get("parallel_group")
+        event.branch_index = labels.get("branch_index")
+        event.metadata = {**(event.metadata or {}), **event_labels}
+        if step_metadata is None and isinstance(event.metadata, dict):
+            step_metadata = event.metadata
+        if event.response_text and not is_scoped:
+            last_text = event.response_text
+        if event.text_delta and not is_scoped:
+            text_buffer.append(event.text_delta)
+        if event.structured_output is not None and not is_scoped:
+            last_structured = event.structured_output
+
+        is_provider_terminal = event.is_terminal and not is_scoped
+        if is_provider_terminal:
+            # Step-level terminal events must not terminate the *workflow* stream.
+            event.is_terminal = False
+        await emit(event)
+        if is_provider_terminal:
+            break
+
+    if not last_text and text_buffer:
+        last_text = "".join(text_buffer)
+
+    chosen_output: Any | None = None
+    if last_structured is not None:
+        chosen_output = last_structured
+    elif last_text is not None:
+        chosen_output = last_text
+
+    validate_output(
+        step.output_schema,
+        chosen_output,
+        label=f"step '{step.display_name()}' output",
+        target="step",
+    )
+
+    response = AgentRunResult(
+        final_output=chosen_output,
+        response_text=last_text
+        if last_text is not None
+        else (
+            json.dumps(last_structured, ensure_ascii=False)
+            if last_structured is not None
+            else None
+        ),
+        structured_output=last_structured,
+        response_id=getattr(stream_handle, "last_response_id", None),
+        usage=getattr(stream_handle, "usage", None),
+        metadata=step_metadata,
+    )
+    return chosen_output, response
+
+
+__all__ = ["execute_agent_step", "stream_agent_step"]
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import logging
+import time
 import uuid
 from collections.abc import Sequence
 from typing import Any
@@ -14,9 +15,11 @@ from app.domain.conversations import (
     ConversationMessage,
     ConversationMetadata,
 )
+from app.observability.metrics import observe_workflow_output_validation
 from app.services.agents.context import ConversationActorContext
 from app.services.assets.service import AssetService
 from app.services.conversation_service import ConversationService
+from app.workflows._shared.schema_utils import SchemaLike, compile_schema
 from app.workflows._shared.specs import WorkflowSpec
 
 logger = logging.getLogger(__name__)
@@ -52,6 +55,25 @@ def aggregate_usage(usages: Sequence[AgentRunUsage | None]) -> AgentRunUsage | N
     )
 
 
+def validate_output(schema: SchemaLike, value: Any, *, label: str, target: str) -> Any:
+    """Validate ``value`` against the precompiled ``schema`` and time it per ``target``."""
+
+    compiled = compile_schema(schema)
+    if compiled is None or value is None:
+        return value
+    started = time.perf_counter()
+    result = "valid"
+    try:
+        return compiled.validate(value, label=label)
+    except ValueError:
+        result = "invalid"
+        raise
+    finally:
+        observe_workflow_output_validation(
+            target=target, result=result, duration_seconds=time.perf_counter() - started
+        )
+
+
 def render_workflow_output_text(value: Any) -> str:
     """Best-effort conversion of a workflow output into message text."""
 
@@ -145,4 +167,5 @@ __all__ = [
     "aggregate_usage",
     "format_stream_output",
     "render_workflow_output_text",
+    "validate_output",
 ]
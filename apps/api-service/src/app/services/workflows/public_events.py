@@ -0,0 +1,131 @@
+"""Project workflow stream events into public_sse_v1 frames and persist them to the ledger."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+
+from app.api.v1.shared.public_stream_projector import PublicStreamProjector
+from app.api.v1.shared.streaming import PublicSseEventBase
+from app.domain.ai.models import AgentStreamEvent
+from app.services.conversations.ledger_recorder import get_conversation_ledger_recorder
+
+logger = logging.getLogger(__name__)
+
+
+def _now_iso() -> str:
+    return datetime.now(tz=UTC).isoformat().replace("+00:00", "Z")
+
+
+async def project_workflow_events(
+    stream: AsyncIterator[AgentStreamEvent],
+    *,
+    workflow_key: str,
+    tenant_id: str,
+    conversation_id: str | None,
+) -> AsyncIterator[list[PublicSseEventBase]]:
+    """Yield the public frames produced by each upstream workflow event.
+
+    Frames are recorded in the conversation ledger before they are yielded so replay
+    matches what live clients saw. After the terminal frame the upstream stream is
+    drained (so the runner finishes recording run state) without yielding anything
+    further. Failures become a single ``error`` frame unless a terminal frame was
+    already emitted.
+    """
+
+    projector = PublicStreamProjector(
+        stream_id=PublicStreamProjector.new_stream_id(prefix="workflow")
+    )
+    ledger_recorder = get_conversation_ledger_recorder()
+    last_conversation_id = conversation_id or "unknown"
+    last_response_id: str | None = None
+    terminal_sent = False
+
+    try:
+        async for event in stream:
+            metadata = event.metadata if isinstance(event.metadata, dict) else {}
+            if event.conversation_id and event.scope is None:
+                last_conversation_id = event.conversation_id
+            if event.response_id and event.scope is None:
+                last_response_id = event.response_id
+
+            workflow_meta = {
+                "workflow_key": metadata.get("workflow_key", workflow_key),
+                "workflow_run_id": metadata.get("workflow_run_id"),
+                "step_name": metadata.get("step_name"),
+                "step_agent": metadata.get("step_agent"),
+                "stage_name": metadata.get("stage_name"),
+                "parallel_group": metadata.get("parallel_group"),
+                "branch_index": metadata.get("branch_index"),
+            }
+            public_events = projector.project(
+                event,
+                conversation_id=last_conversation_id,
+                response_id=last_response_id,
+                agent=event.agent,
+                workflow_meta=workflow_meta,
+                server_timestamp=_now_iso(),
+            )
+            if terminal_sent:
+                # Drain the upstream stream so the workflow runner can finish recording
+                # run state and side effects.
+                continue
+            try:
+                await ledger_recorder.record_public_events(
+                    tenant_id=tenant_id,
+                    conversation_id=last_conversation_id,
+                    events=public_events,
+                )
+            except Exception:
+                logger.exception(
+                    "workflows.stream.ledger_persist_failed",
+                    extra={
+                        "workflow_key": workflow_key,
+                        "conversation_id": last_conversation_id,
+                    },
+                )
+            terminal_sent = any(
+                getattr(ev, "kind", None) in {"final", "error"} for ev in public_events
+            )
+            yield public_events
+    except Exception as exc:
+        logger.exception(
+            "workflows.stream.serialization_error",
+            extra={
+                "workflow_key": workflow_key,
+                "conversation_id": last_conversation_id,
+                "error": str(exc),
+            },
+        )
+        if terminal_sent:
+            return
+        error_event = projector.project_error(
+            conversation_id=last_conversation_id,
+            response_id=last_response_id,
+            agent=None,
+            workflow_meta={"workflow_key": workflow_key},
+            code=None,
+            message=str(exc),
+            source="server",
+            is_retryable=False,
+            server_timestamp=_now_iso(),
+        )
+        try:
+            await ledger_recorder.record_public_events(
+                tenant_id=tenant_id,
+                conversation_id=last_conversation_id,
+                events=[error_event],
+            )
+        except Exception:
+            logger.exception(
+                "workflows.stream.ledger_error_event_persist_failed",
+                extra={
+                    "workflow_key": workflow_key,
+                    "conversation_id": last_conversation_id,
+                },
+            )
+        yield [error_event]
+
+
+__all__ = ["project_workflow_events"]
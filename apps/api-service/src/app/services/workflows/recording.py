@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from typing import Any
 from uuid import uuid4
 
@@ -23,6 +24,12 @@ def _uuid() -> str:
     return str(uuid4())
 
 
+def _json_safe(value: Any) -> Any:
+    if value is None:
+        return None
+    return json.loads(json.dumps(value, default=str))
+
+
 def _normalize_status(value: str) -> StatusType:
     normalized = value.lower()
     if normalized in {"succeeded", "success"}:
@@ -111,14 +118,20 @@ class WorkflowRunRecorder:
         stage_name: str | None,
         parallel_group: str | None,
         branch_index: int | None,
-    ) -> None:
+        node_id: str | None = None,
+        input_fingerprint: str | None = None,
+        output: Any = None,
+    ) -> str | None:
+        """Persist a finished step (and its checkpoint); returns the step id."""
+
         if not self._repository:
-            return
+            return None
 
+        step_id = _uuid()
         raw_payload = response.metadata if isinstance(response.metadata, dict) else None
         await self._repository.create_step(
             WorkflowRunStep(
-                id=_uuid(),
+                id=step_id,
                 workflow_run_id=run_id,
                 sequence_no=sequence_no,
                 step_name=step_name,
@@ -135,8 +148,39 @@ class WorkflowRunRecorder:
                 stage_name=stage_name,
                 parallel_group=parallel_group,
                 branch_index=branch_index,
+                node_id=node_id,
+                input_fingerprint=input_fingerprint,
+                output=_json_safe(output),
             )
         )
+        return step_id
+
+    async def step_session_items(self, step_id: str | None, items: list[Any]) -> None:
+        """Attach the session items a step produced to its checkpoint."""
+
+        if not self._repository or step_id is None or not items:
+            return
+        await self._repository.update_step(step_id, session_items=_json_safe(items))
+
+    async def resume(self, run_id: str) -> None:
+        """Flip a failed, cancelled or interrupted run back to running."""
+
+        if not self._repository:
+            return
+        await self._repository.update_run(
+            run_id,
+            status="running",
+            ended_at=None,
+            final_output_text=None,
+            final_output_structured=None,
+        )
+
+    async def heartbeat(self, run_id: str) -> None:
+        """Mark the run as still executing so resumes leave it alone."""
+
+        if not self._repository:
+            return
+        await self._repository.update_run(run_id, heartbeat_at=_now())
 
     async def end(
         self,
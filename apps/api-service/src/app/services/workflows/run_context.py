@@ -23,6 +23,7 @@ from app.services.agents.interaction_context import InteractionContextBuilder
 from app.services.agents.provider_registry import AgentProviderRegistry
 from app.services.assets.service import AssetService
 from app.services.conversation_service import ConversationService
+from app.services.workflows.dispatch import snapshot_run_request
 from app.services.workflows.recording import WorkflowRunRecorder
 from app.services.workflows.utils import first_agent_key, workflow_agent_keys
 from app.workflows._shared.specs import WorkflowSpec
@@ -75,14 +76,20 @@ class WorkflowRunBootstrapper:
         share_location: bool | None = None,
         container_overrides: dict[str, str] | None = None,
         vector_store_overrides: Mapping[str, Any] | None = None,
+        run_id: str | None = None,
+        resume: bool = False,
     ) -> WorkflowRunContext:
+        """Resolve input and runtime context, then open (or reopen) the run record.
+
+        With ``resume=True`` the run and its user message already exist: the
+        conversation is left untouched and the existing run record flips back to
+        running instead of being created.
+        """
+
         provider = self._provider_registry.get_default()
-        run_id = str(uuid.uuid4())
+        run_id = run_id or str(uuid.uuid4())
         entry_agent = first_agent_key(workflow) or workflow.key
         session_handle = provider.session_store.build(conversation_id)
-        conversation_exists = await self._conversation_service.conversation_exists(
-            conversation_id, tenant_id=actor.tenant_id
-        )
 
         agent_input, user_attachments = await self._resolve_user_input(
             attachments=attachments,
@@ -91,6 +98,74 @@ class WorkflowRunBootstrapper:
             agent_key=entry_agent,
             message=message,
         )
+        if not resume:
+            await self._record_user_message(
+                workflow,
+                actor=actor,
+                message=message,
+                conversation_id=conversation_id,
+                provider_name=provider.name,
+                entry_agent=entry_agent,
+                user_attachments=user_attachments,
+            )
+
+        runtime_ctx = await self._interaction_builder.build(
+            actor=actor,
+            request=_WorkflowRequestProxy(
+                message=message,
+                location=location,
+                share_location=share_location,
+                container_overrides=container_overrides,
+                vector_store_overrides=vector_store_overrides,
+            ),
+            conversation_id=conversation_id,
+            agent_keys=workflow_agent_keys(workflow),
+        )
+        if resume:
+            await self._recorder.resume(run_id)
+        else:
+            await self._bootstrap_run_record(
+                run_id=run_id,
+                workflow=workflow,
+                actor=actor,
+                message=message,
+                conversation_id=conversation_id,
+                runtime_ctx=runtime_ctx,
+                request_snapshot=snapshot_run_request(
+                    attachments=attachments,
+                    location=location,
+                    share_location=share_location,
+                    container_overrides=container_overrides,
+                    vector_store_overrides=vector_store_overrides,
+                ),
+            )
+
+        return WorkflowRunContext(
+            run_id=run_id,
+            workflow=workflow,
+            provider=provider,
+            session_handle=session_handle,
+            entry_agent=entry_agent,
+            agent_input=agent_input,
+            runtime_ctx=runtime_ctx,
+            conversation_id=conversation_id,
+            actor=actor,
+        )
+
+    async def _record_user_message(
+        self,
+        workflow: WorkflowSpec,
+        *,
+        actor: ConversationActorContext,
+        message: str,
+        conversation_id: str,
+        provider_name: str,
+        entry_agent: str,
+        user_attachments: list[ConversationAttachment],
+    ) -> None:
+        conversation_exists = await self._conversation_service.conversation_exists(
+            conversation_id, tenant_id=actor.tenant_id
+        )
         message_id = await self._conversation_service.append_message(
             conversation_id,
             ConversationMessage(role="user", content=message, attachments=user_attachments),
@@ -99,7 +174,7 @@ class WorkflowRunBootstrapper:
                 tenant_id=actor.tenant_id,
                 agent_entrypoint=workflow.key,
                 active_agent=entry_agent,
-                provider=provider.name,
+                provider=provider_name,
                 user_id=actor.user_id,
             ),
         )
@@ -125,39 +200,6 @@ class WorkflowRunBootstrapper:
             existed=conversation_exists,
         )
 
-        runtime_ctx = await self._interaction_builder.build(
-            actor=actor,
-            request=_WorkflowRequestProxy(
-                message=message,
-                location=location,
-                share_location=share_location,
-                container_overrides=container_overrides,
-                vector_store_overrides=vector_store_overrides,
-            ),
-            conversation_id=conversation_id,
-            agent_keys=workflow_agent_keys(workflow),
-        )
-        await self._bootstrap_run_record(
-            run_id=run_id,
-            workflow=workflow,
-            actor=actor,
-            message=message,
-            conversation_id=conversation_id,
-            runtime_ctx=runtime_ctx,
-        )
-
-        return WorkflowRunContext(
-            run_id=run_id,
-            workflow=workflow,
-            provider=provider,
-            session_handle=session_handle,
-            entry_agent=entry_agent,
-            agent_input=agent_input,
-            runtime_ctx=runtime_ctx,
-            conversation_id=conversation_id,
-            actor=actor,
-        )
-
     async def _resolve_user_input(
         self,
         *,
@@ -198,6 +240,7 @@ class WorkflowRunBootstrapper:
         message: str,
         conversation_id: str,
         runtime_ctx,
+        request_snapshot: dict[str, Any],
     ) -> None:
         agent_keys = workflow_agent_keys(workflow)
         contexts: dict[str, dict[str, str | None]] = {}
@@ -216,6 +259,8 @@ class WorkflowRunBootstrapper:
                 exc_info=exc,
             )
 
+        # The request options are kept with the run so a resume can rebuild its input.
+        metadata = {**(metadata or {}), "request": request_snapshot}
         await self._recorder.start(
             run_id,
             workflow,
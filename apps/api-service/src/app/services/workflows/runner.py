@@ -1,4 +1,4 @@
-"""Workflow runner that sequences agents deterministically (with optional parallel stages)."""
+"""Workflow runner that executes agent steps deterministically over a dependency graph."""
 
 from __future__ import annotations
 
@@ -8,6 +8,7 @@ from typing import Any, cast
 from agents import trace
 
 from app.api.v1.shared.attachments import InputAttachment
+from app.core.settings import get_settings
 from app.domain.ai.models import AgentStreamEvent
 from app.domain.workflows import WorkflowRunRepository
 from app.services.agents.attachments import AttachmentService
@@ -27,21 +28,23 @@ from app.services.conversation_service import (
     get_conversation_service,
 )
 from app.services.workflows.attachments import WorkflowAttachmentCollector
+from app.services.workflows.checkpoints import WorkflowRunResume
 from app.services.workflows.output import (
     WorkflowAssistantMessageWriter,
     aggregate_usage,
     format_stream_output,
     render_workflow_output_text,
+    validate_output,
 )
 from app.services.workflows.recording import WorkflowRunRecorder
 from app.services.workflows.run_context import WorkflowRunBootstrapper
+from app.services.workflows.scheduler import WorkflowGraphScheduler
 from app.services.workflows.session_events import SessionDeltaProjector
-from app.services.workflows.stages import run_parallel_stage, run_sequential_stage
-from app.services.workflows.streaming import stream_parallel_stage, stream_sequential_stage
 from app.services.workflows.types import WorkflowRunResult, WorkflowStepResult
 from app.services.workflows.utils import first_agent_key
+from app.workflows._shared.graph import compile_workflow_graph
 from app.workflows._shared.registry import WorkflowRegistry
-from app.workflows._shared.schema_utils import schema_to_json_schema, validate_against_schema
+from app.workflows._shared.schema_utils import shared_json_schema
 from app.workflows._shared.specs import WorkflowSpec
 
 
@@ -60,8 +63,15 @@ class WorkflowRunner:
         input_attachment_service: InputAttachmentService | None = None,
         asset_service: AssetService | None = None,
         container_service: ContainerService | None = None,
+        heartbeat_seconds: float | None = None,
     ) -> None:
         self._registry = registry
+        # Several heartbeats fit in the stale window, so a live run is never resumed.
+        self._heartbeat_seconds = (
+            heartbeat_seconds
+            if heartbeat_seconds is not None
+            else get_settings().workflow_resume_stale_seconds / 4
+        )
         self._provider_registry = provider_registry or get_provider_registry()
         self._interaction_builder = interaction_builder or InteractionContextBuilder()
         self._run_repository = run_repository
@@ -99,6 +109,8 @@ class WorkflowRunner:
         share_location: bool | None = None,
         container_overrides: dict[str, str] | None = None,
         vector_store_overrides: Mapping[str, Any] | None = None,
+        run_id: str | None = None,
+        resume: WorkflowRunResume | None = None,
     ) -> WorkflowRunResult:
         ctx = await self._bootstrapper.prepare(
             workflow,
@@ -110,6 +122,8 @@ class WorkflowRunner:
             share_location=share_location,
             container_overrides=container_overrides,
             vector_store_overrides=vector_store_overrides,
+            run_id=run_id,
+            resume=resume is not None,
         )
         session_projector = SessionDeltaProjector(
             event_projector=self._event_projector,
@@ -119,9 +133,7 @@ class WorkflowRunner:
             session_handle=ctx.session_handle,
         )
 
-        current_input: Any = ctx.agent_input
-        steps_results: list[WorkflowStepResult] = []
-        stages = workflow.resolved_stages()
+        graph = compile_workflow_graph(workflow)
         collector = (
             WorkflowAttachmentCollector(
                 attachment_service=self._attachment_service,
@@ -135,48 +147,34 @@ class WorkflowRunner:
         def _check_cancel() -> None:
             self._raise_if_cancelled(ctx.run_id)
 
+        scheduler = WorkflowGraphScheduler(
+            graph,
+            run_id=ctx.run_id,
+            workflow=workflow,
+            initial_input=ctx.agent_input,
+            provider=ctx.provider,
+            runtime_ctx=ctx.runtime_ctx,
+            conversation_id=conversation_id,
+            recorder=self._recorder,
+            check_cancel=_check_cancel,
+            session_getter=session_projector.get_session_items,
+            ingest_session_delta=session_projector.ingest_delta,
+            session_handle=ctx.session_handle,
+            resume=resume,
+            heartbeat_interval=self._heartbeat_interval(),
+        )
+        steps_results: list[WorkflowStepResult] = scheduler.steps
+
         try:
             with trace(workflow_name=workflow.key, group_id=conversation_id):
-                for _stage_index, stage in enumerate(stages):
-                    _check_cancel()
-                    if stage.mode == "parallel":
-                        current_input = await run_parallel_stage(
-                            run_id=ctx.run_id,
-                            workflow=workflow,
-                            stage=stage,
-                            current_input=current_input,
-                            steps_results=steps_results,
-                            provider=ctx.provider,
-                            runtime_ctx=ctx.runtime_ctx,
-                            conversation_id=conversation_id,
-                            recorder=self._recorder,
-                            check_cancel=_check_cancel,
-                            session_getter=session_projector.get_session_items,
-                            ingest_session_delta=session_projector.ingest_delta,
-                            session_handle=ctx.session_handle,
-                            workflow_run_id=ctx.run_id,
-                        )
-                    else:
-                        current_input = await run_sequential_stage(
-                            run_id=ctx.run_id,
-                            workflow=workflow,
-                            stage=stage,
-                            current_input=current_input,
-                            steps_results=steps_results,
-                            provider=ctx.provider,
-                            runtime_ctx=ctx.runtime_ctx,
-                            conversation_id=conversation_id,
-                            recorder=self._recorder,
-                            check_cancel=_check_cancel,
-                            session_getter=session_projector.get_session_items,
-                            ingest_session_delta=session_projector.ingest_delta,
-                            session_handle=ctx.session_handle,
-                        )
+                _check_cancel()
+                current_input = await scheduler.run()
 
-            validated_output = validate_against_schema(
+            validated_output = validate_output(
                 workflow.output_schema,
                 current_input if steps_results else None,
                 label="workflow output",
+                target="workflow",
             )
 
             if collector and steps_results:
@@ -225,7 +223,7 @@ class WorkflowRunner:
             conversation_id=conversation_id,
             steps=steps_results,
             final_output=validated_output if steps_results else None,
-            output_schema=schema_to_json_schema(workflow.output_schema),
+            output_schema=shared_json_schema(workflow.output_schema),
             attachments=output_attachments,
         )
 
@@ -241,6 +239,8 @@ class WorkflowRunner:
         share_location: bool | None = None,
         container_overrides: dict[str, str] | None = None,
         vector_store_overrides: Mapping[str, Any] | None = None,
+        run_id: str | None = None,
+        resume: WorkflowRunResume | None = None,
     ) -> AsyncIterator[AgentStreamEvent]:
         ctx = await self._bootstrapper.prepare(
             workflow,
@@ -252,6 +252,8 @@ class WorkflowRunner:
             share_location=share_location,
             container_overrides=container_overrides,
             vector_store_overrides=vector_store_overrides,
+            run_id=run_id,
+            resume=resume is not None,
         )
         session_projector = SessionDeltaProjector(
             event_projector=self._event_projector,
@@ -261,9 +263,7 @@ class WorkflowRunner:
             session_handle=ctx.session_handle,
         )
 
-        current_input: Any = ctx.agent_input
-        prior_steps: list[WorkflowStepResult] = []
-        stages = workflow.resolved_stages()
+        graph = compile_workflow_graph(workflow)
         collector = (
             WorkflowAttachmentCollector(
                 attachment_service=self._attachment_service,
@@ -277,63 +277,39 @@ class WorkflowRunner:
         def _check_cancel() -> None:
             self._raise_if_cancelled(ctx.run_id)
 
+        scheduler = WorkflowGraphScheduler(
+            graph,
+            run_id=ctx.run_id,
+            workflow=workflow,
+            initial_input=ctx.agent_input,
+            provider=ctx.provider,
+            runtime_ctx=ctx.runtime_ctx,
+            conversation_id=conversation_id,
+            recorder=self._recorder,
+            check_cancel=_check_cancel,
+            session_getter=session_projector.get_session_items,
+            ingest_session_delta=session_projector.ingest_delta,
+            session_handle=ctx.session_handle,
+            stream=True,
+            resume=resume,
+            heartbeat_interval=self._heartbeat_interval(),
+        )
+        prior_steps: list[WorkflowStepResult] = scheduler.steps
+
         try:
             with trace(workflow_name=workflow.key, group_id=conversation_id):
-                for _stage_index, stage in enumerate(stages):
-                    _check_cancel()
-                    if stage.mode == "parallel":
-                        stage_state: dict[str, Any] = {}
-                        async for event in stream_parallel_stage(
-                            run_id=ctx.run_id,
-                            workflow=workflow,
-                            stage=stage,
-                            current_input=current_input,
-                            prior_steps=prior_steps,
-                            provider=ctx.provider,
-                            runtime_ctx=ctx.runtime_ctx,
-                            conversation_id=conversation_id,
-                            recorder=self._recorder,
-                            check_cancel=_check_cancel,
-                            stage_state=stage_state,
-                            session_getter=session_projector.get_session_items,
-                            ingest_session_delta=session_projector.ingest_delta,
-                            session_handle=ctx.session_handle,
-                            workflow_run_id=ctx.run_id,
-                        ):
-                            if collector is not None:
-                                await collector.ingest_stream_event(event)
-                            yield event
-                        current_input = stage_state.get(
-                            "next_input",
-                            prior_steps[-1].response.final_output if prior_steps else current_input,
-                        )
-                    else:
-                        _check_cancel()
-                        async for event in stream_sequential_stage(
-                            run_id=ctx.run_id,
-                            workflow=workflow,
-                            stage=stage,
-                            current_input=current_input,
-                            prior_steps=prior_steps,
-                            provider=ctx.provider,
-                            runtime_ctx=ctx.runtime_ctx,
-                            conversation_id=conversation_id,
-                            recorder=self._recorder,
-                            check_cancel=_check_cancel,
-                            session_getter=session_projector.get_session_items,
-                            ingest_session_delta=session_projector.ingest_delta,
-                            session_handle=ctx.session_handle,
-                        ):
-                            if collector is not None:
-                                await collector.ingest_stream_event(event)
-                            yield event
-                        if prior_steps:
-                            current_input = prior_steps[-1].response.final_output
-
-            validated_output = validate_against_schema(
+                _check_cancel()
+                async for event in scheduler.events():
+                    if collector is not None:
+                        await collector.ingest_stream_event(event)
+                    yield event
+                current_input = scheduler.output
+
+            validated_output = validate_output(
                 workflow.output_schema,
                 current_input if prior_steps else None,
                 label="workflow output",
+                target="workflow",
             )
 
             if collector is not None:
@@ -428,6 +404,11 @@ class WorkflowRunner:
         if run_id in self._cancellations:
             raise _WorkflowCancelled()
 
+    def _heartbeat_interval(self) -> float | None:
+        if self._run_repository is None or self._heartbeat_seconds <= 0:
+            return None
+        return self._heartbeat_seconds
+
 
 class _WorkflowCancelled(Exception):
     """Internal marker exception for cooperative cancellation."""
@@ -0,0 +1,392 @@
+"""Dependency-graph scheduler shared by the sync and streaming workflow runners."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import logging
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from app.domain.ai import AgentRunResult, RunOptions
+from app.domain.ai.models import AgentStreamEvent
+from app.services.agents.session_items import compute_session_delta
+from app.services.workflows.checkpoints import WorkflowRunResume, step_fingerprint
+from app.services.workflows.execution import execute_agent_step, stream_agent_step
+from app.services.workflows.hooks import apply_reducer, evaluate_guard, run_mapper
+from app.services.workflows.recording import WorkflowRunRecorder
+from app.services.workflows.types import WorkflowStepResult
+from app.workflows._shared.graph import WorkflowGraph, WorkflowNode
+from app.workflows._shared.schema_utils import shared_json_schema
+from app.workflows._shared.specs import WorkflowSpec
+
+logger = logging.getLogger(__name__)
+
+@dataclass(slots=True)
+class _NodeOutcome:
+    output: Any
+    skipped: bool = False
+
+
+@dataclass(slots=True)
+class _StepDone:
+    node: WorkflowNode
+    output: Any = None
+    response: AgentRunResult | None = None
+    error: Exception | None = None
+
+
+class WorkflowGraphScheduler:
+    """Run a compiled workflow graph, starting each step once its inputs are ready.
+
+    Node input is the workflow input for roots, otherwise the outputs of the
+    upstream nodes joined through the node's reducer (a single output is forwarded
+    unchanged). Upstream nodes skipped by a guard contribute nothing; when every
+    upstream node was skipped the input passes through unchanged, mirroring how
+    sequential stages treated skipped steps. At most ``graph.max_concurrency``
+    agent steps execute at once.
+
+    Step results land in ``steps`` in completion order; ``output`` holds the
+    output node's value once the run finishes. With ``stream=True`` the provider
+    event streams of concurrent steps are multiplexed through ``events()``.
+
+    Every recorded step is a checkpoint (node id, input fingerprint, output and the
+    session items it produced). When ``resume`` carries checkpoints from an earlier
+    attempt, a step whose fingerprint still matches is replayed from its checkpoint
+    instead of calling the agent again. With ``heartbeat_interval`` the run record
+    is marked alive at that interval while the graph executes, so resumes can tell a
+    long-running step from a dead worker.
+    """
+
+    def __init__(
+        self,
+        graph: WorkflowGraph,
+        *,
+        run_id: str,
+        workflow: WorkflowSpec,
+        initial_input: Any,
+        provider,
+        runtime_ctx,
+        conversation_id: str,
+        recorder: WorkflowRunRecorder,
+        check_cancel: Callable[[], None],
+        session_getter,
+        ingest_session_delta,
+        session_handle,
+        stream: bool = False,
+        resume: WorkflowRunResume | None = None,
+        heartbeat_interval: float | None = None,
+    ) -> None:
+        self._graph = graph
+        self._run_id = run_id
+        self._workflow = workflow
+        self._initial_input = initial_input
+        self._provider = provider
+        self._runtime_ctx = runtime_ctx
+        self._conversation_id = conversation_id
+        self._recorder = recorder
+        self._check_cancel = check_cancel
+        self._session_getter = session_getter
+        self._ingest_session_delta = ingest_session_delta
+        self._session_handle = session_handle
+        self._stream = stream
+        self._heartbeat_interval = heartbeat_interval
+        self._checkpoints = dict(resume.checkpoints) if resume is not None else {}
+        self._next_sequence_no = resume.sequence_start if resume is not None else 0
+        self._fingerprints: dict[str, str] = {}
+
+        self._order = {node.node_id: index for index, node in enumerate(graph.nodes)}
+        self._nodes = {node.node_id: node for node in graph.nodes}
+        self._waiting = {node.node_id: len(node.depends_on) for node in graph.nodes}
+        self._dependents: dict[str, list[str]] = {node.node_id: [] for node in graph.nodes}
+        for node in graph.nodes:
+            for dependency in node.depends_on:
+                self._dependents[dependency].append(node.node_id)
+        self._ready: list[tuple[int, str]] = [
+            (self._order[node_id], node_id)
+            for node_id, count in self._waiting.items()
+            if count == 0
+        ]
+        heapq.heapify(self._ready)
+        self._outcomes: dict[str, _NodeOutcome] = {}
+        self._running: dict[str, asyncio.Task[None]] = {}
+        self._queue: asyncio.Queue[AgentStreamEvent | _StepDone] = asyncio.Queue()
+        self._session_cursor: list[dict[str, Any]] | None = None
+        self._session_window: list[tuple[WorkflowStepResult, str | None]] = []
+
+        self.steps: list[WorkflowStepResult] = []
+        self.replayed_steps: list[str] = []
+        self.output: Any = None
+
+    async def run(self) -> Any:
+        async for _event in self.events():
+            pass
+        return self.output
+
+    async def events(self) -> AsyncIterator[AgentStreamEvent]:
+        heartbeat = (
+            asyncio.create_task(self._heartbeat(self._heartbeat_interval))
+            if self._heartbeat_interval
+            else None
+        )
+        try:
+            await self._advance()
+            while self._running:
+                item = await self._queue.get()
+                if isinstance(item, AgentStreamEvent):
+                    yield item
+                    continue
+                self._running.pop(item.node.node_id, None)
+                if item.error is not None:
+                    raise item.error
+                await self._complete(item)
+                await self._advance()
+        finally:
+            if heartbeat is not None:
+                heartbeat.cancel()
+            await self._cancel_running()
+        self.output = self._outcomes[self._graph.output_node].output
+
+    async def _heartbeat(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self._recorder.heartbeat(self._run_id)
+            except Exception:
+                logger.warning(
+                    "workflow_run.heartbeat_failed",
+                    extra={"workflow_run_id": self._run_id},
+                    exc_info=True,
+                )
+
+    async def _advance(self) -> None:
+        cap = self._graph.max_concurrency
+        # Steps waiting for a free slot go back on the heap once the ready nodes the
+        # cap does not apply to (joins) have been resolved.
+        deferred: list[tuple[int, str]] = []
+        while self._ready:
+            entry = heapq.heappop(self._ready)
+            node = self._nodes[entry[1]]
+            if node.step is not None and cap is not None and len(self._running) >= cap:
+                deferred.append(entry)
+                continue
+            self._check_cancel()
+
+            node_input, upstream_skipped = await self._node_input(node)
+            step = node.step
+            if step is None:
+                self._resolve(node, node_input, skipped=upstream_skipped)
+                continue
+            if step.guard and not await evaluate_guard(step.guard, node_input, self.steps):
+                self._resolve(node, node_input, skipped=True)
+                continue
+            step_input = node_input
+            if step.input_mapper:
+                step_input = await run_mapper(step.input_mapper, node_input, self.steps)
+            await self._launch(node, step_input)
+        for entry in deferred:
+            heapq.heappush(self._ready, entry)
+
+    async def _node_input(self, node: WorkflowNode) -> tuple[Any, bool]:
+        if not node.depends_on:
+            return self._initial_input, False
+        upstream = [self._outcomes[dependency] for dependency in node.depends_on]
+        produced = [outcome.output for outcome in upstream if not outcome.skipped]
+        if not produced:
+            return upstream[0].output, True
+        return await apply_reducer(node.reducer, produced, self.steps), False
+
+    async def _launch(self, node: WorkflowNode, step_input: Any) -> None:
+        fingerprint = step_fingerprint(node, step_input)
+        checkpoint = self._checkpoints.pop(node.node_id, None)
+        if checkpoint is not None and checkpoint.input_fingerprint == fingerprint:
+            self._replay(node, checkpoint.output, checkpoint.response)
+            return
+        self._fingerprints[node.node_id] = fingerprint
+        if not self._running:
+            self._session_cursor = await self._session_getter()
+        self._running[node.node_id] = asyncio.create_task(self._execute(node, step_input))
+
+    async def _execute(self, node: WorkflowNode, step_input: Any) -> None:
+        step = node.step
+        assert step is not None
+        labels = {
+            "workflow_key": self._workflow.key,
+            "workflow_run_id": self._run_id,
+            "stage_name": node.stage_name,
+            "parallel_group": node.parallel_group,
+            "branch_index": node.branch_index,
+        }
+        metadata: dict[str, Any] = {
+            "prompt_runtime_ctx": self._runtime_ctx,
+            **{key: value for key, value in labels.items() if value is not None},
+        }
+        options = RunOptions(max_turns=step.max_turns) if step.max_turns is not None else None
+        try:
+            if self._stream:
+                output, response = await stream_agent_step(
+                    step,
+                    step_input,
+                    self._provider,
+                    self._conversation_id,
+                    metadata,
+                    options,
+                    labels=labels,
+                    emit=self._queue.put,
+                    check_cancel=self._check_cancel,
+                    session_handle=self._session_handle,
+                )
+            else:
+                output, response = await execute_agent_step(
+                    step,
+                    step_input,
+                    self._provider,
+                    self._runtime_ctx,
+                    self._conversation_id,
+                    metadata,
+                    options,
+                    session_handle=self._session_handle,
+                )
+        except Exception as exc:
+            await self._queue.put(_StepDone(node=node, error=exc))
+            return
+        await self._queue.put(_StepDone(node=node, output=output, response=response))
+
+    def _replay(self, node: WorkflowNode, output: Any, response: AgentRunResult) -> None:
+        self.steps.append(self._step_result(node, response))
+        self.replayed_steps.append(node.label())
+        self._resolve(node, output, skipped=False)
+
+    async def _complete(self, done: _StepDone) -> None:
+        node = done.node
+        step = node.step
+        assert step is not None and done.response is not None
+        sequence_no = self._next_sequence_no
+        self._next_sequence_no += 1
+        step_id = await self._recorder.step_end(
+            self._run_id,
+            sequence_no=sequence_no,
+            step_name=step.display_name(),
+            step_agent=step.agent_key,
+            response=done.response,
+            status="succeeded",
+            stage_name=node.stage_name,
+            parallel_group=node.parallel_group,
+            branch_index=node.branch_index,
+            node_id=node.node_id,
+            input_fingerprint=self._fingerprints.pop(node.node_id, None),
+            output=done.output,
+        )
+        result = self._step_result(node, done.response)
+        self.steps.append(result)
+        self._session_window.append((result, step_id))
+        if not self._running:
+            await self._flush_session_delta()
+        self._resolve(node, done.output, skipped=False)
+
+    @staticmethod
+    def _step_result(node: WorkflowNode, response: AgentRunResult) -> WorkflowStepResult:
+        step = node.step
+        assert step is not None
+        return WorkflowStepResult(
+            name=step.display_name(),
+            agent_key=step.agent_key,
+            response=response,
+            stage_name=node.stage_name,
+            parallel_group=node.parallel_group,
+            branch_index=node.branch_index,
+            output_schema=shared_json_schema(step.output_schema),
+        )
+
+    def _resolve(self, node: WorkflowNode, output: Any, *, skipped: bool) -> None:
+        self._outcomes[node.node_id] = _NodeOutcome(output=output, skipped=skipped)
+        for dependent in self._dependents[node.node_id]:
+            self._waiting[dependent] -= 1
+            if self._waiting[dependent] == 0:
+                heapq.heappush(self._ready, (self._order[dependent], dependent))
+
+    async def _flush_session_delta(self) -> None:
+        """Project (and checkpoint) session items added since the graph was last idle.
+
+        Flushing only when no step is running keeps attribution exact for steps that
+        ran alone; items from overlapping steps are attributed by their
+        ``branch_index`` when the provider echoes it.
+        """
+
+        pre_items, window = self._session_cursor, self._session_window
+        self._session_cursor, self._session_window = None, []
+        if pre_items is None or not window:
+            return
+        post_items = await self._session_getter()
+        if not post_items:
+            return
+
+        owned: list[tuple[tuple[WorkflowStepResult, str | None] | None, list[Any]]]
+        if len(window) == 1:
+            owned = [(window[0], list(compute_session_delta(pre_items, post_items)))]
+        else:
+            by_branch = {
+                entry[0].branch_index: entry
+                for entry in window
+                if entry[0].branch_index is not None
+            }
+            owned = []
+            for item in post_items[len(pre_items) :]:
+                branch_index = _branch_index_of(item)
+                owner = by_branch.get(branch_index) if branch_index is not None else None
+                owned.append((owner, [item]))
+
+        for owner, items in owned:
+            if not items:
+                continue
+            result = owner[0] if owner else None
+            await self._ingest_session_delta(
+                pre_items=[],
+                agent=result.agent_key if result else None,
+                model=_response_model(result.response) if result else None,
+                response_id=result.response.response_id if result else None,
+                session_items=items,
+            )
+            if owner is not None:
+                await self._recorder.step_session_items(owner[1], items)
+
+    async def _cancel_running(self) -> None:
+        tasks = list(self._running.values())
+        self._running.clear()
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _branch_index_of(item: Any) -> int | None:
+    def _as_int(value: Any) -> int | None:
+        if isinstance(value, int):
+            return value
+        if isinstance(value, str) and value.isdigit():
+            return int(value)
+        return None
+
+    if isinstance(item, dict):
+        direct = _as_int(item.get("branch_index"))
+        if direct is not None:
+            return direct
+        metadata = item.get("metadata")
+        if isinstance(metadata, dict):
+            return _as_int(metadata.get("branch_index"))
+    return None
+
+
+def _response_model(response: AgentRunResult | None) -> str | None:
+    if response is None:
+        return None
+    metadata = getattr(response, "metadata", None)
+    if isinstance(metadata, dict):
+        model = metadata.get("model")
+        return str(model) if model is not None else None
+    return None
+
+
+__all__ = ["WorkflowGraphScheduler"]
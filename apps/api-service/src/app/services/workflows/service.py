@@ -2,14 +2,20 @@ from __future__ import annotations
 
 import logging
 import uuid
+from collections import deque
 from collections.abc import AsyncIterator, Sequence
 from dataclasses import dataclass
-from datetime import UTC, datetime, timezone
+from datetime import UTC, datetime, timedelta, timezone
 from typing import Any
 
 from app.api.v1.shared.attachments import InputAttachment
 from app.core.settings import get_settings
-from app.domain.workflows import WorkflowRunListPage, WorkflowRunRepository, WorkflowStatus
+from app.domain.workflows import (
+    WorkflowRun,
+    WorkflowRunListPage,
+    WorkflowRunRepository,
+    WorkflowStatus,
+)
 from app.observability.metrics import WORKFLOW_RUN_DELETES_TOTAL
 from app.services.agents.attachments import AttachmentService
 from app.services.agents.context import ConversationActorContext
@@ -22,6 +28,14 @@ from app.services.agents.provider_registry import (
 from app.services.assets.service import AssetService
 from app.services.containers import ContainerService
 from app.services.workflows.catalog import WorkflowCatalogPage, WorkflowCatalogService
+from app.services.workflows.checkpoints import WorkflowRunResume
+from app.services.workflows.dispatch import (
+    WorkflowRunBackend,
+    WorkflowRunDispatcher,
+    WorkflowRunJob,
+    WorkflowRunStreamEntry,
+)
+from app.services.workflows.public_events import project_workflow_events
 from app.services.workflows.runner import WorkflowRunner, WorkflowRunResult
 from app.workflows._shared.registry import WorkflowRegistry, get_workflow_registry
 from app.workflows._shared.specs import WorkflowDescriptor, WorkflowSpec
@@ -54,18 +68,51 @@ class WorkflowService:
     ) -> None:
         self._registry = registry or get_workflow_registry()
         self._catalog_service = catalog_service or WorkflowCatalogService(self._registry)
+        self._cancellations = _CancellationTracker()
+        self._dispatcher: WorkflowRunDispatcher | None = None
         self._runner = WorkflowRunner(
             registry=self._registry,
             provider_registry=provider_registry,
             interaction_builder=interaction_builder,
             run_repository=run_repository,
-            cancellation_tracker=_CancellationTracker(),
+            cancellation_tracker=self._cancellations,
             attachment_service=attachment_service,
             input_attachment_service=input_attachment_service,
             asset_service=asset_service,
             container_service=container_service,
         )
 
+    def configure_dispatch(
+        self,
+        backend: WorkflowRunBackend,
+        *,
+        worker_concurrency: int,
+        max_attempts: int = 3,
+    ) -> None:
+        """Route detached runs and cancel signals through ``backend``.
+
+        ``worker_concurrency`` workers execute queued runs in this process; with 0 the
+        process only enqueues, cancels and serves event streams. A run whose worker
+        died is redelivered (and resumed from its checkpoints) up to ``max_attempts``
+        deliveries in total.
+        """
+
+        self._dispatcher = WorkflowRunDispatcher(
+            backend,
+            execute=self._execute_job,
+            cancellations=self._cancellations,
+            concurrency=worker_concurrency,
+            max_attempts=max_attempts,
+        )
+
+    async def start_dispatch(self) -> None:
+        if self._dispatcher is not None:
+            await self._dispatcher.start()
+
+    async def shutdown(self) -> None:
+        if self._dispatcher is not None:
+            await self._dispatcher.shutdown()
+
     def list_workflows(self) -> Sequence[WorkflowDescriptor]:
         return self._catalog_service.list_workflows()
 
@@ -143,12 +190,20 @@ class WorkflowService:
     async def cancel_run(self, run_id: str, *, tenant_id: str) -> None:
         if not self._runner._run_repository:
             raise RuntimeError("Workflow run repository is not configured")
-        run, _ = await self._runner._run_repository.get_run_with_steps(run_id)
+        try:
+            run, _ = await self._runner._run_repository.get_run_with_steps(run_id)
+        except ValueError:
+            # Detached runs have no row until a worker starts them.
+            job = await self._get_job(run_id, tenant_id=tenant_id)
+            if job is None:
+                raise
+            await self._signal_cancel(run_id)
+            return
         if run.tenant_id != tenant_id:
             raise ValueError("Workflow run not found")
         if run.status != "running":
             raise RuntimeError("Workflow run is not active")
-        self._runner.flag_cancel(run_id)
+        await self._signal_cancel(run_id)
         now = datetime.now(tz=timezone.utc)  # noqa: UP017
         await self._runner._run_repository.cancel_running_steps(run_id, ended_at=now)
         await self._runner._run_repository.cancel_run(run_id, ended_at=now)
@@ -290,6 +345,7 @@ class WorkflowService:
         *,
         request: WorkflowRunRequest,
         actor: ConversationActorContext,
+        run_id: str | None = None,
     ) -> AsyncIterator[Any]:
         spec = self._registry.get(key)
         if spec is None:
@@ -306,8 +362,192 @@ class WorkflowService:
             share_location=request.share_location,
             container_overrides=request.container_overrides,
             vector_store_overrides=request.vector_store_overrides,
+            run_id=run_id,
         )
 
+    async def resume_run_stream(
+        self,
+        run_id: str,
+        *,
+        actor: ConversationActorContext,
+    ) -> tuple[WorkflowRun, AsyncIterator[Any]]:
+        """Continue a failed, cancelled or interrupted run from its step checkpoints.
+
+        Steps whose checkpoint still matches their input are replayed rather than
+        re-executed; the rest run as usual. A ``running`` run is only resumable once
+        its worker has not heartbeated for ``workflow_resume_stale_seconds`` (it died).
+        The run is claimed atomically, so concurrent resumes execute it only once.
+        """
+
+        repository = self._runner._run_repository
+        if not repository:
+            raise RuntimeError("Workflow run repository is not configured")
+        run, steps = await repository.get_run_with_steps(run_id)
+        if run.tenant_id != actor.tenant_id:
+            raise ValueError("Workflow run not found")
+        spec = self._registry.get(run.workflow_key)
+        if spec is None:
+            raise ValueError(f"Workflow '{run.workflow_key}' not found")
+        if run.status == "succeeded":
+            raise RuntimeError("Workflow run already succeeded")
+        if run.conversation_id is None:
+            raise RuntimeError("Workflow run cannot be resumed")
+        now = datetime.now(tz=UTC)
+        stale_after = timedelta(seconds=get_settings().workflow_resume_stale_seconds)
+        if not await repository.claim_run(
+            run.id, stale_before=now - stale_after, claimed_at=now
+        ):
+            raise RuntimeError("Workflow run is still active")
+
+        snapshot = (run.metadata or {}).get("request")
+        if not isinstance(snapshot, dict):
+            snapshot = {}
+        job = WorkflowRunJob(
+            run_id=run.id,
+            workflow_key=run.workflow_key,
+            tenant_id=run.tenant_id,
+            user_id=run.user_id,
+            conversation_id=run.conversation_id,
+            message=run.request_message or "",
+            attachments=snapshot.get("attachments"),
+            location=snapshot.get("location"),
+            share_location=snapshot.get("share_location"),
+            container_overrides=snapshot.get("container_overrides"),
+            vector_store_overrides=snapshot.get("vector_store_overrides"),
+        )
+        request = job.to_request()
+        self._cancellations.discard(run.id)
+        return run, self._runner.run_stream(
+            spec,
+            actor=actor,
+            message=request.message,
+            attachments=request.attachments,
+            conversation_id=run.conversation_id,
+            location=request.location,
+            share_location=request.share_location,
+            container_overrides=request.container_overrides,
+            vector_store_overrides=request.vector_store_overrides,
+            run_id=run.id,
+            resume=WorkflowRunResume.from_steps(steps),
+        )
+
+    async def dispatch_workflow(
+        self,
+        key: str,
+        *,
+        request: WorkflowRunRequest,
+        actor: ConversationActorContext,
+    ) -> WorkflowRunJob:
+        """Queue a run for a worker and return its job (run id) without waiting."""
+
+        spec = self._registry.get(key)
+        if spec is None:
+            raise ValueError(f"Workflow '{key}' not found")
+        dispatcher = self._require_dispatcher()
+        job = WorkflowRunJob.from_request(
+            run_id=str(uuid.uuid4()),
+            workflow_key=spec.key,
+            conversation_id=request.conversation_id or str(uuid.uuid4()),
+            request=request,
+            actor=actor,
+        )
+        await dispatcher.submit(job)
+        return job
+
+    async def stream_run_events(
+        self,
+        run_id: str,
+        *,
+        tenant_id: str,
+        after: str | None = None,
+    ) -> AsyncIterator[WorkflowRunStreamEntry | None]:
+        """Attach to a detached run's public frames, resuming after ``after``."""
+
+        dispatcher = self._require_dispatcher()
+        dispatcher.validate_event_id(after)
+        job = await self._get_job(run_id, tenant_id=tenant_id)
+        if job is None:
+            raise ValueError("Workflow run not found")
+        return dispatcher.events(run_id, after=after)
+
+    async def _execute_job(self, job: WorkflowRunJob) -> AsyncIterator[str]:
+        actor = job.actor()
+
+        async def _events() -> AsyncIterator[Any]:
+            # Opened lazily so bootstrap failures surface as an error frame.
+            stream = await self._redelivered_stream(job) if job.attempt > 1 else None
+            if stream is None:
+                stream = await self.run_workflow_stream(
+                    job.workflow_key,
+                    request=job.to_request(),
+                    actor=actor,
+                    run_id=job.run_id,
+                )
+            async for event in stream:
+                yield event
+
+        async for public_events in project_workflow_events(
+            _events(),
+            workflow_key=job.workflow_key,
+            tenant_id=job.tenant_id,
+            conversation_id=job.conversation_id,
+        ):
+            for event in public_events:
+                yield event.model_dump_json(by_alias=True)
+
+    async def _redelivered_stream(self, job: WorkflowRunJob) -> AsyncIterator[Any] | None:
+        """Resume a run whose previous worker died, or ``None`` if it never recorded a run."""
+
+        repository = self._runner._run_repository
+        spec = self._registry.get(job.workflow_key)
+        if repository is None or spec is None:
+            return None
+        try:
+            run, steps = await repository.get_run_with_steps(job.run_id)
+        except ValueError:
+            return None
+        if run.status == "succeeded":
+            # Finished before the previous worker could acknowledge it.
+            return _no_events()
+        request = job.to_request()
+        return self._runner.run_stream(
+            spec,
+            actor=job.actor(),
+            message=request.message,
+            attachments=request.attachments,
+            conversation_id=job.conversation_id,
+            location=request.location,
+            share_location=request.share_location,
+            container_overrides=request.container_overrides,
+            vector_store_overrides=request.vector_store_overrides,
+            run_id=job.run_id,
+            resume=WorkflowRunResume.from_steps(steps),
+        )
+
+    async def _get_job(self, run_id: str, *, tenant_id: str) -> WorkflowRunJob | None:
+        if self._dispatcher is None:
+            return None
+        job = await self._dispatcher.get_job(run_id)
+        if job is None or job.tenant_id != tenant_id:
+            return None
+        return job
+
+    async def _signal_cancel(self, run_id: str) -> None:
+        if self._dispatcher is not None:
+            await self._dispatcher.cancel(run_id)
+        else:
+            self._runner.flag_cancel(run_id)
+
+    def _require_dispatcher(self) -> WorkflowRunDispatcher:
+        if self._dispatcher is None:
+            raise RuntimeError("Workflow run dispatch is not configured")
+        return self._dispatcher
+
+
+async def _no_events() -> AsyncIterator[Any]:
+    return
+    yield  # pragma: no cover - makes this an async generator
+
 
 def build_workflow_service(
     *,
@@ -349,7 +589,32 @@ __all__ = [
 
 
 class _CancellationTracker(set[str]):
-    """Simple shared cancellation flag set."""
+    """Cancelled run ids visible to this process's runner.
+
+    Fed by local cancels and by the dispatcher's cross-node listener, which hears about
+    every cancelled run in the deployment; the oldest ids are evicted past
+    ``max_entries`` so the set stays bounded.
+    """
+
+    def __init__(self, max_entries: int = 10_000) -> None:
+        super().__init__()
+        self._max_entries = max_entries
+        self._order: deque[str] = deque()
+
+    def add(self, run_id: str) -> None:
+        if run_id in self:
+            return
+        super().add(run_id)
+        self._order.append(run_id)
+        while len(self._order) > self._max_entries:
+            super().discard(self._order.popleft())
+
+    def discard(self, run_id: str) -> None:
+        super().discard(run_id)
+        try:
+            self._order.remove(run_id)
+        except ValueError:
+            pass
 
     def flag(self, run_id: str) -> None:
         self.add(run_id)
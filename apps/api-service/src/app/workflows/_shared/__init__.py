@@ -1,5 +1,10 @@
 """Shared workflow definitions, registry, and loaders."""
 
+from app.workflows._shared.graph import (
+    WorkflowGraph,
+    WorkflowNode,
+    compile_workflow_graph,
+)
 from app.workflows._shared.registry import (
     WorkflowRegistry,
     get_workflow_registry,
@@ -10,8 +15,11 @@ from app.workflows._shared.registry_loader import (
     load_workflow_specs,
 )
 from app.workflows._shared.schema_utils import (
+    CompiledSchema,
     SchemaLike,
+    compile_schema,
     schema_to_json_schema,
+    shared_json_schema,
     validate_against_schema,
 )
 from app.workflows._shared.specs import (
@@ -31,8 +39,14 @@ __all__ = [
     "WorkflowStage",
     "WorkflowStep",
     "WorkflowDescriptor",
+    "WorkflowGraph",
+    "WorkflowNode",
+    "compile_workflow_graph",
+    "CompiledSchema",
     "SchemaLike",
+    "compile_schema",
     "schema_to_json_schema",
+    "shared_json_schema",
     "validate_against_schema",
 ]
 
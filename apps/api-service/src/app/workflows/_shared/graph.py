@@ -0,0 +1,232 @@
+"""Compile workflow specs into dependency graphs for the scheduler."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from app.workflows._shared.specs import WorkflowSpec, WorkflowStage, WorkflowStep
+
+
+@dataclass(frozen=True, slots=True)
+class WorkflowNode:
+    """One schedulable unit of a workflow graph.
+
+    - node_id: unique id within the graph (step name for graph specs)
+    - step: agent step to run; ``None`` marks a join node that only applies ``reducer``
+    - depends_on: upstream node ids whose outputs feed this node
+    - reducer: dotted-path callable joining upstream outputs into this node's input
+    - stage_name / parallel_group / branch_index: observability labels carried into
+      step results, stream events and run records
+    """
+
+    node_id: str
+    step: WorkflowStep | None
+    depends_on: tuple[str, ...] = ()
+    reducer: str | None = None
+    stage_name: str | None = None
+    parallel_group: str | None = None
+    branch_index: int | None = None
+
+    @property
+    def is_join(self) -> bool:
+        return self.step is None
+
+    def label(self) -> str:
+        return self.step.display_name() if self.step is not None else self.node_id
+
+
+@dataclass(frozen=True, slots=True)
+class WorkflowGraph:
+    """Nodes in topological (then declaration) order plus the node producing the output."""
+
+    workflow_key: str
+    nodes: tuple[WorkflowNode, ...]
+    output_node: str
+    max_concurrency: int | None = None
+
+    @property
+    def step_nodes(self) -> list[WorkflowNode]:
+        return [node for node in self.nodes if node.step is not None]
+
+
+def compile_workflow_graph(spec: WorkflowSpec) -> WorkflowGraph:
+    """Build the dependency graph for ``spec``.
+
+    Staged specs compile to an equivalent graph: a sequential step depends on the
+    previous step, parallel branches depend on whatever fed the stage, and each
+    parallel stage ends in a join node applying the stage reducer. Flat steps that
+    declare ``depends_on`` are used as-is, with a join over the sinks when several
+    steps have no dependents.
+
+    Raises ``ValueError`` for duplicate step names, unknown dependencies, cycles,
+    dependency fields used inside explicit stages, or an invalid concurrency cap.
+    """
+
+    if spec.max_concurrency is not None and spec.max_concurrency < 1:
+        raise ValueError(f"Workflow '{spec.key}' max_concurrency must be at least 1")
+
+    if spec.is_graph:
+        nodes, output_node = _graph_nodes(spec)
+    else:
+        nodes, output_node = _staged_nodes(spec, spec.resolved_stages())
+
+    return WorkflowGraph(
+        workflow_key=spec.key,
+        nodes=_topological_order(spec.key, nodes),
+        output_node=output_node,
+        max_concurrency=spec.max_concurrency,
+    )
+
+
+def _staged_nodes(
+    spec: WorkflowSpec, stages: Sequence[WorkflowStage]
+) -> tuple[list[WorkflowNode], str]:
+    nodes: list[WorkflowNode] = []
+    upstream: tuple[str, ...] = ()
+    output_node: str | None = None
+    for stage_index, stage in enumerate(stages):
+        if not stage.steps:
+            raise ValueError(f"Stage '{stage.name}' must include at least one step")
+        for step in stage.steps:
+            if step.depends_on is not None or step.reducer is not None:
+                raise ValueError(
+                    f"Workflow '{spec.key}' step '{step.display_name()}' declares "
+                    "depends_on/reducer inside a stage; use flat steps for dependency graphs"
+                )
+        if stage.mode == "parallel":
+            branch_ids: list[str] = []
+            for branch_index, step in enumerate(stage.steps):
+                node_id = f"{stage_index}:{branch_index}"
+                nodes.append(
+                    WorkflowNode(
+                        node_id=node_id,
+                        step=step,
+                        depends_on=upstream,
+                        stage_name=stage.name,
+                        parallel_group=stage.name,
+                        branch_index=branch_index,
+                    )
+                )
+                branch_ids.append(node_id)
+            join_id = f"{stage_index}:join"
+            nodes.append(
+                WorkflowNode(
+                    node_id=join_id,
+                    step=None,
+                    depends_on=tuple(branch_ids),
+                    reducer=stage.reducer,
+                    stage_name=stage.name,
+                    parallel_group=stage.name,
+                )
+            )
+            output_node = join_id
+            upstream = (join_id,)
+        else:
+            for step_index, step in enumerate(stage.steps):
+                node_id = f"{stage_index}:{step_index}"
+                nodes.append(
+                    WorkflowNode(
+                        node_id=node_id,
+                        step=step,
+                        depends_on=upstream,
+                        stage_name=stage.name,
+                    )
+                )
+                output_node = node_id
+                upstream = (node_id,)
+
+    if output_node is None:
+        raise ValueError(f"Workflow '{spec.key}' must define at least one stage/step")
+    return nodes, output_node
+
+
+def _graph_nodes(spec: WorkflowSpec) -> tuple[list[WorkflowNode], str]:
+    steps = list(spec.steps or ())
+    names = [step.display_name() for step in steps]
+    seen: set[str] = set()
+    for name in names:
+        if name in seen:
+            raise ValueError(
+                f"Workflow '{spec.key}' has duplicate step name '{name}'; "
+                "step names must be unique when steps declare depends_on"
+            )
+        seen.add(name)
+
+    stage_name = spec.resolved_stages()[0].name
+    nodes: list[WorkflowNode] = []
+    consumed: set[str] = set()
+    for index, step in enumerate(steps):
+        depends_on = tuple(step.depends_on or ())
+        for dependency in depends_on:
+            if dependency not in seen:
+                raise ValueError(
+                    f"Workflow '{spec.key}' step '{step.display_name()}' depends on "
+                    f"unknown step '{dependency}'"
+                )
+        if len(set(depends_on)) != len(depends_on):
+            raise ValueError(
+                f"Workflow '{spec.key}' step '{step.display_name()}' lists a dependency twice"
+            )
+        consumed.update(depends_on)
+        nodes.append(
+            WorkflowNode(
+                node_id=step.display_name(),
+                step=step,
+                depends_on=depends_on,
+                reducer=step.reducer,
+                stage_name=stage_name,
+                parallel_group=stage_name,
+                branch_index=index,
+            )
+        )
+
+    sinks = tuple(node.node_id for node in nodes if node.node_id not in consumed)
+    if len(sinks) == 1:
+        return nodes, sinks[0]
+    if not sinks:
+        # Every step feeds another one, so the graph cannot be acyclic; let the
+        # topological sort report which steps form the cycle.
+        return nodes, nodes[-1].node_id if nodes else ""
+    join_id = f"{stage_name}:join"
+    nodes.append(
+        WorkflowNode(
+            node_id=join_id,
+            step=None,
+            depends_on=sinks,
+            stage_name=stage_name,
+            parallel_group=stage_name,
+        )
+    )
+    return nodes, join_id
+
+
+def _topological_order(workflow_key: str, nodes: list[WorkflowNode]) -> tuple[WorkflowNode, ...]:
+    remaining = {node.node_id: len(node.depends_on) for node in nodes}
+    dependents: dict[str, list[str]] = {node.node_id: [] for node in nodes}
+    for node in nodes:
+        for dependency in node.depends_on:
+            dependents[dependency].append(node.node_id)
+
+    by_id = {node.node_id: node for node in nodes}
+    declaration_order = {node.node_id: index for index, node in enumerate(nodes)}
+    ready = [node.node_id for node in nodes if remaining[node.node_id] == 0]
+    ordered: list[WorkflowNode] = []
+    while ready:
+        ready.sort(key=declaration_order.__getitem__)
+        node_id = ready.pop(0)
+        ordered.append(by_id[node_id])
+        for dependent in dependents[node_id]:
+            remaining[dependent] -= 1
+            if remaining[dependent] == 0:
+                ready.append(dependent)
+
+    if len(ordered) != len(nodes):
+        cyclic = [by_id[node_id].label() for node_id, count in remaining.items() if count > 0]
+        raise ValueError(
+            f"Workflow '{workflow_key}' has a dependency cycle involving: {', '.join(cyclic)}"
+        )
+    return tuple(ordered)
+
+
+__all__ = ["WorkflowGraph", "WorkflowNode", "compile_workflow_graph"]
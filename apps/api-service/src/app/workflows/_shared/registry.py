@@ -6,8 +6,9 @@ from collections.abc import Sequence
 
 from app.agents._shared.registry_loader import load_agent_specs
 from app.agents._shared.specs import AgentSpec
+from app.workflows._shared.graph import compile_workflow_graph
 from app.workflows._shared.registry_loader import load_workflow_specs
-from app.workflows._shared.schema_utils import schema_to_json_schema
+from app.workflows._shared.schema_utils import SchemaLike, compile_schema
 from app.workflows._shared.specs import WorkflowDescriptor, WorkflowSpec
 
 
@@ -25,6 +26,12 @@ def _import_callable(path: str, label: str):
     return obj
 
 
+def _precompile(schema: SchemaLike) -> None:
+    compiled = compile_schema(schema)
+    if compiled is not None:
+        compiled.ensure_compiled()
+
+
 class WorkflowRegistry:
     def __init__(
         self,
@@ -61,8 +68,8 @@ class WorkflowRegistry:
                 raise ValueError(f"Duplicate workflow key '{spec.key}'")
             seen_keys.add(spec.key)
             self._validate_steps(spec)
-            # Fail fast if schema is malformed
-            schema_to_json_schema(spec.output_schema)
+            # Fail fast if schema is malformed; compiled validators are cached for runs.
+            _precompile(spec.output_schema)
             self._descriptors[spec.key] = WorkflowDescriptor(
                 key=spec.key,
                 display_name=spec.display_name,
@@ -96,7 +103,11 @@ class WorkflowRegistry:
                     _import_callable(step.guard, "guard")
                 if step.input_mapper:
                     _import_callable(step.input_mapper, "input_mapper")
-                schema_to_json_schema(step.output_schema)
+                if step.reducer:
+                    _import_callable(step.reducer, "reducer")
+                _precompile(step.output_schema)
+        # Rejects missing dependencies, duplicate graph step names and cycles.
+        compile_workflow_graph(spec)
 
 
 _WORKFLOW_REGISTRY: WorkflowRegistry | None = None
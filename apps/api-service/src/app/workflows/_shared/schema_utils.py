@@ -1,13 +1,82 @@
 """Helpers for workflow output typing and validation."""
 from __future__ import annotations
 
+import copy
+import threading
+from collections import OrderedDict
 from typing import Any
 
-import jsonschema
 from agents.agent_output import AgentOutputSchema, AgentOutputSchemaBase
+from jsonschema.exceptions import best_match
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
 
 SchemaLike = AgentOutputSchemaBase | dict[str, Any] | type[Any] | None
 
+_CACHE_MAX_ENTRIES = 512
+
+
+class CompiledSchema:
+    """A workflow/step output schema normalized to JSON Schema with a reusable validator.
+
+    The validator class is chosen from the schema's ``$schema`` draft and the schema
+    is checked once, so validating an output only walks the instance.
+    """
+
+    __slots__ = ("json_schema", "_validator")
+
+    def __init__(self, json_schema: dict[str, Any]) -> None:
+        self.json_schema = json_schema
+        self._validator: Validator | None = None
+
+    def ensure_compiled(self) -> Validator:
+        """Check the schema and build its validator (once); raises if the schema is invalid."""
+
+        if self._validator is None:
+            validator_cls = validator_for(self.json_schema)
+            validator_cls.check_schema(self.json_schema)
+            self._validator = validator_cls(self.json_schema)
+        return self._validator
+
+    @property
+    def validator(self) -> Validator:
+        return self.ensure_compiled()
+
+    def validate(self, value: Any, *, label: str | None = None) -> Any:
+        if value is None:
+            return value
+        error = best_match(self.validator.iter_errors(value))
+        if error is not None:
+            label_txt = label or "output"
+            raise ValueError(f"{label_txt} does not match declared schema: {error.message}")
+        return value
+
+
+# Specs are static, so schemas are cached by object identity; each entry keeps its
+# source alive so an id is never reused while cached.
+_compiled: OrderedDict[int, tuple[Any, CompiledSchema]] = OrderedDict()
+_compiled_lock = threading.Lock()
+
+
+def compile_schema(schema: SchemaLike) -> CompiledSchema | None:
+    """Return the cached compiled form of ``schema`` (``None`` when no schema is set)."""
+
+    if schema is None:
+        return None
+    key = id(schema)
+    with _compiled_lock:
+        entry = _compiled.get(key)
+        if entry is not None and entry[0] is schema:
+            _compiled.move_to_end(key)
+            return entry[1]
+    compiled = CompiledSchema(_to_json_schema(schema))
+    with _compiled_lock:
+        _compiled[key] = (schema, compiled)
+        _compiled.move_to_end(key)
+        while len(_compiled) > _CACHE_MAX_ENTRIES:
+            _compiled.popitem(last=False)
+    return compiled
+
 
 def schema_to_json_schema(schema: SchemaLike) -> dict[str, Any] | None:
     """Normalize a workflow/step output schema to a JSON Schema dict.
@@ -17,10 +86,27 @@ def schema_to_json_schema(schema: SchemaLike) -> dict[str, Any] | None:
     - A Python type (wrapped via `AgentOutputSchema`)
     - A raw JSON schema dict
     - None (returns None)
+
+    The result is a copy, so callers may modify it without touching the cached schema.
     """
 
-    if schema is None:
-        return None
+    compiled = compile_schema(schema)
+    return copy.deepcopy(compiled.json_schema) if compiled is not None else None
+
+
+def shared_json_schema(schema: SchemaLike) -> dict[str, Any] | None:
+    """Like ``schema_to_json_schema`` but returns the cached dict itself.
+
+    For internal hot paths (step results, checkpoint fingerprints) that only read the
+    schema; it must not be modified. Copy with ``schema_to_json_schema`` instead when
+    the schema is handed to code that may mutate it.
+    """
+
+    compiled = compile_schema(schema)
+    return compiled.json_schema if compiled is not None else None
+
+
+def _to_json_schema(schema: SchemaLike) -> dict[str, Any]:
     if isinstance(schema, dict):
         return schema
     if isinstance(schema, AgentOutputSchemaBase):
@@ -41,17 +127,17 @@ def validate_against_schema(
     payload does not satisfy the schema.
     """
 
-    schema_dict = schema_to_json_schema(schema)
-    if schema_dict is None or value is None:
+    compiled = compile_schema(schema)
+    if compiled is None:
         return value
+    return compiled.validate(value, label=label)
 
-    try:
-        jsonschema.validate(instance=value, schema=schema_dict)
-    except jsonschema.ValidationError as exc:  # pragma: no cover - thin wrapper
-        label_txt = label or "output"
-        raise ValueError(f"{label_txt} does not match declared schema: {exc.message}") from exc
-    return value
-
-
-__all__ = ["SchemaLike", "schema_to_json_schema", "validate_against_schema"]
 
+__all__ = [
+    "CompiledSchema",
+    "SchemaLike",
+    "compile_schema",
+    "schema_to_json_schema",
+    "shared_json_schema",
+    "validate_against_schema",
+]
@@ -21,6 +21,12 @@ class WorkflowStep:
     - max_turns: optional override of RunOptions.max_turns per step
     - output_schema: optional JSON schema (or AgentOutputSchema) describing the
       structured output of this step; if provided, outputs are validated.
+    - depends_on: names of upstream steps (flat ``steps`` only). Declaring it on any
+      step turns the workflow into a dependency graph: each step starts as soon as
+      its upstream steps finish, and steps without dependencies start immediately.
+    - reducer: dotted-path callable joining the outputs of ``depends_on`` into this
+      step's input; if omitted, a single upstream output is forwarded as-is and
+      several become a list.
     """
 
     agent_key: str
@@ -31,6 +37,8 @@ class WorkflowStep:
     input_mapper_type: InputMapperType | None = "function"
     max_turns: int | None = None
     output_schema: SchemaLike = None
+    depends_on: Sequence[str] | None = None
+    reducer: str | None = None
 
     def display_name(self) -> str:
         return self.name or self.agent_key
@@ -69,6 +77,7 @@ class WorkflowSpec:
     default: bool = False
     allow_handoff_agents: bool = False  # optional guardrail for strict chains
     output_schema: SchemaLike = None  # optional final output schema
+    max_concurrency: int | None = None  # cap on steps executing at once within a run
 
     def ensure_valid(self) -> None:
         resolved = self.resolved_stages()
@@ -82,9 +91,20 @@ class WorkflowSpec:
 
         if self.stages and len(self.stages) > 0:
             return list(self.stages)
+        if self.is_graph:
+            # Dependency graphs have no stage barriers; expose them as one parallel group.
+            return [WorkflowStage(name="stage-1", steps=self.steps or (), mode="parallel")]
         # Backward compatibility: wrap flat steps in a single sequential stage.
         return [WorkflowStage(name="stage-1", steps=self.steps or (), mode="sequential")]
 
+    @property
+    def is_graph(self) -> bool:
+        """True when flat steps declare ``depends_on`` instead of relying on order."""
+
+        if self.stages:
+            return False
+        return any(step.depends_on is not None for step in self.steps or ())
+
     @property
     def step_count(self) -> int:
         return sum(len(stage.steps) for stage in self.resolved_stages())
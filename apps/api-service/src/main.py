@@ -12,11 +12,16 @@ from app.api.errors import register_exception_handlers
 from app.api.openapi import build_openapi_schema
 from app.api.router import api_router
 from app.bootstrap import (
+    ProcessRole,
     get_container,
     shutdown_container,
+    start_singleton_job,
+    wire_asset_service,
+    wire_chat_run_manager,
     wire_conversation_query_service,
     wire_storage_service,
     wire_title_service,
+    wire_workflow_services,
 )
 from app.core.provider_validation import (
     ProviderViolation,
@@ -36,6 +41,7 @@ from app.infrastructure.db import (
     dispose_engine,
     get_async_sessionmaker,
     get_engine,
+    get_read_sessionmaker,
     init_engine,
 )
 from app.infrastructure.persistence.activity import (
@@ -69,7 +75,10 @@ from app.infrastructure.redis.factory import get_redis_factory
 from app.infrastructure.redis_types import RedisBytesClient
 from app.infrastructure.security.secret_manager import configure_secret_manager_client
 from app.middleware.logging import LoggingMiddleware
+from app.middleware.metrics import HttpMetricsMiddleware
+from app.middleware.read_your_writes import ReadYourWritesMiddleware
 from app.observability.logging import configure_logging
+from app.observability.metrics import mark_process_exited
 from app.presentation import health as health_routes
 from app.presentation import metrics as metrics_routes
 from app.presentation import well_known as well_known_routes
@@ -85,6 +94,7 @@ from app.services.auth_service import AuthService
 from app.services.billing.payment_gateway import get_payment_gateway
 from app.services.geoip_service import build_geoip_service
 from app.services.integrations.slack_notifier import build_slack_notifier
+from app.services.shared.event_partitions import EventPartitionMaintainer
 from app.services.signup.email_verification_service import build_email_verification_service
 from app.services.signup.invite_service import build_invite_service
 from app.services.signup.password_recovery_service import build_password_recovery_service
@@ -157,8 +167,12 @@ def _log_provider_violations(violations: list[ProviderViolation]) -> None:
 
 
 @asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Handle application lifespan events."""
+async def application_runtime(role: ProcessRole = "api"):
+    """Wire services and start background jobs for an API or worker process.
+
+    Singleton jobs start through leader election; API processes skip them when
+    ``BACKGROUND_JOBS_MODE=dedicated`` leaves them to ``src/worker.py``.
+    """
     settings = get_settings()
     provider_violations = validate_providers(settings)
     if provider_violations:
@@ -221,10 +235,14 @@ async def lifespan(app: FastAPI):
         raise RuntimeError("Database engine failed to initialise; cannot configure sessions.")
     session_factory = get_async_sessionmaker()
     container.session_factory = session_factory
+    read_session_factory = get_read_sessionmaker()
+    container.read_session_factory = read_session_factory
     logger.debug("Startup checkpoint: session factory configured")
 
     container.activity_service = ActivityService()
-    activity_repo = SqlAlchemyActivityEventRepository(session_factory)
+    activity_repo = SqlAlchemyActivityEventRepository(
+        session_factory, read_session_factory=read_session_factory
+    )
     container.activity_service.set_repository(activity_repo)
     activity_inbox_repo = SqlAlchemyActivityInboxRepository(session_factory)
     container.activity_service.set_inbox_repository(activity_inbox_repo)
@@ -256,7 +274,9 @@ async def lifespan(app: FastAPI):
         repo_already_set = False
 
     if not repo_already_set:
-        postgres_repository = PostgresConversationRepository(session_factory)
+        postgres_repository = PostgresConversationRepository(
+            session_factory, read_session_factory=read_session_factory
+        )
         container.conversation_service.set_repository(postgres_repository)
     logger.debug("Startup checkpoint: conversation repository configured")
     try:
@@ -437,7 +457,9 @@ async def lifespan(app: FastAPI):
             worker.configure(
                 repository=stripe_repo, dispatcher=container.stripe_event_dispatcher
             )
-            await worker.start()
+            await start_singleton_job(
+                container, "stripe-dispatch-retry", worker, settings=settings, role=role
+            )
         else:
             logger.info("Stripe dispatch retry worker disabled by configuration")
 
@@ -503,13 +525,65 @@ async def lifespan(app: FastAPI):
             settings_factory=lambda: settings,
             client_factory=container.vector_store_service.openai_client,
         )
-        await container.vector_store_sync_worker.start()
+        await start_singleton_job(
+            container,
+            "vector-store-sync",
+            container.vector_store_sync_worker,
+            settings=settings,
+            role=role,
+        )
     logger.debug("Startup checkpoint: vector sync worker configured")
+
+    # Monthly event partitions (Postgres): create upcoming months well ahead so new
+    # rows never land in the DEFAULT partition.
+    container.event_partition_maintainer = EventPartitionMaintainer(
+        session_factory=session_factory,
+        months_ahead=settings.event_partitions_months_ahead,
+    )
+    await start_singleton_job(
+        container,
+        "event-partitions",
+        container.event_partition_maintainer,
+        settings=settings,
+        role=role,
+    )
+
+    # Thumbnails for image assets stored before thumbnails were on or whose render was lost.
+    if settings.asset_thumbnails_enabled:
+        wire_asset_service(container)
+        if container.asset_thumbnail_backfill is not None:
+            await start_singleton_job(
+                container,
+                "asset-thumbnail-backfill",
+                container.asset_thumbnail_backfill,
+                settings=settings,
+                role=role,
+            )
+
+    # Detached chat runs: SSE frames are buffered per run so clients can resume.
+    wire_chat_run_manager(container)
+
+    # Detached workflow runs: with a shared backend every node listens for cancel
+    # signals and (when WORKFLOW_WORKER_CONCURRENCY > 0) executes queued runs.
+    if settings.workflow_run_backend == "redis":
+        wire_workflow_services(container)
+        if container.workflow_service is None:  # pragma: no cover - defensive
+            raise RuntimeError("Workflow service failed to initialize")
+        await container.workflow_service.start_dispatch()
+    logger.debug("Startup checkpoint: workflow dispatch configured")
     try:
         yield
     finally:
         await shutdown_container()
         await dispose_engine()
+        mark_process_exited()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Handle application lifespan events."""
+    async with application_runtime(role="api"):
+        yield
 
 
 # =============================================================================
@@ -557,9 +631,16 @@ def create_application() -> FastAPI:
         allow_headers=settings.get_allowed_headers_list(),
     )
 
+    # Read-your-writes scope for read-replica routing
+    if settings.database_replica_url:
+        app.add_middleware(ReadYourWritesMiddleware)
+
     # Custom logging middleware
     app.add_middleware(LoggingMiddleware)
 
+    # Per-route RED metrics (outermost, so the timing covers the whole stack)
+    app.add_middleware(HttpMetricsMiddleware)
+
     # =============================================================================
     # ROUTER REGISTRATION
     # =============================================================================
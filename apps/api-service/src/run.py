@@ -5,6 +5,7 @@
 
 import os
 import sys
+import tempfile
 from pathlib import Path
 
 import uvicorn
@@ -50,6 +51,24 @@ def get_server_config():
         "workers": int(os.getenv("WORKERS", "1")),
     }
 
+
+def configure_metrics(workers: int):
+    """Enable Prometheus multiprocess mode so /metrics aggregates every worker.
+
+    Must run before the workers import prometheus_client; stale files from a
+    previous run are removed so counters start from zero.
+    """
+    if workers <= 1:
+        return
+    metrics_dir = Path(
+        os.getenv("PROMETHEUS_MULTIPROC_DIR") or tempfile.mkdtemp(prefix="api-service-metrics-")
+    )
+    metrics_dir.mkdir(parents=True, exist_ok=True)
+    for stale in metrics_dir.glob("*.db"):
+        stale.unlink()
+    os.environ["PROMETHEUS_MULTIPROC_DIR"] = str(metrics_dir)
+    print(f"📊 Prometheus multiprocess metrics in {metrics_dir}")
+
 # =============================================================================
 # MAIN EXECUTION
 # =============================================================================
@@ -63,6 +82,8 @@ def main():
     
     # Get server configuration
     config = get_server_config()
+    workers = config["workers"] if not config["reload"] else 1
+    configure_metrics(workers)
     
     print(f"📍 Server will run on http://{config['host']}:{config['port']}")
     print(f"🔄 Reload mode: {'enabled' if config['reload'] else 'disabled'}")
@@ -76,7 +97,7 @@ def main():
             port=config["port"],
             reload=config["reload"],
             log_level=config["log_level"],
-            workers=config["workers"] if not config["reload"] else 1,
+            workers=workers,
             access_log=True,
         )
     except KeyboardInterrupt:
@@ -0,0 +1,41 @@
+"""Dedicated background worker entry point for api-service.
+
+Wires the same services as the API but serves no HTTP. It starts the
+singleton background jobs (Stripe dispatch retries, vector store sync) under
+leader election, plus workflow dispatch when the Redis run backend is on.
+Pair it with ``BACKGROUND_JOBS_MODE=dedicated`` on the API replicas so web
+processes leave those jobs alone. Any number of worker replicas may run: each
+job executes on whichever worker holds its lease.
+
+Run with ``python src/worker.py`` (or ``just worker``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import signal
+
+from main import application_runtime
+
+logger = logging.getLogger(__name__)
+
+
+async def run_worker() -> None:
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+
+    async with application_runtime(role="worker"):
+        logger.info("worker.started")
+        await stop_event.wait()
+        logger.info("worker.stopping")
+
+
+def main() -> None:
+    asyncio.run(run_worker())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+"""Offline throughput benchmarks for streamed chat turns.
+
+Each round drives ``POST /api/v1/chat/stream`` end to end (auth, rate limits, agent
+service, public stream projection, ledger, detached run buffer and SSE framing)
+against the deterministic synthetic provider, so the numbers measure the service
+rather than a model. Frames are timestamped when the app sends them, because the
+TestClient transport buffers whole response bodies. Profiles emit events back to
+back, so the gap between consecutive frames is the service's per-event overhead.
+
+Reported per benchmark (``extra_info``): chat turns/sec, SSE frames/sec and p95
+per-event overhead. Runs fail when p95 overhead exceeds
+``BENCH_MAX_P95_EVENT_OVERHEAD_MS``, or, with ``--benchmark-compare-fail``, when
+timings regress against a saved baseline (see ``just bench-chat``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import statistics
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+import pytest
+import pytest_asyncio
+from fastapi.testclient import TestClient
+
+from tests.utils.contract_auth import make_user_payload, override_current_user
+from tests.utils.contract_env import configure_contract_env
+
+configure_contract_env()
+
+pytestmark = [
+    pytest.mark.auto_migrations(enabled=True),
+    pytest.mark.benchmark(group="chat-stream"),
+]
+
+import main  # noqa: E402
+from app.core import settings as config_module  # noqa: E402
+from app.infrastructure.db.engine import init_engine  # noqa: E402
+from tests.utils.synthetic_agent_provider import (  # noqa: E402
+    SyntheticAgentProvider,
+    SyntheticProfile,
+    build_synthetic_provider,
+)
+
+PROFILES: dict[str, SyntheticProfile] = {
+    "text": SyntheticProfile(output_tokens=64),
+    "tools": SyntheticProfile(output_tokens=64, tool_calls=3),
+    "large_events": SyntheticProfile(
+        output_tokens=64, tool_calls=1, delta_padding_bytes=2048, tool_output_bytes=16384
+    ),
+}
+ROUNDS = 30
+CONCURRENT_TURNS = 8
+MAX_P95_EVENT_OVERHEAD_MS = float(os.getenv("BENCH_MAX_P95_EVENT_OVERHEAD_MS", "25"))
+_REQUEST_BODY = json.dumps({"message": "benchmark turn"}).encode()
+
+
+@dataclass(slots=True)
+class _Turn:
+    status: int = 0
+    frames: list[dict[str, Any]] = field(default_factory=list)
+    sent_at: list[float] = field(default_factory=list)
+
+    def gaps(self) -> list[float]:
+        pairs = zip(self.sent_at, self.sent_at[1:], strict=False)
+        return [later - earlier for earlier, later in pairs]
+
+
+async def _stream_turn() -> _Turn:
+    """Call the ASGI app directly and timestamp each SSE frame as it is sent."""
+
+    turn = _Turn()
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/api/v1/chat/stream",
+        "raw_path": b"/api/v1/chat/stream",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [
+            (b"host", b"testserver"),
+            (b"user-agent", b"testclient"),
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(_REQUEST_BODY)).encode()),
+        ],
+        "client": ("testclient", 50000),
+        "server": ("testserver", 80),
+    }
+    request_sent = False
+
+    async def receive() -> dict[str, Any]:
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": _REQUEST_BODY, "more_body": False}
+        await asyncio.Event().wait()  # the client never disconnects
+        raise AssertionError("unreachable")
+
+    async def send(message: dict[str, Any]) -> None:
+        if message["type"] == "http.response.start":
+            turn.status = message["status"]
+            return
+        body = message.get("body", b"")
+        for block in body.decode().split("\n\n"):
+            for line in block.splitlines():
+                if line.startswith("data: "):
+                    turn.sent_at.append(time.perf_counter())
+                    turn.frames.append(json.loads(line[len("data: ") :]))
+
+    await main.app(scope, receive, send)
+    return turn
+
+
+async def _concurrent_turns(count: int) -> list[_Turn]:
+    return list(await asyncio.gather(*(_stream_turn() for _ in range(count))))
+
+
+def _p95(values: list[float]) -> float:
+    return statistics.quantiles(values, n=20, method="inclusive")[18]
+
+
+def _assert_complete(turn: _Turn, profile: SyntheticProfile) -> None:
+    assert turn.status == 200
+    kinds = [frame["kind"] for frame in turn.frames]
+    assert kinds[-1] == "final", kinds[-3:]
+    assert kinds.count("message.delta") == profile.output_tokens
+
+
+def _record(benchmark: Any, turns: list[_Turn], *, turns_per_round: int = 1) -> float:
+    mean = benchmark.stats.stats.mean
+    frames_per_turn = statistics.mean(len(turn.frames) for turn in turns)
+    gaps_ms = [gap * 1000 for turn in turns for gap in turn.gaps()]
+    p95_overhead_ms = _p95(gaps_ms)
+    benchmark.extra_info.update(
+        {
+            "turns_per_sec": round(turns_per_round / mean, 2),
+            "frames_per_turn": frames_per_turn,
+            "sse_frames_per_sec": round(turns_per_round * frames_per_turn / mean, 1),
+            "p95_event_overhead_ms": round(p95_overhead_ms, 3),
+        }
+    )
+    return p95_overhead_ms
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def _ensure_engine_initialized() -> None:
+    await init_engine(run_migrations=True)
+
+
+@pytest.fixture
+def synthetic_provider(monkeypatch: pytest.MonkeyPatch) -> SyntheticAgentProvider:
+    provider = build_synthetic_provider()
+    # Same seam as the HTTP smoke server: the app lifespan registers this provider.
+    monkeypatch.setattr(main, "build_openai_provider", lambda **_: provider)
+    # Benchmarks start hundreds of streams per minute; lift the per-user chat quotas.
+    monkeypatch.setenv("CHAT_STREAM_RATE_LIMIT_PER_MINUTE", "1000000")
+    monkeypatch.setenv("CHAT_STREAM_CONCURRENT_LIMIT", "1000")
+    config_module.get_settings.cache_clear()
+    return provider
+
+
+@pytest.fixture
+def chat_client(synthetic_provider: SyntheticAgentProvider) -> Iterator[TestClient]:
+    with override_current_user(main.app, lambda: make_user_payload()):
+        with TestClient(main.app) as client:
+            yield client
+
+
+@pytest.mark.parametrize("profile_name", sorted(PROFILES))
+def test_chat_turn(
+    benchmark: Any,
+    chat_client: TestClient,
+    synthetic_provider: SyntheticAgentProvider,
+    profile_name: str,
+) -> None:
+    profile = PROFILES[profile_name]
+    synthetic_provider.profile = profile
+    turns: list[_Turn] = []
+
+    def _one_turn() -> None:
+        turns.append(chat_client.portal.call(_stream_turn))
+
+    benchmark.pedantic(_one_turn, rounds=ROUNDS, warmup_rounds=3, iterations=1)
+
+    for turn in turns:
+        _assert_complete(turn, profile)
+    p95_overhead_ms = _record(benchmark, turns[-ROUNDS:])
+    assert p95_overhead_ms <= MAX_P95_EVENT_OVERHEAD_MS, (
+        f"p95 per-event overhead {p95_overhead_ms:.3f}ms exceeds "
+        f"{MAX_P95_EVENT_OVERHEAD_MS}ms budget"
+    )
+
+
+def test_concurrent_chat_turns(
+    benchmark: Any,
+    chat_client: TestClient,
+    synthetic_provider: SyntheticAgentProvider,
+) -> None:
+    profile = PROFILES["text"]
+    synthetic_provider.profile = profile
+    rounds: list[list[_Turn]] = []
+
+    def _one_round() -> None:
+        rounds.append(chat_client.portal.call(_concurrent_turns, CONCURRENT_TURNS))
+
+    benchmark.pedantic(_one_round, rounds=ROUNDS // 3, warmup_rounds=1, iterations=1)
+
+    turns = [turn for batch in rounds for turn in batch]
+    for turn in turns:
+        _assert_complete(turn, profile)
+    _record(benchmark, turns, turns_per_round=CONCURRENT_TURNS)
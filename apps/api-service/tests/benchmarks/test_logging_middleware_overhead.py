@@ -0,0 +1,137 @@
+"""Per-request overhead of the request logging middleware.
+
+Compares the pure-ASGI ``LoggingMiddleware`` with the ``BaseHTTPMiddleware``
+implementation it replaced (reproduced below) and with no middleware at all, on a
+trivial endpoint called directly through ASGI so transport costs do not dilute the
+difference. ``extra_info["per_request_us"]`` is the mean time per request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import uuid
+from collections.abc import Awaitable, Callable, Iterator
+from typing import Any
+
+import pytest
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import PlainTextResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.middleware.logging import LoggingMiddleware
+from app.observability.logging import log_context, log_event
+
+pytestmark = pytest.mark.benchmark(group="logging-middleware")
+
+REQUESTS_PER_ROUND = 200
+_SCOPE: dict[str, Any] = {
+    "type": "http",
+    "asgi": {"version": "3.0", "spec_version": "2.4"},
+    "http_version": "1.1",
+    "method": "GET",
+    "scheme": "http",
+    "path": "/ping",
+    "raw_path": b"/ping",
+    "root_path": "",
+    "query_string": b"",
+    "headers": [(b"host", b"testserver"), (b"user-agent", b"bench")],
+    "client": ("127.0.0.1", 50000),
+    "server": ("testserver", 80),
+}
+
+
+class _BaseHTTPLoggingMiddleware(BaseHTTPMiddleware):
+    """The previous implementation, kept for comparison."""
+
+    async def dispatch(
+        self,
+        request: Request,
+        call_next: Callable[[Request], Awaitable[Response]],
+    ) -> Response:
+        correlation_id = str(uuid.uuid4())
+        request.state.correlation_id = correlation_id
+        start_time = time.perf_counter()
+        client_ip = request.client.host if request.client else None
+        with log_context(
+            correlation_id=correlation_id,
+            http_method=request.method,
+            http_path=str(request.url),
+            client_ip=client_ip,
+        ):
+            log_event(
+                "http.request",
+                method=request.method,
+                path=str(request.url),
+                client_ip=client_ip,
+                user_agent=request.headers.get("user-agent"),
+            )
+            response = await call_next(request)
+            process_time = time.perf_counter() - start_time
+            log_event(
+                "http.response",
+                status_code=response.status_code,
+                duration_ms=round(process_time * 1000, 3),
+                content_length=response.headers.get("content-length"),
+                content_type=response.headers.get("content-type"),
+            )
+            response.headers["X-Correlation-ID"] = correlation_id
+            response.headers["X-Process-Time"] = str(round(process_time, 4))
+            return response
+
+
+_MIDDLEWARE: dict[str, type[Any] | None] = {
+    "none": None,
+    "asgi": LoggingMiddleware,
+    "base_http": _BaseHTTPLoggingMiddleware,
+}
+
+
+def _app(middleware: type[Any] | None) -> FastAPI:
+    app = FastAPI()
+    if middleware is not None:
+        app.add_middleware(middleware)
+
+    @app.get("/ping")
+    async def ping() -> PlainTextResponse:
+        return PlainTextResponse("pong")
+
+    return app
+
+
+async def _requests(app: FastAPI, count: int) -> None:
+    async def receive() -> dict[str, Any]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict[str, Any]) -> None:
+        return None
+
+    for _ in range(count):
+        await app(dict(_SCOPE), receive, send)
+
+
+@pytest.fixture
+def event_loop_runner() -> Iterator[asyncio.AbstractEventLoop]:
+    loop = asyncio.new_event_loop()
+    try:
+        yield loop
+    finally:
+        loop.close()
+
+
+@pytest.mark.parametrize("implementation", list(_MIDDLEWARE))
+def test_logging_middleware_overhead(
+    benchmark: Any, event_loop_runner: asyncio.AbstractEventLoop, implementation: str
+) -> None:
+    app = _app(_MIDDLEWARE[implementation])
+
+    benchmark.pedantic(
+        lambda: event_loop_runner.run_until_complete(_requests(app, REQUESTS_PER_ROUND)),
+        rounds=20,
+        warmup_rounds=2,
+        iterations=1,
+    )
+
+    benchmark.extra_info["per_request_us"] = round(
+        benchmark.stats.stats.mean / REQUESTS_PER_ROUND * 1_000_000, 2
+    )
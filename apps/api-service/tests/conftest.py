@@ -63,6 +63,7 @@ from app.domain.conversations import (
     ConversationSessionState,
     ConversationRunUsage,
     ConversationSummary,
+    ConversationTurn,
     MessagePage,
 )
 from app.infrastructure.persistence.models.base import Base
@@ -131,7 +132,7 @@ def pytest_configure(config: pytest.Config) -> None:
 
 
 def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
-    """Skip Stripe replay tests unless explicitly enabled."""
+    """Skip Stripe replay, manual and benchmark tests unless explicitly enabled."""
 
     skip_stripe_replay_if_disabled(config, items)
 
@@ -141,6 +142,13 @@ def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item
             if "manual" in item.keywords:
                 item.add_marker(skip_manual)
 
+    # pytest-benchmark registers --benchmark-only; benchmarks never run in the regular suite.
+    if not config.getoption("benchmark_only", default=False):
+        skip_benchmark = pytest.mark.skip(reason="benchmark (use --benchmark-only to run)")
+        for item in items:
+            if item.get_closest_marker("benchmark") is not None:
+                item.add_marker(skip_benchmark)
+
 
 @pytest.fixture(autouse=True)
 def _reset_application_container() -> Generator[None, None, None]:
@@ -301,6 +309,24 @@ class EphemeralConversationRepository(ConversationRepository):
         )
         return len(self._messages[key])
 
+    async def record_turn(
+        self,
+        conversation_id: str,
+        *,
+        tenant_id: str,
+        turn: ConversationTurn,
+    ) -> int | None:
+        message_id = await self.add_message(
+            conversation_id, turn.message, tenant_id=tenant_id, metadata=turn.metadata
+        )
+        key = self._key(tenant_id, conversation_id)
+        if turn.session_state is not None:
+            self._session_state[key] = turn.session_state
+        if turn.run_usage is not None:
+            self._usage[key].append(turn.run_usage)
+        self._events[key].extend(turn.run_events)
+        return message_id
+
     async def get_messages(
         self,
         conversation_id: str,
@@ -326,3 +326,56 @@ def test_chat_stream_does_not_emit_tool_guardrail_events_to_public_stream(
                 break
 
     assert_common_stream(events)
+
+
+def _sse_frames(response: Any) -> list[tuple[str, dict[str, Any]]]:
+    frames: list[tuple[str, dict[str, Any]]] = []
+    event_id = ""
+    for raw in response.iter_lines():
+        line = raw.decode() if isinstance(raw, bytes | bytearray) else raw
+        if line.startswith("id: "):
+            event_id = line[len("id: ") :]
+        elif line.startswith("data: "):
+            frames.append((event_id, json.loads(line[len("data: ") :])))
+    return frames
+
+
+@patch("app.infrastructure.providers.openai.runtime.OpenAIAgentRuntime.run_stream")
+def test_chat_stream_resumes_after_last_event_id(mock_run_stream, client: TestClient) -> None:
+    mock_run_stream.return_value = _FakeStreamingHandle(
+        [
+            AgentStreamEvent(
+                kind="raw_response_event",
+                raw_type="response.output_text.delta",
+                text_delta="Hello",
+                raw_event={"item_id": "msg_1", "output_index": 0, "content_index": 0},
+                response_id="resp_resume",
+            ),
+            AgentStreamEvent(
+                kind="run_item_stream_event",
+                response_id="resp_resume",
+                response_text="Hello world",
+                is_terminal=True,
+            ),
+        ]
+    )
+
+    payload = {"message": "Hi there", "agent_type": default_agent_key()}
+    with client.stream("POST", "/api/v1/chat/stream", json=payload) as response:
+        assert response.status_code == 200
+        run_id = response.headers["x-chat-run-id"]
+        frames = _sse_frames(response)
+
+    assert len(frames) >= 2
+    assert [event_id for event_id, _ in frames] == [f"{n}-0" for n in range(1, len(frames) + 1)]
+
+    with client.stream(
+        "GET",
+        f"/api/v1/chat/runs/{run_id}/stream",
+        headers={"Last-Event-ID": frames[0][0]},
+    ) as resumed:
+        assert resumed.status_code == 200
+        assert _sse_frames(resumed) == frames[1:]
+
+    missing = client.get("/api/v1/chat/runs/chat_missing/stream")
+    assert missing.status_code == 404
@@ -174,6 +174,56 @@ def test_run_workflow_stream(mock_run_stream: AsyncMock, client: TestClient) ->
     assert events[-1].workflow.workflow_run_id == "run-1"
 
 
+@patch("app.services.workflows.service.WorkflowService.run_workflow_stream", new_callable=AsyncMock)
+def test_run_workflow_detached_and_attach_by_run_id(
+    mock_run_stream: AsyncMock, client: TestClient
+) -> None:
+    async def _gen():
+        for text, terminal in (("hel", False), ("hello", True)):
+            yield AgentStreamEvent(
+                kind="run_item_stream_event",
+                response_id="r1",
+                text_delta=None if terminal else text,
+                response_text=text if terminal else None,
+                metadata={"workflow_key": "analysis_code", "step_agent": "researcher"},
+                is_terminal=terminal,
+            )
+
+    mock_run_stream.return_value = _gen()
+
+    response = client.post(
+        "/api/v1/workflows/analysis_code/run-detached", json={"message": "hello"}
+    )
+    assert response.status_code == 202
+    body = response.json()
+    run_id = body["workflow_run_id"]
+    assert body["events_url"] == f"/api/v1/workflows/runs/{run_id}/events/stream"
+
+    def _read(headers: dict[str, str] | None = None) -> list[tuple[str, Any]]:
+        frames: list[tuple[str, Any]] = []
+        event_id = ""
+        with client.stream("GET", body["events_url"], headers=headers or {}) as stream:
+            assert stream.status_code == 200
+            for line in stream.iter_lines():
+                if line.startswith("id: "):
+                    event_id = line[4:]
+                elif line.startswith("data: "):
+                    frames.append(
+                        (event_id, StreamingWorkflowEvent.model_validate_json(line[6:]).root)
+                    )
+        return frames
+
+    frames = _read()
+    assert frames[-1][1].kind == "final"
+    assert mock_run_stream.await_args.kwargs["run_id"] == run_id
+
+    resumed = _read({"Last-Event-ID": frames[0][0]})
+    assert [event_id for event_id, _ in resumed] == [event_id for event_id, _ in frames[1:]]
+
+    missing = client.get("/api/v1/workflows/runs/unknown-run/events/stream")
+    assert missing.status_code == 404
+
+
 def test_get_workflow_run(client: TestClient) -> None:
     service = get_workflow_service()
     repo = getattr(service._runner, "_run_repository", None)
@@ -6,7 +6,7 @@ import asyncio
 import os
 import uuid
 from collections.abc import AsyncIterator, Iterator
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any, cast
 
@@ -14,6 +14,7 @@ import asyncpg
 import pytest
 from agents.extensions.memory.sqlalchemy_session import SQLAlchemySession
 from sqlalchemy import select, text
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.engine.url import URL, make_url
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
@@ -25,15 +26,31 @@ from sqlalchemy.ext.asyncio import (
 from alembic import command
 from alembic.config import Config
 from app.domain.billing import TenantSubscription
-from app.domain.conversations import ConversationMessage, ConversationMetadata
+from app.domain.conversation_ledger import ConversationLedgerEventRecord
+from app.domain.conversations import (
+    ConversationEvent,
+    ConversationMessage,
+    ConversationMetadata,
+)
+from app.infrastructure.persistence.activity.models import ActivityEventRow
 from app.infrastructure.persistence.billing.models import (
     SubscriptionUsage as ORMSubscriptionUsage,
 )
 from app.infrastructure.persistence.billing.postgres import PostgresBillingRepository
 from app.infrastructure.persistence.tenants.models import TenantAccount
+from app.infrastructure.persistence.conversations.ledger_store import ConversationLedgerStore
 from app.infrastructure.persistence.conversations.postgres import (
     PostgresConversationRepository,
 )
+from app.infrastructure.persistence.conversations.run_event_store import RunEventStore
+from app.infrastructure.persistence.partitions import (
+    ACTIVITY_EVENTS,
+    add_months,
+    drop_expired_partitions,
+    ensure_partitions,
+    is_partitioned,
+    month_start,
+)
 
 pytestmark = pytest.mark.postgres
 
@@ -351,3 +368,85 @@ async def test_billing_subscription_upsert_roundtrip(
         usage_rows = result.scalars().all()
         assert len(usage_rows) == 1
         assert usage_rows[0].quantity == 10
+
+
+async def _seed_conversation(session_factory: async_sessionmaker[AsyncSession]) -> tuple[str, str]:
+    tenant_id = await _seed_tenant(session_factory)
+    conversation_id = f"partitioned-{uuid.uuid4().hex[:8]}"
+    await PostgresConversationRepository(session_factory).add_message(
+        conversation_id,
+        ConversationMessage(role="user", content="Hello partitions"),
+        tenant_id=tenant_id,
+        metadata=ConversationMetadata(tenant_id=tenant_id, agent_entrypoint="triage"),
+    )
+    return conversation_id, tenant_id
+
+
+@pytest.mark.asyncio
+async def test_partitioned_event_tables_reject_duplicate_logical_keys(
+    migrated_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    async with migrated_session_factory() as session:
+        assert await is_partitioned(session, "agent_run_events")
+        assert await is_partitioned(session, "conversation_ledger_events")
+    conversation_id, tenant_id = await _seed_conversation(migrated_session_factory)
+
+    run_events = RunEventStore(migrated_session_factory)
+    event = ConversationEvent(
+        run_item_type="message", role="assistant", content_text="hi", sequence_no=0
+    )
+    await run_events.add_run_events(conversation_id, tenant_id=tenant_id, events=[event])
+    with pytest.raises(IntegrityError):
+        await run_events.add_run_events(conversation_id, tenant_id=tenant_id, events=[event])
+
+    ledger = ConversationLedgerStore(migrated_session_factory)
+    frame = ConversationLedgerEventRecord(
+        schema_version="public_sse_v1",
+        kind="message.delta",
+        stream_id="stream-1",
+        event_id=1,
+        server_timestamp=datetime.now(UTC),
+        response_id=None,
+        agent=None,
+        workflow_run_id=None,
+        provider_sequence_number=None,
+        output_index=None,
+        item_id=None,
+        content_index=None,
+        tool_call_id=None,
+        payload_size_bytes=2,
+        payload_json={},
+    )
+    await ledger.add_events(conversation_id, tenant_id=tenant_id, events=[frame])
+    with pytest.raises(IntegrityError):
+        await ledger.add_events(conversation_id, tenant_id=tenant_id, events=[frame])
+
+
+@pytest.mark.asyncio
+async def test_partition_maintenance_drains_and_expires_the_default_partition(
+    migrated_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    tenant_id = uuid.UUID(await _seed_tenant(migrated_session_factory))
+    now = datetime.now(UTC)
+    far_month = add_months(month_start(now), 24)
+    future_at = datetime(far_month.year, far_month.month, 10, tzinfo=UTC)
+    ancient_at = datetime(2000, 1, 15, tzinfo=UTC)
+
+    async with migrated_session_factory() as session:
+        for created_at in (future_at, ancient_at):
+            session.add(ActivityEventRow(tenant_id=tenant_id, action="test", created_at=created_at))
+        await session.commit()
+
+        created = await ensure_partitions(session, ACTIVITY_EVENTS, now=now, months_ahead=24)
+        assert f"activity_events_p{far_month:%Y%m}" in created
+        moved = await session.execute(
+            text(f'SELECT count(*) FROM "activity_events_p{far_month:%Y%m}"')
+        )
+        assert moved.scalar() == 1
+
+        affected = await drop_expired_partitions(
+            session, ACTIVITY_EVENTS, cutoff=ancient_at + timedelta(days=400)
+        )
+        assert affected == ["activity_events_default"]
+        leftover = await session.execute(text('SELECT count(*) FROM "activity_events_default"'))
+        assert leftover.scalar() == 0
@@ -31,6 +31,9 @@ class _StubConversationService:
     async def update_session_state(self, *args, **kwargs):  # pragma: no cover - noop
         return None
 
+    async def record_turn(self, *args, **kwargs):  # pragma: no cover - noop
+        return None
+
     async def record_conversation_created(self, *args, **kwargs):  # pragma: no cover - noop
         return None
 
@@ -69,10 +72,11 @@ async def test_agent_service_stream_attaches_images(monkeypatch):
 
     # Storage
     storage = MagicMock()
-    storage.put_object = AsyncMock()
-    storage.put_object.return_value.id = uuid.uuid4()
-    storage.put_object.return_value.checksum_sha256 = "abc"
-    storage.put_object.return_value.created_at = None
+    storage.put_object_stream = AsyncMock()
+    storage.put_object_stream.return_value.id = uuid.uuid4()
+    storage.put_object_stream.return_value.checksum_sha256 = "abc"
+    storage.put_object_stream.return_value.created_at = None
+    storage.put_object_stream.return_value.size_bytes = 9
     storage.get_presigned_download = AsyncMock(return_value=(MagicMock(url="https://u"), MagicMock()))
 
     svc = AgentService(
@@ -99,7 +103,7 @@ async def test_agent_service_stream_attaches_images(monkeypatch):
         events.append(ev)
 
     assert any(ev.attachments for ev in events)
-    storage.put_object.assert_awaited()
+    storage.put_object_stream.assert_awaited()
     storage.get_presigned_download.assert_awaited()
 
 
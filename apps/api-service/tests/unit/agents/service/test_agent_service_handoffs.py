@@ -38,6 +38,15 @@ class _FakeConversationService(ConversationService):
     async def update_session_state(self, conversation_id, *, tenant_id, state: ConversationSessionState):
         return None
 
+    async def record_turn(self, conversation_id, *, tenant_id, turn):
+        await self.append_message(
+            conversation_id, turn.message, tenant_id=tenant_id, metadata=turn.metadata
+        )
+        if turn.session_state is not None:
+            await self.update_session_state(
+                conversation_id, tenant_id=tenant_id, state=turn.session_state
+            )
+
     async def record_conversation_created(self, *args, **kwargs):  # pragma: no cover - unused
         return None
 
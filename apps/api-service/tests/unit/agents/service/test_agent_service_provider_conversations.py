@@ -43,6 +43,15 @@ class FakeConversationService(ConversationService):
     ):
         self.session_states[(tenant_id, conversation_id)] = state
 
+    async def record_turn(self, conversation_id, *, tenant_id, turn):
+        await self.append_message(
+            conversation_id, turn.message, tenant_id=tenant_id, metadata=turn.metadata
+        )
+        if turn.session_state is not None:
+            await self.update_session_state(
+                conversation_id, tenant_id=tenant_id, state=turn.session_state
+            )
+
     async def record_conversation_created(  # pragma: no cover - stub to satisfy AgentService
         self,
         conversation_id: str,
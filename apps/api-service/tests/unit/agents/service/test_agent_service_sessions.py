@@ -28,6 +28,11 @@ class _StubConversationService:
     async def update_session_state(self, conversation_id: str, *, tenant_id: str, state):
         self.states[conversation_id] = state
 
+    async def record_turn(self, conversation_id: str, *, tenant_id: str, turn):
+        if turn.session_state is not None:
+            self.states[conversation_id] = turn.session_state
+        return None
+
 
 class _StubAttachmentService:
     async def ingest_image_outputs(self, *args, **kwargs):
@@ -50,11 +55,20 @@ class _StubUsageService:
     async def record(self, *args, **kwargs):
         return None
 
+    def build_run_usage(self, *args, **kwargs):
+        return None
+
+    async def record_billing(self, *args, **kwargs):
+        return None
+
 
 class _StubEventProjector:
     async def ingest_session_items(self, *args, **kwargs):
         return None
 
+    def build_events(self, *args, **kwargs):
+        return []
+
 
 class _StubSessionStore:
     def build(self, session_id: str):
@@ -9,7 +9,11 @@ from app.services.agents import AgentService
 from app.services.agents.context import ConversationActorContext
 from app.services.agents.policy import AgentRuntimePolicy
 from app.services.conversation_service import ConversationService
-from app.services.containers.files_gateway import ContainerFileContent
+from app.services.containers.files_gateway import ContainerFileStream
+
+
+async def _chunks(data: bytes):
+    yield data
 
 
 class _StubConversationService:
@@ -28,6 +32,9 @@ class _StubConversationService:
     async def update_session_state(self, *args, **kwargs):  # pragma: no cover - noop
         return None
 
+    async def record_turn(self, *args, **kwargs):  # pragma: no cover - noop
+        return None
+
     async def record_conversation_created(self, *args, **kwargs):  # pragma: no cover - noop
         return None
 
@@ -65,10 +72,11 @@ async def test_sse_events_include_attachments(monkeypatch):
     provider.runtime.run_stream.return_value = MockStream()
 
     storage = MagicMock()
-    storage.put_object = AsyncMock()
-    storage.put_object.return_value.id = uuid.uuid4()
-    storage.put_object.return_value.checksum_sha256 = "abc"
-    storage.put_object.return_value.created_at = None
+    storage.put_object_stream = AsyncMock()
+    storage.put_object_stream.return_value.id = uuid.uuid4()
+    storage.put_object_stream.return_value.checksum_sha256 = "abc"
+    storage.put_object_stream.return_value.created_at = None
+    storage.put_object_stream.return_value.size_bytes = 9
     storage.get_presigned_download = AsyncMock(return_value=(MagicMock(url="https://u"), MagicMock()))
 
     svc = AgentService(
@@ -96,7 +104,7 @@ async def test_sse_events_include_attachments(monkeypatch):
 
     assert any(ev.attachments for ev in events)
     assert any(ev.payload and ev.payload.get("_attachment_note") == "stored" for ev in events if ev.payload)
-    storage.put_object.assert_awaited()
+    storage.put_object_stream.assert_awaited()
     storage.get_presigned_download.assert_awaited()
 
 
@@ -133,15 +141,16 @@ async def test_sse_terminal_event_includes_container_file_attachments(monkeypatc
     provider.runtime.run_stream.return_value = MockStream()
 
     storage = MagicMock()
-    storage.put_object = AsyncMock()
-    storage.put_object.return_value.id = uuid.uuid4()
-    storage.put_object.return_value.checksum_sha256 = "abc"
-    storage.put_object.return_value.created_at = None
+    storage.put_object_stream = AsyncMock()
+    storage.put_object_stream.return_value.id = uuid.uuid4()
+    storage.put_object_stream.return_value.checksum_sha256 = "abc"
+    storage.put_object_stream.return_value.created_at = None
+    storage.put_object_stream.return_value.size_bytes = 9
     storage.get_presigned_download = AsyncMock(return_value=(MagicMock(url="https://u"), MagicMock()))
 
     gateway = MagicMock()
-    gateway.download_file_content = AsyncMock(
-        return_value=ContainerFileContent(data=b"a,b\n1,2\n", filename="squares.csv")
+    gateway.stream_file_content.return_value.__aenter__.return_value = ContainerFileStream(
+        chunks=_chunks(b"a,b\n1,2\n"), filename="squares.csv", size_bytes=len(b"a,b\n1,2\n")
     )
 
     svc = AgentService(
@@ -173,6 +182,6 @@ async def test_sse_terminal_event_includes_container_file_attachments(monkeypatc
     assert terminal.attachments, "Expected stored attachment payloads on terminal event"
     assert any(att.get("filename") == "squares.csv" for att in terminal.attachments if isinstance(att, dict))
 
-    gateway.download_file_content.assert_awaited()
-    storage.put_object.assert_awaited()
+    gateway.stream_file_content.assert_called()
+    storage.put_object_stream.assert_awaited()
     storage.get_presigned_download.assert_awaited()
@@ -46,6 +46,11 @@ class FakeConversationService:
     async def persist_run_usage(self, conversation_id, *, tenant_id, usage):
         self.usage_calls.append((conversation_id, tenant_id, usage))
 
+    async def record_turn(self, conversation_id, *, tenant_id, turn):
+        if turn.run_usage is not None:
+            self.usage_calls.append((conversation_id, tenant_id, turn.run_usage))
+        return None
+
     async def list_run_usage(self, *args, **kwargs):  # pragma: no cover - unused
         return []
 
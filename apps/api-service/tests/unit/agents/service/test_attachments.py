@@ -1,12 +1,17 @@
 import uuid
 from collections import defaultdict
+from contextlib import asynccontextmanager
 from typing import cast
 
 import pytest
 
 from app.domain.conversations import ConversationAttachment, ConversationMessage
 from app.services.agents.attachments import AttachmentService
-from app.services.containers.files_gateway import ContainerFileContent, ContainerFilesGateway
+from app.services.containers.files_gateway import (
+    ContainerFileContent,
+    ContainerFileStream,
+    ContainerFilesGateway,
+)
 from app.services.assets.service import AssetService
 from app.services.storage.service import StorageService
 
@@ -21,6 +26,24 @@ class FakeStorageService:
         self.put_calls.append((tenant_id, filename, mime_type, metadata))
         return type("Obj", (), {"id": oid})
 
+    async def put_object_stream(
+        self,
+        *,
+        tenant_id,
+        user_id,
+        chunks,
+        filename,
+        mime_type,
+        size_hint,
+        agent_key,
+        conversation_id,
+        metadata,
+    ):
+        data = b"".join([chunk async for chunk in chunks])
+        oid = uuid.uuid4()
+        self.put_calls.append((tenant_id, filename, mime_type, metadata))
+        return type("Obj", (), {"id": oid, "size_bytes": len(data)})
+
     async def get_presigned_download(self, *, tenant_id, object_id):
         self.presigned_for[tenant_id].append(object_id)
         return type("Presigned", (), {"url": f"https://example.com/{object_id}"}), None
@@ -119,6 +142,18 @@ class FakeContainerFilesGateway:
         self.calls.append((uuid.UUID(str(tenant_id)), str(container_id), str(file_id)))
         return ContainerFileContent(data=self._data, filename=self._filename)
 
+    @asynccontextmanager
+    async def stream_file_content(self, *, tenant_id, container_id, file_id, chunk_size=4):
+        self.calls.append((uuid.UUID(str(tenant_id)), str(container_id), str(file_id)))
+
+        async def _chunks():
+            for offset in range(0, len(self._data), chunk_size):
+                yield self._data[offset : offset + chunk_size]
+
+        yield ContainerFileStream(
+            chunks=_chunks(), filename=self._filename, size_bytes=len(self._data)
+        )
+
 
 @pytest.mark.asyncio
 async def test_ingest_container_file_citations_happy_path():
@@ -122,6 +122,7 @@ async def test_chat_stream_emits_compaction_event():
     interaction_builder = SimpleNamespace(build=_build_ctx)
     conversation_service = SimpleNamespace(
         append_message=_noop,
+        record_turn=_noop,
         record_conversation_created=_noop,
         get_session_state=_noop,
         update_session_state=_noop,
@@ -131,13 +132,15 @@ async def test_chat_stream_emits_compaction_event():
     session_manager = SimpleNamespace(
         acquire_session=_acquire_session,
         sync_session_state=_noop,
+        build_session_state=lambda **_kwargs: None,
     )
     event_projector_calls: list[list[dict[str, Any]]] = []
 
-    async def _ingest_session_items(**kwargs):
+    def _build_events(**kwargs):
         event_projector_calls.append(kwargs.get("session_items", []))
+        return []
 
-    event_projector = SimpleNamespace(ingest_session_items=_ingest_session_items)
+    event_projector = SimpleNamespace(build_events=_build_events)
 
     async def _record_usage(*_args, **_kwargs):
         return None
@@ -149,7 +152,11 @@ async def test_chat_stream_emits_compaction_event():
         interaction_builder=interaction_builder,
         conversation_service=cast(ConversationService, conversation_service),
         session_manager=session_manager,
-        usage_service=SimpleNamespace(record=_record_usage),
+        usage_service=SimpleNamespace(
+            record=_record_usage,
+            record_billing=_record_usage,
+            build_run_usage=lambda **_kwargs: None,
+        ),
         usage_recorder=None,
         attachment_service=SimpleNamespace(
             ingest_image_outputs=_ingest_images,
@@ -7,8 +7,9 @@ from unittest.mock import AsyncMock
 import pytest
 
 from app.domain.ai.lifecycle import LifecycleEventBus
-from app.domain.ai.models import AgentStreamEvent
+from app.domain.ai.models import AgentRunUsage, AgentStreamEvent
 from app.domain.conversations import ConversationAttachment
+from app.observability.metrics import REGISTRY
 from app.services.agents.attachments import AttachmentService
 from app.services.agents.context import ConversationActorContext
 from app.services.agents.streaming_pipeline import (
@@ -156,3 +157,93 @@ async def test_stream_processor_accumulates_response_and_attachments():
 
     # Last event is a drained lifecycle event from the bus.
     assert emitted[-1].kind == "lifecycle"
+
+
+@pytest.mark.asyncio
+async def test_stream_processor_records_latency_throughput_and_cache_metrics():
+    ticks = iter([10.0, 10.4, 12.4])  # start, first text delta, terminal
+    processor = AgentStreamProcessor(
+        lifecycle_bus=LifecycleEventBus(),
+        provider=SimpleNamespace(get_agent=lambda key: None),
+        actor=ConversationActorContext(tenant_id="t1", user_id="u1"),
+        conversation_id="conv-1",
+        entrypoint_agent="metrics-agent",
+        entrypoint_output_schema=None,
+        attachment_service=AttachmentService(lambda: None),
+        entrypoint_model="GPT-Test",
+        clock=lambda: next(ticks),
+    )
+
+    class _Handle:
+        usage = AgentRunUsage(input_tokens=1000, output_tokens=100, cached_input_tokens=800)
+
+        async def events(self):
+            yield AgentStreamEvent(kind="raw_response_event", text_delta="Hel")
+            yield AgentStreamEvent(kind="raw_response_event", text_delta="lo")
+            yield AgentStreamEvent(kind="run_item_stream_event", is_terminal=True)
+
+    [ev async for ev in processor.iter_events(_Handle())]
+
+    labels = {"agent": "metrics-agent", "model": "gpt-test"}
+
+    def _sample(name: str) -> float | None:
+        return REGISTRY.get_sample_value(name, labels)
+
+    assert _sample("agent_stream_time_to_first_token_seconds_count") == 1
+    assert _sample("agent_stream_time_to_first_token_seconds_sum") == pytest.approx(0.4)
+    assert _sample("agent_stream_output_tokens_per_second_sum") == pytest.approx(50.0)
+    assert _sample("agent_stream_cached_input_ratio_sum") == pytest.approx(0.8)
+
+
+@pytest.mark.asyncio
+async def test_stream_processor_measures_throughput_per_response_and_ttft_for_first_agent():
+    # start, a1 first delta, a1 completed, a2 first delta, a2 completed
+    ticks = iter([0.0, 1.0, 2.0, 5.0, 6.0])
+    processor = AgentStreamProcessor(
+        lifecycle_bus=LifecycleEventBus(),
+        provider=SimpleNamespace(
+            get_agent=lambda key: SimpleNamespace(output_schema=None, model="m2")
+        ),
+        actor=ConversationActorContext(tenant_id="t1", user_id="u1"),
+        conversation_id="conv-1",
+        entrypoint_agent="window-entry",
+        entrypoint_output_schema=None,
+        attachment_service=AttachmentService(lambda: None),
+        entrypoint_model="m1",
+        clock=lambda: next(ticks),
+    )
+
+    def _completed(output_tokens: int, reasoning_tokens: int) -> AgentStreamEvent:
+        usage = {
+            "output_tokens": output_tokens,
+            "output_tokens_details": {"reasoning_tokens": reasoning_tokens},
+        }
+        return AgentStreamEvent(
+            kind="raw_response_event",
+            raw_type="response.completed",
+            payload={"type": "response.completed", "response": {"usage": usage}},
+        )
+
+    class _Handle:
+        usage = AgentRunUsage(input_tokens=10, output_tokens=70, reasoning_output_tokens=10)
+
+        async def events(self):
+            yield AgentStreamEvent(kind="raw_response_event", text_delta="Hi")
+            yield AgentStreamEvent(kind="raw_response_event", text_delta="!")
+            yield _completed(30, 10)
+            yield AgentStreamEvent(kind="agent_updated_stream_event", new_agent="window-handoff")
+            yield AgentStreamEvent(kind="raw_response_event", text_delta="Done")
+            yield _completed(40, 0)
+            yield AgentStreamEvent(kind="run_item_stream_event", is_terminal=True)
+
+    [ev async for ev in processor.iter_events(_Handle())]
+
+    entry = {"agent": "window-entry", "model": "m1"}
+    handoff = {"agent": "window-handoff", "model": "m2"}
+    tps = "agent_stream_output_tokens_per_second"
+    ttft = "agent_stream_time_to_first_token_seconds"
+    # Reasoning tokens and the time between responses are left out of each window.
+    assert REGISTRY.get_sample_value(f"{tps}_sum", entry) == pytest.approx(20.0)
+    assert REGISTRY.get_sample_value(f"{tps}_sum", handoff) == pytest.approx(40.0)
+    assert REGISTRY.get_sample_value(f"{ttft}_sum", entry) == pytest.approx(1.0)
+    assert REGISTRY.get_sample_value(f"{ttft}_count", handoff) is None
@@ -0,0 +1,151 @@
+"""Detached chat runs outlive their connection and resume with exactly-once frames."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import AsyncIterator, Callable
+
+import pytest
+from fakeredis import FakeServer
+from fakeredis.aioredis import FakeRedis
+
+from app.infrastructure.chat.redis_backend import RedisChatRunBackend
+from app.services.agents.detached_runs import (
+    ChatRun,
+    ChatRunBackend,
+    ChatRunExpiredError,
+    ChatRunManager,
+    ChatRunNotFoundError,
+    InMemoryChatRunBackend,
+)
+
+RUN = ChatRun(run_id="chat_1", tenant_id="t", user_id="u")
+FRAMES = [f'{{"n": {index}}}' for index in range(6)]
+
+
+def _memory(lease_seconds: float = 30.0) -> ChatRunBackend:
+    return InMemoryChatRunBackend(lease_seconds=lease_seconds)
+
+
+def _redis(lease_seconds: float = 30.0) -> ChatRunBackend:
+    return RedisChatRunBackend(
+        FakeRedis(server=FakeServer()), lease_seconds=lease_seconds, owns_client=False
+    )
+
+
+class _GatedRun:
+    """Yields the first half of the frames, then waits for ``release`` before the rest."""
+
+    def __init__(self) -> None:
+        self.release = asyncio.Event()
+        self.finished = False
+
+    async def frames(self) -> AsyncIterator[str]:
+        half = len(FRAMES) // 2
+        for frame in FRAMES[:half]:
+            yield frame
+        await self.release.wait()
+        for frame in FRAMES[half:]:
+            yield frame
+        self.finished = True
+
+
+async def _wait_until_done(manager: ChatRunManager) -> None:
+    await asyncio.gather(*manager._tasks)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend_factory", [_memory, _redis], ids=["memory", "redis"])
+async def test_disconnect_mid_stream_then_resume_delivers_each_frame_once(
+    backend_factory: Callable[..., ChatRunBackend],
+) -> None:
+    manager = ChatRunManager(backend_factory(), poll_interval_seconds=0.05)
+    run = _GatedRun()
+    await manager.start(RUN, run.frames())
+
+    # First connection reads part of the stream, then the client drops.
+    received: list[tuple[str, str]] = []
+    first_connection = await manager.events(RUN.run_id)
+    async for entry in first_connection:
+        if entry is None:
+            continue
+        received.append((entry.entry_id, entry.data or ""))
+        if len(received) == 2:
+            break
+    await first_connection.aclose()
+
+    # The run keeps going without any reader attached.
+    run.release.set()
+    await _wait_until_done(manager)
+    assert run.finished
+
+    last_event_id = received[-1][0]
+    async for entry in await manager.events(RUN.run_id, after=last_event_id):
+        if entry is not None:
+            received.append((entry.entry_id, entry.data or ""))
+
+    assert [data for _, data in received] == FRAMES
+    assert [entry_id for entry_id, _ in received] == [f"{n}-0" for n in range(1, 7)]
+    await manager.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_resuming_from_the_last_frame_only_returns_the_end() -> None:
+    manager = ChatRunManager(InMemoryChatRunBackend(), poll_interval_seconds=0.05)
+    await manager.start(RUN, _frames(FRAMES))
+    await _wait_until_done(manager)
+
+    resumed = [entry async for entry in await manager.events(RUN.run_id, after=f"{len(FRAMES)}-0")]
+
+    assert resumed == []
+
+
+@pytest.mark.asyncio
+async def test_resume_before_trimmed_frames_is_rejected() -> None:
+    manager = ChatRunManager(InMemoryChatRunBackend(max_frames=3), poll_interval_seconds=0.05)
+    await manager.start(RUN, _frames(FRAMES))
+    await _wait_until_done(manager)
+
+    with pytest.raises(ChatRunExpiredError):
+        await manager.events(RUN.run_id, after="1-0")
+    with pytest.raises(ValueError):
+        await manager.events(RUN.run_id, after="not-an-id")
+
+
+@pytest.mark.asyncio
+async def test_runs_are_only_visible_to_their_owner() -> None:
+    manager = ChatRunManager(_redis(), poll_interval_seconds=0.05)
+    await manager.start(RUN, _frames(FRAMES))
+
+    assert await manager.get_run(RUN.run_id, tenant_id="t", user_id="u") == RUN
+    with pytest.raises(ChatRunNotFoundError):
+        await manager.get_run(RUN.run_id, tenant_id="t", user_id="someone-else")
+    with pytest.raises(ChatRunNotFoundError):
+        await manager.get_run("chat_missing", tenant_id="t", user_id="u")
+    await manager.shutdown()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend_factory", [_memory, _redis], ids=["memory", "redis"])
+async def test_run_whose_producer_died_ends_with_an_error_frame(
+    backend_factory: Callable[[float], ChatRunBackend],
+) -> None:
+    backend = backend_factory(0.01)
+    manager = ChatRunManager(backend, poll_interval_seconds=0.01)
+    # The run was recorded but nothing pumps it and nothing renews its lease.
+    await backend.create_run(RUN)
+
+    entries = [entry async for entry in await manager.events(RUN.run_id)]
+
+    frames = [entry for entry in entries if entry is not None]
+    assert len(frames) == 1
+    payload = json.loads(frames[0].data or "{}")
+    assert payload["kind"] == "error"
+    assert payload["error"]["code"] == "run_interrupted"
+    await manager.shutdown()
+
+
+async def _frames(frames: list[str]) -> AsyncIterator[str]:
+    for frame in frames:
+        yield frame
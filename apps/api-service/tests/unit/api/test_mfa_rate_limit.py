@@ -22,10 +22,11 @@ def client(monkeypatch: pytest.MonkeyPatch) -> TestClient:
     # Stub rate limiter to capture keys
     calls: dict[str, list[str]] = {}
 
-    async def fake_enforce(quota, keys):  # pragma: no cover - simple stub
-        calls[quota.scope] = keys
+    async def fake_enforce_many(checks):  # pragma: no cover - simple stub
+        for quota, keys in checks:
+            calls[quota.scope] = keys
 
-    monkeypatch.setattr(mfa_module.rate_limiter, "enforce", fake_enforce)
+    monkeypatch.setattr(mfa_module.rate_limiter, "enforce_many", fake_enforce_many)
 
     # Stub MFA completion to avoid hitting real service
     async def fake_complete_mfa_challenge(**_: object) -> UserSessionTokens:  # pragma: no cover
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from typing import Any, cast
+
+import httpx
+import pytest
+from fastapi import HTTPException
+from openai import APIStatusError, AsyncOpenAI
+
+from app.api.dependencies.tenant import TenantContext, TenantRole
+from app.api.v1.openai_files.router import download_openai_file
+
+
+class _FakeStreamedContent:
+    def __init__(self, chunks: list[bytes], *, status_code: int, headers: dict[str, str]) -> None:
+        self._chunks = chunks
+        self.status_code = status_code
+        self.headers = httpx.Headers(headers)
+        self.requested_chunk_size: int | None = None
+
+    async def iter_bytes(self, chunk_size: int | None = None):
+        self.requested_chunk_size = chunk_size
+        for chunk in self._chunks:
+            yield chunk
+
+    async def aread(self) -> bytes:  # pragma: no cover - must not be used
+        raise AssertionError("download should stream, not buffer")
+
+
+class _FakeStreamingContext:
+    def __init__(self, owner: _FakeStreamingFiles, response: _FakeStreamedContent) -> None:
+        self._owner = owner
+        self._response = response
+
+    async def __aenter__(self) -> _FakeStreamedContent:
+        if self._owner.error is not None:
+            raise self._owner.error
+        self._owner.open = True
+        return self._response
+
+    async def __aexit__(self, *_exc: object) -> None:
+        self._owner.open = False
+
+
+class _FakeStreamingFiles:
+    def __init__(self, response: _FakeStreamedContent, error: Exception | None = None) -> None:
+        self._response = response
+        self.error = error
+        self.open = False
+        self.extra_headers: dict[str, str] | None = None
+
+    def content(self, file_id: str, *, extra_headers: dict[str, str] | None = None):
+        self.extra_headers = extra_headers
+        return _FakeStreamingContext(self, self._response)
+
+
+class _FakeClient:
+    def __init__(self, streaming: _FakeStreamingFiles) -> None:
+        self.files = type("Files", (), {"with_streaming_response": streaming})()
+
+
+class _FakeVectorStoreService:
+    async def get_file_by_openai_id(self, *, tenant_id: str, openai_file_id: str) -> None:
+        return None
+
+
+def _tenant() -> TenantContext:
+    return TenantContext(tenant_id="t-1", role=TenantRole.VIEWER, user={"user_id": "u"})
+
+
+async def _download(client: _FakeClient, *, range_header: str | None = None):
+    return await download_openai_file(
+        file_id="file-abc",
+        range_header=range_header,
+        _=cast(Any, {"user_id": "u"}),
+        tenant_context=_tenant(),
+        client=cast(AsyncOpenAI, client),
+        vector_store_service=_FakeVectorStoreService(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_download_streams_chunks_and_forwards_range() -> None:
+    upstream = _FakeStreamedContent(
+        [b"hel", b"lo"],
+        status_code=206,
+        headers={"Content-Range": "bytes 0-4/10", "Content-Length": "5", "Accept-Ranges": "bytes"},
+    )
+    streaming = _FakeStreamingFiles(upstream)
+
+    response = await _download(_FakeClient(streaming), range_header="bytes=0-4")
+
+    assert streaming.extra_headers == {"Range": "bytes=0-4"}
+    assert response.status_code == 206
+    assert response.headers["Content-Range"] == "bytes 0-4/10"
+    assert response.headers["Content-Length"] == "5"
+    assert streaming.open is True
+
+    body = [chunk async for chunk in cast(Any, response).body_iterator]
+
+    assert body == [b"hel", b"lo"]
+    assert upstream.requested_chunk_size is not None
+    assert streaming.open is False
+
+
+@pytest.mark.asyncio
+async def test_download_ignores_malformed_range() -> None:
+    upstream = _FakeStreamedContent([b"all"], status_code=200, headers={})
+    streaming = _FakeStreamingFiles(upstream)
+
+    response = await _download(_FakeClient(streaming), range_header="bytes=0-1,4-5")
+
+    assert streaming.extra_headers is None
+    assert response.status_code == 200
+    assert [chunk async for chunk in cast(Any, response).body_iterator] == [b"all"]
+
+
+@pytest.mark.asyncio
+async def test_download_maps_unsatisfiable_range_to_416() -> None:
+    request = httpx.Request("GET", "https://api.openai.com/v1/files/file-abc/content")
+    error = APIStatusError(
+        "range",
+        response=httpx.Response(416, request=request),
+        body=None,
+    )
+    streaming = _FakeStreamingFiles(
+        _FakeStreamedContent([], status_code=416, headers={}), error=error
+    )
+
+    with pytest.raises(HTTPException) as excinfo:
+        await _download(_FakeClient(streaming), range_header="bytes=99-")
+
+    assert excinfo.value.status_code == 416
+
+
+@pytest.mark.asyncio
+async def test_download_closes_upstream_when_body_is_never_sent() -> None:
+    streaming = _FakeStreamingFiles(_FakeStreamedContent([b"x"], status_code=200, headers={}))
+
+    response = await _download(_FakeClient(streaming))
+    assert streaming.open is True
+
+    # Starlette runs the background task even when the client disconnects first.
+    assert response.background is not None
+    await response.background()
+    assert streaming.open is False
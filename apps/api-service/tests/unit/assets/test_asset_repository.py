@@ -1,4 +1,5 @@
 import uuid
+from datetime import UTC, datetime, timedelta
 
 import pytest
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
@@ -91,6 +92,37 @@ async def test_asset_repository_create_list_and_link_message() -> None:
     updated = await repo.get_record(tenant_id=tenant_id, asset_id=created.id)
     assert updated is not None
     assert updated.message_id == 42
+    assert updated.thumbnail_object_id is None
+
+    later = datetime.now(UTC) + timedelta(minutes=1)
+    missing = await repo.list_missing_thumbnails(created_before=later, after=None, limit=10)
+    assert [asset.id for asset in missing] == [created.id]
+    assert missing[0].created_at is not None
+    assert not await repo.list_missing_thumbnails(
+        created_before=later, after=(missing[0].created_at, created.id), limit=10
+    )
+    assert not await repo.list_missing_thumbnails(
+        created_before=datetime.now(UTC) - timedelta(hours=1), after=None, limit=10
+    )
+
+    await repo.record_thumbnail_failure(tenant_id=tenant_id, asset_id=created.id)
+    failed = await repo.get_record(tenant_id=tenant_id, asset_id=created.id)
+    assert failed is not None
+    assert failed.thumbnail_failures == 1
+    assert await repo.list_missing_thumbnails(
+        created_before=later, after=None, limit=10, max_failures=2
+    )
+    assert not await repo.list_missing_thumbnails(
+        created_before=later, after=None, limit=10, max_failures=1
+    )
+
+    thumbnail_id = uuid.uuid4()
+    await repo.set_thumbnail(
+        tenant_id=tenant_id, asset_id=created.id, thumbnail_object_id=thumbnail_id
+    )
+    views = await repo.list_by_ids(tenant_id=tenant_id, asset_ids=[created.id])
+    assert views[0].asset.thumbnail_object_id == thumbnail_id
+    assert not await repo.list_missing_thumbnails(created_before=later, after=None, limit=10)
 
     duplicate = await repo.create(record)
     assert duplicate.id == created.id
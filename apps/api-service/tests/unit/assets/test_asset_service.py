@@ -1,10 +1,24 @@
+import io
 import uuid
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
 from typing import cast
 
 import pytest
 
+from app.core.settings import Settings
 from app.domain.assets import AssetNotFoundError, AssetRecord, AssetRepository, AssetView
+from app.domain.storage import StorageObjectRef
+from app.infrastructure.executors import IntegrationExecutor
 from app.services.assets.service import AssetService
+from app.services.assets.thumbnails import (
+    MAX_SOURCE_PIXELS,
+    MAX_THUMBNAIL_ATTEMPTS,
+    SOURCE_HEADER_BYTES,
+    AssetThumbnailBackfill,
+    AssetThumbnailPipeline,
+    render_thumbnail,
+)
 from app.services.storage.service import StorageService
 
 
@@ -113,14 +127,16 @@ async def test_get_thumbnail_urls_skips_missing_and_non_images() -> None:
             self._views = views
 
     class _Storage:
-        async def get_presigned_download(self, *, tenant_id, object_id):
+        async def get_presigned_downloads(self, *, tenant_id, object_ids):
             presign = type(
                 "Presign",
                 (),
                 {"url": "https://example.com/thumb", "method": "GET", "headers": {}},
             )
-            obj = type("Obj", (), {"id": object_id})
-            return presign, obj
+            return {
+                object_id: (presign, type("Obj", (), {"id": object_id}))
+                for object_id in object_ids
+            }
 
         def signed_url_ttl(self) -> int:
             return 900
@@ -140,3 +156,246 @@ async def test_get_thumbnail_urls_skips_missing_and_non_images() -> None:
     assert items[0].asset_id == image_asset.id
     assert missing
     assert unsupported == [file_asset.id]
+
+
+def _image_asset(tenant_id: uuid.UUID, **overrides) -> AssetRecord:
+    values: dict = {
+        "id": uuid.uuid4(),
+        "tenant_id": tenant_id,
+        "storage_object_id": uuid.uuid4(),
+        "asset_type": "image",
+        "source_tool": "image_generation",
+        "conversation_id": None,
+        "message_id": None,
+        "tool_call_id": None,
+        "response_id": None,
+        "container_id": None,
+        "openai_file_id": None,
+    }
+    values.update(overrides)
+    return AssetRecord(**values)
+
+
+def _view(asset: AssetRecord) -> AssetView:
+    return AssetView(
+        asset=asset,
+        filename="img.png",
+        mime_type="image/png",
+        size_bytes=123,
+        agent_key=None,
+        storage_status="ready",
+        storage_created_at=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_thumbnail_urls_presigns_in_one_call_and_prefers_thumbnails() -> None:
+    tenant_id = uuid.uuid4()
+    with_thumb = _image_asset(tenant_id, thumbnail_object_id=uuid.uuid4())
+    without_thumb = _image_asset(tenant_id)
+    views = [_view(with_thumb), _view(without_thumb)]
+
+    class _Repo(StubAssetRepository):
+        def __init__(self):
+            super().__init__(asset=None)
+            self._views = views
+
+    calls: list[list[uuid.UUID]] = []
+
+    class _Storage:
+        async def get_presigned_downloads(self, *, tenant_id, object_ids):
+            calls.append(list(object_ids))
+            presign = type("Presign", (), {"method": "GET", "headers": {}})
+            return {
+                object_id: (
+                    type("P", (presign,), {"url": f"https://example.com/{object_id}"}),
+                    type("Obj", (), {"id": object_id}),
+                )
+                for object_id in object_ids
+            }
+
+        def signed_url_ttl(self) -> int:
+            return 900
+
+    service = AssetService(
+        lambda: None,
+        storage_service=cast(StorageService, _Storage()),
+        repository=cast(AssetRepository, _Repo()),
+    )
+
+    items, missing, unsupported = await service.get_thumbnail_urls(
+        tenant_id=tenant_id, asset_ids=[with_thumb.id, without_thumb.id]
+    )
+
+    assert len(calls) == 1
+    assert not missing and not unsupported
+    assert [item.storage_object_id for item in items] == [
+        with_thumb.thumbnail_object_id,
+        without_thumb.storage_object_id,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_thumbnail_pipeline_stores_and_links_rendered_thumbnail() -> None:
+    tenant_id = uuid.uuid4()
+    asset = _image_asset(tenant_id)
+    thumbnail_id = uuid.uuid4()
+    stored: list[dict] = []
+    linked: list[tuple[uuid.UUID, uuid.UUID]] = []
+
+    class _Storage:
+        async def iter_object_bytes(self, *, tenant_id, object_id):
+            assert object_id == asset.storage_object_id
+            yield b"original-"
+            yield b"bytes"
+
+        async def put_object(self, **kwargs):
+            stored.append(kwargs)
+            return StorageObjectRef(bucket="b", key="k", id=thumbnail_id)
+
+    class _Repo:
+        async def set_thumbnail(self, *, tenant_id, asset_id, thumbnail_object_id):
+            linked.append((asset_id, thumbnail_object_id))
+
+        async def record_thumbnail_failure(self, *, tenant_id, asset_id):
+            raise AssertionError("unexpected failure")
+
+    class _InlineExecutor:
+        async def run(self, func, /, *args, **kwargs):
+            return func(*args, **kwargs)
+
+    settings = SimpleNamespace(asset_thumbnail_max_edge_px=64, asset_thumbnail_quality=70)
+    pipeline = AssetThumbnailPipeline(
+        storage_service=cast(StorageService, _Storage()),
+        repository=cast(AssetRepository, _Repo()),
+        settings_provider=lambda: cast(Settings, settings),
+        renderer=lambda data, *, max_edge, quality: f"{data!r}:{max_edge}:{quality}".encode(),
+        executor=cast(IntegrationExecutor, _InlineExecutor()),
+    )
+
+    assert await pipeline.generate(asset) == thumbnail_id
+
+    assert stored[0]["data"] == b"b'original-bytes':64:70"
+    assert stored[0]["mime_type"] == "image/webp"
+    assert stored[0]["metadata"]["derived_from"] == str(asset.storage_object_id)
+    assert stored[0]["derived_from"] == asset.storage_object_id
+    assert linked == [(asset.id, thumbnail_id)]
+    await pipeline.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_thumbnail_pipeline_refuses_oversized_sources_from_the_header() -> None:
+    image_module = pytest.importorskip("PIL.Image")
+    tenant_id = uuid.uuid4()
+    asset = _image_asset(tenant_id)
+    buffer = io.BytesIO()
+    image_module.new("1", (MAX_SOURCE_PIXELS // 1000 + 1, 1000)).save(buffer, format="PNG")
+    header = buffer.getvalue().ljust(SOURCE_HEADER_BYTES, b"\0")
+    failures: list[uuid.UUID] = []
+
+    class _Storage:
+        async def iter_object_bytes(self, *, tenant_id, object_id):
+            yield header
+            raise AssertionError("read past the header")
+
+    class _Repo:
+        async def record_thumbnail_failure(self, *, tenant_id, asset_id):
+            failures.append(asset_id)
+
+    def _renderer(data, *, max_edge, quality):
+        raise AssertionError("renderer should not run")
+
+    settings = SimpleNamespace(asset_thumbnail_max_edge_px=64, asset_thumbnail_quality=70)
+    pipeline = AssetThumbnailPipeline(
+        storage_service=cast(StorageService, _Storage()),
+        repository=cast(AssetRepository, _Repo()),
+        settings_provider=lambda: cast(Settings, settings),
+        renderer=_renderer,
+    )
+
+    assert await pipeline.generate(asset) is None
+    assert failures == [asset.id]
+
+
+@pytest.mark.asyncio
+async def test_delete_asset_removes_its_thumbnail_derivative() -> None:
+    tenant_id = uuid.uuid4()
+    asset = _image_asset(tenant_id, thumbnail_object_id=uuid.uuid4())
+    deleted: list[tuple[uuid.UUID, bool]] = []
+    marked: list[uuid.UUID] = []
+
+    class _Storage:
+        async def delete_object(self, *, tenant_id, object_id, include_derived=False):
+            deleted.append((object_id, include_derived))
+
+    class _Repo(StubAssetRepository):
+        async def mark_deleted(self, *, tenant_id, asset_id):
+            marked.append(asset_id)
+
+    service = AssetService(
+        lambda: None,
+        storage_service=cast(StorageService, _Storage()),
+        repository=cast(AssetRepository, _Repo(asset)),
+    )
+
+    await service.delete_asset(tenant_id=tenant_id, asset_id=asset.id)
+
+    assert deleted == [
+        (asset.storage_object_id, False),
+        (asset.thumbnail_object_id, True),
+    ]
+    assert marked == [asset.id]
+
+
+@pytest.mark.asyncio
+async def test_thumbnail_backfill_pages_through_assets_missing_a_thumbnail() -> None:
+    tenant_id = uuid.uuid4()
+    started = datetime.now(UTC) - timedelta(days=1)
+    assets = [
+        _image_asset(tenant_id, created_at=started + timedelta(minutes=index))
+        for index in range(5)
+    ]
+    queries: list[tuple[datetime, uuid.UUID] | None] = []
+    generated: list[uuid.UUID] = []
+
+    class _Repo:
+        async def list_missing_thumbnails(self, *, created_before, after, limit, max_failures):
+            assert max_failures == MAX_THUMBNAIL_ATTEMPTS
+            queries.append(after)
+            pending = [
+                asset
+                for asset in assets
+                if asset.created_at < created_before
+                and (after is None or (asset.created_at, asset.id) > after)
+            ]
+            return pending[:limit]
+
+    class _Pipeline:
+        async def generate(self, asset):
+            generated.append(asset.id)
+            # The broken asset keeps failing; the backfill moves on regardless.
+            return None if asset is assets[2] else uuid.uuid4()
+
+    backfill = AssetThumbnailBackfill(
+        pipeline=cast(AssetThumbnailPipeline, _Pipeline()),
+        repository=cast(AssetRepository, _Repo()),
+        batch_size=2,
+    )
+
+    assert await backfill.run_once() == 4
+    assert generated == [asset.id for asset in assets]
+    assert queries == [
+        None,
+        (assets[1].created_at, assets[1].id),
+        (assets[3].created_at, assets[3].id),
+    ]
+
+
+def test_render_thumbnail_refuses_oversized_sources() -> None:
+    image_module = pytest.importorskip("PIL.Image")
+    buffer = io.BytesIO()
+    # PNG stores the dimensions up front, so the guard trips before any decoding.
+    image_module.new("1", (MAX_SOURCE_PIXELS // 1000 + 1, 1000)).save(buffer, format="PNG")
+
+    with pytest.raises(ValueError, match="too large"):
+        render_thumbnail(buffer.getvalue(), max_edge=64, quality=70)
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.v1.auth import routes_service_accounts as routes
+from app.infrastructure.security.vault import VaultVerificationCache
+from app.observability.metrics import SERVICE_ACCOUNT_ISSUANCE_LATENCY_SECONDS
+
+
+class _CountingProvider:
+    def __init__(self, valid: bool = True) -> None:
+        self.valid = valid
+        self.calls = 0
+
+    async def verify(self, payload: bytes, signature: str, *, purpose: object) -> bool:
+        self.calls += 1
+        return self.valid
+
+
+def _observations(account: str, *, cached: bool) -> float:
+    histogram = SERVICE_ACCOUNT_ISSUANCE_LATENCY_SECONDS.labels(
+        account=account,
+        result="success",
+        reason="vault_verify",
+        reused="true" if cached else "false",
+    )
+    return next(
+        sample.value
+        for metric in histogram.collect()
+        for sample in metric.samples
+        if sample.name.endswith("_count")
+    )
+
+
+@pytest.fixture
+def cache(monkeypatch: pytest.MonkeyPatch) -> VaultVerificationCache:
+    cache = VaultVerificationCache(ttl_seconds=60)
+    monkeypatch.setattr(routes, "get_vault_verification_cache", lambda: cache)
+    return cache
+
+
+@pytest.mark.asyncio
+async def test_repeated_envelope_skips_provider(
+    monkeypatch: pytest.MonkeyPatch, cache: VaultVerificationCache
+) -> None:
+    provider = _CountingProvider()
+    monkeypatch.setattr(routes, "get_secret_provider", lambda: provider)
+    claims = {"account": "ci-bot", "exp": int(time.time()) + 120}
+    cached_before = _observations("ci-bot", cached=True)
+
+    for _ in range(3):
+        await routes._verify_vault_signature("Bearer vault:v1:sig", b"{}", claims=claims)
+
+    assert provider.calls == 1
+    assert _observations("ci-bot", cached=True) == cached_before + 2
+
+
+@pytest.mark.asyncio
+async def test_invalid_signature_is_not_cached(
+    monkeypatch: pytest.MonkeyPatch, cache: VaultVerificationCache
+) -> None:
+    provider = _CountingProvider(valid=False)
+    monkeypatch.setattr(routes, "get_secret_provider", lambda: provider)
+    claims = {"account": "ci-bot", "exp": int(time.time()) + 120}
+
+    for _ in range(2):
+        with pytest.raises(HTTPException) as excinfo:
+            await routes._verify_vault_signature("Bearer vault:v1:bad", b"{}", claims=claims)
+        assert excinfo.value.status_code == 401
+
+    assert provider.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_fractional_exp_bounds_the_cached_verification(
+    monkeypatch: pytest.MonkeyPatch, cache: VaultVerificationCache
+) -> None:
+    provider = _CountingProvider()
+    monkeypatch.setattr(routes, "get_secret_provider", lambda: provider)
+    claims = {"account": "ci-bot", "exp": time.time() + 0.05}
+
+    await routes._verify_vault_signature("Bearer vault:v1:sig", b"{}", claims=claims)
+    time.sleep(0.1)
+    await routes._verify_vault_signature("Bearer vault:v1:sig", b"{}", claims=claims)
+
+    assert provider.calls == 2
@@ -8,11 +8,17 @@ from uuid import UUID
 
 import pytest
 import pytest_asyncio
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.domain.conversations import ConversationEvent, ConversationNotFoundError
 from app.infrastructure.persistence.conversations.run_event_store import RunEventStore
-from app.infrastructure.persistence.conversations.models import AgentConversation
+from app.infrastructure.persistence.conversations.models import (
+    AgentConversation,
+    AgentRunEvent,
+    AgentRunEventKey,
+)
 from app.infrastructure.persistence.models.base import Base
 
 
@@ -124,3 +130,31 @@ async def test_get_run_events_returns_empty_for_existing_conversation(
 
     events = await store.get_run_events(conv_id, tenant_id=tenant_id)
     assert events == []
+
+
+@pytest.mark.asyncio
+async def test_duplicate_sequence_is_rejected_by_the_key_table(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    store = RunEventStore(session_factory)
+    conv_id = "5b0e3a9d-2f6c-4d8e-9a1b-7c3d5e6f7a8b"
+    tenant_id = "9f8e7d6c-5b4a-4392-8a7b-6c5d4e3f2a1b"
+    await _insert_conversation(session_factory, conv_id=conv_id, tenant_id=tenant_id)
+
+    def _event(text: str) -> ConversationEvent:
+        return ConversationEvent(
+            run_item_type="message",
+            role="assistant",
+            content_text=text,
+            sequence_no=0,
+            timestamp=datetime.now(UTC),
+        )
+
+    await store.add_run_events(conv_id, tenant_id=tenant_id, events=[_event("first")])
+    with pytest.raises(IntegrityError):
+        await store.add_run_events(conv_id, tenant_id=tenant_id, events=[_event("second")])
+
+    async with session_factory() as session:
+        events = await session.scalar(select(func.count()).select_from(AgentRunEvent))
+        keys = await session.scalar(select(func.count()).select_from(AgentRunEventKey))
+    assert (events, keys) == (1, 1)
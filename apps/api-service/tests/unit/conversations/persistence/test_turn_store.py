@@ -0,0 +1,186 @@
+"""A finished chat turn is written in one transaction with a bounded statement count."""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import AsyncGenerator, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from app.domain.conversations import (
+    ConversationEvent,
+    ConversationMessage,
+    ConversationMetadata,
+    ConversationRunUsage,
+    ConversationSessionState,
+    ConversationTurn,
+)
+from app.infrastructure.persistence.conversations.models import AgentConversation
+from app.infrastructure.persistence.conversations.postgres import PostgresConversationRepository
+from app.infrastructure.persistence.models.base import Base
+
+# SELECT conversation FOR UPDATE, active segment lookup, UPDATE conversation,
+# INSERT usage, INSERT message, next run-event sequence, dedupe lookup, SAVEPOINT,
+# batched INSERT of the run-event keys, RELEASE. Run events add one INSERT per row
+# on SQLite (Postgres batches them). Raising this bound means a turn got chattier.
+_FIXED_TURN_STATEMENTS = 10
+
+
+@dataclass
+class _Counts:
+    statements: int = 0
+    commits: int = 0
+
+
+@pytest_asyncio.fixture()
+async def engine() -> AsyncGenerator[AsyncEngine, None]:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    try:
+        yield engine
+    finally:
+        await engine.dispose()
+
+
+def _repository(engine: AsyncEngine) -> PostgresConversationRepository:
+    factory: async_sessionmaker[AsyncSession] = async_sessionmaker(engine, expire_on_commit=False)
+    return PostgresConversationRepository(factory)
+
+
+@contextmanager
+def _count_queries(engine: AsyncEngine) -> Iterator[_Counts]:
+    counts = _Counts()
+
+    def _on_execute(*_args) -> None:
+        counts.statements += 1
+
+    def _on_commit(_conn) -> None:
+        counts.commits += 1
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _on_execute)
+    event.listen(engine.sync_engine, "commit", _on_commit)
+    try:
+        yield counts
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _on_execute)
+        event.remove(engine.sync_engine, "commit", _on_commit)
+
+
+def _metadata(tenant_id: str) -> ConversationMetadata:
+    return ConversationMetadata(
+        tenant_id=tenant_id,
+        agent_entrypoint="triage",
+        active_agent="triage",
+        provider="openai",
+        user_id=str(uuid.uuid4()),
+        sdk_session_id="sess-1",
+    )
+
+
+def _turn(tenant_id: str, conversation_id: str, response_id: str) -> ConversationTurn:
+    return ConversationTurn(
+        message=ConversationMessage(role="assistant", content="Here you go."),
+        metadata=_metadata(tenant_id),
+        session_state=ConversationSessionState(
+            provider="openai",
+            sdk_session_id="sess-1",
+            session_cursor="cursor-2",
+            last_session_sync_at=datetime.now(UTC),
+        ),
+        run_usage=ConversationRunUsage(
+            conversation_id=conversation_id,
+            response_id=response_id,
+            run_id=None,
+            agent_key="triage",
+            provider="openai",
+            requests=1,
+            input_tokens=120,
+            output_tokens=30,
+            total_tokens=150,
+            cached_input_tokens=100,
+            reasoning_output_tokens=None,
+            request_usage_entries=None,
+            created_at=datetime.now(UTC),
+        ),
+        run_events=[
+            ConversationEvent(
+                run_item_type="tool_call",
+                run_item_name=f"call-{index}",
+                tool_call_id=f"call-{index}",
+                tool_name="web_search",
+                agent="triage",
+                response_id=response_id,
+            )
+            for index in range(3)
+        ],
+    )
+
+
+@pytest.mark.asyncio
+async def test_record_turn_commits_once_with_bounded_statements(engine: AsyncEngine) -> None:
+    repo = _repository(engine)
+    tenant_id = str(uuid.uuid4())
+    conversation_id = str(uuid.uuid4())
+    await repo.add_message(
+        conversation_id,
+        ConversationMessage(role="user", content="Find me something."),
+        tenant_id=tenant_id,
+        metadata=_metadata(tenant_id),
+    )
+
+    turn = _turn(tenant_id, conversation_id, "resp-1")
+    with _count_queries(engine) as counts:
+        message_id = await repo.record_turn(conversation_id, tenant_id=tenant_id, turn=turn)
+
+    assert message_id is not None
+    assert counts.commits == 1
+    assert counts.statements <= _FIXED_TURN_STATEMENTS + len(turn.run_events)
+
+    messages = await repo.get_messages(conversation_id, tenant_id=tenant_id)
+    assert [message.role for message in messages] == ["user", "assistant"]
+    state = await repo.get_session_state(conversation_id, tenant_id=tenant_id)
+    assert state is not None and state.session_cursor == "cursor-2"
+    usage = await repo.list_run_usage(conversation_id, tenant_id=tenant_id)
+    assert [row.input_tokens for row in usage] == [120]
+    events = await repo.get_run_events(conversation_id, tenant_id=tenant_id)
+    assert [ev.sequence_no for ev in events] == [0, 1, 2]
+    async with async_sessionmaker(engine)() as session:
+        row = await session.get(AgentConversation, uuid.UUID(conversation_id))
+    assert row is not None
+    assert (row.message_count, row.total_tokens_prompt, row.total_cached_input_tokens) == (
+        2,
+        120,
+        100,
+    )
+
+
+@pytest.mark.asyncio
+async def test_record_turn_keeps_message_when_event_projection_fails(engine: AsyncEngine) -> None:
+    repo = _repository(engine)
+    tenant_id = str(uuid.uuid4())
+    conversation_id = str(uuid.uuid4())
+    turn = _turn(tenant_id, conversation_id, "resp-dup")
+    # Same sequence number twice violates the (conversation, sequence) run-event key.
+    for ev in turn.run_events:
+        ev.sequence_no = 7
+
+    message_id = await repo.record_turn(conversation_id, tenant_id=tenant_id, turn=turn)
+
+    assert message_id is not None
+    messages = await repo.get_messages(conversation_id, tenant_id=tenant_id)
+    assert [message.content for message in messages] == ["Here you go."]
+    assert await repo.get_run_events(conversation_id, tenant_id=tenant_id) == []
+    usage = await repo.list_run_usage(conversation_id, tenant_id=tenant_id)
+    assert len(usage) == 1
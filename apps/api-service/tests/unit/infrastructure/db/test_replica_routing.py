@@ -0,0 +1,132 @@
+"""Read-only queries land on the replica unless the request has already written."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.domain.activity import ActivityEvent
+from app.infrastructure.db.routing import (
+    PrimarySession,
+    ReplicaSessionmaker,
+    has_written,
+    read_your_writes,
+)
+from app.infrastructure.persistence.activity.repository import (
+    SqlAlchemyActivityEventRepository,
+)
+from app.infrastructure.persistence.models.base import Base
+from app.infrastructure.persistence.registry import import_all_models
+from app.infrastructure.persistence.tenants.models import TenantAccount
+
+TENANT_ID = str(uuid4())
+
+
+@dataclass(slots=True)
+class _Factories:
+    primary: async_sessionmaker[AsyncSession]
+    read: async_sessionmaker[AsyncSession]
+
+
+async def _bootstrap(url: str) -> None:
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine)() as session:
+        session.add(TenantAccount(id=UUID(TENANT_ID), slug="tenant-replica", name="Tenant"))
+        await session.commit()
+    await engine.dispose()
+
+
+@pytest.fixture
+async def factories(tmp_path: Path) -> AsyncIterator[_Factories]:
+    import_all_models()
+    primary_url = f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}"
+    replica_url = f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}"
+    for url in (primary_url, replica_url):
+        await _bootstrap(url)
+
+    primary_engine = create_async_engine(primary_url)
+    replica_engine = create_async_engine(replica_url)
+    primary = async_sessionmaker(
+        primary_engine, expire_on_commit=False, sync_session_class=PrimarySession
+    )
+    read = ReplicaSessionmaker(replica_engine, primary=primary, expire_on_commit=False)
+    try:
+        yield _Factories(primary=primary, read=read)
+    finally:
+        await primary_engine.dispose()
+        await replica_engine.dispose()
+
+
+def _event(action: str) -> ActivityEvent:
+    return ActivityEvent(
+        id=str(uuid4()),
+        tenant_id=TENANT_ID,
+        action=action,
+        created_at=datetime.now(UTC),
+    )
+
+
+async def _actions(repo: SqlAlchemyActivityEventRepository) -> list[str]:
+    page = await repo.list_events(TENANT_ID, limit=10)
+    return [event.action for event in page.items]
+
+
+async def _primary_ids(factories: _Factories) -> list[str]:
+    async with factories.primary() as session:
+        rows = await session.execute(text("SELECT id FROM activity_events"))
+        return [str(UUID(str(value))) for value in rows.scalars()]
+
+
+@pytest.mark.asyncio
+async def test_feed_reads_replica_and_writes_hit_primary(factories: _Factories) -> None:
+    replica_only = SqlAlchemyActivityEventRepository(factories.read)
+    await replica_only.record(_event("seeded.on_replica"))
+    repo = SqlAlchemyActivityEventRepository(
+        factories.primary, read_session_factory=factories.read
+    )
+
+    await repo.record(_event("written.on_primary"))
+
+    # Outside a request scope writes are not tracked, so listing stays on the replica.
+    assert await _actions(repo) == ["seeded.on_replica"]
+    stored = await repo.get_event(TENANT_ID, (await _primary_ids(factories))[0])
+    assert stored is not None and stored.action == "written.on_primary"
+
+
+@pytest.mark.asyncio
+async def test_request_reads_its_own_writes_from_primary(factories: _Factories) -> None:
+    repo = SqlAlchemyActivityEventRepository(
+        factories.primary, read_session_factory=factories.read
+    )
+
+    with read_your_writes():
+        assert await _actions(repo) == []
+        assert not has_written()
+
+        await repo.record(_event("written.in_request"))
+
+        assert has_written()
+        assert await _actions(repo) == ["written.in_request"]
+
+    with read_your_writes():
+        assert await _actions(repo) == []
+
+
+@pytest.mark.asyncio
+async def test_primary_reads_do_not_count_as_writes(factories: _Factories) -> None:
+    repo = SqlAlchemyActivityEventRepository(factories.primary)
+
+    with read_your_writes():
+        await repo.list_events(TENANT_ID, limit=10)
+        await _primary_ids(factories)
+
+        assert not has_written()
@@ -0,0 +1,87 @@
+"""Monthly partition naming, bounds, and expiry selection."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from datetime import UTC, date, datetime
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.infrastructure.persistence.partitions import (
+    RUN_EVENTS,
+    MonthlyPartition,
+    add_months,
+    expired_partitions,
+    is_partition_name,
+    is_partitioned,
+    monthly_partitions,
+)
+
+
+def test_partition_name_and_bounds_cover_one_utc_month() -> None:
+    partition = MonthlyPartition(table="agent_run_events", start=date(2026, 12, 1))
+
+    assert partition.name == "agent_run_events_p202612"
+    assert partition.end == date(2027, 1, 1)
+    assert partition.end_at == datetime(2027, 1, 1, tzinfo=UTC)
+    assert partition.create_sql() == (
+        'CREATE TABLE IF NOT EXISTS "agent_run_events_p202612" PARTITION OF "agent_run_events" '
+        "FOR VALUES FROM ('2026-12-01 00:00:00+00') TO ('2027-01-01 00:00:00+00')"
+    )
+
+
+def test_from_name_ignores_default_and_foreign_partitions() -> None:
+    parsed = MonthlyPartition.from_name("activity_events", "activity_events_p202602")
+
+    assert parsed == MonthlyPartition(table="activity_events", start=date(2026, 2, 1))
+    assert MonthlyPartition.from_name("activity_events", "activity_events_default") is None
+    assert MonthlyPartition.from_name("activity_events", "activity_events_p202613") is None
+    assert MonthlyPartition.from_name("activity_events", "agent_run_events_p202602") is None
+
+
+def test_partition_names_cover_monthly_and_default_partitions() -> None:
+    partition = MonthlyPartition(table="activity_events", start=date(2026, 3, 1))
+
+    assert partition.attach_sql() == (
+        'ALTER TABLE "activity_events" ATTACH PARTITION "activity_events_p202603" '
+        "FOR VALUES FROM ('2026-03-01 00:00:00+00') TO ('2026-04-01 00:00:00+00')"
+    )
+    assert is_partition_name("conversation_ledger_events_default")
+    assert is_partition_name("agent_run_events_p202611")
+    assert not is_partition_name("agent_run_events")
+    assert not is_partition_name("agent_run_event_keys")
+
+
+def test_monthly_partitions_span_year_boundaries() -> None:
+    partitions = monthly_partitions(
+        "t", first=date(2026, 11, 17), last=add_months(date(2026, 11, 1), 3)
+    )
+
+    assert [p.name for p in partitions] == ["t_p202611", "t_p202612", "t_p202701", "t_p202702"]
+    assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+
+
+def test_expired_partitions_keep_the_month_containing_the_cutoff() -> None:
+    partitions = monthly_partitions("t", first=date(2026, 1, 1), last=date(2026, 6, 1))
+
+    expired = expired_partitions(partitions, cutoff=datetime(2026, 4, 15, tzinfo=UTC))
+    assert [p.name for p in expired] == ["t_p202601", "t_p202602", "t_p202603"]
+
+    on_boundary = expired_partitions(partitions, cutoff=datetime(2026, 4, 1, tzinfo=UTC))
+    assert [p.name for p in on_boundary] == ["t_p202601", "t_p202602", "t_p202603"]
+
+
+@pytest.fixture
+async def sqlite_session() -> AsyncIterator[AsyncSession]:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    try:
+        async with async_sessionmaker(engine)() as session:
+            yield session
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_is_partitioned_is_false_off_postgres(sqlite_session: AsyncSession) -> None:
+    assert await is_partitioned(sqlite_session, RUN_EVENTS.name) is False
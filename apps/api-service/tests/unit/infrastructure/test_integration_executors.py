@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import boto3
+import pytest
+
+from app.core.settings import Settings
+from app.domain.storage import S3ProviderConfig, StorageProviderStatus
+from app.infrastructure.executors import (
+    IntegrationExecutor,
+    IntegrationExecutorRegistry,
+    IntegrationExecutorSaturatedError,
+    shutdown_integration_executors,
+)
+from app.infrastructure.storage.providers.s3 import S3StorageProvider
+from app.infrastructure.stripe.errors import StripeClientError
+from app.infrastructure.stripe.transport import StripeRequestExecutor
+from app.observability.metrics import INTEGRATION_EXECUTOR_REJECTIONS_TOTAL
+
+
+def _rejections(executor: str) -> float:
+    return INTEGRATION_EXECUTOR_REJECTIONS_TOTAL.labels(executor=executor)._value.get()
+
+
+@pytest.mark.asyncio
+async def test_executor_rejects_when_workers_and_queue_are_full() -> None:
+    executor = IntegrationExecutor("unit-saturation", max_workers=1, max_queue=1)
+    release = threading.Event()
+    try:
+        running = asyncio.create_task(executor.run(release.wait))
+        queued = asyncio.create_task(executor.run(release.wait))
+        await asyncio.sleep(0.05)
+        assert executor.in_flight == 2
+
+        before = _rejections("unit-saturation")
+        with pytest.raises(IntegrationExecutorSaturatedError):
+            await executor.run(lambda: None)
+        assert _rejections("unit-saturation") == before + 1
+
+        release.set()
+        assert await running is True
+        assert await queued is True
+        assert executor.in_flight == 0
+        assert await executor.run(lambda: "ok") == "ok"
+    finally:
+        release.set()
+        executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_keeps_slot_until_thread_finishes() -> None:
+    executor = IntegrationExecutor("unit-cancel", max_workers=1, max_queue=0)
+    release = threading.Event()
+    try:
+        task = asyncio.create_task(executor.run(release.wait))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        # The hung call still occupies the only worker.
+        with pytest.raises(IntegrationExecutorSaturatedError):
+            await executor.run(lambda: None)
+        release.set()
+        for _ in range(50):
+            if executor.in_flight == 0:
+                break
+            await asyncio.sleep(0.01)
+        assert executor.in_flight == 0
+    finally:
+        release.set()
+        executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_hung_stripe_calls_do_not_starve_other_integrations() -> None:
+    """Chaos scenario: Stripe hangs indefinitely while storage/geoip keep serving."""
+
+    stripe_pool = IntegrationExecutor("chaos-stripe", max_workers=2, max_queue=1)
+    storage_pool = IntegrationExecutor("chaos-storage", max_workers=2, max_queue=4)
+    geoip_pool = IntegrationExecutor("chaos-geoip", max_workers=1, max_queue=4)
+    stripe = StripeRequestExecutor(max_attempts=1, executor=stripe_pool)
+    stripe_hang = threading.Event()
+    try:
+        hung = [
+            asyncio.create_task(stripe.request("customer.create", stripe_hang.wait))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0.05)
+
+        with pytest.raises(StripeClientError) as excinfo:
+            await asyncio.wait_for(stripe.request("customer.create", lambda: None), 1.0)
+        assert excinfo.value.code == "executor_saturated"
+
+        for i in range(20):
+            result = await asyncio.wait_for(storage_pool.run(lambda i=i: i * 2), timeout=1.0)
+            assert result == i * 2
+        assert await asyncio.wait_for(geoip_pool.run(lambda: "US"), timeout=1.0) == "US"
+
+        stripe_hang.set()
+        assert await asyncio.gather(*hung) == [True, True, True]
+    finally:
+        stripe_hang.set()
+        for pool in (stripe_pool, storage_pool, geoip_pool):
+            pool.shutdown()
+
+
+def test_registry_rebuilds_an_executor_when_its_limits_change() -> None:
+    registry = IntegrationExecutorRegistry()
+    small = Settings.model_validate(
+        {"INTEGRATION_EXECUTOR_STORAGE_WORKERS": 2, "INTEGRATION_EXECUTOR_STORAGE_QUEUE": 1}
+    )
+    large = Settings.model_validate(
+        {"INTEGRATION_EXECUTOR_STORAGE_WORKERS": 8, "INTEGRATION_EXECUTOR_STORAGE_QUEUE": 4}
+    )
+    try:
+        first = registry.get("storage", small)
+        assert registry.get("storage", small) is first
+        assert first.limits == (2, 1)
+
+        resized = registry.get("storage", large)
+        assert resized is not first
+        assert resized.limits == (8, 4)
+        assert registry.get("storage", large) is resized
+    finally:
+        registry.shutdown()
+
+
+class _S3Stub:
+    def head_bucket(self, *, Bucket: str) -> None:
+        return None
+
+
+@pytest.mark.asyncio
+async def test_long_lived_clients_survive_an_executor_reset(monkeypatch) -> None:
+    monkeypatch.setattr(boto3, "client", lambda _name, **_kwargs: _S3Stub())
+    storage = S3StorageProvider(
+        S3ProviderConfig(region=None, bucket="assets", endpoint_url=None, force_path_style=False)
+    )
+    stripe = StripeRequestExecutor(max_attempts=1)
+    try:
+        assert (await storage.health_check()).status is StorageProviderStatus.HEALTHY
+        assert await stripe.request("customer.create", lambda: "first") == "first"
+
+        # What container shutdown/reset does; cached providers and clients are kept.
+        shutdown_integration_executors()
+
+        assert (await storage.health_check()).status is StorageProviderStatus.HEALTHY
+        assert await stripe.request("customer.create", lambda: "second") == "second"
+    finally:
+        shutdown_integration_executors()
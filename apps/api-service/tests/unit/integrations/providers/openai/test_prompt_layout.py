@@ -0,0 +1,130 @@
+"""Rendered agent prompts keep a byte-stable prefix ahead of per-run context."""
+
+from __future__ import annotations
+
+import hashlib
+from types import SimpleNamespace
+from typing import Any, cast
+
+import pytest
+
+from app.agents._shared import prompt_context
+from app.agents._shared.prompt_context import PromptRuntimeContext
+from app.agents._shared.registry_loader import load_agent_specs
+from app.agents._shared.specs import AgentSpec
+from app.core.settings import Settings
+from app.infrastructure.providers.openai.registry.agent_builder import AgentBuilder
+from app.infrastructure.providers.openai.registry.prompt import PromptRenderer
+from app.infrastructure.providers.openai.registry.tool_resolver import ToolResolver
+from app.observability.metrics import REGISTRY
+from app.services.agents.context import ConversationActorContext
+from app.utils.tools import ToolRegistry
+
+_SETTINGS = SimpleNamespace(environment="test", agent_default_model="default")
+
+
+def _clock_provider(minute: int):
+    def _provider(ctx: PromptRuntimeContext, spec: Any) -> dict[str, Any]:
+        time = f"16:{minute:02d} UTC"
+        return {"date": "May 4, 2026", "time": time, "date_and_time": f"May 4, 2026 at {time}"}
+
+    return _provider
+
+
+def _turn(*, message: str, summary: str | None, user_id: str = "user-1") -> PromptRuntimeContext:
+    return PromptRuntimeContext(
+        actor=ConversationActorContext(tenant_id="tenant-1", user_id=user_id),
+        conversation_id="conv-1",
+        request_message=message,
+        settings=_SETTINGS,
+        memory_summary=summary,
+    )
+
+
+def _sha(value: str) -> str:
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+@pytest.mark.parametrize("spec", load_agent_specs(), ids=lambda spec: spec.key)
+def test_stable_prefix_hashes_identically_across_turns_and_minutes(
+    spec, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    renderer = PromptRenderer(settings_factory=lambda: cast(Settings, _SETTINGS))
+
+    monkeypatch.setitem(prompt_context._PROVIDER_REGISTRY, "datetime", _clock_provider(4))
+    first_prefix, first_context, _ = renderer.render_sections(
+        spec=spec,
+        runtime_ctx=_turn(message="hello", summary=None),
+        validate_prompts=True,
+    )
+    monkeypatch.setitem(prompt_context._PROVIDER_REGISTRY, "datetime", _clock_provider(5))
+    second_prefix, second_context, _ = renderer.render_sections(
+        spec=spec,
+        runtime_ctx=_turn(message="and now?", summary="User prefers tables.", user_id="user-2"),
+        validate_prompts=True,
+    )
+
+    assert _sha(first_prefix) == _sha(second_prefix)
+    sections = set(spec.runtime_context)
+    assert ("16:04 UTC" in first_context) == ("datetime" in sections)
+    assert ("16:05 UTC" in second_context) == ("datetime" in sections)
+    assert ("user-2" in second_context) == ("identity" in sections)
+    assert ("conv-1" in second_context) == ("conversation" in sections)
+    assert ("User prefers tables." in second_context) == ("memory" in sections)
+    assert bool(second_context) == bool(sections)
+    for volatile in ("16:0", "user-", "conv-1", "User prefers tables."):
+        assert volatile not in second_prefix
+
+
+def test_builder_appends_runtime_context_and_records_prefix_size() -> None:
+    settings_factory = lambda: cast(Settings, _SETTINGS)  # noqa: E731
+    builder = AgentBuilder(
+        tool_resolver=ToolResolver(tool_registry=ToolRegistry(), settings_factory=settings_factory),
+        prompt_renderer=PromptRenderer(settings_factory=settings_factory),
+        settings_factory=settings_factory,
+    )
+    spec = AgentSpec(
+        key="layout-probe",
+        display_name="Layout Probe",
+        description="",
+        instructions="Answer briefly.",
+        runtime_context=("memory", "datetime"),
+    )
+
+    result = builder.build_agent(
+        spec=spec,
+        runtime_ctx=_turn(message="hi", summary="Earlier: discussed pricing."),
+        agents={},
+        spec_map={spec.key: spec},
+        validate_prompts=True,
+    )
+
+    instructions = str(result.agent.instructions)
+    assert instructions.startswith("Answer briefly.\n\n---\n\n# Runtime Context")
+    assert "Earlier: discussed pricing." in instructions
+    assert instructions.rstrip().endswith("UTC")
+    # Sections the agent did not opt into stay out of its instructions.
+    for identifier in ("tenant-1", "user-1", "conv-1"):
+        assert identifier not in instructions
+    recorded = REGISTRY.get_sample_value(
+        "agent_prompt_stable_prefix_bytes", {"agent": "layout-probe"}
+    )
+    assert recorded == len(b"Answer briefly.")
+
+
+def test_agents_without_runtime_context_get_no_trailer() -> None:
+    renderer = PromptRenderer(settings_factory=lambda: cast(Settings, _SETTINGS))
+    spec = AgentSpec(
+        key="no-context",
+        display_name="No Context",
+        description="",
+        instructions="Answer briefly.",
+    )
+
+    instructions, _ = renderer.render_instructions(
+        spec=spec,
+        runtime_ctx=_turn(message="hi", summary="Earlier: discussed pricing."),
+        validate_prompts=True,
+    )
+
+    assert instructions == "Answer briefly."
@@ -2,73 +2,184 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 from typing import Any
 
 import httpx
 import pytest
 
-from app.infrastructure.security.vault import VaultTransitClient, VaultVerificationError
+from app.infrastructure.security.vault import (
+    AsyncVaultTransitClient,
+    VaultSigningError,
+    VaultVerificationCache,
+    VaultVerificationError,
+)
 
 
-class MockTransport(httpx.BaseTransport):
-    def __init__(self, status_code: int, payload: dict[str, Any]):
-        self._status_code = status_code
-        self._payload = payload
+class _TransitRecorder:
+    def __init__(self, handler: Any) -> None:
+        self._handler = handler
+        self.requests: list[httpx.Request] = []
 
-    def handle_request(self, request: httpx.Request) -> httpx.Response:
-        return httpx.Response(
-            status_code=self._status_code,
-            content=json.dumps(self._payload),
-            request=request,
-        )
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return self._handler(request)
 
 
-class HeaderCaptureTransport(httpx.BaseTransport):
-    def __init__(self, expected_namespace: str):
-        self.expected_namespace = expected_namespace
-        self.last_request: httpx.Request | None = None
-
-    def handle_request(self, request: httpx.Request) -> httpx.Response:
-        self.last_request = request
-        return httpx.Response(status_code=500, json={"errors": ["forced"]}, request=request)
+def _async_client(recorder: _TransitRecorder, **kwargs: Any) -> AsyncVaultTransitClient:
+    return AsyncVaultTransitClient(
+        base_url="https://vault/",
+        token="token",
+        key_name="auth-service",
+        transport=httpx.MockTransport(recorder),
+        **kwargs,
+    )
 
 
-def test_vault_verify_success(monkeypatch: pytest.MonkeyPatch) -> None:
-    transport = MockTransport(200, {"data": {"valid": True}})
+@pytest.mark.asyncio
+async def test_async_client_reuses_pooled_connection_and_sends_headers() -> None:
+    recorder = _TransitRecorder(lambda request: httpx.Response(200, json={"data": {"valid": True}}))
+    client = _async_client(recorder, namespace="admin/tenant")
 
-    client = VaultTransitClient(base_url="https://vault", token="token", key_name="auth-service")
-    assert client.verify_signature("payload", "signature", transport=transport) is True
+    assert await client.verify_signature("payload", "vault:v1:sig") is True
+    pooled = client._client
+    assert await client.verify_signature("payload", "vault:v1:sig") is True
+    assert client._client is pooled
 
+    request = recorder.requests[-1]
+    assert request.url == "https://vault/v1/transit/verify/auth-service"
+    assert request.headers["X-Vault-Token"] == "token"
+    assert request.headers["X-Vault-Namespace"] == "admin/tenant"
 
-def test_vault_verify_invalid(monkeypatch: pytest.MonkeyPatch) -> None:
-    transport = MockTransport(200, {"data": {"valid": False}})
+    await client.aclose()
+    assert client._client is None
 
-    client = VaultTransitClient(base_url="https://vault", token="token", key_name="auth-service")
-    assert client.verify_signature("payload", "signature", transport=transport) is False
 
+@pytest.mark.asyncio
+async def test_async_client_reports_invalid_signature() -> None:
+    client = _async_client(
+        _TransitRecorder(lambda request: httpx.Response(200, json={"data": {"valid": False}}))
+    )
+    assert await client.verify_signature("payload", "signature") is False
+    await client.aclose()
 
-def test_vault_verify_error(monkeypatch: pytest.MonkeyPatch) -> None:
-    transport = MockTransport(500, {"errors": ["failure"]})
 
-    client = VaultTransitClient(base_url="https://vault", token="token", key_name="auth-service")
+@pytest.mark.asyncio
+async def test_async_client_sign_returns_signature_or_raises() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        if body["input"] == "empty":
+            return httpx.Response(200, json={"data": {}})
+        return httpx.Response(200, json={"data": {"signature": f"vault:v1:{body['input']}"}})
 
-    with pytest.raises(VaultVerificationError):
-        client.verify_signature("payload", "signature", transport=transport)
+    client = _async_client(_TransitRecorder(handler))
+    assert await client.sign_payload("x") == "vault:v1:x"
+    with pytest.raises(VaultSigningError):
+        await client.sign_payload("empty")
+    await client.aclose()
 
 
-def test_vault_namespace_header(monkeypatch: pytest.MonkeyPatch) -> None:
-    transport = HeaderCaptureTransport(expected_namespace="admin/tenant")
-    client = VaultTransitClient(
-        base_url="https://vault",
-        token="token",
-        key_name="auth-service",
-        namespace="admin/tenant",
-    )
-
+@pytest.mark.asyncio
+async def test_async_client_raises_on_http_error() -> None:
+    client = _async_client(_TransitRecorder(lambda request: httpx.Response(403, text="denied")))
     with pytest.raises(VaultVerificationError):
-        client.verify_signature("payload", "signature", transport=transport)
-
-    assert transport.last_request is not None
-    headers = transport.last_request.headers
-    assert headers.get("X-Vault-Namespace") == "admin/tenant"
+        await client.verify_signature("payload", "signature")
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_batch_methods_send_batch_input_and_preserve_order() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        if request.url.path.endswith("/sign/auth-service"):
+            results = [{"signature": f"vault:v1:{item['input']}"} for item in body["batch_input"]]
+        else:
+            results = [
+                {"error": "invalid signature"} if item["signature"] == "bad" else {"valid": True}
+                for item in body["batch_input"]
+            ]
+        return httpx.Response(200, json={"data": {"batch_results": results}})
+
+    recorder = _TransitRecorder(handler)
+    client = _async_client(recorder)
+
+    assert await client.sign_batch(["a", "b"], signature_algorithm="sha2-512") == [
+        "vault:v1:a",
+        "vault:v1:b",
+    ]
+    assert json.loads(recorder.requests[-1].content) == {
+        "batch_input": [{"input": "a"}, {"input": "b"}],
+        "signature_algorithm": "sha2-512",
+    }
+
+    assert await client.verify_batch([("a", "vault:v1:a"), ("b", "bad")]) == [True, False]
+    assert recorder.requests[-1].url == "https://vault/v1/transit/verify/auth-service"
+    assert json.loads(recorder.requests[-1].content) == {
+        "batch_input": [
+            {"input": "a", "signature": "vault:v1:a"},
+            {"input": "b", "signature": "bad"},
+        ]
+    }
+    assert len(recorder.requests) == 2
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_single_calls_are_coalesced_into_one_batch() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        if request.url.path.endswith("/verify/auth-service"):
+            results = [{"valid": item["signature"] == "ok"} for item in body["batch_input"]]
+        else:
+            results = [
+                {"error": "bad input"} if item["input"] == "bad" else {"signature": "vault:v1:s"}
+                for item in body["batch_input"]
+            ]
+        return httpx.Response(200, json={"data": {"batch_results": results}})
+
+    recorder = _TransitRecorder(handler)
+    client = _async_client(recorder)
+
+    verified = await asyncio.gather(
+        client.verify_signature("a", "ok"),
+        client.verify_signature("b", "nope"),
+        client.verify_signature("c", "ok"),
+    )
+    assert verified == [True, False, True]
+    assert len(recorder.requests) == 1
+    assert [item["input"] for item in json.loads(recorder.requests[0].content)["batch_input"]] == [
+        "a",
+        "b",
+        "c",
+    ]
+
+    signed = await asyncio.gather(
+        client.sign_payload("a"), client.sign_payload("bad"), return_exceptions=True
+    )
+    assert signed[0] == "vault:v1:s"
+    assert isinstance(signed[1], VaultSigningError)
+    assert len(recorder.requests) == 2
+    await client.aclose()
+
+
+def test_verification_cache_expires_and_evicts() -> None:
+    now = [100.0]
+    cache = VaultVerificationCache(ttl_seconds=30, max_entries=2, clock=lambda: now[0])
+    first = cache.digest(b"payload", "sig-1")
+    second = cache.digest(b"payload", "sig-2")
+    third = cache.digest(b"payload", "sig-3")
+
+    cache.add(first)
+    cache.add(second, ttl_seconds=5)
+    assert cache.contains(first) and cache.contains(second)
+
+    now[0] += 10
+    assert cache.contains(second) is False
+    cache.add(second)
+    cache.add(third)
+    assert cache.contains(first) is False  # evicted as least recently used
+
+    now[0] += 31
+    assert cache.contains(third) is False
+    assert VaultVerificationCache(ttl_seconds=0).enabled is False
@@ -0,0 +1,128 @@
+"""HTTP RED metrics and multiprocess aggregation of the /metrics payload."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from prometheus_client.parser import text_string_to_metric_families
+
+from app.middleware.metrics import HttpMetricsMiddleware
+from app.observability import metrics
+
+# Each worker is a fresh interpreter so prometheus_client starts in multiprocess
+# mode, mirroring `uvicorn --workers N` with PROMETHEUS_MULTIPROC_DIR set.
+_WORKER = textwrap.dedent(
+    """
+    import sys
+
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from app.middleware.metrics import HttpMetricsMiddleware
+    from app.observability import metrics
+
+    requests, exit_cleanly = int(sys.argv[1]), sys.argv[2] == "exit"
+    app = FastAPI()
+    app.add_middleware(HttpMetricsMiddleware)
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: str) -> dict[str, str]:
+        return {"id": item_id}
+
+    client = TestClient(app)
+    for index in range(requests):
+        assert client.get(f"/items/{index}").status_code == 200
+    metrics.record_workflow_run_workers_busy(value=2)
+    if exit_cleanly:
+        metrics.mark_process_exited()
+    """
+)
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(HttpMetricsMiddleware)
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: str) -> dict[str, str]:
+        return {"id": item_id}
+
+    @app.get("/boom")
+    async def boom() -> None:
+        raise HTTPException(status_code=503, detail="down")
+
+    return app
+
+
+def _count(route: str, status_class: str, method: str = "GET") -> float:
+    value = metrics.REGISTRY.get_sample_value(
+        "http_request_duration_seconds_count",
+        {"method": method, "route": route, "status_class": status_class},
+    )
+    return value or 0.0
+
+
+def test_requests_are_labelled_by_route_template() -> None:
+    before_items = _count("/items/{item_id}", "2xx")
+    before_errors = _count("/boom", "5xx")
+    before_unmatched = _count("unmatched", "4xx")
+    before_other_method = _count("/items/{item_id}", "4xx", method="OTHER")
+
+    client = TestClient(_app())
+    for item_id in ("a", "b", "c"):
+        client.get(f"/items/{item_id}")
+    client.get("/boom")
+    client.get("/no/such/path")
+    client.request("PROPFIND", "/items/a")
+
+    assert _count("/items/{item_id}", "2xx") - before_items == 3
+    assert _count("/boom", "5xx") - before_errors == 1
+    assert _count("unmatched", "4xx") - before_unmatched == 1
+    assert _count("/items/{item_id}", "4xx", method="OTHER") - before_other_method == 1
+
+
+def test_route_labels_are_capped(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(metrics, "_http_route_labels", {"/known"})
+    monkeypatch.setattr(metrics, "_HTTP_ROUTE_LABEL_LIMIT", 1)
+
+    assert metrics._http_route_label("/known") == "/known"
+    assert metrics._http_route_label("/new/{id}") == "other"
+    assert metrics._http_route_label(None) == "unmatched"
+
+
+def test_multiprocess_scrape_sums_every_worker(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    env = {
+        **os.environ,
+        metrics.MULTIPROCESS_DIR_ENV: str(tmp_path),
+        "PYTHONPATH": os.pathsep.join(sys.path),
+    }
+    workers = [(3, "exit"), (5, "stay"), (7, "stay")]
+    processes = [
+        subprocess.Popen([sys.executable, "-c", _WORKER, str(count), mode], env=env)
+        for count, mode in workers
+    ]
+    assert [process.wait(timeout=120) for process in processes] == [0, 0, 0]
+
+    monkeypatch.setenv(metrics.MULTIPROCESS_DIR_ENV, str(tmp_path))
+    payload = metrics.render_latest().decode()
+    samples = {
+        (sample.name, tuple(sorted(sample.labels.items()))): sample.value
+        for family in text_string_to_metric_families(payload)
+        for sample in family.samples
+    }
+
+    request_count = samples[
+        (
+            "http_request_duration_seconds_count",
+            (("method", "GET"), ("route", "/items/{item_id}"), ("status_class", "2xx")),
+        )
+    ]
+    assert request_count == 15
+    # livesum drops the worker that exited cleanly.
+    assert samples[("workflow_run_workers_busy", ())] == 4
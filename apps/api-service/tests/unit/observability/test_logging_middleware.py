@@ -0,0 +1,142 @@
+"""Pure-ASGI request logging middleware."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.middleware.logging import LoggingMiddleware
+from app.observability.logging import JSONLogFormatter, clear_log_context, get_log_context
+
+
+class _BufferHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.items: list[dict[str, Any]] = []
+
+    def emit(self, record: logging.LogRecord) -> None:  # pragma: no cover - trivial transport
+        self.items.append(json.loads(self.format(record)))
+
+
+@pytest.fixture
+def log_records() -> Iterator[list[dict[str, Any]]]:
+    clear_log_context()
+    handler = _BufferHandler()
+    handler.setFormatter(JSONLogFormatter())
+    logger = logging.getLogger("api-service.observability")
+    logger.setLevel(logging.INFO)
+    logger.addHandler(handler)
+    try:
+        yield handler.items
+    finally:
+        logger.removeHandler(handler)
+
+
+def _app(
+    release: asyncio.Event | None = None, body_tasks: list[asyncio.Task[Any] | None] | None = None
+) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(LoggingMiddleware)
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: str, request: Request) -> dict[str, str]:
+        return {"id": item_id, "correlation_id": request.state.correlation_id}
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def _body() -> AsyncIterator[bytes]:
+            if body_tasks is not None:
+                body_tasks.append(asyncio.current_task())
+            yield f"first {get_log_context().get('correlation_id')}\n".encode()
+            if release is not None:
+                await release.wait()
+            yield b"second\n"
+
+        return StreamingResponse(_body(), media_type="text/plain")
+
+    return app
+
+
+def test_request_and_response_are_logged_under_the_correlation_id(
+    log_records: list[dict[str, Any]],
+) -> None:
+    client = TestClient(_app())
+
+    response = client.get("/items/42", headers={"user-agent": "pytest"})
+
+    correlation_id = response.headers["X-Correlation-ID"]
+    assert response.json() == {"id": "42", "correlation_id": correlation_id}
+    assert float(response.headers["X-Process-Time"]) >= 0
+    by_event = {record["event"]: record for record in log_records}
+    request_log, response_log = by_event["http.request"], by_event["http.response"]
+    assert request_log["correlation_id"] == response_log["correlation_id"] == correlation_id
+    assert request_log["fields"]["method"] == "GET"
+    assert request_log["fields"]["path"] == "http://testserver/items/42"
+    assert request_log["fields"]["user_agent"] == "pytest"
+    assert response_log["fields"]["status_code"] == 200
+    assert response_log["fields"]["content_type"] == "application/json"
+    assert response_log["fields"]["duration_ms"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_streamed_body_is_forwarded_chunk_by_chunk_from_the_request_task(
+    log_records: list[dict[str, Any]],
+) -> None:
+    # The generator only yields its second chunk once the client has received the
+    # first, so a middleware that buffers the body would never complete.
+    release = asyncio.Event()
+    body_tasks: list[asyncio.Task[Any] | None] = []
+    app = _app(release, body_tasks)
+    start: dict[str, Any] = {}
+    chunks: list[bytes] = []
+
+    async def receive() -> dict[str, Any]:
+        await asyncio.Event().wait()
+        raise AssertionError("unreachable")
+
+    async def send(message: dict[str, Any]) -> None:
+        if message["type"] == "http.response.start":
+            start.update(message)
+        elif message.get("body"):
+            chunks.append(message["body"])
+            release.set()
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.4"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/stream",
+        "raw_path": b"/stream",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"testserver")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+    }
+    request_tasks: list[asyncio.Task[Any] | None] = []
+
+    async def _serve() -> None:
+        request_tasks.append(asyncio.current_task())
+        await app(scope, receive, send)
+
+    await asyncio.wait_for(_serve(), timeout=5)
+
+    headers = {key.decode().lower(): value.decode() for key, value in start["headers"]}
+    correlation_id = headers["x-correlation-id"]
+    # The log context is still active while the body is produced.
+    assert chunks == [f"first {correlation_id}\n".encode(), b"second\n"]
+    # No per-request task: the body is produced by the task serving the request.
+    assert body_tasks == request_tasks
+    response_log = next(record for record in log_records if record["event"] == "http.response")
+    assert response_log["correlation_id"] == correlation_id
+    assert response_log["fields"]["content_type"].startswith("text/plain")
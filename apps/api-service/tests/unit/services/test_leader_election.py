@@ -0,0 +1,151 @@
+"""Singleton jobs run on exactly one contender and fail over when the leader dies."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from fakeredis import FakeServer
+from fakeredis.aioredis import FakeRedis
+from redis.exceptions import ConnectionError
+
+from app.bootstrap.container import ApplicationContainer, start_singleton_job
+from app.core.settings import get_settings
+from app.services.shared.leader_election import LeaderElectedJob, RedisLeaderLease
+
+TTL_SECONDS = 0.3
+
+
+class _Job:
+    def __init__(self) -> None:
+        self.running = False
+        self.starts = 0
+
+    async def start(self) -> None:
+        self.running = True
+        self.starts += 1
+
+    async def shutdown(self) -> None:
+        self.running = False
+
+
+def _contenders(count: int) -> tuple[list[LeaderElectedJob], list[_Job]]:
+    server = FakeServer()
+    jobs = [_Job() for _ in range(count)]
+    contenders = [
+        LeaderElectedJob(
+            "stripe-retry",
+            job,
+            lease=RedisLeaderLease(
+                FakeRedis(server=server),
+                name="stripe-retry",
+                holder_id=f"node-{index}",
+                ttl_seconds=TTL_SECONDS,
+            ),
+            ttl_seconds=TTL_SECONDS,
+        )
+        for index, job in enumerate(jobs)
+    ]
+    return contenders, jobs
+
+
+async def _poll_all(contenders: list[LeaderElectedJob]) -> None:
+    for contender in contenders:
+        await contender.poll()
+
+
+@pytest.mark.asyncio
+async def test_exactly_one_contender_runs_the_job() -> None:
+    contenders, jobs = _contenders(3)
+
+    for _ in range(3):
+        await _poll_all(contenders)
+
+    assert [job.running for job in jobs] == [True, False, False]
+    assert jobs[0].starts == 1
+    assert [c.is_leader for c in contenders] == [True, False, False]
+
+
+@pytest.mark.asyncio
+async def test_follower_takes_over_after_leader_crash() -> None:
+    contenders, jobs = _contenders(3)
+    leader, *followers = contenders
+    await _poll_all(contenders)
+
+    # The leader stops renewing (process frozen or killed) and its lease expires.
+    await asyncio.sleep(TTL_SECONDS * 1.5)
+    await _poll_all(followers)
+
+    assert [job.running for job in jobs[1:]] == [True, False]
+
+    # A leader that comes back after losing its lease stands down on its next poll.
+    await leader.poll()
+    assert not leader.is_leader
+    assert [job.running for job in jobs] == [False, True, False]
+
+
+@pytest.mark.asyncio
+async def test_shutdown_releases_the_lease_for_immediate_failover() -> None:
+    contenders, jobs = _contenders(2)
+    leader, follower = contenders
+    await leader.start()
+    await follower.poll()
+    assert jobs[0].running and not jobs[1].running
+
+    await leader.shutdown()
+    await follower.poll()
+
+    assert not jobs[0].running
+    assert jobs[1].running
+
+
+@pytest.mark.asyncio
+async def test_background_loop_renews_the_lease() -> None:
+    contenders, jobs = _contenders(2)
+    leader, follower = contenders
+    await leader.start()
+    try:
+        await asyncio.sleep(TTL_SECONDS * 2)
+        await follower.poll()
+
+        assert jobs[0].running and jobs[0].starts == 1
+        assert not jobs[1].running
+    finally:
+        await leader.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_redis_failure_stops_the_job(monkeypatch: pytest.MonkeyPatch) -> None:
+    contenders, jobs = _contenders(1)
+    leader = contenders[0]
+    await leader.poll()
+    assert jobs[0].running
+
+    async def _unreachable() -> bool:
+        raise ConnectionError("redis down")
+
+    monkeypatch.setattr(leader._lease, "acquire", _unreachable)
+    await leader.poll()
+
+    assert not leader.is_leader
+    assert not jobs[0].running
+
+
+@pytest.mark.asyncio
+async def test_dedicated_mode_leaves_singleton_jobs_to_the_worker() -> None:
+    settings = get_settings().model_copy(update={"background_jobs_mode": "dedicated"})
+    api_container, worker_container = ApplicationContainer(), ApplicationContainer()
+    api_job, worker_job = _Job(), _Job()
+
+    await start_singleton_job(api_container, "sync", api_job, settings=settings, role="api")
+    await start_singleton_job(
+        worker_container, "sync", worker_job, settings=settings, role="worker"
+    )
+    try:
+        assert not api_job.running and api_container.leader_elected_jobs == []
+        assert worker_job.running
+        assert worker_container.leader_elected_jobs[0].is_leader
+    finally:
+        for elected in worker_container.leader_elected_jobs:
+            await elected.shutdown()
+    assert not worker_job.running
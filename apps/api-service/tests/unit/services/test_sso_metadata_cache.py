@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any
+
+import httpx
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from app.observability.metrics import OIDC_METADATA_LOOKUPS_TOTAL
+from app.services.sso.metadata_cache import OidcMetadataCache, OidcMetadataFetchError
+from app.services.sso.oidc_client import OidcClient
+
+_URL = "https://idp.example.com/.well-known/openid-configuration"
+_DISCOVERY = {
+    "issuer": "https://idp.example.com",
+    "authorization_endpoint": "https://idp.example.com/authorize",
+    "token_endpoint": "https://idp.example.com/token",
+    "jwks_uri": "https://idp.example.com/jwks",
+}
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _Upstream:
+    def __init__(self, payload: dict[str, object], *, headers: dict[str, str] | None = None):
+        self.payload = payload
+        self.headers = headers or {}
+        self.requests: list[httpx.Request] = []
+        self.fail = False
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.fail:
+            return httpx.Response(503)
+        etag = self.headers.get("ETag")
+        if etag and request.headers.get("if-none-match") == etag:
+            return httpx.Response(304, headers=self.headers)
+        return httpx.Response(200, json=self.payload, headers=self.headers)
+
+
+def _cache(upstream: _Upstream, **kwargs: Any) -> OidcMetadataCache:
+    transport = httpx.MockTransport(upstream.handler)
+    return OidcMetadataCache(http_client=httpx.AsyncClient(transport=transport), **kwargs)
+
+
+def _lookups(result: str, kind: str = "discovery") -> float:
+    return OIDC_METADATA_LOOKUPS_TOTAL.labels(kind=kind, result=result)._value.get()
+
+
+@pytest.mark.asyncio
+async def test_cache_honours_max_age_and_revalidates_with_etag() -> None:
+    upstream = _Upstream(_DISCOVERY, headers={"Cache-Control": "max-age=300", "ETag": '"v1"'})
+    clock = _Clock()
+    cache = _cache(upstream, clock=clock)
+    hits_before = _lookups("hit")
+    assert await cache.get(_URL, kind="discovery") == _DISCOVERY
+    clock.now += 100
+    assert await cache.get(_URL, kind="discovery") == _DISCOVERY
+    assert len(upstream.requests) == 1
+    assert _lookups("hit") == hits_before + 1
+
+    clock.now += 300
+    assert await cache.get(_URL, kind="discovery") == _DISCOVERY
+    assert len(upstream.requests) == 2
+    assert upstream.requests[-1].headers["if-none-match"] == '"v1"'
+    await cache.aclose()
+
+
+@pytest.mark.asyncio
+async def test_cache_refreshes_in_background_before_expiry() -> None:
+    upstream = _Upstream(_DISCOVERY, headers={"Cache-Control": "max-age=100"})
+    clock = _Clock()
+    cache = _cache(upstream, clock=clock)
+    await cache.get(_URL, kind="discovery")
+    clock.now += 90
+    await cache.get(_URL, kind="discovery")
+    await asyncio.sleep(0.01)
+    assert len(upstream.requests) == 2
+
+    clock.now += 50  # beyond the original expiry, inside the refreshed one
+    await cache.get(_URL, kind="discovery")
+    assert len(upstream.requests) == 2
+    await cache.aclose()
+
+
+@pytest.mark.asyncio
+async def test_cache_serves_stale_on_error_within_bound() -> None:
+    upstream = _Upstream(_DISCOVERY, headers={"Cache-Control": "max-age=60"})
+    clock = _Clock()
+    cache = _cache(upstream, clock=clock, max_stale_seconds=600)
+    await cache.get(_URL, kind="discovery")
+    upstream.fail = True
+
+    clock.now += 120
+    stale_before = _lookups("stale")
+    assert await cache.get(_URL, kind="discovery") == _DISCOVERY
+    assert _lookups("stale") == stale_before + 1
+
+    clock.now += 1000
+    with pytest.raises(OidcMetadataFetchError):
+        await cache.get(_URL, kind="discovery")
+    await cache.aclose()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_upstream_request() -> None:
+    upstream = _Upstream(_DISCOVERY)
+    cache = _cache(upstream, clock=_Clock())
+    results = await asyncio.gather(*(cache.get(_URL, kind="discovery") for _ in range(5)))
+    assert results == [_DISCOVERY] * 5
+    assert len(upstream.requests) == 1
+    await cache.aclose()
+
+
+@pytest.mark.asyncio
+async def test_shared_fetch_survives_a_caller_closing_its_client() -> None:
+    upstream = _Upstream(_DISCOVERY)
+    cache = _cache(upstream, clock=_Clock())
+    caller_http = httpx.AsyncClient(transport=httpx.MockTransport(upstream.handler))
+    first = OidcClient(caller_http, metadata_cache=cache)
+    second = OidcClient(metadata_cache=cache)
+
+    first_lookup = asyncio.create_task(first.fetch_discovery("https://idp.example.com"))
+    await asyncio.sleep(0)
+    await caller_http.aclose()
+    document = await second.fetch_discovery("https://idp.example.com")
+
+    assert document.issuer == _DISCOVERY["issuer"]
+    assert (await first_lookup).issuer == _DISCOVERY["issuer"]
+    assert len(upstream.requests) == 1
+    await second.close()
+    await cache.aclose()
+
+
+def _rsa_jwk(kid: str) -> tuple[rsa.RSAPrivateKey, dict[str, object]]:
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(private_key.public_key()))
+    jwk["kid"] = kid
+    return private_key, jwk
+
+
+@pytest.mark.asyncio
+async def test_unknown_kid_forces_jwks_refresh() -> None:
+    _, old_jwk = _rsa_jwk("old")
+    new_key, new_jwk = _rsa_jwk("new")
+    upstream = _Upstream({"keys": [old_jwk]}, headers={"Cache-Control": "max-age=3600"})
+    clock = _Clock()
+    cache = _cache(upstream, clock=clock, force_refresh_interval_seconds=30)
+    token = jwt.encode(
+        {
+            "sub": "s",
+            "iss": "https://idp.example.com",
+            "aud": "client",
+            "iat": 1,
+            "exp": 4_102_444_800,
+        },
+        new_key,
+        algorithm="RS256",
+        headers={"kid": "new"},
+    )
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(upstream.handler)) as http:
+        client = OidcClient(http, metadata_cache=cache)
+        await client._fetch_jwks(_DISCOVERY["jwks_uri"])
+        clock.now += 60
+        upstream.payload = {"keys": [old_jwk, new_jwk]}
+
+        claims = await client.verify_id_token(
+            id_token=token,
+            issuer="https://idp.example.com",
+            audience="client",
+            jwks_uri=_DISCOVERY["jwks_uri"],
+            allowed_algs=["RS256"],
+        )
+
+    assert claims["sub"] == "s"
+    assert len(upstream.requests) == 2
+    await cache.aclose()
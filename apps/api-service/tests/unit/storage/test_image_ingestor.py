@@ -10,9 +10,11 @@ from app.core.settings import get_settings
 class StubStorage(StorageService):
     def __init__(self):
         # Bypass super init; we won't hit base members that need session_factory
-        pass
+        self.stored: list[bytes] = []
+
+    async def put_object_stream(self, *, chunks, **kwargs):
+        self.stored.append(b"".join([chunk async for chunk in chunks]))
 
-    async def put_object(self, **kwargs):
         class Obj:
             def __init__(self):
                 self.id = uuid4()
@@ -54,6 +56,7 @@ async def test_ingest_image_output_happy_path(monkeypatch):
     assert result.attachment.object_id
     assert result.attachment.filename.endswith(".png")
     assert result.size_bytes == len(b"testimagebytes")
+    assert storage.stored == [b"testimagebytes"]
 
 
 @pytest.mark.asyncio
@@ -77,3 +80,27 @@ async def test_ingest_image_output_rejects_large(monkeypatch):
             background="auto",
             storage_service=storage, 
         )
+
+
+@pytest.mark.asyncio
+async def test_ingest_image_output_accepts_unpadded_and_wrapped_base64():
+    encoded = base64.b64encode(b"testimagebytes").decode()
+    data = encoded.rstrip("=")[:8] + "\n" + encoded.rstrip("=")[8:]
+    storage = StubStorage()
+
+    result = await ingest_image_output(
+        image_b64=data,
+        tenant_id=str(uuid4()),
+        user_id=None,
+        conversation_id=str(uuid4()),
+        agent_key="triage",
+        tool_call_id="tc_1",
+        response_id="r_1",
+        image_format="png",
+        quality="high",
+        background="auto",
+        storage_service=storage,
+    )
+
+    assert result.size_bytes == len(b"testimagebytes")
+    assert storage.stored == [b"testimagebytes"]
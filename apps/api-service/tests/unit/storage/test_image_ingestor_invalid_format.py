@@ -10,7 +10,7 @@ class StubStorage(StorageService):
     def __init__(self):
         pass
 
-    async def put_object(self, **kwargs):
+    async def put_object_stream(self, **kwargs):
         class Obj:
             def __init__(self):
                 self.id = uuid.uuid4()
@@ -58,3 +58,51 @@ async def test_health_check_reports_unavailable_on_error(monkeypatch):
 
     assert stub.account_info_calls == 1
     assert health.status is StorageProviderStatus.UNAVAILABLE
+
+
+class _StubBlobClient:
+    def __init__(self, container: str, blob: str) -> None:
+        self.url = f"https://acct.blob.core.windows.net/{container}/{blob}"
+
+
+class _DelegationStub(_StubBlobServiceClient):
+    def __init__(self) -> None:
+        super().__init__()
+        self.delegation_key_calls = 0
+
+    def get_user_delegation_key(self, start, expiry):
+        self.delegation_key_calls += 1
+        return {"expiry": expiry}
+
+    def get_blob_client(self, *, container: str, blob: str) -> _StubBlobClient:
+        return _StubBlobClient(container, blob)
+
+
+async def test_presigned_downloads_reuse_cached_delegation_key(monkeypatch):
+    stub = _DelegationStub()
+    monkeypatch.setattr(azure_blob, "DefaultAzureCredential", lambda **_: object())
+    monkeypatch.setattr(azure_blob, "BlobServiceClient", lambda **_: stub)
+    monkeypatch.setattr(
+        azure_blob,
+        "generate_blob_sas",
+        lambda **kwargs: f"sig={kwargs['blob_name']}",
+    )
+
+    config = AzureBlobProviderConfig(
+        account_url="https://acct.blob.core.windows.net",
+        container="assets",
+        connection_string=None,
+    )
+    provider = azure_blob.AzureBlobStorageProvider(config)
+
+    urls = await provider.get_presigned_downloads(
+        objects=[("assets", "a.png"), ("assets", "b.png")], expires_in=900
+    )
+    single = await provider.get_presigned_download(bucket="assets", key="c.png", expires_in=900)
+
+    assert [url.url for url in urls] == [
+        "https://acct.blob.core.windows.net/assets/a.png?sig=a.png",
+        "https://acct.blob.core.windows.net/assets/b.png?sig=b.png",
+    ]
+    assert single.url.endswith("c.png?sig=c.png")
+    assert stub.delegation_key_calls == 1
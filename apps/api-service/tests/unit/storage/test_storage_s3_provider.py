@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import io
+
 import boto3
+import pytest
 
 from app.domain.storage import S3ProviderConfig, StorageProviderStatus
 from app.infrastructure.storage.providers.s3 import S3StorageProvider
@@ -12,7 +15,7 @@ class _StubClient:
         self.head_bucket_bucket: str | None = None
         self.list_buckets_called = False
 
-    def head_bucket(self, *, Bucket: str) -> None:  # noqa: N802 - boto3 style
+    def head_bucket(self, *, Bucket: str) -> None:
         self.head_bucket_called = True
         self.head_bucket_bucket = Bucket
 
@@ -24,7 +27,7 @@ class _StubClient:
 async def test_health_check_uses_head_bucket(monkeypatch):
     stub = _StubClient()
 
-    def _client(service_name: str, **_kwargs):  # noqa: ANN001 - boto3 signature
+    def _client(service_name: str, **_kwargs):
         assert service_name == "s3"
         return stub
 
@@ -45,3 +48,145 @@ async def test_health_check_uses_head_bucket(monkeypatch):
     assert stub.list_buckets_called is False
     assert health.status is StorageProviderStatus.HEALTHY
     assert health.details.get("bucket") == "demo-assets"
+
+
+class _StubBody(io.BytesIO):
+    def __init__(self, data: bytes) -> None:
+        super().__init__(data)
+        self.read_sizes: list[int] = []
+
+    def read(self, size: int | None = -1) -> bytes:
+        self.read_sizes.append(-1 if size is None else size)
+        return super().read(size)
+
+
+class _StubObjectClient:
+    def __init__(self, data: bytes) -> None:
+        self._data = data
+        self.get_object_kwargs: dict[str, object] = {}
+        self.body: _StubBody | None = None
+
+    def get_object(self, **kwargs):
+        self.get_object_kwargs = kwargs
+        data = self._data
+        range_header = kwargs.get("Range")
+        if isinstance(range_header, str):
+            start, _, end = range_header.removeprefix("bytes=").partition("-")
+            data = data[int(start) : int(end) + 1 if end else None]
+        self.body = _StubBody(data)
+        return {"Body": self.body}
+
+
+async def test_iter_object_bytes_reads_bounded_chunks_with_range(monkeypatch):
+    stub = _StubObjectClient(b"0123456789")
+    monkeypatch.setattr(boto3, "client", lambda _name, **_kwargs: stub)
+    provider = S3StorageProvider(
+        S3ProviderConfig(region=None, bucket="demo", endpoint_url=None, force_path_style=False)
+    )
+
+    chunks = [
+        chunk
+        async for chunk in provider.iter_object_bytes(
+            bucket="demo", key="obj", chunk_size=4, start=5
+        )
+    ]
+
+    assert chunks == [b"5678", b"9"]
+    assert stub.get_object_kwargs == {"Bucket": "demo", "Key": "obj", "Range": "bytes=5-"}
+    assert stub.body is not None
+    assert set(stub.body.read_sizes) == {4}
+    assert stub.body.closed
+
+
+class _StubMultipartClient:
+    def __init__(self, *, fail_part: int | None = None) -> None:
+        self.fail_part = fail_part
+        self.put_calls: list[dict[str, object]] = []
+        self.parts: dict[int, bytes] = {}
+        self.completed: list[dict[str, object]] | None = None
+        self.aborted = False
+
+    def put_object(self, **kwargs):
+        self.put_calls.append(kwargs)
+
+    def create_multipart_upload(self, **_kwargs):
+        return {"UploadId": "up-1"}
+
+    def upload_part(self, *, PartNumber: int, Body: bytes, **_kwargs):
+        if PartNumber == self.fail_part:
+            raise RuntimeError("part failed")
+        self.parts[PartNumber] = Body
+        return {"ETag": f"etag-{PartNumber}"}
+
+    def complete_multipart_upload(self, *, MultipartUpload, **_kwargs):
+        self.completed = MultipartUpload["Parts"]
+
+    def abort_multipart_upload(self, **_kwargs):
+        self.aborted = True
+
+
+async def _chunks(total: int, size: int):
+    for offset in range(0, total, size):
+        yield bytes([offset % 251]) * min(size, total - offset)
+
+
+def _provider(monkeypatch, stub) -> S3StorageProvider:
+    monkeypatch.setattr(boto3, "client", lambda _name, **_kwargs: stub)
+    return S3StorageProvider(
+        S3ProviderConfig(region=None, bucket="demo", endpoint_url=None, force_path_style=False)
+    )
+
+
+async def test_put_object_stream_uses_single_put_for_small_objects(monkeypatch):
+    stub = _StubMultipartClient()
+    provider = _provider(monkeypatch, stub)
+
+    ref = await provider.put_object_stream(
+        bucket="demo", key="obj", chunks=_chunks(1000, 100), content_type="text/plain"
+    )
+
+    assert ref.size_bytes == 1000
+    assert len(stub.put_calls) == 1
+    assert stub.put_calls[0]["ContentType"] == "text/plain"
+    assert stub.parts == {}
+
+
+async def test_put_object_stream_uploads_ordered_parts(monkeypatch):
+    stub = _StubMultipartClient()
+    provider = _provider(monkeypatch, stub)
+    part_size = 5 * 1024 * 1024
+    total = part_size * 2 + 123
+
+    ref = await provider.put_object_stream(
+        bucket="demo",
+        key="obj",
+        chunks=_chunks(total, 1024 * 1024),
+        content_type=None,
+        part_size=part_size,
+        concurrency=2,
+    )
+
+    assert ref.size_bytes == total
+    assert [len(stub.parts[n]) for n in (1, 2, 3)] == [part_size, part_size, 123]
+    assert stub.completed == [
+        {"PartNumber": n, "ETag": f"etag-{n}"} for n in (1, 2, 3)
+    ]
+    assert stub.put_calls == []
+
+
+async def test_put_object_stream_aborts_failed_multipart_upload(monkeypatch):
+    stub = _StubMultipartClient(fail_part=2)
+    provider = _provider(monkeypatch, stub)
+    part_size = 5 * 1024 * 1024
+
+    with pytest.raises(RuntimeError, match="part failed"):
+        await provider.put_object_stream(
+            bucket="demo",
+            key="obj",
+            chunks=_chunks(part_size * 3, 1024 * 1024),
+            content_type=None,
+            part_size=part_size,
+        )
+
+    assert stub.aborted is True
+    assert stub.completed is None
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import hashlib
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
 import pytest
+from fakeredis.aioredis import FakeRedis
 
-from app.domain.storage import StorageProviderLiteral
+from app.domain.storage import StorageObjectRef, StorageProviderLiteral
+from app.infrastructure.storage.presign_cache import (
+    InMemoryPresignedUrlCache,
+    RedisPresignedUrlCache,
+)
 from app.infrastructure.storage.providers.memory import MemoryStorageProvider
 from app.services.storage.naming import bucket_name, bucket_region
 from app.services.storage.service import StorageService
@@ -19,6 +25,9 @@ class _FakeSettings:
     storage_bucket_prefix: str = "agent-data"
     storage_signed_url_ttl_seconds: int = 900
     storage_max_file_mb: int = 1
+    storage_stream_chunk_bytes: int = 1024 * 1024
+    storage_multipart_part_bytes: int = 5 * 1024 * 1024
+    storage_multipart_concurrency: int = 2
     storage_allowed_mime_types: list[str] = field(
         default_factory=lambda: ["text/plain", "application/json"]
     )
@@ -56,6 +65,7 @@ class _FakeObject:
     conversation_id: uuid.UUID | None
     metadata_json: dict[str, object]
     expires_at: datetime | None
+    derived_from_id: uuid.UUID | None = None
     deleted_at: datetime | None = None
     created_at: datetime | None = None
     updated_at: datetime | None = None
@@ -65,6 +75,7 @@ class _FakeRepo:
     def __init__(self) -> None:
         self.buckets: dict[tuple[uuid.UUID, str], _FakeBucket] = {}
         self.objects: dict[uuid.UUID, _FakeObject] = {}
+        self.bulk_lookups = 0
 
     async def get_or_create_bucket(
         self,
@@ -104,6 +115,7 @@ class _FakeRepo:
         conversation_id: uuid.UUID | None,
         metadata_json: dict[str, object],
         expires_at: datetime | None,
+        derived_from_id: uuid.UUID | None = None,
     ) -> _FakeObject:
         obj = _FakeObject(
             id=object_id,
@@ -121,6 +133,7 @@ class _FakeRepo:
             conversation_id=conversation_id,
             metadata_json=metadata_json,
             expires_at=expires_at,
+            derived_from_id=derived_from_id,
         )
         self.objects[obj.id] = obj
         return obj
@@ -131,12 +144,31 @@ class _FakeRepo:
             return obj
         return None
 
+    async def list_objects_for_tenant(self, *, tenant_id: uuid.UUID, object_ids):
+        self.bulk_lookups += 1
+        return [
+            obj
+            for obj in self.objects.values()
+            if obj.id in set(object_ids) and obj.tenant_id == tenant_id and obj.deleted_at is None
+        ]
+
     async def list_objects(
         self, *, tenant_id: uuid.UUID, limit: int, offset: int, conversation_id=None
     ):
-        objs = [o for o in self.objects.values() if o.tenant_id == tenant_id]
+        objs = [
+            o
+            for o in self.objects.values()
+            if o.tenant_id == tenant_id and o.deleted_at is None and o.derived_from_id is None
+        ]
         return objs[offset : offset + limit]
 
+    async def list_derived_objects(self, *, tenant_id: uuid.UUID, object_id: uuid.UUID):
+        return [
+            o
+            for o in self.objects.values()
+            if o.tenant_id == tenant_id and o.derived_from_id == object_id and o.deleted_at is None
+        ]
+
     async def mark_deleted(self, *, object_id: uuid.UUID) -> None:
         if object_id in self.objects:
             self.objects[object_id].deleted_at = datetime.utcnow()
@@ -195,6 +227,276 @@ async def test_presign_upload_rejects_oversize():
         )
 
 
+@pytest.mark.asyncio
+async def test_iter_object_bytes_streams_chunks_and_verifies_checksum():
+    repo = _FakeRepo()
+    service = _service(repo)
+    tenant_id = uuid.uuid4()
+    payload = b"0123456789abcdef-tail"
+    ref = await service.put_object(
+        tenant_id=tenant_id,
+        user_id=None,
+        data=payload,
+        filename="notes.txt",
+        mime_type="text/plain",
+    )
+    assert ref.id is not None
+
+    chunks = [
+        chunk
+        async for chunk in service.iter_object_bytes(
+            tenant_id=tenant_id, object_id=ref.id, chunk_size=8
+        )
+    ]
+
+    assert chunks == [payload[0:8], payload[8:16], payload[16:]]
+
+    repo.objects[ref.id].checksum_sha256 = "0" * 64
+    with pytest.raises(ValueError, match="checksum"):
+        async for _ in service.iter_object_bytes(tenant_id=tenant_id, object_id=ref.id):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_memory_provider_iterates_inclusive_byte_ranges():
+    provider = MemoryStorageProvider()
+    await provider.put_object(bucket="b", key="k", data=b"abcdefghij", content_type=None)
+
+    chunks = [
+        chunk
+        async for chunk in provider.iter_object_bytes(
+            bucket="b", key="k", chunk_size=3, start=2, end=7
+        )
+    ]
+
+    assert chunks == [b"cde", b"fgh"]
+
+
+@pytest.mark.asyncio
+async def test_get_presigned_downloads_batches_lookup_and_skips_deleted():
+    repo = _FakeRepo()
+    service = _service(repo)
+    tenant_id = uuid.uuid4()
+    refs = [
+        await service.put_object(
+            tenant_id=tenant_id,
+            user_id=None,
+            data=b"x",
+            filename=f"{name}.txt",
+            mime_type="text/plain",
+        )
+        for name in ("a", "b", "c")
+    ]
+    kept, deleted, other = (ref.id for ref in refs)
+    assert kept and deleted and other
+    await service.delete_object(tenant_id=tenant_id, object_id=deleted)
+
+    result = await service.get_presigned_downloads(
+        tenant_id=tenant_id, object_ids=[kept, deleted, other, uuid.uuid4()]
+    )
+
+    assert repo.bulk_lookups == 1
+    assert set(result) == {kept, other}
+    url, ref = result[kept]
+    assert ref.filename == "a.txt"
+    assert url.url.endswith("a.txt")
+
+
+@pytest.mark.asyncio
+async def test_derivatives_are_hidden_and_deleted_with_their_source():
+    repo = _FakeRepo()
+    service = _service(repo)
+    tenant_id = uuid.uuid4()
+    source = await service.put_object(
+        tenant_id=tenant_id, user_id=None, data=b"img", filename="a.txt", mime_type="text/plain"
+    )
+    assert source.id
+    thumbnail = await service.put_object(
+        tenant_id=tenant_id,
+        user_id=None,
+        data=b"thumb",
+        filename="a-preview.txt",
+        mime_type="text/plain",
+        derived_from=source.id,
+    )
+    assert thumbnail.id
+
+    listed = await service.list_objects(tenant_id=tenant_id, limit=10, offset=0)
+    assert [ref.id for ref in listed] == [source.id]
+
+    await service.delete_object(tenant_id=tenant_id, object_id=thumbnail.id)
+    assert repo.objects[thumbnail.id].deleted_at is None
+
+    await service.delete_object(tenant_id=tenant_id, object_id=source.id)
+    assert repo.objects[source.id].deleted_at is not None
+    assert repo.objects[thumbnail.id].deleted_at is not None
+
+
+class _SigningCounter(MemoryStorageProvider):
+    def __init__(self) -> None:
+        super().__init__()
+        self.signed: list[str] = []
+
+    async def get_presigned_download(self, *, bucket, key, expires_in):
+        self.signed.append(key)
+        return await super().get_presigned_download(bucket=bucket, key=key, expires_in=expires_in)
+
+    async def get_presigned_downloads(self, *, objects, expires_in):
+        self.signed.extend(key for _, key in objects)
+        return [
+            await super(_SigningCounter, self).get_presigned_download(
+                bucket=bucket, key=key, expires_in=expires_in
+            )
+            for bucket, key in objects
+        ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend", ["memory", "redis"])
+async def test_presigned_downloads_are_reused_until_object_is_deleted(backend):
+    repo = _FakeRepo()
+    provider = _SigningCounter()
+    settings: Any = _FakeSettings()
+    settings.storage_presign_cache_min_remaining = 0.5
+    cache = (
+        InMemoryPresignedUrlCache()
+        if backend == "memory"
+        else RedisPresignedUrlCache(FakeRedis())
+    )
+    service = StorageService(
+        session_factory=None,
+        settings_provider=lambda: settings,
+        provider_resolver=lambda _settings: provider,
+        repository=repo,  # type: ignore[arg-type]
+        presign_cache=cache,
+    )
+    tenant_id = uuid.uuid4()
+    first, second = [
+        await service.put_object(
+            tenant_id=tenant_id,
+            user_id=None,
+            data=b"x",
+            filename=f"{name}.txt",
+            mime_type="text/plain",
+        )
+        for name in ("a", "b")
+    ]
+    assert first.id and second.id
+
+    url, ref = await service.get_presigned_download(tenant_id=tenant_id, object_id=first.id)
+    again, cached_ref = await service.get_presigned_download(
+        tenant_id=tenant_id, object_id=first.id
+    )
+    batch = await service.get_presigned_downloads(
+        tenant_id=tenant_id, object_ids=[first.id, second.id]
+    )
+
+    assert again.url == url.url and cached_ref == ref
+    assert batch[first.id][0].url == url.url
+    assert provider.signed == [first.key, second.key]
+
+    await service.delete_object(tenant_id=tenant_id, object_id=first.id)
+    with pytest.raises(FileNotFoundError):
+        await service.get_presigned_download(tenant_id=tenant_id, object_id=first.id)
+    other_tenant = await service.get_presigned_downloads(
+        tenant_id=uuid.uuid4(), object_ids=[second.id]
+    )
+    assert other_tenant == {}
+
+
+class _CountingProvider(MemoryStorageProvider):
+    def __init__(self) -> None:
+        super().__init__()
+        self.ensure_calls = 0
+        self.fail_next_put = False
+
+    async def ensure_bucket(self, bucket, *, region=None, create_if_missing=True):
+        self.ensure_calls += 1
+        await super().ensure_bucket(bucket, region=region, create_if_missing=create_if_missing)
+
+    async def put_object(self, *, bucket, key, data, content_type):
+        if self.fail_next_put:
+            self.fail_next_put = False
+            raise RuntimeError("bucket vanished")
+        # Bypass the base class, which re-ensures the bucket on every write.
+        self._buckets[bucket][key] = data
+        return StorageObjectRef(bucket=bucket, key=key, size_bytes=len(data))
+
+
+@pytest.mark.asyncio
+async def test_put_object_memoizes_bucket_until_a_write_fails():
+    repo = _FakeRepo()
+    provider = _CountingProvider()
+    settings: Any = _FakeSettings()
+    service = StorageService(
+        session_factory=None,
+        settings_provider=lambda: settings,
+        provider_resolver=lambda _settings: provider,
+        repository=repo,  # type: ignore[arg-type]
+    )
+    tenant_id = uuid.uuid4()
+
+    async def _put() -> None:
+        await service.put_object(
+            tenant_id=tenant_id, user_id=None, data=b"x", filename="a.txt", mime_type="text/plain"
+        )
+
+    await _put()
+    await _put()
+    assert provider.ensure_calls == 1
+
+    provider.fail_next_put = True
+    with pytest.raises(RuntimeError):
+        await _put()
+    await _put()
+    assert provider.ensure_calls == 2
+
+
+async def _stream(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+@pytest.mark.asyncio
+async def test_put_object_stream_records_size_and_checksum():
+    repo = _FakeRepo()
+    service = _service(repo)
+    tenant_id = uuid.uuid4()
+
+    ref = await service.put_object_stream(
+        tenant_id=tenant_id,
+        user_id=None,
+        chunks=_stream(b"hello ", b"streamed ", b"world"),
+        filename="notes.txt",
+        mime_type="text/plain",
+    )
+
+    assert ref.id is not None
+    obj = repo.objects[ref.id]
+    assert obj.size_bytes == len(b"hello streamed world")
+    assert obj.checksum_sha256 == hashlib.sha256(b"hello streamed world").hexdigest()
+    data = await service.get_object_bytes(tenant_id=tenant_id, object_id=ref.id)
+    assert data == b"hello streamed world"
+
+
+@pytest.mark.asyncio
+async def test_put_object_stream_enforces_limit_while_streaming():
+    repo = _FakeRepo()
+    service = _service(repo, settings=_FakeSettings(storage_max_file_mb=1))
+    half = b"0" * (512 * 1024 + 1)
+
+    with pytest.raises(ValueError, match="size"):
+        await service.put_object_stream(
+            tenant_id=uuid.uuid4(),
+            user_id=None,
+            chunks=_stream(half, half),
+            filename="big.txt",
+            mime_type="text/plain",
+        )
+
+    assert repo.objects == {}
+
+
 def test_bucket_name_prefers_fixed_provider_container_or_bucket():
     repo = _FakeRepo()
     tenant_id = uuid.uuid4()
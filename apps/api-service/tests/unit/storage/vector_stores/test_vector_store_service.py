@@ -66,11 +66,15 @@ class _FakeFilesClient:
     def __init__(self, file_meta: _FakeFile, upload_file: _FakeFile | None = None):
         self._file_meta = file_meta
         self._upload_file = upload_file or file_meta
+        self.uploaded: list[bytes] = []
 
     async def retrieve(self, file_id: str) -> _FakeFile:
         return self._file_meta
 
     async def create(self, **kwargs) -> _FakeFile:
+        file_tuple = kwargs.get("file")
+        if isinstance(file_tuple, tuple):
+            self.uploaded.append(file_tuple[1].read())
         return self._upload_file
 
     async def delete(self, *args, **kwargs):
@@ -427,16 +431,21 @@ class _FakeStorage:
             filename=filename,
             status="uploaded",
         )
+        self.chunks_served = 0
 
     async def get_presigned_download(self, *, tenant_id, object_id):
         if object_id != self._object_id:
             raise FileNotFoundError("Object not found")
         return StoragePresignedUrl(url="https://example.com", method="GET"), self._ref
 
-    async def get_object_bytes(self, *, tenant_id, object_id, verify_sha256: bool = True):
+    async def iter_object_bytes(
+        self, *, tenant_id, object_id, chunk_size: int | None = None, verify_sha256: bool = True
+    ):
         if object_id != self._object_id:
             raise FileNotFoundError("Object not found")
-        return self._data
+        for offset in range(0, len(self._data), 4):
+            self.chunks_served += 1
+            yield self._data[offset : offset + 4]
 
 
 @pytest.mark.asyncio
@@ -444,13 +453,18 @@ async def test_attach_storage_object_success(session_factory, settings):
     settings.vector_max_files_per_store = 5
     upload_file = _FakeFile("file-uploaded", bytes=2048, mime_type="text/plain")
     object_id = uuid4()
-    svc = _service(
-        session_factory,
-        settings,
+    storage = _FakeStorage(object_id, b"hello world", filename="doc.txt", mime_type="text/plain")
+    fake_client = _FakeOpenAI(
+        type("RemoteStore", (), {"id": "vs_123", "usage_bytes": 0, "status": "ready"}),
         _FakeFile("file-meta"),
-        storage_service=_FakeStorage(object_id, b"hello world", filename="doc.txt", mime_type="text/plain"),
         upload_file=upload_file,
     )
+    svc = VectorStoreService(
+        session_factory,
+        lambda: settings,
+        client_factory=lambda _tenant_id: cast(AsyncOpenAI, fake_client),
+        storage_service=cast(Any, storage),
+    )
     tenant_id = uuid4()
     store = await svc.create_store(tenant_id=tenant_id, owner_user_id=None, name="primary")
 
@@ -462,6 +476,9 @@ async def test_attach_storage_object_success(session_factory, settings):
         chunking_strategy=None,
     )
     assert created.openai_file_id == "file-uploaded"
+    assert created.size_bytes == len(b"hello world")
+    assert storage.chunks_served == 3
+    assert fake_client.files.uploaded == [b"hello world"]
 
 
 @pytest.mark.asyncio
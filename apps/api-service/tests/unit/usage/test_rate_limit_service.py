@@ -27,6 +27,74 @@ async def test_enforce_quota_blocks_after_limit() -> None:
         await limiter.enforce(quota, ["tenant", "user"])
 
 
+@pytest.mark.asyncio
+async def test_enforce_spreads_quota_instead_of_resetting_window() -> None:
+    limiter = RateLimiter()
+    client = FakeRedis()
+    limiter.configure(redis=client, prefix="test", owns_client=False)
+    quota = RateLimitQuota(name="chat", limit=3, window_seconds=60)
+
+    for _ in range(3):
+        await limiter.enforce(quota, ["tenant", "user"])
+    with pytest.raises(RateLimitExceeded) as excinfo:
+        await limiter.enforce(quota, ["tenant", "user"])
+
+    # GCRA frees one request per window/limit (20s) rather than the whole window.
+    assert 1 <= excinfo.value.retry_after <= 20
+    assert 0 < await client.pttl("test:quota:chat:tenant:user") <= 60_000
+
+
+class _CountingRedis(FakeRedis):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.commands: list[str] = []
+
+    async def execute_command(self, *args: Any, **options: Any) -> Any:
+        self.commands.append(str(args[0]).upper())
+        return await super().execute_command(*args, **options)
+
+
+@pytest.mark.asyncio
+async def test_enforce_many_is_one_round_trip_and_all_or_nothing() -> None:
+    limiter = RateLimiter()
+    client = _CountingRedis()
+    limiter.configure(redis=client, prefix="test", owns_client=False)
+    user_quota = RateLimitQuota(name="user", limit=5, window_seconds=60)
+    ip_quota = RateLimitQuota(name="ip", limit=1, window_seconds=60, scope="ip")
+    checks = [(user_quota, ["u-1"]), (ip_quota, ["10.0.0.1"])]
+
+    await limiter.enforce_many([(user_quota, ["warm-up"])])  # first call loads the script
+    client.commands.clear()
+    await limiter.enforce_many(checks)
+    assert client.commands == ["EVALSHA"]
+
+    tat_before = await client.get("test:quota:user:u-1")
+    with pytest.raises(RateLimitExceeded) as excinfo:
+        await limiter.enforce_many(checks)
+    assert excinfo.value.quota == "ip"
+    assert excinfo.value.scope == "ip"
+    # The rejected call must not have charged the quota that still had budget.
+    assert await client.get("test:quota:user:u-1") == tat_before
+
+
+@pytest.mark.asyncio
+async def test_acquire_concurrency_charges_rate_quota_in_same_call() -> None:
+    limiter = RateLimiter()
+    client = FakeRedis()
+    limiter.configure(redis=client, prefix="test", owns_client=False)
+    slot = ConcurrencyQuota(name="chat_stream", limit=2, ttl_seconds=30)
+    rate = RateLimitQuota(name="chat_stream_per_minute", limit=1, window_seconds=60)
+    parts = ["tenant", "user"]
+
+    lease = await limiter.acquire_concurrency(slot, parts, rate_quotas=[(rate, parts)])
+    with pytest.raises(RateLimitExceeded) as excinfo:
+        await limiter.acquire_concurrency(slot, parts, rate_quotas=[(rate, parts)])
+    assert excinfo.value.quota == "chat_stream_per_minute"
+    # Rejection by the rate quota must not leak a concurrency slot.
+    assert await client.zcard("test:lease:chat_stream:tenant:user") == 1
+    await lease.release()
+
+
 @pytest.mark.asyncio
 async def test_concurrency_leases_release_counters() -> None:
     limiter = RateLimiter()
@@ -55,18 +123,68 @@ async def test_concurrency_lease_refreshes_ttl() -> None:
     quota = ConcurrencyQuota(name="chat_stream", limit=1, ttl_seconds=1)
 
     lease = await limiter.acquire_concurrency(quota, ["tenant", "user"])
-    key = "test:concurrency:chat_stream:tenant:user"
+    key = "test:lease:chat_stream:tenant:user"
 
     async with lease:
         await asyncio.sleep(1.2)
-        ttl = await client.ttl(key)
+        ttl = await client.pttl(key)
+        assert await client.zcard(key) == 1
     assert ttl > 0
 
     assert not await client.exists(key)
 
 
+@pytest.mark.asyncio
+async def test_leases_from_crashed_process_expire_without_release() -> None:
+    client = FakeRedis()
+    crashed = RateLimiter()
+    crashed.configure(redis=client, prefix="test", owns_client=False)
+    quota = ConcurrencyQuota(name="chat_stream", limit=1, ttl_seconds=1)
+
+    lease = await crashed.acquire_concurrency(quota, ["tenant", "user"])
+    await lease.__aenter__()
+    crashed.reset()  # process dies: heartbeat stops, lease never released
+
+    survivor = RateLimiter()
+    survivor.configure(redis=client, prefix="test", owns_client=False)
+    with pytest.raises(RateLimitExceeded) as excinfo:
+        await survivor.acquire_concurrency(quota, ["tenant", "user"])
+    assert excinfo.value.retry_after == 1
+
+    await asyncio.sleep(1.1)
+    recovered = await survivor.acquire_concurrency(quota, ["tenant", "user"])
+    await recovered.release()
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_renews_all_leases_in_one_command() -> None:
+    limiter = RateLimiter()
+    client = _CountingRedis()
+    limiter.configure(redis=client, prefix="test", owns_client=False)
+    quota = ConcurrencyQuota(name="chat_stream", limit=50, ttl_seconds=30)
+
+    leases = [
+        await limiter.acquire_concurrency(quota, ["tenant", f"user-{i % 3}"]) for i in range(20)
+    ]
+    for lease in leases:
+        await lease.__aenter__()
+
+    heartbeat = limiter._leases
+    assert heartbeat is not None and heartbeat.active == 20
+    await heartbeat.renew()  # first renewal loads the script
+    client.commands.clear()
+    await heartbeat.renew()
+    assert client.commands == ["EVALSHA"]
+
+    await limiter.shutdown()
+    assert await client.keys("test:lease:*") == []
+
+
 class _FlakyRedis(FakeRedis):
-    async def incr(self, *_args: Any, **_kwargs: Any) -> int:
+    async def evalsha(self, *_args: Any, **_kwargs: Any) -> Any:
+        raise ConnectionError("boom")
+
+    async def eval(self, *_args: Any, **_kwargs: Any) -> Any:
         raise ConnectionError("boom")
 
 
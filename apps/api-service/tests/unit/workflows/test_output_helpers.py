@@ -2,8 +2,19 @@ from __future__ import annotations
 
 import json
 
+import pytest
+from jsonschema.exceptions import SchemaError
+
 from app.domain.ai.models import AgentRunUsage
-from app.services.workflows.output import aggregate_usage, format_stream_output
+from app.observability.metrics import REGISTRY
+from app.services.workflows.output import aggregate_usage, format_stream_output, validate_output
+from app.workflows._shared.registry import WorkflowRegistry
+from app.workflows._shared.schema_utils import (
+    compile_schema,
+    schema_to_json_schema,
+    shared_json_schema,
+)
+from app.workflows._shared.specs import WorkflowSpec, WorkflowStep
 
 
 def test_aggregate_usage_returns_none_when_empty():
@@ -33,3 +44,54 @@ def test_format_stream_output_handles_text_and_structured():
     text, structured = format_stream_output({"a": 1})
     assert structured == {"a": 1}
     assert json.loads(text or "{}") == {"a": 1}
+
+
+_SCHEMA = {"type": "object", "properties": {"n": {"type": "integer"}}, "required": ["n"]}
+
+
+def _validations(result: str) -> float:
+    return (
+        REGISTRY.get_sample_value(
+            "workflow_output_validation_duration_seconds_count",
+            {"target": "step", "result": result},
+        )
+        or 0.0
+    )
+
+
+def test_validate_output_uses_cached_compiled_schema_and_records_timing():
+    compiled = compile_schema(_SCHEMA)
+    assert compiled is compile_schema(_SCHEMA)
+    valid_before, invalid_before = _validations("valid"), _validations("invalid")
+
+    assert validate_output(_SCHEMA, {"n": 1}, label="step 'a' output", target="step") == {"n": 1}
+    with pytest.raises(ValueError, match="step 'a' output does not match declared schema"):
+        validate_output(_SCHEMA, {"n": "x"}, label="step 'a' output", target="step")
+
+    assert _validations("valid") == valid_before + 1
+    assert _validations("invalid") == invalid_before + 1
+
+
+def test_schema_to_json_schema_returns_a_private_copy():
+    exported = schema_to_json_schema(_SCHEMA)
+    assert exported == compile_schema(_SCHEMA).json_schema
+    exported["properties"]["n"]["type"] = "string"
+
+    assert schema_to_json_schema(_SCHEMA) == _SCHEMA
+
+
+def test_shared_json_schema_reuses_the_cached_schema():
+    assert shared_json_schema(_SCHEMA) is shared_json_schema(_SCHEMA)
+    assert shared_json_schema(_SCHEMA) is compile_schema(_SCHEMA).json_schema
+    assert shared_json_schema(None) is None
+
+
+def test_registry_rejects_malformed_output_schema_at_load():
+    spec = WorkflowSpec(
+        key="bad_schema",
+        display_name="Bad schema",
+        description="",
+        steps=(WorkflowStep(agent_key="researcher", output_schema={"type": "nope"}),),
+    )
+    with pytest.raises(SchemaError, match="nope"):
+        WorkflowRegistry(workflow_specs=[spec])
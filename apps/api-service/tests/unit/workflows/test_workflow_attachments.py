@@ -12,12 +12,16 @@ from app.services.agents.attachments import AttachmentService
 from app.services.agents.context import ConversationActorContext
 from app.services.agents.provider_registry import get_provider_registry
 from app.services.assets.service import AssetService
-from app.services.containers.files_gateway import ContainerFileContent
+from app.services.containers.files_gateway import ContainerFileStream
 from app.services.workflows.runner import WorkflowRunner
 from app.workflows._shared.registry import WorkflowRegistry
 from app.workflows._shared.specs import WorkflowSpec, WorkflowStep
 
 
+async def _chunks(data: bytes):
+    yield data
+
+
 class _FakeRuntime:
     def __init__(self):
         self.calls: list[tuple[str, object]] = []
@@ -86,15 +90,16 @@ def _actor() -> ConversationActorContext:
 
 def _attachment_service():
     storage = MagicMock()
-    storage.put_object = AsyncMock()
-    storage.put_object.return_value.id = uuid.uuid4()
-    storage.put_object.return_value.checksum_sha256 = "abc"
-    storage.put_object.return_value.created_at = None
+    storage.put_object_stream = AsyncMock()
+    storage.put_object_stream.return_value.id = uuid.uuid4()
+    storage.put_object_stream.return_value.checksum_sha256 = "abc"
+    storage.put_object_stream.return_value.created_at = None
+    storage.put_object_stream.return_value.size_bytes = 9
     storage.get_presigned_download = AsyncMock(return_value=(MagicMock(url="https://u"), MagicMock()))
 
     gateway = MagicMock()
-    gateway.download_file_content = AsyncMock(
-        return_value=ContainerFileContent(data=b"%PDF-1.4\n", filename="report.pdf")
+    gateway.stream_file_content.return_value.__aenter__.return_value = ContainerFileStream(
+        chunks=_chunks(b"%PDF-1.4\n"), filename="report.pdf", size_bytes=len(b"%PDF-1.4\n")
     )
 
     svc = AttachmentService(lambda: storage, container_files_gateway_resolver=lambda: gateway)
@@ -132,8 +137,8 @@ async def test_workflow_run_ingests_container_file_attachments(monkeypatch: pyte
 
     assert result.attachments, "expected attachments to be returned on WorkflowRunResult"
     assert any(att.filename == "report.pdf" for att in result.attachments or [])
-    gateway.download_file_content.assert_awaited()
-    storage.put_object.assert_awaited()
+    gateway.stream_file_content.assert_called()
+    storage.put_object_stream.assert_awaited()
     storage.get_presigned_download.assert_awaited()
 
 
@@ -171,8 +176,8 @@ async def test_workflow_run_asset_linking_is_best_effort(monkeypatch: pytest.Mon
         setattr(provider, "_runtime", original_runtime)
 
     assert result.attachments, "expected attachments to be returned on WorkflowRunResult"
-    gateway.download_file_content.assert_awaited()
-    storage.put_object.assert_awaited()
+    gateway.stream_file_content.assert_called()
+    storage.put_object_stream.assert_awaited()
     storage.get_presigned_download.assert_awaited()
 
 
@@ -214,6 +219,6 @@ async def test_workflow_stream_terminal_event_includes_attachments(monkeypatch:
         isinstance(att, dict) and att.get("filename") == "report.pdf"
         for att in (terminal.attachments or [])
     )
-    gateway.download_file_content.assert_awaited()
-    storage.put_object.assert_awaited()
+    gateway.stream_file_content.assert_called()
+    storage.put_object_stream.assert_awaited()
     storage.get_presigned_download.assert_awaited()
@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.agents._shared.registry_loader import load_agent_specs
+from app.domain.ai import AgentRunResult
+from app.domain.ai.models import AgentStreamEvent
+from app.domain.workflows import WorkflowRun
+from app.infrastructure.persistence.models.base import Base as ModelBase
+from app.infrastructure.persistence.workflows.repository import (
+    SqlAlchemyWorkflowRunRepository,
+)
+from app.services.agents.context import ConversationActorContext
+from app.services.agents.provider_registry import get_provider_registry
+from app.services.workflows.checkpoints import WorkflowRunResume
+from app.services.workflows.runner import WorkflowRunner
+from app.services.workflows.service import WorkflowService
+from app.workflows._shared.registry import WorkflowRegistry
+from app.workflows._shared.specs import WorkflowSpec, WorkflowStep
+
+
+class _FlakyRuntime:
+    """Fails the first call for each agent in ``fail_once``; records every call."""
+
+    def __init__(self, fail_once: set[str] | None = None) -> None:
+        self.fail_once = set(fail_once or ())
+        self.calls: list[str] = []
+
+    async def run(self, agent_key: str, message: Any, **_: Any) -> AgentRunResult:
+        self.calls.append(agent_key)
+        if agent_key in self.fail_once:
+            self.fail_once.discard(agent_key)
+            raise RuntimeError(f"{agent_key} failed")
+        output = f"{agent_key}({message})"
+        return AgentRunResult(final_output=output, response_text=output)
+
+    def run_stream(self, agent_key: str, message: Any, **_: Any) -> _StreamHandle:
+        self.calls.append(agent_key)
+        return _StreamHandle(f"{agent_key}({message})")
+
+
+class _StreamHandle:
+    def __init__(self, response_text: str) -> None:
+        self._response_text = response_text
+        self.last_response_id = "resp-1"
+        self.usage = None
+
+    async def events(self) -> AsyncIterator[AgentStreamEvent]:
+        yield AgentStreamEvent(
+            kind="run_item_stream_event",
+            response_id=self.last_response_id,
+            response_text=self._response_text,
+            is_terminal=True,
+        )
+
+
+@pytest.fixture()
+async def repo(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'checkpoints.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(ModelBase.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+    return SqlAlchemyWorkflowRunRepository(session_factory)
+
+
+@pytest.fixture()
+def runtime():
+    provider = get_provider_registry().get_default()
+    original_runtime = getattr(provider, "_runtime", None)
+    flaky = _FlakyRuntime()
+    provider._runtime = flaky
+    yield flaky
+    provider._runtime = original_runtime
+
+
+def _spec() -> WorkflowSpec:
+    return WorkflowSpec(
+        key="chain",
+        display_name="Chain",
+        description="",
+        steps=(
+            WorkflowStep(agent_key="triage", depends_on=()),
+            WorkflowStep(agent_key="researcher", depends_on=("triage",)),
+            WorkflowStep(agent_key="retriever", depends_on=("researcher",)),
+        ),
+        allow_handoff_agents=True,
+    )
+
+
+async def _run(runner: WorkflowRunner, *, message: str = "in", resume=None):
+    return await runner.run(
+        _spec(),
+        actor=ConversationActorContext(tenant_id="t", user_id="u"),
+        message=message,
+        attachments=None,
+        conversation_id="c",
+        run_id="run-1",
+        resume=resume,
+    )
+
+
+@pytest.mark.anyio
+async def test_resume_replays_finished_steps_and_reruns_the_failed_one(repo, runtime) -> None:
+    runtime.fail_once = {"researcher"}
+    runner = WorkflowRunner(registry=WorkflowRegistry(), run_repository=repo)
+    with pytest.raises(RuntimeError, match="researcher failed"):
+        await _run(runner)
+
+    run, steps = await repo.get_run_with_steps("run-1")
+    assert run.status == "failed"
+    assert [(step.node_id, step.output) for step in steps] == [("triage", "triage(in)")]
+    assert run.metadata and run.metadata["request"]["attachments"] is None
+
+    result = await _run(runner, resume=WorkflowRunResume.from_steps(steps))
+
+    assert runtime.calls == ["triage", "researcher", "researcher", "retriever"]
+    assert result.final_output == "retriever(researcher(triage(in)))"
+    assert [step.name for step in result.steps] == ["triage", "researcher", "retriever"]
+    run, steps = await repo.get_run_with_steps("run-1")
+    assert run.status == "succeeded"
+    assert [(step.sequence_no, step.node_id) for step in steps] == [
+        (0, "triage"),
+        (1, "researcher"),
+        (2, "retriever"),
+    ]
+
+
+@pytest.mark.anyio
+async def test_checkpoint_is_ignored_when_step_input_changed(repo, runtime) -> None:
+    runner = WorkflowRunner(registry=WorkflowRegistry(), run_repository=repo)
+    await _run(runner)
+    _, steps = await repo.get_run_with_steps("run-1")
+
+    await _run(runner, message="other", resume=WorkflowRunResume.from_steps(steps))
+
+    # Every fingerprint covers the (changed) upstream input, so nothing is replayed.
+    assert runtime.calls == ["triage", "researcher", "retriever"] * 2
+
+
+def _service(repo) -> WorkflowService:
+    registry = WorkflowRegistry(workflow_specs=[_spec()], agent_specs=load_agent_specs())
+    return WorkflowService(registry=registry, run_repository=repo)
+
+
+async def _seed_run(
+    repo,
+    *,
+    status: str,
+    started_at: datetime,
+    heartbeat_at: datetime | None = None,
+    metadata: dict[str, Any] | None = None,
+) -> None:
+    await repo.create_run(
+        WorkflowRun(
+            id="run-1",
+            workflow_key="chain",
+            tenant_id="t",
+            user_id="u",
+            status=status,  # type: ignore[arg-type]
+            started_at=started_at,
+            request_message="in",
+            conversation_id="c",
+            metadata=metadata,
+            heartbeat_at=heartbeat_at,
+        )
+    )
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("status", "age", "error", "message"),
+    [
+        ("succeeded", timedelta(hours=1), RuntimeError, "already succeeded"),
+        ("running", timedelta(seconds=5), RuntimeError, "still active"),
+    ],
+)
+async def test_resume_rejects_runs_that_cannot_continue(repo, status, age, error, message):
+    await _seed_run(repo, status=status, started_at=datetime.now(tz=UTC) - age)
+    service = _service(repo)
+    with pytest.raises(error, match=message):
+        await service.resume_run_stream(
+            "run-1", actor=ConversationActorContext(tenant_id="t", user_id="u")
+        )
+    with pytest.raises(ValueError, match="not found"):
+        await service.resume_run_stream(
+            "run-1", actor=ConversationActorContext(tenant_id="other", user_id="u")
+        )
+
+
+@pytest.mark.anyio
+async def test_stale_running_run_resumes(repo, runtime) -> None:
+    await _seed_run(repo, status="running", started_at=datetime.now(tz=UTC) - timedelta(hours=1))
+    run, stream = await _service(repo).resume_run_stream(
+        "run-1", actor=ConversationActorContext(tenant_id="t", user_id="u")
+    )
+    events = [event async for event in stream]
+
+    assert run.id == "run-1"
+    assert events[-1].is_terminal
+    assert runtime.calls == ["triage", "researcher", "retriever"]
+    run, _ = await repo.get_run_with_steps("run-1")
+    assert run.status == "succeeded"
+
+
+@pytest.mark.anyio
+async def test_running_run_with_a_recent_heartbeat_is_not_resumed(repo) -> None:
+    now = datetime.now(tz=UTC)
+    await _seed_run(
+        repo,
+        status="running",
+        started_at=now - timedelta(hours=1),
+        heartbeat_at=now - timedelta(seconds=5),
+    )
+
+    with pytest.raises(RuntimeError, match="still active"):
+        await _service(repo).resume_run_stream(
+            "run-1", actor=ConversationActorContext(tenant_id="t", user_id="u")
+        )
+
+
+@pytest.mark.anyio
+async def test_only_one_concurrent_resume_claims_the_run(repo, runtime) -> None:
+    await _seed_run(
+        repo,
+        status="failed",
+        started_at=datetime.now(tz=UTC) - timedelta(hours=1),
+        # Unknown keys in the stored request snapshot are ignored.
+        metadata={"request": {"location": None, "legacy_option": True}},
+    )
+    service = _service(repo)
+    actor = ConversationActorContext(tenant_id="t", user_id="u")
+
+    outcomes = await asyncio.gather(
+        service.resume_run_stream("run-1", actor=actor),
+        service.resume_run_stream("run-1", actor=actor),
+        return_exceptions=True,
+    )
+
+    claimed = [outcome for outcome in outcomes if not isinstance(outcome, BaseException)]
+    rejected = [outcome for outcome in outcomes if isinstance(outcome, BaseException)]
+    assert len(claimed) == 1
+    assert len(rejected) == 1 and "still active" in str(rejected[0])
+    _, stream = claimed[0]
+    assert [event async for event in stream][-1].is_terminal
+    assert runtime.calls == ["triage", "researcher", "retriever"]
+
+
+@pytest.mark.anyio
+async def test_runner_heartbeats_while_steps_execute(repo, runtime) -> None:
+    async def _slow_run(agent_key: str, message: Any, **_: Any) -> AgentRunResult:
+        await asyncio.sleep(0.05)
+        output = f"{agent_key}({message})"
+        return AgentRunResult(final_output=output, response_text=output)
+
+    runtime.run = _slow_run
+    runner = WorkflowRunner(
+        registry=WorkflowRegistry(), run_repository=repo, heartbeat_seconds=0.01
+    )
+    await _run(runner)
+
+    run, _ = await repo.get_run_with_steps("run-1")
+    assert run.heartbeat_at is not None
@@ -0,0 +1,312 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+from fakeredis import FakeServer
+from fakeredis.aioredis import FakeRedis
+
+from app.api.v1.chat.schemas import LocationHint
+from app.api.v1.shared.overrides import VectorStoreOverride
+from app.infrastructure.workflows.redis_backend import RedisWorkflowRunBackend
+from app.services.agents.context import ConversationActorContext
+from app.services.workflows.dispatch import (
+    InMemoryWorkflowRunBackend,
+    WorkflowRunDispatcher,
+    WorkflowRunJob,
+)
+from app.services.workflows.service import WorkflowRunRequest, WorkflowService
+from app.workflows._shared.registry import WorkflowRegistry
+
+
+class _BlockingFakeRedis(FakeRedis):
+    """fakeredis answers a blocking XREADGROUP immediately; wait like Redis does."""
+
+    async def xreadgroup(self, *args: Any, block: int | None = None, **kwargs: Any) -> Any:
+        result = await super().xreadgroup(*args, **kwargs)
+        if not result and block:
+            await asyncio.sleep(block / 1000)
+        return result
+
+
+def _job(run_id: str = "run-1", tenant_id: str = "t") -> WorkflowRunJob:
+    return WorkflowRunJob(
+        run_id=run_id,
+        workflow_key="demo",
+        tenant_id=tenant_id,
+        user_id="u",
+        conversation_id="c",
+        message="hello",
+    )
+
+
+async def _collect(dispatcher: WorkflowRunDispatcher, run_id: str, after: str | None = None):
+    frames = []
+    async for entry in dispatcher.events(run_id, after=after):
+        if entry is not None:
+            frames.append(entry)
+    return frames
+
+
+def test_job_round_trips_request_fields() -> None:
+    request = WorkflowRunRequest(
+        message="hi",
+        location=LocationHint(city="Oslo"),
+        share_location=True,
+        container_overrides={"agent": "cntr_1"},
+        vector_store_overrides={"agent": VectorStoreOverride(vector_store_id="vs_1")},
+    )
+    job = WorkflowRunJob.from_request(
+        run_id="r",
+        workflow_key="demo",
+        conversation_id="c",
+        request=request,
+        actor=ConversationActorContext(tenant_id="t", user_id="u"),
+    )
+
+    restored = WorkflowRunJob.from_json(job.to_json()).to_request()
+
+    assert restored.location == LocationHint(city="Oslo")
+    assert restored.vector_store_overrides == {"agent": {"vector_store_id": "vs_1"}}
+    assert restored.container_overrides == {"agent": "cntr_1"}
+    assert restored.conversation_id == "c"
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_runs_job_and_streams_resumable_frames() -> None:
+    async def _execute(job: WorkflowRunJob) -> AsyncIterator[str]:
+        for index in range(3):
+            yield f'{{"n": {index}}}'
+
+    dispatcher = WorkflowRunDispatcher(
+        InMemoryWorkflowRunBackend(),
+        execute=_execute,
+        cancellations=set(),
+        concurrency=1,
+        poll_interval_seconds=0.05,
+    )
+    await dispatcher.submit(_job())
+
+    frames = await asyncio.wait_for(_collect(dispatcher, "run-1"), 2)
+    assert [frame.data for frame in frames] == ['{"n": 0}', '{"n": 1}', '{"n": 2}']
+
+    resumed = await asyncio.wait_for(_collect(dispatcher, "run-1", after=frames[0].entry_id), 2)
+    assert [frame.data for frame in resumed] == ['{"n": 1}', '{"n": 2}']
+    await dispatcher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_job_cancelled_while_queued_never_executes() -> None:
+    started: list[str] = []
+
+    async def _execute(job: WorkflowRunJob) -> AsyncIterator[str]:
+        started.append(job.run_id)
+        yield "{}"
+
+    backend = InMemoryWorkflowRunBackend()
+    dispatcher = WorkflowRunDispatcher(
+        backend, execute=_execute, cancellations=set(), concurrency=0
+    )
+    await dispatcher.submit(_job())
+    await dispatcher.cancel("run-1")
+
+    worker = WorkflowRunDispatcher(
+        backend,
+        execute=_execute,
+        cancellations=set(),
+        concurrency=1,
+        poll_interval_seconds=0.05,
+    )
+    await worker.start()
+    assert await asyncio.wait_for(_collect(worker, "run-1"), 2) == []
+    assert started == []
+    await worker.shutdown()
+    await dispatcher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_shares_runs_and_cancellation_across_nodes() -> None:
+    server = FakeServer()
+    cancelled_on_worker: set[str] = set()
+    release = asyncio.Event()
+
+    async def _execute(job: WorkflowRunJob) -> AsyncIterator[str]:
+        yield '{"kind": "lifecycle"}'
+        await release.wait()
+        yield '{"kind": "final"}'
+
+    api_node = WorkflowRunDispatcher(
+        RedisWorkflowRunBackend(_BlockingFakeRedis(server=server)),
+        execute=_execute,
+        cancellations=set(),
+        concurrency=0,
+        poll_interval_seconds=0.05,
+    )
+    worker_node = WorkflowRunDispatcher(
+        RedisWorkflowRunBackend(_BlockingFakeRedis(server=server)),
+        execute=_execute,
+        cancellations=cancelled_on_worker,
+        concurrency=1,
+        poll_interval_seconds=0.05,
+    )
+    await worker_node.start()
+    await api_node.submit(_job())
+
+    assert (await api_node.get_job("run-1")).tenant_id == "t"
+    stream = api_node.events("run-1")
+    first = None
+    while first is None:
+        first = await asyncio.wait_for(anext(stream), 2)
+    assert first.data == '{"kind": "lifecycle"}'
+    assert worker_node.running == frozenset({"run-1"})
+
+    await asyncio.sleep(0.1)  # let the worker's pub/sub subscription settle
+    await api_node.cancel("run-1")
+    for _ in range(50):
+        if "run-1" in cancelled_on_worker:
+            break
+        await asyncio.sleep(0.02)
+    assert "run-1" in cancelled_on_worker
+
+    release.set()
+    rest = [entry async for entry in stream if entry is not None]
+    assert [entry.data for entry in rest] == ['{"kind": "final"}']
+    assert await api_node.backend.is_cancel_requested("run-1") is True
+
+    await worker_node.shutdown()
+    await api_node.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_redelivers_a_job_whose_worker_died() -> None:
+    server = FakeServer()
+    executed: list[tuple[str, int]] = []
+
+    async def _execute(job: WorkflowRunJob) -> AsyncIterator[str]:
+        executed.append((job.run_id, job.attempt))
+        yield '{"kind": "final"}'
+
+    dead_worker = RedisWorkflowRunBackend(_BlockingFakeRedis(server=server), lease_seconds=0.05)
+    await dead_worker.enqueue(_job())
+    claimed = await dead_worker.dequeue(timeout=0.1)
+    assert claimed is not None and claimed.attempt == 1
+    # The worker never heartbeats or acknowledges, as if its process was killed.
+
+    survivor = WorkflowRunDispatcher(
+        RedisWorkflowRunBackend(_BlockingFakeRedis(server=server), lease_seconds=0.05),
+        execute=_execute,
+        cancellations=set(),
+        concurrency=1,
+        poll_interval_seconds=0.05,
+    )
+    await survivor.start()
+    frames = await asyncio.wait_for(_collect(survivor, "run-1"), 2)
+
+    assert executed == [("run-1", 2)]
+    assert [frame.data for frame in frames] == ['{"kind": "final"}']
+    assert await dead_worker.dequeue(timeout=0.1) is None  # acknowledged, not redelivered
+    await survivor.shutdown()
+    await dead_worker.close()
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_drops_malformed_queue_entries() -> None:
+    redis = _BlockingFakeRedis(server=FakeServer())
+    backend = RedisWorkflowRunBackend(redis, owns_client=False)
+    await backend.enqueue(_job())
+    await redis.xadd("workflow-runs:queue", {"other": "field"})
+    await redis.xadd("workflow-runs:queue", {"job": "not json"})
+    await backend.enqueue(_job("run-2"))
+
+    delivered = [await backend.dequeue(timeout=0.05) for _ in range(4)]
+
+    assert [job.run_id if job else None for job in delivered] == ["run-1", None, None, "run-2"]
+    pending = await redis.xpending("workflow-runs:queue", "workers")
+    assert pending["pending"] == 2  # only the two real jobs await acknowledgement
+    assert await redis.xlen("workflow-runs:queue") == 2
+    await redis.aclose()
+
+
+@pytest.mark.asyncio
+async def test_watchers_get_an_error_frame_when_the_worker_stops_heartbeating() -> None:
+    backend = InMemoryWorkflowRunBackend(lease_seconds=0.05)
+    dispatcher = WorkflowRunDispatcher(
+        backend,
+        execute=_never_called,
+        cancellations=set(),
+        concurrency=0,
+        poll_interval_seconds=0.02,
+        max_attempts=1,
+    )
+    await dispatcher.submit(_job())
+    await backend.dequeue(timeout=0.1)  # claimed by a worker that then disappears
+
+    frames = await asyncio.wait_for(_collect(dispatcher, "run-1"), 2)
+
+    assert len(frames) == 1
+    payload = json.loads(frames[0].data or "")
+    assert payload["kind"] == "error"
+    assert payload["error"]["code"] == "run_interrupted"
+    assert payload["workflow"]["workflow_run_id"] == "run-1"
+    await dispatcher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_job_past_max_attempts_is_abandoned_with_an_error_frame() -> None:
+    backend = InMemoryWorkflowRunBackend(lease_seconds=0.02)
+    await backend.enqueue(_job())
+    await backend.dequeue(timeout=0.1)
+    await asyncio.sleep(0.03)
+    await backend.dequeue(timeout=0.1)  # attempt 2, also lost
+
+    worker = WorkflowRunDispatcher(
+        backend,
+        execute=_never_called,
+        cancellations=set(),
+        concurrency=1,
+        poll_interval_seconds=0.02,
+        max_attempts=2,
+    )
+    await worker.start()
+    frames = await asyncio.wait_for(_collect(worker, "run-1"), 2)
+
+    assert [json.loads(frame.data or "")["kind"] for frame in frames] == ["error"]
+    assert await backend.dequeue(timeout=0.05) is None
+    await worker.shutdown()
+
+
+async def _never_called(job: WorkflowRunJob) -> AsyncIterator[str]:
+    raise AssertionError("job should not execute")
+    yield  # pragma: no cover
+
+
+class _MissingRunRepository:
+    async def get_run_with_steps(self, run_id: str, include_deleted: bool = False):
+        raise ValueError("Workflow run not found")
+
+
+@pytest.mark.asyncio
+async def test_cancel_run_signals_queued_detached_run() -> None:
+    service = WorkflowService(
+        registry=WorkflowRegistry(), run_repository=_MissingRunRepository()  # type: ignore[arg-type]
+    )
+    backend = InMemoryWorkflowRunBackend()
+    service.configure_dispatch(backend, worker_concurrency=0)
+    await backend.enqueue(_job("queued", tenant_id="tenant-a"))
+
+    with pytest.raises(ValueError):
+        await service.cancel_run("queued", tenant_id="tenant-b")
+    assert await backend.is_cancel_requested("queued") is False
+
+    await service.cancel_run("queued", tenant_id="tenant-a")
+    assert await backend.is_cancel_requested("queued") is True
+    assert service._cancellations.is_cancelled("queued")
+
+    with pytest.raises(ValueError):
+        await service.stream_run_events("queued", tenant_id="tenant-b")
+    with pytest.raises(ValueError):
+        await service.stream_run_events("queued", tenant_id="tenant-a", after="bogus")
+    await service.shutdown()
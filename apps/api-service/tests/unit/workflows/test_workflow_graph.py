@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import asyncio
+import importlib
+from types import SimpleNamespace
+from typing import Any, cast
+
+import pytest
+
+from app.agents._shared.registry_loader import load_agent_specs
+from app.domain.ai import AgentRunResult
+from app.services.agents.context import ConversationActorContext
+from app.services.agents.provider_registry import get_provider_registry
+from app.services.workflows.runner import WorkflowRunner
+from app.services.workflows.scheduler import WorkflowGraphScheduler
+from app.workflows._shared.graph import WorkflowGraph, WorkflowNode, compile_workflow_graph
+from app.workflows._shared.registry import WorkflowRegistry
+from app.workflows._shared.specs import WorkflowSpec, WorkflowStage, WorkflowStep
+
+
+def joined(outputs, _prior):
+    return "+".join(str(o) for o in outputs)
+
+
+JOINED: list[Any] = []
+
+
+def record_join(outputs, _prior):
+    JOINED.append(outputs)
+    return outputs
+
+
+class _GatedRuntime:
+    """Runs each agent until its gate opens, tracking start order and concurrency."""
+
+    def __init__(self, gated: set[str] | None = None) -> None:
+        self.gates = {key: asyncio.Event() for key in gated or ()}
+        self.started: list[str] = []
+        self.active = 0
+        self.peak = 0
+
+    async def run(self, agent_key: str, message: Any, **_: Any) -> AgentRunResult:
+        self.started.append(agent_key)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            gate = self.gates.get(agent_key)
+            if gate is not None:
+                await gate.wait()
+            else:
+                await asyncio.sleep(0)
+        finally:
+            self.active -= 1
+        output = f"{agent_key}({message})"
+        return AgentRunResult(final_output=output, response_text=output)
+
+
+async def _run(spec: WorkflowSpec, runtime: _GatedRuntime):
+    provider = get_provider_registry().get_default()
+    original_runtime = getattr(provider, "_runtime", None)
+    provider._runtime = runtime
+    try:
+        return await WorkflowRunner(registry=WorkflowRegistry()).run(
+            spec,
+            actor=ConversationActorContext(tenant_id="t", user_id="u"),
+            message="in",
+            attachments=None,
+            conversation_id="c",
+        )
+    finally:
+        provider._runtime = original_runtime
+
+
+def _spec(*steps: WorkflowStep, max_concurrency: int | None = None) -> WorkflowSpec:
+    return WorkflowSpec(
+        key="graph",
+        display_name="Graph",
+        description="",
+        steps=steps,
+        allow_handoff_agents=True,
+        max_concurrency=max_concurrency,
+    )
+
+
+def test_staged_spec_compiles_to_join_nodes() -> None:
+    spec = WorkflowSpec(
+        key="staged",
+        display_name="Staged",
+        description="",
+        stages=(
+            WorkflowStage(
+                name="fanout",
+                mode="parallel",
+                steps=(WorkflowStep(agent_key="a"), WorkflowStep(agent_key="b")),
+                reducer="tests.unit.workflows.test_workflow_graph:joined",
+            ),
+            WorkflowStage(name="synthesis", steps=(WorkflowStep(agent_key="c"),)),
+        ),
+    )
+
+    graph = compile_workflow_graph(spec)
+
+    assert [(node.label(), node.depends_on) for node in graph.nodes] == [
+        ("a", ()),
+        ("b", ()),
+        ("0:join", ("0:0", "0:1")),
+        ("c", ("0:join",)),
+    ]
+    assert graph.nodes[2].reducer == "tests.unit.workflows.test_workflow_graph:joined"
+    assert graph.output_node == "1:0"
+
+
+@pytest.mark.parametrize(
+    ("steps", "message"),
+    [
+        ((WorkflowStep(agent_key="researcher", depends_on=("missing",)),), "unknown step"),
+        (
+            (
+                WorkflowStep(agent_key="researcher", name="a", depends_on=("b",)),
+                WorkflowStep(agent_key="code_assistant", name="b", depends_on=("a",)),
+            ),
+            "cycle involving: a, b",
+        ),
+        (
+            (
+                WorkflowStep(agent_key="researcher", name="a", depends_on=()),
+                WorkflowStep(agent_key="code_assistant", name="a"),
+            ),
+            "duplicate step name",
+        ),
+    ],
+)
+def test_registry_rejects_invalid_graphs(steps, message) -> None:
+    with pytest.raises(ValueError, match=message):
+        WorkflowRegistry(workflow_specs=[_spec(*steps)], agent_specs=load_agent_specs())
+
+
+@pytest.mark.asyncio
+async def test_step_starts_when_its_own_dependencies_finish() -> None:
+    runtime = _GatedRuntime(gated={"slow"})
+    spec = _spec(
+        WorkflowStep(agent_key="slow", depends_on=()),
+        WorkflowStep(agent_key="fast", depends_on=()),
+        WorkflowStep(agent_key="after_slow", depends_on=("slow",)),
+        WorkflowStep(agent_key="after_fast", depends_on=("fast",)),
+        WorkflowStep(
+            agent_key="join",
+            depends_on=("after_slow", "after_fast"),
+            reducer="tests.unit.workflows.test_workflow_graph:joined",
+        ),
+    )
+
+    task = asyncio.create_task(_run(spec, runtime))
+    for _ in range(200):
+        if "after_fast" in runtime.started:
+            break
+        await asyncio.sleep(0.01)
+    # The fast branch progressed while the slow one is still running.
+    assert runtime.started == ["slow", "fast", "after_fast"]
+
+    runtime.gates["slow"].set()
+    result = await asyncio.wait_for(task, 2)
+
+    assert result.final_output == "join(after_slow(slow(in))+after_fast(fast(in)))"
+    assert [step.name for step in result.steps][-1] == "join"
+    assert {step.branch_index for step in result.steps} == {0, 1, 2, 3, 4}
+
+
+@pytest.mark.asyncio
+async def test_max_concurrency_caps_running_steps() -> None:
+    runtime = _GatedRuntime()
+    spec = _spec(
+        WorkflowStep(agent_key="a", depends_on=()),
+        WorkflowStep(agent_key="b", depends_on=()),
+        WorkflowStep(agent_key="c", depends_on=()),
+        max_concurrency=1,
+    )
+
+    result = await _run(spec, runtime)
+
+    assert runtime.peak == 1
+    # Several sinks are joined into a list, like a parallel stage without a reducer.
+    assert result.final_output == ["a(in)", "b(in)", "c(in)"]
+
+
+class _NullRecorder:
+    async def step_end(self, *_: Any, **__: Any) -> None:
+        return None
+
+    async def step_session_items(self, *_: Any, **__: Any) -> None:
+        return None
+
+
+@pytest.mark.asyncio
+async def test_join_nodes_resolve_while_steps_wait_for_a_slot() -> None:
+    runtime = _GatedRuntime(gated={"y"})
+    graph = WorkflowGraph(
+        workflow_key="graph",
+        nodes=(
+            WorkflowNode(node_id="x", step=WorkflowStep(agent_key="x")),
+            WorkflowNode(node_id="y", step=WorkflowStep(agent_key="y")),
+            WorkflowNode(node_id="z", step=WorkflowStep(agent_key="z")),
+            WorkflowNode(
+                node_id="j",
+                step=None,
+                depends_on=("x",),
+                reducer="tests.unit.workflows.test_workflow_graph:record_join",
+            ),
+            WorkflowNode(node_id="out", step=None, depends_on=("y", "z", "j")),
+        ),
+        output_node="out",
+        max_concurrency=1,
+    )
+
+    async def _no_items() -> list[dict[str, Any]]:
+        return []
+
+    async def _ingest(**_: Any) -> None:
+        return None
+
+    scheduler = WorkflowGraphScheduler(
+        graph,
+        run_id="run",
+        workflow=_spec(WorkflowStep(agent_key="x")),
+        initial_input="in",
+        provider=SimpleNamespace(runtime=runtime),
+        runtime_ctx=None,
+        conversation_id="c",
+        recorder=cast(Any, _NullRecorder()),
+        check_cancel=lambda: None,
+        session_getter=_no_items,
+        ingest_session_delta=_ingest,
+        session_handle=None,
+    )
+    # Reducers are imported by dotted path, which may not be this module object.
+    joined_calls = importlib.import_module("tests.unit.workflows.test_workflow_graph").JOINED
+    joined_calls.clear()
+    task = asyncio.create_task(scheduler.run())
+    for _ in range(200):
+        if runtime.started == ["x", "y"]:
+            break
+        await asyncio.sleep(0.01)
+    await asyncio.sleep(0.01)
+
+    # "y" holds the only slot and "z" waits for it, but the join over "x" resolves.
+    assert runtime.started == ["x", "y"]
+    assert joined_calls == [["x(in)"]]
+
+    runtime.gates["y"].set()
+    assert await asyncio.wait_for(task, 2) == ["y(in)", "z(in)", ["x(in)"]]
@@ -0,0 +1,253 @@
+"""Deterministic synthetic agent provider for offline throughput benchmarks.
+
+Extends the stub provider with a configurable workload: first-token latency, token
+rate, function tool calls and event payload sizes. Event streams mirror what the
+OpenAI provider emits (raw Responses events for output items, text deltas and tool
+arguments, plus run items for tool calls/outputs), so the public stream projector,
+ledger and SSE framing do the same work they do in production. Output is seeded and
+reproducible: the same profile always yields the same events.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import uuid
+from collections.abc import AsyncIterator, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from tests.utils.stub_agent_provider import (
+    StubAgentProvider,
+    StubRuntime,
+    _load_agent_descriptors,
+)
+
+from app.domain.ai.models import AgentDescriptor, AgentRunResult, AgentRunUsage, AgentStreamEvent
+from app.domain.ai.ports import AgentStreamingHandle
+
+_VOCABULARY = (
+    "agent", "stream", "tenant", "result", "query", "vector", "summary", "billing",
+    "workflow", "context", "request", "token", "event", "response", "signal", "cache",
+)  # fmt: skip
+
+
+@dataclass(frozen=True, slots=True)
+class SyntheticProfile:
+    """Shape of one synthetic agent turn.
+
+    ``tokens_per_second=None`` emits deltas back to back, which isolates the
+    service's own per-event cost; set it to model a real model's pacing.
+    """
+
+    output_tokens: int = 64
+    tokens_per_second: float | None = None
+    first_token_latency_ms: float = 0.0
+    tool_calls: int = 0
+    tool_latency_ms: float = 0.0
+    tool_output_bytes: int = 256
+    delta_padding_bytes: int = 0
+    seed: int = 0
+
+    def tokens(self) -> list[str]:
+        rng = random.Random(self.seed)
+        padding = "x" * self.delta_padding_bytes
+        return [f"{rng.choice(_VOCABULARY)}{padding} " for _ in range(self.output_tokens)]
+
+
+class _SyntheticStreamingHandle(AgentStreamingHandle):
+    def __init__(self, profile: SyntheticProfile, *, agent_key: str) -> None:
+        self._profile = profile
+        self._agent_key = agent_key
+        self._response_id = f"resp_synthetic_{uuid.uuid4().hex}"
+        self._usage = AgentRunUsage(
+            input_tokens=16,
+            output_tokens=profile.output_tokens,
+            total_tokens=16 + profile.output_tokens,
+            requests=1 + profile.tool_calls,
+        )
+
+    async def events(self) -> AsyncIterator[AgentStreamEvent]:
+        profile = self._profile
+        seq = 0
+
+        def _raw(raw_type: str, raw_event: Mapping[str, Any], **fields: Any) -> AgentStreamEvent:
+            nonlocal seq
+            seq += 1
+            return AgentStreamEvent(
+                kind="raw_response_event",
+                response_id=self._response_id,
+                sequence_number=seq,
+                raw_type=raw_type,
+                raw_event=raw_event,
+                agent=self._agent_key,
+                **fields,
+            )
+
+        if profile.first_token_latency_ms:
+            await asyncio.sleep(profile.first_token_latency_ms / 1000)
+
+        for index in range(profile.tool_calls):
+            call_id = f"call_synthetic_{index}"
+            name = "synthetic_lookup"
+            arguments = json.dumps({"query": f"lookup {index}", "limit": 5})
+            yield _raw(
+                "response.output_item.added",
+                {
+                    "output_index": index,
+                    "item": {
+                        "id": call_id,
+                        "call_id": call_id,
+                        "type": "function_call",
+                        "name": name,
+                        "status": "in_progress",
+                    },
+                },
+            )
+            yield _raw(
+                "response.function_call_arguments.done",
+                {"item_id": call_id, "output_index": index, "name": name, "arguments": arguments},
+            )
+            yield AgentStreamEvent(
+                kind="run_item_stream_event",
+                response_id=self._response_id,
+                run_item_name="tool_called",
+                run_item_type="function_call",
+                tool_call_id=call_id,
+                tool_name=name,
+                agent=self._agent_key,
+                payload={"raw_item": {"call_id": call_id, "type": "function_call", "name": name}},
+            )
+            if profile.tool_latency_ms:
+                await asyncio.sleep(profile.tool_latency_ms / 1000)
+            yield AgentStreamEvent(
+                kind="run_item_stream_event",
+                response_id=self._response_id,
+                run_item_name="tool_output",
+                run_item_type="function_call_output",
+                tool_call_id=call_id,
+                tool_name=name,
+                agent=self._agent_key,
+                payload={
+                    "output": "r" * profile.tool_output_bytes,
+                    "raw_item": {"call_id": call_id, "type": "function_call_output"},
+                },
+            )
+
+        message_index = profile.tool_calls
+        message_id = "msg_synthetic"
+        yield _raw(
+            "response.output_item.added",
+            {
+                "output_index": message_index,
+                "item": {"id": message_id, "type": "message", "role": "assistant"},
+            },
+        )
+        interval = 1.0 / profile.tokens_per_second if profile.tokens_per_second else 0.0
+        tokens = profile.tokens()
+        for token in tokens:
+            if interval:
+                await asyncio.sleep(interval)
+            yield _raw(
+                "response.output_text.delta",
+                {
+                    "item_id": message_id,
+                    "output_index": message_index,
+                    "content_index": 0,
+                    "delta": token,
+                },
+                text_delta=token,
+            )
+
+        yield AgentStreamEvent(
+            kind="run_item_stream_event",
+            response_id=self._response_id,
+            response_text="".join(tokens).strip(),
+            agent=self._agent_key,
+            usage=self._usage,
+            is_terminal=True,
+        )
+
+    @property
+    def last_response_id(self) -> str | None:
+        return self._response_id
+
+    @property
+    def usage(self) -> AgentRunUsage | None:
+        return self._usage
+
+
+class SyntheticRuntime(StubRuntime):
+    def __init__(self, default_agent: str, profile: SyntheticProfile) -> None:
+        super().__init__(default_agent)
+        self.profile = profile
+
+    async def run(
+        self,
+        agent_key: str,
+        message: Any,
+        *,
+        session: Any | None = None,
+        conversation_id: str | None = None,
+        metadata: Mapping[str, Any] | None = None,
+        options: Any | None = None,
+    ) -> AgentRunResult:
+        handle = self.run_stream(agent_key, message)
+        text = ""
+        async for event in handle.events():
+            if event.is_terminal:
+                text = event.response_text or ""
+        return AgentRunResult(
+            final_output=text,
+            response_id=handle.last_response_id,
+            usage=handle.usage,
+            response_text=text,
+            final_agent=agent_key or self._default_agent,
+        )
+
+    def run_stream(
+        self,
+        agent_key: str,
+        message: Any,
+        *,
+        session: Any | None = None,
+        conversation_id: str | None = None,
+        metadata: Mapping[str, Any] | None = None,
+        options: Any | None = None,
+    ) -> AgentStreamingHandle:
+        return _SyntheticStreamingHandle(self.profile, agent_key=agent_key or self._default_agent)
+
+
+class SyntheticAgentProvider(StubAgentProvider):
+    name = "synthetic"
+
+    def __init__(
+        self,
+        descriptors: Sequence[AgentDescriptor],
+        default_key: str,
+        profile: SyntheticProfile,
+    ) -> None:
+        super().__init__(descriptors, default_key)
+        self._runtime = SyntheticRuntime(default_key, profile)
+
+    @property
+    def runtime(self) -> SyntheticRuntime:
+        return self._runtime
+
+    @property
+    def profile(self) -> SyntheticProfile:
+        return self._runtime.profile
+
+    @profile.setter
+    def profile(self, value: SyntheticProfile) -> None:
+        self._runtime.profile = value
+
+
+def build_synthetic_provider(profile: SyntheticProfile | None = None) -> SyntheticAgentProvider:
+    descriptors = _load_agent_descriptors()
+    default_key = next((d.key for d in descriptors if d.key == "triage"), descriptors[0].key)
+    return SyntheticAgentProvider(descriptors, default_key, profile or SyntheticProfile())
+
+
+__all__ = ["SyntheticAgentProvider", "SyntheticProfile", "build_synthetic_provider"]
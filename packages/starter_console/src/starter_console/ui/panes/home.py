@@ -52,13 +52,14 @@ class HomePane(FooterPane):
 
     async def refresh_data(self) -> None:
         self._set_status("Refreshing status...")
+        self._probes = []
         await asyncio.to_thread(self._collect)
         self._render_summary()
         self._render_tables()
         self._set_status(self._timestamp_label())
 
     def _collect(self) -> None:
-        snapshot = self.hub.load_home()
+        snapshot = self.hub.load_home(on_probe=self._probe_finished)
         self._probes = list(snapshot.probes)
         self._services = list(snapshot.services)
         self._summary = snapshot.summary
@@ -66,6 +67,14 @@ class HomePane(FooterPane):
         self._strict = snapshot.strict
         self._stack_state = snapshot.stack_state
 
+    def _probe_finished(self, probe: ProbeResult) -> None:
+        self.app.call_from_thread(self._render_probe, probe)
+
+    def _render_probe(self, probe: ProbeResult) -> None:
+        self._probes.append(probe)
+        self._render_probe_table()
+        self._set_status(f"Probing... {len(self._probes)} done")
+
     def _render_summary(self) -> None:
         summary_text = format_summary(
             self._summary,
@@ -76,15 +85,7 @@ class HomePane(FooterPane):
         self.query_one("#home-summary", Static).update(summary_text)
 
     def _render_tables(self) -> None:
-        probe_table = self.query_one("#home-probes", DataTable)
-        probe_table.clear(columns=True)
-        probe_table.add_columns("Probe", "Status", "Detail")
-        probe_items = probe_rows(self._probes)
-        if not probe_items:
-            probe_table.add_row("No probes detected", "-", "Run Doctor to populate.")
-        else:
-            for row in probe_items:
-                probe_table.add_row(*row)
+        self._render_probe_table()
 
         service_table = self.query_one("#home-services", DataTable)
         service_table.clear(columns=True)
@@ -96,6 +97,17 @@ class HomePane(FooterPane):
             for row in service_items:
                 service_table.add_row(*row)
 
+    def _render_probe_table(self) -> None:
+        probe_table = self.query_one("#home-probes", DataTable)
+        probe_table.clear(columns=True)
+        probe_table.add_columns("Probe", "Status", "Detail")
+        probe_items = probe_rows(self._probes)
+        if not probe_items:
+            probe_table.add_row("No probes detected", "-", "Run Doctor to populate.")
+        else:
+            for row in probe_items:
+                probe_table.add_row(*row)
+
     def _set_status(self, message: str) -> None:
         self.query_one("#home-status", Static).update(message)
 
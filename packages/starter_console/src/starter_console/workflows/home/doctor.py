@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 import os
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 from dataclasses import asdict
 from datetime import UTC, datetime
 from pathlib import Path
@@ -10,7 +10,7 @@ from pathlib import Path
 from starter_console.core import CLIContext
 from starter_console.core.constants import PROJECT_ROOT, SAFE_ENVIRONMENTS
 from starter_console.core.status_models import ProbeResult, ProbeState, ServiceStatus
-from starter_console.workflows.home.probes import util
+from starter_console.workflows.home.probes.executor import run_probes
 from starter_console.workflows.home.probes.registry import PROBE_SPECS, ProbeContext, ProbeSpec
 
 DEFAULT_JSON_REPORT = PROJECT_ROOT / "var" / "reports" / "operator-dashboard.json"
@@ -57,9 +57,15 @@ class DoctorRunner:
         return json_out, md_out
 
     def collect(
-        self, *, log_suppressed: bool = False
+        self,
+        *,
+        log_suppressed: bool = False,
+        on_result: Callable[[ProbeResult], None] | None = None,
+        max_age: float | None = None,
     ) -> tuple[list[ProbeResult], list[ServiceStatus], dict[str, int]]:
-        probes = self._run_probes(log_suppressed=log_suppressed)
+        probes = self._run_probes(
+            log_suppressed=log_suppressed, on_result=on_result, max_age=max_age
+        )
         services = self._build_services(probes)
         summary = self._summarize(probes)
         return probes, services, summary
@@ -67,7 +73,13 @@ class DoctorRunner:
     # ------------------------------------------------------------------
     # Internals
     # ------------------------------------------------------------------
-    def _run_probes(self, *, log_suppressed: bool = False) -> list[ProbeResult]:
+    def _run_probes(
+        self,
+        *,
+        log_suppressed: bool = False,
+        on_result: Callable[[ProbeResult], None] | None = None,
+        max_age: float | None = None,
+    ) -> list[ProbeResult]:
         ctx = ProbeContext(
             env=os.environ,
             settings=self.ctx.optional_settings(),
@@ -80,20 +92,23 @@ class DoctorRunner:
                 "Suppressed probes via EXPECT_*_DOWN: " + ", ".join(sorted(self.expect_down)),
                 topic="probes",
             )
-        results: list[ProbeResult] = []
-        for spec in PROBE_SPECS:
-            def _runner(spec: object = spec) -> ProbeResult:
-                assert isinstance(spec, ProbeSpec)
-                return spec.factory(ctx)
 
-            result = util.guard_probe(
-                spec.name,
-                _runner,
-                force_skip=spec.name in self.expect_down,
-                skip_reason="suppressed by EXPECT_*_DOWN",
-            )
-            results.append(self._with_category(result, spec.category))
-        return results
+        def _stream(spec: ProbeSpec, result: ProbeResult) -> None:
+            if on_result is not None:
+                on_result(self._with_category(result, spec.category))
+
+        results = run_probes(
+            PROBE_SPECS,
+            ctx,
+            skip=self.expect_down,
+            skip_reason="suppressed by EXPECT_*_DOWN",
+            on_result=_stream,
+            max_age=max_age,
+        )
+        return [
+            self._with_category(result, spec.category)
+            for spec, result in zip(PROBE_SPECS, results, strict=True)
+        ]
 
     def _build_services(self, probes: list[ProbeResult]) -> list[ServiceStatus]:
         services: list[ServiceStatus] = []
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import timedelta
 from pathlib import Path
@@ -17,6 +18,9 @@ from starter_console.workflows.home.runtime import resolve_log_root
 from starter_console.workflows.setup_menu.detection import STALE_AFTER_DAYS, collect_setup_items
 from starter_console.workflows.setup_menu.models import SetupItem
 
+# Home refreshes within this window reuse recent probe results instead of re-probing.
+HOME_PROBE_CACHE_SECONDS = 15.0
+
 
 @dataclass(frozen=True, slots=True)
 class HomeSnapshot:
@@ -64,10 +68,17 @@ class HubService:
     def __init__(self, ctx: CLIContext) -> None:
         self.ctx = ctx
 
-    def load_home(self, *, profile: str | None = None, strict: bool = False) -> HomeSnapshot:
+    def load_home(
+        self,
+        *,
+        profile: str | None = None,
+        strict: bool = False,
+        on_probe: Callable[[ProbeResult], None] | None = None,
+        max_age: float | None = HOME_PROBE_CACHE_SECONDS,
+    ) -> HomeSnapshot:
         resolved_profile = profile or detect_profile()
         runner = DoctorRunner(self.ctx, profile=resolved_profile, strict=strict)
-        probes, services, summary = runner.collect()
+        probes, services, summary = runner.collect(on_result=on_probe, max_age=max_age)
         stack_state = None
         stack_service = next((service for service in services if service.label == "stack"), None)
         if stack_service:
@@ -0,0 +1,173 @@
+"""Concurrent probe execution with per-probe deadlines and a short-lived result cache."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Collection, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from time import monotonic
+
+from starter_console.core.status_models import ProbeResult, ProbeState
+from starter_console.workflows.home.probes import util
+from starter_console.workflows.home.probes.registry import ProbeContext, ProbeSpec
+
+DEFAULT_PROBE_TIMEOUT_SECONDS = 5.0
+
+ProbeCallback = Callable[[ProbeSpec, ProbeResult], None]
+_CacheKey = tuple[str, str, bool, bool]
+
+
+class ProbeResultCache:
+    """Thread-safe store of recent probe results, keyed by probe and run profile."""
+
+    def __init__(self) -> None:
+        self._entries: dict[_CacheKey, tuple[float, ProbeResult]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: _CacheKey, *, max_age: float) -> ProbeResult | None:
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, result = entry
+        if monotonic() - stored_at > max_age:
+            return None
+        return result
+
+    def put(self, key: _CacheKey, result: ProbeResult) -> None:
+        with self._lock:
+            self._entries[key] = (monotonic(), result)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+PROBE_RESULT_CACHE = ProbeResultCache()
+
+
+def run_probes(
+    specs: Sequence[ProbeSpec],
+    ctx: ProbeContext,
+    *,
+    skip: Collection[str] = (),
+    skip_reason: str | None = None,
+    on_result: ProbeCallback | None = None,
+    max_age: float | None = None,
+    cache: ProbeResultCache = PROBE_RESULT_CACHE,
+) -> list[ProbeResult]:
+    """Run ``specs`` concurrently and return their results in spec order.
+
+    Each probe runs on its own daemon thread with its own deadline
+    (``ProbeSpec.timeout_seconds`` or ``DEFAULT_PROBE_TIMEOUT_SECONDS``); a probe
+    that misses it is reported as timed out and its thread is abandoned, so a
+    hung probe never keeps the process from exiting. ``on_result`` is invoked on
+    the calling thread as each probe completes. With ``max_age`` set, results
+    younger than that many seconds are served from ``cache`` instead of probing
+    again; timeouts are never cached.
+    """
+
+    results: dict[str, ProbeResult] = {}
+
+    def _emit(spec: ProbeSpec, result: ProbeResult) -> None:
+        results[spec.name] = result
+        if on_result is not None:
+            on_result(spec, result)
+
+    pending: list[ProbeSpec] = []
+    for spec in specs:
+        if spec.name in skip:
+            _emit(
+                spec,
+                ProbeResult(
+                    name=spec.name, state=ProbeState.SKIPPED, detail=skip_reason or "skipped"
+                ),
+            )
+            continue
+        cached = cache.get(_cache_key(spec, ctx), max_age=max_age) if max_age else None
+        if cached is not None:
+            _emit(spec, cached)
+            continue
+        pending.append(spec)
+
+    if pending:
+        _collect(pending, ctx, cache=cache, emit=_emit)
+
+    return [results[spec.name] for spec in specs]
+
+
+def _collect(
+    specs: Sequence[ProbeSpec],
+    ctx: ProbeContext,
+    *,
+    cache: ProbeResultCache,
+    emit: ProbeCallback,
+) -> None:
+    started = monotonic()
+    running: dict[Future[ProbeResult], ProbeSpec] = {_start(spec, ctx): spec for spec in specs}
+    deadlines = {future: started + _timeout(spec) for future, spec in running.items()}
+
+    while running:
+        remaining = min(deadlines[future] for future in running) - monotonic()
+        done, _ = wait(running, timeout=max(remaining, 0), return_when=FIRST_COMPLETED)
+        for future in done:
+            spec = running.pop(future)
+            try:
+                result = future.result()
+            except Exception as exc:  # guard_probe rejected the probe's return value
+                result = ProbeResult(
+                    name=spec.name,
+                    state=ProbeState.ERROR,
+                    detail=f"unhandled exception: {exc}",
+                )
+            cache.put(_cache_key(spec, ctx), result)
+            emit(spec, result)
+        now = monotonic()
+        for future in [f for f in running if deadlines[f] <= now]:
+            spec = running.pop(future)
+            emit(spec, _timed_out(spec, ctx))
+
+
+def _start(spec: ProbeSpec, ctx: ProbeContext) -> Future[ProbeResult]:
+    # A daemon thread rather than a pool worker: ThreadPoolExecutor joins its
+    # workers at interpreter exit, so one hung probe would hang the command.
+    future: Future[ProbeResult] = Future()
+
+    def _run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(util.guard_probe(spec.name, lambda: spec.factory(ctx)))
+        except BaseException as exc:
+            future.set_exception(exc)
+
+    threading.Thread(target=_run, name=f"probe-{spec.name}", daemon=True).start()
+    return future
+
+
+def _timeout(spec: ProbeSpec) -> float:
+    return spec.timeout_seconds or DEFAULT_PROBE_TIMEOUT_SECONDS
+
+
+def _timed_out(spec: ProbeSpec, ctx: ProbeContext) -> ProbeResult:
+    timeout = _timeout(spec)
+    return ProbeResult(
+        name=spec.name,
+        state=ProbeState.WARN if (ctx.warn_only or spec.optional) else ProbeState.ERROR,
+        detail=f"timed out after {timeout:g}s",
+        remediation="Check the dependency is reachable, then rerun doctor.",
+        duration_ms=timeout * 1000,
+    )
+
+
+def _cache_key(spec: ProbeSpec, ctx: ProbeContext) -> _CacheKey:
+    return (spec.name, ctx.profile, ctx.strict, ctx.warn_only)
+
+
+__all__ = [
+    "DEFAULT_PROBE_TIMEOUT_SECONDS",
+    "PROBE_RESULT_CACHE",
+    "ProbeCallback",
+    "ProbeResultCache",
+    "run_probes",
+]
@@ -32,6 +32,7 @@ class ProbeSpec:
     factory: Callable[[ProbeContext], ProbeResult]
     category: str = "core"
     optional: bool = False
+    timeout_seconds: float | None = None
 
 
 PROBE_SPECS: tuple[ProbeSpec, ...] = (
@@ -43,10 +44,18 @@ PROBE_SPECS: tuple[ProbeSpec, ...] = (
     ProbeSpec("redis", lambda ctx: _redis_probe(ctx.warn_only), category="core"),
     ProbeSpec("api", lambda ctx: _api_probe(ctx.warn_only), category="core"),
     ProbeSpec("frontend", lambda ctx: _frontend_probe(ctx.warn_only), category="core"),
-    ProbeSpec("migrations", lambda ctx: _migrations_probe(), category="core"),
+    ProbeSpec(
+        "migrations", lambda ctx: _migrations_probe(), category="core", timeout_seconds=10.0
+    ),
     ProbeSpec("secrets", lambda ctx: _secrets_probe(ctx), category="secrets", optional=True),
     ProbeSpec("billing", lambda ctx: _billing_probe(ctx), category="billing", optional=True),
-    ProbeSpec("sso", lambda ctx: _sso_probe(ctx), category="auth", optional=True),
+    ProbeSpec(
+        "sso",
+        lambda ctx: _sso_probe(ctx),
+        category="auth",
+        optional=True,
+        timeout_seconds=20.0,
+    ),
     ProbeSpec("storage", lambda ctx: _storage_probe(ctx), category="storage", optional=True),
 )
 
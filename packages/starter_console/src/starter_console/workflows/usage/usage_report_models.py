@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import csv
 import json
 from collections.abc import Iterable
 from dataclasses import dataclass, field
@@ -99,6 +100,11 @@ class UsageReport:
     tenants: list[TenantUsageSnapshot]
 
     def to_dict(self) -> dict[str, Any]:
+        return {**self.header_dict(), "tenants": [tenant.to_dict() for tenant in self.tenants]}
+
+    def header_dict(self) -> dict[str, Any]:
+        """Report-level fields, i.e. everything in ``to_dict`` except ``tenants``."""
+
         return {
             "generated_at": isoformat(self.generated_at),
             "applied_period_start": isoformat(self.applied_period_start),
@@ -110,7 +116,6 @@ class UsageReport:
             "include_inactive": self.include_inactive,
             "tenant_count": len(self.tenants),
             "feature_count": sum(len(tenant.features) for tenant in self.tenants),
-            "tenants": [tenant.to_dict() for tenant in self.tenants],
         }
 
     def iter_rows(self) -> Iterable[dict[str, Any]]:
@@ -148,50 +153,66 @@ class UsageReportArtifacts:
     csv_path: Path | None
 
 
+CSV_FIELDNAMES: tuple[str, ...] = (
+    "tenant_id",
+    "tenant_slug",
+    "tenant_name",
+    "plan_code",
+    "plan_name",
+    "subscription_status",
+    "feature_key",
+    "feature_display_name",
+    "unit",
+    "quantity",
+    "soft_limit",
+    "hard_limit",
+    "remaining_to_soft_limit",
+    "remaining_to_hard_limit",
+    "percent_of_soft_limit",
+    "percent_of_hard_limit",
+    "status",
+    "approaching",
+    "window_start",
+    "window_end",
+    "usage_window_start",
+    "usage_window_end",
+)
+
+
 def write_report_json(path: Path, report: UsageReport) -> Path:
+    """Write ``report`` as indented JSON, one tenant at a time.
+
+    The output matches ``json.dumps(report.to_dict(), indent=2)`` without
+    materializing the whole document in memory.
+    """
+
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(report.to_dict(), indent=2) + "\n", encoding="utf-8")
+    with path.open("w", encoding="utf-8") as handle:
+        handle.write("{\n")
+        for key, value in report.header_dict().items():
+            handle.write(f"  {json.dumps(key)}: {_nested_json(value, depth=1)},\n")
+        handle.write('  "tenants": [')
+        for index, tenant in enumerate(report.tenants):
+            handle.write(",\n    " if index else "\n    ")
+            handle.write(_nested_json(tenant.to_dict(), depth=2))
+        handle.write("\n  ]\n}\n" if report.tenants else "]\n}\n")
     return path
 
 
 def write_report_csv(path: Path, report: UsageReport) -> Path:
     path.parent.mkdir(parents=True, exist_ok=True)
-    rows = list(report.iter_rows())
-    fieldnames = list(rows[0].keys()) if rows else [
-        "tenant_id",
-        "tenant_slug",
-        "tenant_name",
-        "plan_code",
-        "plan_name",
-        "subscription_status",
-        "feature_key",
-        "feature_display_name",
-        "unit",
-        "quantity",
-        "soft_limit",
-        "hard_limit",
-        "remaining_to_soft_limit",
-        "remaining_to_hard_limit",
-        "percent_of_soft_limit",
-        "percent_of_hard_limit",
-        "status",
-        "approaching",
-        "window_start",
-        "window_end",
-        "usage_window_start",
-        "usage_window_end",
-    ]
-
-    import csv
-
     with path.open("w", encoding="utf-8", newline="") as handle:
-        writer = csv.DictWriter(handle, fieldnames=fieldnames)
+        writer = csv.DictWriter(handle, fieldnames=CSV_FIELDNAMES)
         writer.writeheader()
-        for row in rows:
+        for row in report.iter_rows():
             writer.writerow(row)
     return path
 
 
+def _nested_json(value: Any, *, depth: int) -> str:
+    return json.dumps(value, indent=2).replace("\n", "\n" + "  " * depth)
+
+
 def isoformat(value: datetime | None) -> str | None:
     if value is None:
         return None
@@ -204,6 +225,7 @@ __all__ = [
     "TenantUsageSnapshot",
     "UsageReport",
     "UsageReportArtifacts",
+    "CSV_FIELDNAMES",
     "write_report_json",
     "write_report_csv",
     "isoformat",
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Sequence
+from collections.abc import AsyncIterator, Iterable, Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
@@ -52,6 +52,22 @@ class UsageRow:
     period_end: datetime
 
 
+@dataclass(slots=True)
+class UsageTotalRow:
+    """Usage summed per subscription and feature inside the subscription's window."""
+
+    subscription_id: str
+    feature_key: str
+    unit: str
+    quantity: int
+    usage_start: datetime
+    usage_end: datetime
+
+
+# Rows fetched per round trip when streaming aggregated usage.
+_STREAM_BATCH_SIZE = 1000
+
+
 async def fetch_subscriptions(
     connection: AsyncConnection,
     request: UsageReportRequest,
@@ -246,6 +262,128 @@ async def fetch_usage_rows(
     return rows
 
 
+async def stream_usage_totals(
+    connection: AsyncConnection,
+    subscription_ids: Sequence[str],
+    feature_filter: Sequence[str] | None,
+    *,
+    period_start: datetime | None,
+    period_end: datetime | None,
+    fallback_start: datetime | None = None,
+    fallback_end: datetime | None = None,
+) -> AsyncIterator[UsageTotalRow]:
+    """Stream usage totals grouped by subscription and feature.
+
+    Each subscription is aggregated over its own window: the requested period
+    when given, otherwise the subscription's current billing period, falling back
+    to ``fallback_start``/``fallback_end`` when the subscription has none. Usage
+    records overlapping the window count in full. Aggregation happens in SQL and
+    results are read through a server-side cursor, so memory stays proportional
+    to the number of (subscription, feature) pairs rather than raw usage rows.
+    """
+
+    if not subscription_ids:
+        return
+
+    clauses: list[str] = []
+    params: dict[str, Any] = {}
+
+    clause, clause_params = _build_in_clause("su.subscription_id", subscription_ids, "usage_sub")
+    clauses.append(clause)
+    params.update(clause_params)
+
+    if feature_filter:
+        clause, clause_params = _build_in_clause("su.feature_key", feature_filter, "usage_feature")
+        clauses.append(clause)
+        params.update(clause_params)
+
+    window_clauses, window_params = _window_clauses(
+        period_start=period_start,
+        period_end=period_end,
+        fallback_start=fallback_start,
+        fallback_end=fallback_end,
+    )
+    clauses.extend(window_clauses)
+    params.update(window_params)
+
+    where = " AND ".join(clauses)
+    query = text(
+        f"""
+        SELECT
+            su.subscription_id,
+            su.feature_key,
+            MAX(su.unit) AS unit,
+            SUM(su.quantity) AS quantity,
+            MIN(su.period_start) AS usage_start,
+            MAX(su.period_end) AS usage_end
+        FROM subscription_usage su
+        JOIN tenant_subscriptions ts ON ts.id = su.subscription_id
+        WHERE {where}
+        GROUP BY su.subscription_id, su.feature_key
+        ORDER BY su.subscription_id, su.feature_key
+        """
+    ).execution_options(yield_per=_STREAM_BATCH_SIZE)
+
+    try:
+        result = await connection.stream(query, params)
+        async for row in result:
+            mapping = dict(row._mapping)
+            usage_start = _ensure_datetime(mapping.get("usage_start"))
+            usage_end = _ensure_datetime(mapping.get("usage_end"))
+            if usage_start is None or usage_end is None:
+                raise UsageReportQueryError(
+                    "Usage rows require period_start/period_end timestamps"
+                )
+            yield UsageTotalRow(
+                subscription_id=str(mapping["subscription_id"]),
+                feature_key=str(mapping["feature_key"]),
+                unit=str(mapping.get("unit") or "units"),
+                quantity=int(mapping.get("quantity") or 0),
+                usage_start=usage_start,
+                usage_end=usage_end,
+            )
+    except SQLAlchemyError as exc:  # pragma: no cover - defensive
+        raise UsageReportQueryError(f"Failed to aggregate usage records: {exc}") from exc
+
+
+def _window_clauses(
+    *,
+    period_start: datetime | None,
+    period_end: datetime | None,
+    fallback_start: datetime | None,
+    fallback_end: datetime | None,
+) -> tuple[list[str], dict[str, Any]]:
+    """Build overlap predicates between usage records and each subscription's window."""
+
+    params: dict[str, Any] = {}
+    if period_start is not None and period_end is not None:
+        if period_start > period_end:
+            period_start, period_end = period_end, period_start
+        params.update(window_start=period_start, window_end=period_end)
+        return ["su.period_end >= :window_start", "su.period_start <= :window_end"], params
+
+    def _bound(
+        requested: datetime | None, column: str, fallback: datetime | None, name: str
+    ) -> str:
+        if requested is not None:
+            params[f"window_{name}"] = requested
+            return f":window_{name}"
+        if fallback is not None:
+            params[f"fallback_{name}"] = fallback
+            return f"COALESCE({column}, :fallback_{name})"
+        return column
+
+    start = _bound(period_start, "ts.current_period_start", fallback_start, "start")
+    end = _bound(period_end, "ts.current_period_end", fallback_end, "end")
+    # Mirror the per-subscription swap applied when a window is inverted.
+    lower = f"(CASE WHEN {start} > {end} THEN {end} ELSE {start} END)"
+    upper = f"(CASE WHEN {start} > {end} THEN {start} ELSE {end} END)"
+    return [
+        f"({lower} IS NULL OR su.period_end >= {lower})",
+        f"({upper} IS NULL OR su.period_start <= {upper})",
+    ], params
+
+
 def _build_in_clause(column: str, values: Iterable[str], prefix: str) -> tuple[str, dict[str, Any]]:
     placeholders: list[str] = []
     params: dict[str, Any] = {}
@@ -287,7 +425,9 @@ __all__ = [
     "SubscriptionRow",
     "PlanFeatureRow",
     "UsageRow",
+    "UsageTotalRow",
     "fetch_subscriptions",
     "fetch_plan_features",
     "fetch_usage_rows",
+    "stream_usage_totals",
 ]
@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 
-from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
 
 from starter_console.workflows.usage.usage_report_models import (
     FeatureUsageSnapshot,
@@ -22,10 +22,10 @@ from starter_console.workflows.usage.usage_report_queries import (
     PlanFeatureRow,
     SubscriptionRow,
     UsageReportQueryError,
-    UsageRow,
+    UsageTotalRow,
     fetch_plan_features,
     fetch_subscriptions,
-    fetch_usage_rows,
+    stream_usage_totals,
 )
 
 
@@ -42,20 +42,6 @@ class TimeWindow:
     end: datetime | None
 
 
-@dataclass(slots=True)
-class UsageAccumulator:
-    quantity: int = 0
-    unit: str = "units"
-    window_start: datetime | None = None
-    window_end: datetime | None = None
-
-    def add(self, row: UsageRow) -> None:
-        self.quantity += row.quantity
-        self.unit = row.unit or self.unit
-        self.window_start = _min_datetime(self.window_start, row.period_start)
-        self.window_end = _max_datetime(self.window_end, row.period_end)
-
-
 class UsageReportService:
     """Coordinates SQL queries and aggregations for CLI exports."""
 
@@ -78,20 +64,17 @@ class UsageReportService:
                     request.feature_keys,
                 )
 
-                usage_rows = await fetch_usage_rows(
-                    connection,
-                    [row.subscription_id for row in subscriptions],
-                    request.feature_keys,
-                    request.period_start,
-                    request.period_end,
+                windows, derived_start, derived_end = self._compute_time_windows(
+                    subscriptions, request
+                )
+                usage_map = await self._collect_usage(
+                    connection, subscriptions, request, derived_start, derived_end
                 )
         except UsageReportQueryError as exc:
             raise UsageReportError(str(exc)) from exc
         finally:
             await engine.dispose()
 
-        windows, derived_start, derived_end = self._compute_time_windows(subscriptions, request)
-        usage_map = self._aggregate_usage(usage_rows, windows)
         tenants = self._build_tenant_snapshots(
             subscriptions,
             plan_features,
@@ -136,26 +119,33 @@ class UsageReportService:
 
         return windows, derived_start, derived_end
 
-    def _aggregate_usage(
+    async def _collect_usage(
         self,
-        usage_rows: Sequence[UsageRow],
-        windows: dict[str, TimeWindow],
-    ) -> dict[str, dict[str, UsageAccumulator]]:
-        usage_map: dict[str, dict[str, UsageAccumulator]] = {}
-        for row in usage_rows:
-            window = windows.get(row.subscription_id)
-            if window and not _overlaps(row.period_start, row.period_end, window.start, window.end):
-                continue
-            feature_map = usage_map.setdefault(row.subscription_id, {})
-            accumulator = feature_map.setdefault(row.feature_key, UsageAccumulator())
-            accumulator.add(row)
+        connection: AsyncConnection,
+        subscriptions: Sequence[SubscriptionRow],
+        request: UsageReportRequest,
+        derived_start: datetime | None,
+        derived_end: datetime | None,
+    ) -> dict[str, dict[str, UsageTotalRow]]:
+        usage_map: dict[str, dict[str, UsageTotalRow]] = {}
+        totals = stream_usage_totals(
+            connection,
+            [row.subscription_id for row in subscriptions],
+            request.feature_keys,
+            period_start=request.period_start,
+            period_end=request.period_end,
+            fallback_start=derived_start,
+            fallback_end=derived_end,
+        )
+        async for total in totals:
+            usage_map.setdefault(total.subscription_id, {})[total.feature_key] = total
         return usage_map
 
     def _build_tenant_snapshots(
         self,
         subscriptions: Sequence[SubscriptionRow],
         plan_features: dict[str, dict[str, PlanFeatureRow]],
-        usage_map: dict[str, dict[str, UsageAccumulator]],
+        usage_map: dict[str, dict[str, UsageTotalRow]],
         request: UsageReportRequest,
         windows: dict[str, TimeWindow],
     ) -> list[TenantUsageSnapshot]:
@@ -176,7 +166,7 @@ class UsageReportService:
                 self._build_feature_snapshot(
                     feature_key=feature_key,
                     definition=plan_definitions.get(feature_key),
-                    accumulator=usage_for_subscription.get(feature_key),
+                    usage=usage_for_subscription.get(feature_key),
                     warn_threshold=warn_threshold,
                 )
                 for feature_key in sorted(feature_keys)
@@ -203,11 +193,11 @@ class UsageReportService:
         *,
         feature_key: str,
         definition: PlanFeatureRow | None,
-        accumulator: UsageAccumulator | None,
+        usage: UsageTotalRow | None,
         warn_threshold: float,
     ) -> FeatureUsageSnapshot:
-        quantity = accumulator.quantity if accumulator else 0
-        unit = accumulator.unit if accumulator else "units"
+        quantity = usage.quantity if usage else 0
+        unit = usage.unit if usage else "units"
         display_name = (definition.display_name if definition else None) or feature_key
         soft_limit = definition.soft_limit if definition else None
         hard_limit = definition.hard_limit if definition else None
@@ -241,8 +231,8 @@ class UsageReportService:
             percent_of_hard_limit=_percent(quantity, hard_limit),
             status=status,
             approaching=approaching,
-            usage_window_start=(accumulator.window_start if accumulator else None),
-            usage_window_end=(accumulator.window_end if accumulator else None),
+            usage_window_start=(usage.usage_start if usage else None),
+            usage_window_end=(usage.usage_end if usage else None),
         )
 
 
@@ -269,19 +259,6 @@ def _percent(quantity: int, limit_value: int | None) -> float | None:
     return round((quantity / limit_value) * 100, 2)
 
 
-def _overlaps(
-    record_start: datetime,
-    record_end: datetime,
-    window_start: datetime | None,
-    window_end: datetime | None,
-) -> bool:
-    if window_start and record_end < window_start:
-        return False
-    if window_end and record_start > window_end:
-        return False
-    return True
-
-
 def _min_datetime(current: datetime | None, candidate: datetime) -> datetime:
     if current is None:
         return candidate
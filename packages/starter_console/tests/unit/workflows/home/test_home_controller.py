@@ -18,7 +18,7 @@ def test_hub_service_load_home(monkeypatch):
         profile = "demo"
         strict = False
 
-        def collect(self):
+        def collect(self, **_kwargs):
             return probes, services, summary
 
     monkeypatch.setattr(hub_service, "DoctorRunner", lambda ctx, profile, strict: FakeRunner())
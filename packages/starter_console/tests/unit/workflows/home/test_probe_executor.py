@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+import threading
+import time
+
+from starter_console.core.status_models import ProbeResult, ProbeState
+from starter_console.workflows.home.probes.executor import ProbeResultCache, run_probes
+from starter_console.workflows.home.probes.registry import ProbeContext, ProbeSpec
+
+
+def _ctx(*, warn_only: bool = False) -> ProbeContext:
+    return ProbeContext(env={}, settings=None, profile="demo", strict=False, warn_only=warn_only)
+
+
+def _spec(name: str, *, delay: float = 0.0, calls: list[str] | None = None, **kwargs) -> ProbeSpec:
+    def _probe(ctx: ProbeContext) -> ProbeResult:
+        if calls is not None:
+            calls.append(name)
+        time.sleep(delay)
+        return ProbeResult(name=name, state=ProbeState.OK, detail="ok")
+
+    return ProbeSpec(name=name, factory=_probe, **kwargs)
+
+
+def test_probes_run_concurrently_and_stream_in_completion_order():
+    streamed: list[str] = []
+    specs = (_spec("slow", delay=0.3), _spec("fast", delay=0.05), _spec("mid", delay=0.15))
+
+    started = time.monotonic()
+    results = run_probes(
+        specs,
+        _ctx(),
+        on_result=lambda spec, result: streamed.append(result.name),
+        cache=ProbeResultCache(),
+    )
+
+    assert time.monotonic() - started < 0.5
+    assert streamed == ["fast", "mid", "slow"]
+    assert [result.name for result in results] == ["slow", "fast", "mid"]
+
+
+def test_probe_past_its_deadline_reports_timeout_without_blocking_others():
+    release = threading.Event()
+
+    def _hang(ctx: ProbeContext) -> ProbeResult:
+        release.wait(5)
+        return ProbeResult(name="hang", state=ProbeState.OK)
+
+    specs = (
+        ProbeSpec(name="hang", factory=_hang, timeout_seconds=0.1),
+        ProbeSpec(name="hang_optional", factory=_hang, optional=True, timeout_seconds=0.1),
+        _spec("fast"),
+    )
+    try:
+        results = run_probes(specs, _ctx(), cache=ProbeResultCache())
+    finally:
+        release.set()
+
+    hang, hang_optional, fast = results
+    assert hang.state is ProbeState.ERROR
+    assert hang.detail == "timed out after 0.1s"
+    assert hang_optional.state is ProbeState.WARN
+    assert fast.state is ProbeState.OK
+
+
+def test_timed_out_results_are_not_cached():
+    calls: list[str] = []
+    release = threading.Event()
+
+    def _hang(ctx: ProbeContext) -> ProbeResult:
+        calls.append("hang")
+        release.wait(5)
+        return ProbeResult(name="hang", state=ProbeState.OK)
+
+    cache = ProbeResultCache()
+    specs = (ProbeSpec(name="hang", factory=_hang, timeout_seconds=0.05),)
+    try:
+        run_probes(specs, _ctx(), cache=cache, max_age=30)
+        run_probes(specs, _ctx(), cache=cache, max_age=30)
+    finally:
+        release.set()
+    assert calls == ["hang", "hang"]
+
+
+def test_hung_probe_does_not_block_interpreter_exit():
+    script = """
+import time
+from starter_console.core.status_models import ProbeResult
+from starter_console.workflows.home.probes.executor import ProbeResultCache, run_probes
+from starter_console.workflows.home.probes.registry import ProbeContext, ProbeSpec
+
+def _hang(ctx):
+    time.sleep(60)
+    return ProbeResult(name="hang")
+
+ctx = ProbeContext(env={}, settings=None, profile="demo", strict=False, warn_only=False)
+spec = ProbeSpec(name="hang", factory=_hang, timeout_seconds=0.1)
+print(run_probes((spec,), ctx, cache=ProbeResultCache())[0].detail)
+"""
+    completed = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, timeout=20
+    )
+    assert completed.returncode == 0, completed.stderr
+    assert completed.stdout.strip() == "timed out after 0.1s"
+
+
+def test_recent_results_are_reused_within_max_age():
+    calls: list[str] = []
+    cache = ProbeResultCache()
+    specs = (_spec("db", calls=calls), _spec("api", calls=calls))
+
+    run_probes(specs, _ctx(), cache=cache, max_age=30)
+    run_probes(specs, _ctx(), cache=cache, max_age=30)
+    assert sorted(calls) == ["api", "db"]
+
+    # A different profile, or no max_age, probes again.
+    run_probes(specs, _ctx(warn_only=True), cache=cache, max_age=30)
+    run_probes(specs, _ctx(), cache=cache)
+    assert len(calls) == 6
+
+
+def test_skipped_probes_are_not_executed():
+    calls: list[str] = []
+    results = run_probes(
+        (_spec("api", calls=calls),),
+        _ctx(),
+        skip={"api"},
+        skip_reason="suppressed",
+        cache=ProbeResultCache(),
+    )
+    assert calls == []
+    assert results[0].state is ProbeState.SKIPPED
+    assert results[0].detail == "suppressed"
@@ -8,7 +8,12 @@ from pathlib import Path
 
 import pytest
 from starter_console.workflows.usage import UsageReportRequest
-from starter_console.workflows.usage.usage_report_models import UsageReport
+from starter_console.workflows.usage.usage_report_models import (
+    FeatureUsageSnapshot,
+    TenantUsageSnapshot,
+    UsageReport,
+    write_report_json,
+)
 from starter_console.workflows.usage.usage_report_service import (
     UsageReportError,
     UsageReportService,
@@ -145,6 +150,116 @@ async def test_generate_report_requires_matching_subscriptions(tmp_path):
         await service.generate_report(request)
 
 
+@pytest.mark.asyncio
+async def test_generate_report_sums_usage_inside_each_subscription_window(tmp_path):
+    database_url = _sqlite_url(tmp_path / "usage-windows.db")
+    _bootstrap_schema(database_url)
+    start = datetime(2026, 1, 1, tzinfo=UTC)
+    plan_id = str(uuid.uuid4())
+    _insert(database_url, "billing_plans", {"id": plan_id, "code": "pro", "name": "Pro"})
+    _insert(
+        database_url,
+        "plan_features",
+        {"plan_id": plan_id, "feature_key": "messages", "hard_limit": 100, "is_metered": 1},
+    )
+
+    subscriptions: dict[str, str] = {}
+    for slug, offset_days in (("acme", 0), ("globex", 60)):
+        tenant_id = str(uuid.uuid4())
+        subscriptions[slug] = str(uuid.uuid4())
+        sub_start = start + timedelta(days=offset_days)
+        _insert(database_url, "tenant_accounts", {"id": tenant_id, "slug": slug})
+        _insert(
+            database_url,
+            "tenant_subscriptions",
+            {
+                "id": subscriptions[slug],
+                "tenant_id": tenant_id,
+                "plan_id": plan_id,
+                "status": "active",
+                "current_period_start": sub_start.isoformat(),
+                "current_period_end": (sub_start + timedelta(days=30)).isoformat(),
+            },
+        )
+    # Two records inside acme's window, one before it; globex's window starts later.
+    for day, quantity in ((1, 10), (20, 15), (-5, 99)):
+        for slug in ("acme", "globex"):
+            _insert(
+                database_url,
+                "subscription_usage",
+                {
+                    "id": str(uuid.uuid4()),
+                    "subscription_id": subscriptions[slug],
+                    "feature_key": "messages",
+                    "unit": "requests",
+                    "quantity": quantity,
+                    "period_start": (start + timedelta(days=day)).isoformat(),
+                    "period_end": (start + timedelta(days=day, hours=1)).isoformat(),
+                },
+            )
+
+    report = await UsageReportService().generate_report(
+        UsageReportRequest(database_url=database_url)
+    )
+
+    by_slug = {tenant.tenant_slug: tenant.features[0] for tenant in report.tenants}
+    assert by_slug["acme"].quantity == 25
+    assert by_slug["acme"].unit == "requests"
+    assert by_slug["acme"].usage_window_start == start + timedelta(days=1)
+    assert by_slug["acme"].usage_window_end == start + timedelta(days=20, hours=1)
+    assert by_slug["globex"].quantity == 0
+    assert by_slug["globex"].usage_window_start is None
+
+
+def test_write_report_json_matches_in_memory_serialization(tmp_path):
+    now = datetime.now(UTC)
+    feature = FeatureUsageSnapshot(
+        feature_key="messages",
+        display_name="Messages",
+        unit="requests",
+        quantity=5,
+        soft_limit=None,
+        hard_limit=10,
+        remaining_to_soft_limit=None,
+        remaining_to_hard_limit=5,
+        percent_of_soft_limit=None,
+        percent_of_hard_limit=50.0,
+        status="ok",
+        approaching=False,
+        usage_window_start=now,
+        usage_window_end=now,
+    )
+    tenants = [
+        TenantUsageSnapshot(
+            tenant_id=str(index),
+            tenant_slug=f"tenant-{index}",
+            tenant_name=None,
+            plan_code="pro",
+            plan_name="Pro",
+            subscription_status="active",
+            window_start=now,
+            window_end=None,
+            features=[feature] * index,
+        )
+        for index in range(3)
+    ]
+    report = UsageReport(
+        generated_at=now,
+        applied_period_start=None,
+        applied_period_end=None,
+        tenant_filters=("tenant-1",),
+        plan_filters=(),
+        feature_filters=(),
+        warn_threshold=0.8,
+        include_inactive=False,
+        tenants=tenants,
+    )
+
+    path = write_report_json(tmp_path / "report.json", report)
+
+    assert path.read_text(encoding="utf-8") == json.dumps(report.to_dict(), indent=2) + "\n"
+
+
 def test_write_usage_report_files(tmp_path):
     dummy_report = UsageReport(
         generated_at=datetime.now(UTC),
@@ -168,6 +283,7 @@ def test_write_usage_report_files(tmp_path):
     assert artifacts.csv_path.exists()
     data = json.loads(artifacts.json_path.read_text(encoding="utf-8"))
     assert data["tenant_count"] == 0
+    assert json.dumps(data, indent=2) + "\n" == artifacts.json_path.read_text(encoding="utf-8")
 
 
 def _sqlite_url(path: Path) -> str:
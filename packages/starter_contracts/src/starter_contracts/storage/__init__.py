@@ -1,4 +1,7 @@
 from .models import (
+    DEFAULT_MULTIPART_CONCURRENCY,
+    DEFAULT_MULTIPART_PART_BYTES,
+    DEFAULT_STREAM_CHUNK_BYTES,
     AzureBlobProviderConfig,
     GCSProviderConfig,
     MinioProviderConfig,
@@ -12,6 +15,9 @@ from .models import (
 )
 
 __all__ = [
+    "DEFAULT_MULTIPART_CONCURRENCY",
+    "DEFAULT_MULTIPART_PART_BYTES",
+    "DEFAULT_STREAM_CHUNK_BYTES",
     "AzureBlobProviderConfig",
     "GCSProviderConfig",
     "MinioProviderConfig",
@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 import uuid
+from collections.abc import AsyncIterable, AsyncIterator, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import StrEnum
-from typing import Protocol, runtime_checkable
+from typing import Final, Protocol, runtime_checkable
+
+DEFAULT_STREAM_CHUNK_BYTES: Final[int] = 1024 * 1024
+DEFAULT_MULTIPART_PART_BYTES: Final[int] = 8 * 1024 * 1024
+DEFAULT_MULTIPART_CONCURRENCY: Final[int] = 4
 
 
 class StorageProviderLiteral(StrEnum):
@@ -126,20 +131,54 @@ class StorageProviderProtocol(Protocol):
         self, *, bucket: str, key: str, expires_in: int
     ) -> StoragePresignedUrl: ...
 
+    async def get_presigned_downloads(
+        self, *, objects: Sequence[tuple[str, str]], expires_in: int
+    ) -> list[StoragePresignedUrl]:
+        """Presign GETs for many ``(bucket, key)`` pairs in one call, in input order."""
+        ...
+
     async def head_object(self, *, bucket: str, key: str) -> StorageObjectRef | None: ...
 
     async def get_object_bytes(self, *, bucket: str, key: str) -> bytes: ...
 
+    def iter_object_bytes(
+        self,
+        *,
+        bucket: str,
+        key: str,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_BYTES,
+        start: int = 0,
+        end: int | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Yield the object (or the inclusive ``start``-``end`` byte range) in chunks."""
+        ...
+
     async def delete_object(self, *, bucket: str, key: str) -> None: ...
 
     async def put_object(
         self, *, bucket: str, key: str, data: bytes, content_type: str | None
     ) -> StorageObjectRef: ...
 
+    async def put_object_stream(
+        self,
+        *,
+        bucket: str,
+        key: str,
+        chunks: AsyncIterable[bytes],
+        content_type: str | None,
+        part_size: int = DEFAULT_MULTIPART_PART_BYTES,
+        concurrency: int = DEFAULT_MULTIPART_CONCURRENCY,
+    ) -> StorageObjectRef:
+        """Upload an object from an async byte stream, in parts where supported."""
+        ...
+
     async def health_check(self) -> StorageProviderHealth: ...
 
 
 __all__ = [
+    "DEFAULT_MULTIPART_CONCURRENCY",
+    "DEFAULT_MULTIPART_PART_BYTES",
+    "DEFAULT_STREAM_CHUNK_BYTES",
     "AzureBlobProviderConfig",
     "GCSProviderConfig",
     "MinioProviderConfig",